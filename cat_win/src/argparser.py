@@ -306,7 +306,7 @@ class ArgParser:
             for i, p_split in enumerate(param[p_length:].split(':')):
                 try:
                     self.file_truncate[i] = int(eval(p_split))
-                except (SyntaxError, NameError, ValueError, ArithmeticError):
+                except (SyntaxError, NameError, TypeError, ValueError, ArithmeticError):
                     self.file_truncate[i] = None
             return False
         # '[' + ARGS_CUT + ']'
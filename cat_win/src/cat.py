@@ -6,10 +6,15 @@ try:
     from colorama import init as coloramaInit
 except ImportError:
     nop = lambda *_, **__: None; coloramaInit = nop
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from functools import lru_cache
-from itertools import groupby
+from itertools import chain, groupby, islice
+from operator import getitem
 from time import monotonic
+import contextlib
+import multiprocessing
 import os
 import shlex
 import sys
@@ -24,9 +29,17 @@ from cat_win.src.domain.files import Files
 from cat_win.src.persistence.cconfig import CConfig
 from cat_win.src.persistence.config import Config
 from cat_win.src.service.helper.archiveviewer import display_archive
-from cat_win.src.service.helper.environment import on_windows_os
-from cat_win.src.service.helper.iohelper import IoHelper, err_print
+from cat_win.src.service.helper.editorhelper import History
+from cat_win.src.service.helper.editorsearchhelper import HexSearch
+from cat_win.src.service.helper.environment import get_cache_dir, on_windows_os
+from cat_win.src.service.helper.filelines import FileLines
+from cat_win.src.service.helper.iohelper import IoHelper, encoded_line_breaks, err_print
+from cat_win.src.service.helper.iohelper import LINE_BREAKS
 from cat_win.src.service.helper.levenshtein import calculate_suggestions
+from cat_win.src.service.helper.lineindex import LineIndex
+from cat_win.src.service.helper.longline import LongLine
+from cat_win.src.service.helper.outputsink import OutputCapture, OutputSink
+from cat_win.src.service.helper.pagecache import PageCache
 from cat_win.src.service.helper.progressbar import PBar
 from cat_win.src.service.helper.tmpfilehelper import TmpFileHelper
 try:
@@ -408,12 +421,12 @@ def _get_file_prefix(prefix: str, file_index: int, hyper: bool = False) -> str:
     return f"{color_dic[CKW.FILE_PREFIX]}{file}{color_dic[CKW.RESET_ALL]}:{prefix}"
 
 
-def print_file(content: list, stepper: More) -> bool:
+def print_file(content, stepper: More) -> bool:
     """
     print a file and possibly include the substrings and patterns to search for.
 
     Parameters:
-    content (list):
+    content (iterable):
         the content of a file like [(prefix, line), ...]
     stepper (More):
         the stepper to step through the file
@@ -423,13 +436,13 @@ def print_file(content: list, stepper: More) -> bool:
         identifies if the given content parameter contained any
         queried keyword/pattern.
     """
-    if not content:
-        return False
     if not any([arg_parser.file_queries, u_args[ARGS_GREP], u_args[ARGS_GREP_ONLY]]):
         if u_args[ARGS_MORE]:
             stepper.add_lines([prefix + line for prefix, line in content])
             return False
-        print(*[prefix + line for prefix, line in content], sep='\n')
+        with OutputSink() as sink:
+            for prefix, line in content:
+                sink.write_line(prefix + line)
         return False
 
     string_finder = StringFinder(arg_parser.file_queries)
@@ -617,12 +630,102 @@ def edit_raw_content(content: bytes, file_index: int = 0) -> None:
         return print(content)
     sys.stdout.buffer.write(content)
 
-def edit_content(content: list, file_index: int = 0, line_offset: int = 0) -> None:
+def _map_lines(content, func, *args):
+    """
+    lazily apply a function to every line of the content.
+
+    Parameters:
+    content (iterable):
+        the content of a file like [(prefix, line), ...]
+    func (function):
+        the function to call like func(line, *args)
+    args (tuple):
+        additional arguments to pass to the function
+
+    Yields:
+    (tuple):
+        the prefix and the new line like (prefix, line)
+    """
+    for prefix, line in content:
+        yield prefix, func(line, *args)
+
+
+def _replace_chars(line: str, char_mapping: list) -> str:
+    """
+    replace every char in a line according to the mapping.
+
+    Parameters:
+    line (str):
+        the line to edit
+    char_mapping (list):
+        the chars and their replacements like [(char, replacement), ...]
+
+    Returns:
+    line (str):
+        the edited line
+    """
+    for char, replacement in char_mapping:
+        line = line.replace(char, replacement)
+    return line
+
+
+def _slice_content(content, c_slice: slice):
+    """
+    slice the content. slices that only step forward will be applied lazily.
+
+    Parameters:
+    content (iterable):
+        the content of a file like [(prefix, line), ...]
+    c_slice (slice):
+        the slice to apply
+
+    Returns:
+    (iterable):
+        the sliced content
+    """
+    if c_slice == slice(None):
+        return content
+    if all(val is None or val >= 0 for val in (c_slice.start, c_slice.stop)) and \
+        (c_slice.step is None or c_slice.step > 0):
+        return islice(content, c_slice.start, c_slice.stop, c_slice.step)
+    return list(content)[c_slice]
+
+
+def _add_line_prefixes(content, file_index: int = 0):
+    """
+    lazily add the line length and the file to the line prefixes.
+
+    Parameters:
+    content (iterable):
+        the content of a file like [(prefix, line), ...]
+    file_index (int):
+        the index of the u_files.files list, pointing to the file that
+        is currently being processed
+
+    Returns:
+    content (iterable):
+        the content with the new prefixes
+    """
+    if u_args[ARGS_LLENGTH]:
+        content = ((_get_line_length_prefix(prefix, line), line) for prefix, line in content)
+    if u_args[ARGS_FILE_PREFIX]:
+        content = ((_get_file_prefix(prefix, file_index), line) for prefix, line in content)
+    elif u_args[ARGS_FFILE_PREFIX]:
+        content = ((_get_file_prefix(prefix, file_index, hyper=True), line)
+                   for prefix, line in content)
+    return content
+
+
+def edit_content(content, file_index: int = 0, line_offset: int = 0,
+                 excluded_by_peek: int = 0, reversed_lines_sum: int = None,
+                 truncated: bool = False) -> None:
     """
     apply all parameters to a string (file Content).
+    line-local parameters are applied lazily, so the content will only be held
+    in memory if a parameter needs to know the entire content (e.g. sort, reverse, peek).
 
     Parameters:
-    content (list):
+    content (iterable):
         the content of a file like [(prefix, line), ...]
     file_index (int):
         the index of the u_files.files list, pointing to the file that
@@ -630,9 +733,24 @@ def edit_content(content: list, file_index: int = 0, line_offset: int = 0) -> No
         the repl mode
     line_offset (int):
         the offset for counting the line numbers (used in the repl)
+    excluded_by_peek (int):
+        the amount of lines that have already been excluded by peeking.
+        in this case the content only consists of the first and last peek_size lines
+    reversed_lines_sum (int):
+        if not None, the content has already been reversed (read from the end of the file).
+        in this case this is the amount of lines of the content (used for the line numbers)
+    truncated (bool):
+        indicates if the content has already been truncated to the lines between
+        the bounds of the truncate parameter (only the step still has to be applied).
+        in this case the line_offset is the amount of lines in front of the content
     """
+    content = iter(content)
+    first_line = next(content, None)
+    if first_line is not None:
+        content = chain((first_line,), content)
     if not (
-        content or
+        first_line is not None or
+        truncated or
         os.isatty(sys.stdout.fileno()) or
         file_index < 0 or
         u_files.is_temp_file(file_index)
@@ -660,19 +778,25 @@ def edit_content(content: list, file_index: int = 0, line_offset: int = 0) -> No
                               const_dic[DKW.STRINGS_DELIMETER])
 
     if u_args[ARGS_SPECIFIC_FORMATS]:
-        content = Formatter.format(content)
-
-    excluded_by_peek = 0
-
-    if u_args[ARGS_NUMBER]:
-        content = [(_get_line_prefix(j+line_offset, file_index+1), c[1])
-                   for j, c in enumerate(content, start=1)]
-
-    content = content[slice(*arg_parser.file_truncate)]
-
-    if u_args[ARGS_PEEK] and len(content) > 2*const_dic[DKW.PEEK_SIZE]:
-        excluded_by_peek = len(content) - 2*const_dic[DKW.PEEK_SIZE]
-        content = content[:const_dic[DKW.PEEK_SIZE]] + content[-const_dic[DKW.PEEK_SIZE]:]
+        content = Formatter.format(list(content))
+
+    if u_args[ARGS_NUMBER] and reversed_lines_sum is not None:
+        content = ((_get_line_prefix(reversed_lines_sum-j+line_offset, file_index+1), c[1])
+                   for j, c in enumerate(content))
+    elif u_args[ARGS_NUMBER]:
+        peek_size = const_dic[DKW.PEEK_SIZE]
+        content = ((_get_line_prefix(j+line_offset+excluded_by_peek*(j > peek_size),
+                                     file_index+1), c[1])
+                   for j, c in enumerate(content, start=1))
+
+    content = _slice_content(content, slice(None, None, arg_parser.file_truncate[2])
+                             if truncated else slice(*arg_parser.file_truncate))
+
+    if u_args[ARGS_PEEK] and not excluded_by_peek:
+        content = list(content)
+        if len(content) > 2*const_dic[DKW.PEEK_SIZE]:
+            excluded_by_peek = len(content) - 2*const_dic[DKW.PEEK_SIZE]
+            content = content[:const_dic[DKW.PEEK_SIZE]] + content[-const_dic[DKW.PEEK_SIZE]:]
 
     for arg, param in u_args:
         if arg == ARGS_CUT:
@@ -682,25 +806,25 @@ def edit_content(content: list, file_index: int = 0, line_offset: int = 0) -> No
                     slice_evals[i] = int(eval(p_split))
                 except (SyntaxError, NameError, ValueError, ArithmeticError):
                     pass
-            content = [(prefix, line[slice_evals[0]:slice_evals[1]:slice_evals[2]])
-                        for prefix, line in content]
+            content = _map_lines(content, getitem, slice(*slice_evals))
 
     for arg, param in u_args:
         if arg == ARGS_ENDS:
             emarker = color_dic[CKW.ENDS]+const_dic[DKW.END_MARKER_SYMBOL]+color_dic[CKW.RESET_ALL]
-            content = [(prefix, line + emarker) for prefix, line in content]
+            content = _map_lines(content, str.__add__, emarker)
         elif arg == ARGS_SQUEEZE:
-            content = [list(group)[0] for _, group in groupby(content, lambda x: x[1])]
-        elif arg == ARGS_REVERSE:
+            content = (next(group) for _, group in groupby(content, lambda x: x[1]))
+        elif arg == ARGS_REVERSE and reversed_lines_sum is None:
+            content = list(content)
             content.reverse()
         elif arg == ARGS_SORT:
-            content.sort(key = lambda l: l[1].casefold())
+            content = sorted(content, key = lambda l: l[1].casefold())
         elif arg == ARGS_SSORT:
-            content.sort(key = lambda l: len(l[1]))
+            content = sorted(content, key = lambda l: len(l[1]))
         elif arg == ARGS_BLANK:
-            content = [c for c in content if c[1].strip(
+            content = (c for c in content if c[1].strip(
                 None if const_dic[DKW.BLANK_REMOVE_WS_LINES] else ''
-            )]
+            ))
         elif arg == ARGS_EVAL:
             content = comp_eval(converter, content, param, remove_ansi_codes_from_line)
         elif arg == ARGS_HEX:
@@ -713,38 +837,33 @@ def edit_content(content: list, file_index: int = 0, line_offset: int = 0) -> No
             content = comp_conv(converter, content, param, remove_ansi_codes_from_line)
         elif arg == ARGS_REPLACE:
             replace_this, replace_with = arg_parser.file_replace_mapping[param]
-            content = [(prefix, line.replace(replace_this, f"{color_dic[CKW.REPLACE]}" + \
-                f"{replace_with}{color_dic[CKW.RESET_ALL]}"))
-                        for prefix, line in content]
+            content = _map_lines(content, str.replace, replace_this,
+                                 f"{color_dic[CKW.REPLACE]}{replace_with}{color_dic[CKW.RESET_ALL]}")
         elif arg == ARGS_CHR:
-            for c_id, char, _, possible in SPECIAL_CHARS:
-                if not possible:
-                    continue
-                content = [
-                    (prefix, line.replace(
-                        chr(c_id), f"{color_dic[CKW.CHARS]}^{char}{color_dic[CKW.RESET_ALL]}"
-                    ))
-                    for prefix, line in content
-                ]
+            content = _map_lines(content, _replace_chars, [
+                (chr(c_id), f"{color_dic[CKW.CHARS]}^{char}{color_dic[CKW.RESET_ALL]}")
+                for c_id, char, _, possible in SPECIAL_CHARS if possible
+            ])
 
-    if u_args[ARGS_LLENGTH]:
-        content = [(_get_line_length_prefix(prefix, line), line) for prefix, line in content]
-    if u_args[ARGS_FILE_PREFIX]:
-        content = [(_get_file_prefix(prefix, file_index), line) for prefix, line in content]
-    elif u_args[ARGS_FFILE_PREFIX]:
-        content = [(_get_file_prefix(prefix, file_index, hyper=True), line)
-                   for prefix, line in content]
+    content = _add_line_prefixes(content, file_index)
     if u_args[ARGS_B64E]:
         content = encode_base64('\n'.join(''.join(x) for x in content), True,
                                 arg_parser.file_encoding)
         content = [('', content)]
+    if u_args[ARGS_CLIP]:
+        content = list(content)
 
     stepper = More()
-    found_queried = print_file(content[:len(content)//2], stepper)
-    if file_index >= 0:
-        u_files[file_index].set_contains_queried(found_queried)
-    print_excluded_by_peek(content, excluded_by_peek)
-    found_queried = print_file(content[len(content)//2:], stepper)
+    if excluded_by_peek:
+        content = list(content)
+        found_queried = print_file(content[:len(content)//2], stepper)
+        if file_index >= 0:
+            u_files[file_index].set_contains_queried(found_queried)
+        print_excluded_by_peek(content, excluded_by_peek)
+        content_end = content[len(content)//2:]
+    else:
+        content_end = content
+    found_queried = print_file(content_end, stepper)
     if file_index >= 0:
         u_files[file_index].set_contains_queried(found_queried)
 
@@ -755,6 +874,385 @@ def edit_content(content: list, file_index: int = 0, line_offset: int = 0) -> No
         Clipboard.clipboard += '\n'.join(prefix + line for prefix, line in content)
 
 
+def _to_content(lines):
+    """
+    convert the lines of a file to content.
+
+    Parameters:
+    lines (iterable):
+        the lines of a file
+
+    Yields:
+    (tuple):
+        the (still empty) prefix and the next line of the file like ('', line)
+    """
+    strip_color = not os.isatty(sys.stdout.fileno()) and const_dic[DKW.STRIP_COLOR_ON_PIPE]
+    for line in lines:
+        if strip_color:
+            line = remove_ansi_codes_from_line(line)
+        yield '', line
+
+
+def _yield_file_lines(file_index: int, errors: str = 'strict', skip: int = 0,
+                      reverse: bool = False, line_range: tuple = None):
+    """
+    lazily read the lines of a file.
+
+    Parameters:
+    file_index (int):
+        the index regarding which file is currently being edited
+    errors (str):
+        the type of error handling when decoding the file
+    skip (int):
+        the amount of lines to skip at the beginning of the file
+    reverse (bool):
+        if True the lines will be read from the end of the file in reversed order
+    line_range (tuple):
+        if not None, only the lines within this range will be read
+        (see _get_truncate_range())
+
+    Returns:
+    (generator):
+        yields the (still empty) prefix and the next line of the file like ('', line)
+    """
+    # splitlines() gives a slight inaccuracy, because
+    # it also splits on other bytes than \r and \n ...
+    # the alternative would be worse: split('\n') would increase the linecount each
+    # time catw touches a file.
+    if line_range is not None:
+        offset, _, lines_count = line_range
+        return _to_content(islice(IoHelper.yield_lines(
+            u_files[file_index].path, arg_parser.file_encoding, errors, offset=offset
+        ), skip, lines_count))
+    yield_lines = IoHelper.yield_lines_reversed if reverse else IoHelper.yield_lines
+    return _to_content(islice(yield_lines(
+        u_files[file_index].path, arg_parser.file_encoding, errors
+    ), skip, None))
+
+
+def _can_truncate_file() -> bool:
+    """
+    check if only the lines within the bounds of the truncate parameter
+    have to be read from the file.
+
+    Returns:
+    (bool):
+        indicates if _get_truncate_range() can be used
+    """
+    return bool(
+        arg_parser.file_truncate[:2] != [None, None] and
+        (arg_parser.file_truncate[2] is None or arg_parser.file_truncate[2] > 0) and
+        not u_args[ARGS_STRINGS] and
+        not u_args[ARGS_SPECIFIC_FORMATS] and
+        encoded_line_breaks(arg_parser.file_encoding)
+    )
+
+
+def _get_truncate_range(file_index: int) -> tuple:
+    """
+    find the lines within the bounds of the truncate parameter, without
+    decoding the lines in front of them. a stored line index is being used to
+    seek close to the first line, negative bounds are found by scanning
+    backwards from the end of the file.
+
+    Parameters:
+    file_index (int):
+        the index regarding which file is currently being edited
+
+    Returns:
+    (tuple):
+        the byte offset of the first line, the amount of lines in front of it
+        and the amount of lines to read (None to read until the end of the file),
+        like (offset, line_offset, lines_count)
+    """
+    file_path, file_encoding = u_files[file_index].path, arg_parser.file_encoding
+    start, stop, _ = arg_parser.file_truncate
+    if start is not None and start < 0 and (stop is None or stop < 0) and \
+        not u_args[ARGS_NUMBER]:
+        # without line numbers the amount of lines in front is not needed
+        offset, lines_found = IoHelper.find_last_lines(file_path, -start, file_encoding)
+        return (offset, 0, max(lines_found + (stop or 0), 0))
+    if (start is not None and start < 0) or (stop is not None and stop < 0):
+        start, stop, _ = slice(start, stop).indices(_count_file_lines(file_index))
+    start = start or 0
+    line_breaks = encoded_line_breaks(file_encoding)
+    index = LineIndex.get(file_path, line_breaks, build=False)
+    offset = LineIndex.find_line(file_path, start, line_breaks,
+                                 index.seek(start) if index is not None else (0, 0))
+    return (offset, start, None if stop is None else max(stop - start, 0))
+
+
+def _can_peek_file() -> bool:
+    """
+    check if the content to peek at can directly be read from the
+    start and the end of the file.
+
+    Returns:
+    (bool):
+        indicates if _peek_file_content() can be used
+    """
+    return bool(
+        u_args[ARGS_PEEK] and
+        not u_args[ARGS_STRINGS] and
+        not u_args[ARGS_SPECIFIC_FORMATS] and
+        arg_parser.file_truncate == [None, None, None] and
+        encoded_line_breaks(arg_parser.file_encoding)
+    )
+
+
+def _can_reverse_file() -> bool:
+    """
+    check if the content can directly be read from the end of the file
+    in reversed order. this is only possible if no parameter requires
+    the lines to be in their original order.
+
+    Returns:
+    (bool):
+        indicates if the file can be read using IoHelper.yield_lines_reversed()
+    """
+    return bool(
+        u_args[ARGS_REVERSE] and
+        not u_args[ARGS_PEEK] and
+        not u_args[ARGS_STRINGS] and
+        not u_args[ARGS_SPECIFIC_FORMATS] and
+        not u_args[ARGS_SORT] and
+        not u_args[ARGS_SSORT] and
+        arg_parser.file_truncate == [None, None, None] and
+        encoded_line_breaks(arg_parser.file_encoding)
+    )
+
+
+def _can_grep_file() -> bool:
+    """
+    check if the file can be searched as a whole, instead of searching
+    every line on its own. this is only possible if only literals are queried,
+    the lines will be grepped, and no parameter changes the lines.
+
+    Returns:
+    (bool):
+        indicates if _yield_grep_content() can be used
+    """
+    return bool(
+        (u_args[ARGS_GREP] or u_args[ARGS_GREP_ONLY]) and
+        arg_parser.file_queries and
+        all(isinstance(query, str) and query for query, _ in arg_parser.file_queries) and
+        arg_parser.file_queries_replacement is None and
+        arg_parser.file_truncate == [None, None, None] and
+        not any(u_args[arg] for arg in [
+            ARGS_NOKEYWORD, ARGS_MORE, ARGS_CLIP, ARGS_B64E, ARGS_STRINGS,
+            ARGS_SPECIFIC_FORMATS, ARGS_PEEK, ARGS_CUT, ARGS_ENDS, ARGS_SQUEEZE,
+            ARGS_REVERSE, ARGS_SORT, ARGS_SSORT, ARGS_BLANK, ARGS_EVAL, ARGS_HEX,
+            ARGS_DEC, ARGS_OCT, ARGS_BIN, ARGS_REPLACE, ARGS_CHR,
+        ])
+    )
+
+
+def _grep_file_lines(file_index: int, errors: str = 'strict', skip: int = 0):
+    """
+    lazily read the lines of a file, that possibly contain a queried literal.
+    the file is being searched in large chunks, so that only
+    these lines have to be split from the file.
+
+    Parameters:
+    file_index (int):
+        the index regarding which file is currently being edited
+    errors (str):
+        the type of error handling when decoding the file
+    skip (int):
+        the amount of lines to skip at the beginning of the file
+
+    Yields:
+    (tuple):
+        the line number and the line like (line_number, line)
+    """
+    string_finder = StringFinder(arg_parser.file_queries)
+    strip_color = not os.isatty(sys.stdout.fileno()) and const_dic[DKW.STRIP_COLOR_ON_PIPE]
+    lines_sum = 0
+    for chunk in IoHelper.yield_line_chunks(u_files[file_index].path,
+                                            arg_parser.file_encoding, errors):
+        # the queries are being searched in the lines without ANSI-Colorcodes
+        if '\x1b' in chunk:
+            lines = enumerate(chunk.splitlines())
+        else:
+            lines = string_finder.find_literal_lines(chunk)
+        for index, line in lines:
+            if lines_sum + index < skip:
+                continue
+            if strip_color:
+                line = remove_ansi_codes_from_line(line)
+            yield lines_sum + index + 1, line
+        lines_sum += sum(map(chunk.count, LINE_BREAKS)) - chunk.count('\r\n')
+        lines_sum += chunk[-1] not in LINE_BREAKS
+
+
+def _yield_grep_content(file_index: int):
+    """
+    lazily read the lines of a file, that possibly contain a queried literal.
+    if the file turns out to not be plaintext after some lines have already
+    been yielded, the rest of the file will be searched using the fallback error handling.
+
+    Parameters:
+    file_index (int):
+        the index regarding which file is currently being edited
+
+    Yields:
+    (tuple):
+        the line number and the line like (line_number, line)
+    """
+    line_number = 0
+    try:
+        for line_number, line in _grep_file_lines(file_index):
+            yield line_number, line
+        return
+    except UnicodeError:
+        if not line_number:
+            raise
+    u_files[file_index].set_plaintext(plain=False)
+    if u_args[ARGS_PLAIN_ONLY]:
+        return
+    yield from _grep_file_lines(
+        file_index, 'ignore' if const_dic[DKW.IGNORE_UNKNOWN_BYTES] else 'replace', line_number
+    )
+
+
+def print_grep_content(content, file_index: int = 0) -> None:
+    """
+    print the lines of a file, that possibly contain a queried literal.
+
+    Parameters:
+    content (iterable):
+        the lines of a file like [(line_number, line), ...]
+    file_index (int):
+        the index regarding which file is currently being edited
+    """
+    if u_args[ARGS_NUMBER]:
+        content = ((_get_line_prefix(line_number, file_index+1), line)
+                   for line_number, line in content)
+    else:
+        content = (('', line) for _, line in content)
+    found_queried = print_file(_add_line_prefixes(content, file_index), More())
+    u_files[file_index].set_contains_queried(found_queried)
+
+
+def _needs_line_count() -> bool:
+    """
+    check if the lines of the files will be counted by _count_file_lines(),
+    so that the scan of u_files.generate_values() can count them as well.
+
+    Returns:
+    (bool):
+        indicates if the amount of lines of each file is needed
+    """
+    return bool(
+        _can_peek_file() or
+        (_can_reverse_file() and u_args[ARGS_NUMBER]) or
+        (_can_truncate_file() and any(bound is not None and bound < 0
+                                      for bound in arg_parser.file_truncate[:2]))
+    )
+
+
+def _count_file_lines(file_index: int) -> int:
+    """
+    count the lines of a file like IoHelper.count_lines(). the result of
+    the scan of u_files.generate_values() is being reused, if available.
+
+    Parameters:
+    file_index (int):
+        the index regarding which file is currently being edited
+
+    Returns:
+    (int):
+        the amount of lines in the file
+    """
+    line_count = u_files.get_line_count(u_files[file_index].path)
+    if line_count >= 0:
+        return line_count
+    return IoHelper.count_lines(u_files[file_index].path, arg_parser.file_encoding)
+
+
+def _check_plaintext(file_index: int) -> None:
+    """
+    decode a whole file strictly, without keeping its content, so that a file
+    which is not plaintext can be skipped before any of its lines is printed.
+
+    Parameters:
+    file_index (int):
+        the index regarding which file is currently being edited
+
+    Raises:
+    (UnicodeError):
+        if the file cannot be decoded
+    """
+    for _ in IoHelper.yield_file_chunks(u_files[file_index].path, arg_parser.file_encoding):
+        pass
+
+
+def _peek_file_content(file_index: int, errors: str = 'strict') -> tuple:
+    """
+    read only the first and the last peek_size lines of a file.
+    the lines in between are only counted.
+
+    Parameters:
+    file_index (int):
+        the index regarding which file is currently being edited
+    errors (str):
+        the type of error handling when decoding the file
+
+    Returns:
+    (tuple):
+        the content of the file like [('', line), ...] and the amount of lines
+        that have been excluded
+    """
+    peek_size = const_dic[DKW.PEEK_SIZE]
+    file_path = u_files[file_index].path
+    lines_sum = _count_file_lines(file_index)
+    if lines_sum <= 2 * peek_size:
+        return list(_yield_file_lines(file_index, errors)), 0
+    content = list(islice(_yield_file_lines(file_index, errors), peek_size))
+    content+= _to_content(IoHelper.read_last_lines(file_path, peek_size,
+                                                   arg_parser.file_encoding, errors))
+    return content, lines_sum - 2 * peek_size
+
+
+def _yield_file_content(file_index: int, reverse: bool = False, line_range: tuple = None):
+    """
+    lazily read the lines of a file. if the file turns out to not be plaintext
+    after some lines have already been yielded, the rest of the file will be
+    decoded using the fallback error handling.
+
+    Parameters:
+    file_index (int):
+        the index regarding which file is currently being edited
+    reverse (bool):
+        if True the lines will be read from the end of the file in reversed order
+    line_range (tuple):
+        if not None, only the lines within this range will be read
+        (see _get_truncate_range())
+
+    Yields:
+    (tuple):
+        the (still empty) prefix and the next line of the file like ('', line)
+    """
+    yielded = 0
+    try:
+        for line in _yield_file_lines(file_index, reverse=reverse, line_range=line_range):
+            yield line
+            yielded += 1
+        return
+    except UnicodeError:
+        if not yielded:
+            raise
+    # the lines yielded so far have been valid, therefor the decoding of
+    # the file will be identical up to this point, regardless of the error handling
+    u_files[file_index].set_plaintext(plain=False)
+    if u_args[ARGS_PLAIN_ONLY]:
+        return
+    yield from _yield_file_lines(
+        file_index, 'ignore' if const_dic[DKW.IGNORE_UNKNOWN_BYTES] else 'replace', yielded,
+        reverse, line_range
+    )
+
+
 def edit_file(file_index: int = 0) -> None:
     """
     apply all parameters to a file.
@@ -767,23 +1265,36 @@ def edit_file(file_index: int = 0) -> None:
         raw_content = IoHelper.read_file(u_files[file_index].path, True)
         edit_raw_content(raw_content, file_index)
         return
-    content = []
-    file_size = -1 if (
-        u_files[file_index].file_size < const_dic[DKW.LARGE_FILE_SIZE]//len(u_files)
-    ) else u_files[file_index].file_size
+    excluded_by_peek = 0
+    peek_file = _can_peek_file()
+    grep_file = not peek_file and _can_grep_file()
+    reversed_lines_sum = None
+    if _can_reverse_file():
+        reversed_lines_sum = 0
+        if u_args[ARGS_NUMBER]:
+            try:
+                reversed_lines_sum = _count_file_lines(file_index)
+            except OSError:
+                pass
+    reverse_file = reversed_lines_sum is not None
+    line_range = None
     try:
-        file_content = IoHelper.read_file(
-            u_files[file_index].path,
-            file_encoding=arg_parser.file_encoding,
-            file_length=file_size
-        )
-        # splitlines() gives a slight inaccuracy, because
-        # it also splits on other bytes than \r and \n ...
-        # the alternative would be worse: split('\n') would increase the linecount each
-        # time catw touches a file.
-        if not os.isatty(sys.stdout.fileno()) and const_dic[DKW.STRIP_COLOR_ON_PIPE]:
-            file_content = remove_ansi_codes_from_line(file_content)
-        content = [('', line) for line in file_content.splitlines()]
+        if u_args[ARGS_PLAIN_ONLY]:
+            # the lines are streamed, so an undecodable byte at the end of the file
+            # would only be found after the lines in front of it have been printed
+            _check_plaintext(file_index)
+        if not peek_file and not grep_file and _can_truncate_file():
+            line_range = _get_truncate_range(file_index)
+        if peek_file:
+            content, excluded_by_peek = _peek_file_content(file_index)
+        else:
+            content = (_yield_grep_content(file_index) if grep_file else
+                       _yield_file_content(file_index, reverse_file, line_range))
+            # read the first chunk, so that an undecodable or unreadable file
+            # is being recognized before anything has been printed
+            first_line = next(content, None)
+            if first_line is not None:
+                content = chain((first_line,), content)
     except PermissionError:
         err_print(f"Permission denied! Skipping {u_files[file_index].displayname} ...")
         return
@@ -797,26 +1308,32 @@ def edit_file(file_index: int = 0) -> None:
             return
         if display_archive(u_files[file_index].path, _convert_size):
             return
+        errors = 'ignore' if const_dic[DKW.IGNORE_UNKNOWN_BYTES] else 'replace'
         try:
-            file_content = IoHelper.read_file(
-                u_files[file_index].path,
-                file_encoding=arg_parser.file_encoding,
-                errors='ignore' if const_dic[DKW.IGNORE_UNKNOWN_BYTES] else 'replace',
-                file_length=file_size
-            )
-            if not os.isatty(sys.stdout.fileno()) and const_dic[DKW.STRIP_COLOR_ON_PIPE]:
-                file_content = remove_ansi_codes_from_line(file_content)
-            content = [('', line) for line in file_content.splitlines()]
+            if peek_file:
+                content, excluded_by_peek = _peek_file_content(file_index, errors)
+            else:
+                content = (_grep_file_lines(file_index, errors) if grep_file else
+                           _yield_file_lines(file_index, errors, reverse=reverse_file,
+                                             line_range=line_range))
+                first_line = next(content, None)
+                if first_line is not None:
+                    content = chain((first_line,), content)
         except OSError:
             err_print('Operation failed! Try using the enc=X parameter.')
             return
 
-    edit_content(content, file_index)
+    if grep_file:
+        print_grep_content(content, file_index)
+        return
+    edit_content(content, file_index, line_range[1] if line_range is not None else 0,
+                 excluded_by_peek, reversed_lines_sum, line_range is not None)
 
 
 def print_raw_view(file_index: int = 0, mode: str = 'X') -> None:
     """
-    print the raw byte representation of a file in hexadecimal or binary
+    print the raw byte representation of a file in hexadecimal or binary.
+    the bounds of the truncate parameter define the range of bytes to display.
 
     Parameters:
     file_index (int):
@@ -825,29 +1342,151 @@ def print_raw_view(file_index: int = 0, mode: str = 'X') -> None:
         either 'x', 'X' for hexadecimal (lower- or upper case letters),
         or 'b' for binary
     """
-    queue = []
-    skipped = 0
+    peek_size = const_dic[DKW.PEEK_SIZE]
+    colors = [color_dic[CKW.RAWVIEWER], color_dic[CKW.RESET_ALL]]
 
     print(u_files[file_index].displayname, ':', sep='')
-    raw_gen = get_raw_view_lines_gen(u_files[file_index].path, mode,
-                                     [color_dic[CKW.RAWVIEWER], color_dic[CKW.RESET_ALL]],
-                                     arg_parser.file_encoding)
+    start, stop, _ = slice(*arg_parser.file_truncate[:2]).indices(
+        get_file_size(u_files[file_index].path)
+    )
+    # without any bounds the file is displayed until EOF (even if the size is unknown)
+    length = -1 if arg_parser.file_truncate[:2] == [None, None] else max(stop - start, 0)
+    raw_gen = get_raw_view_lines_gen(u_files[file_index].path, mode, colors,
+                                     arg_parser.file_encoding, start, length)
     print(next(raw_gen)) # the header will always be available
-    for line in raw_gen:
-        skipped += 1
-        if u_args[ARGS_PEEK] and skipped > const_dic[DKW.PEEK_SIZE]:
-            queue.append(line)
-            if len(queue) > const_dic[DKW.PEEK_SIZE]:
-                queue = queue[1:]
-            continue
-        print(line)
-    if queue:
-        if skipped > (2*const_dic[DKW.PEEK_SIZE]):
-            _print_excluded_by_peek(21, skipped-2*const_dic[DKW.PEEK_SIZE])
-        print('\n'.join(queue))
+    # the rows stay aligned to the file
+    rows_sum = -(-(start % 16 + max(stop - start, 0)) // 16)
+    if not u_args[ARGS_PEEK] or rows_sum <= 2*peek_size:
+        with OutputSink() as sink:
+            for line in raw_gen:
+                sink.write_line(line)
+        print()
+        return
+    with OutputSink() as sink:
+        for line in islice(raw_gen, peek_size):
+            sink.write_line(line)
+    raw_gen.close()
+    _print_excluded_by_peek(21, rows_sum-2*peek_size)
+    # seek directly to the last rows
+    tail_start = start - start % 16 + (rows_sum-peek_size)*16
+    raw_gen = get_raw_view_lines_gen(u_files[file_index].path, mode, colors,
+                                     arg_parser.file_encoding, tail_start,
+                                     stop-tail_start if length >= 0 else -1)
+    next(raw_gen) # skip the header
+    with OutputSink() as sink:
+        for line in raw_gen:
+            sink.write_line(line)
     print()
 
 
+def _can_edit_files_parallel() -> bool:
+    """
+    check if the files can be edited by multiple worker processes.
+    this is only possible if editing a file does not interact with the user
+    or write anything else than text to the stdout and stderr.
+
+    Returns:
+    (bool):
+        indicates if _edit_files_parallel() can be used
+    """
+    return bool(
+        const_dic[DKW.FILE_WORKERS] > 1 and
+        len(u_files) > 1 and
+        not any(u_args[arg] for arg in [ARGS_RAW, ARGS_MORE, ARGS_CLIP]) and
+        # displaying found keywords waits for the user input
+        not (arg_parser.file_queries and arg_parser.file_queries_replacement is None and
+             not any(u_args[arg] for arg in [ARGS_GREP, ARGS_GREP_ONLY,
+                                              ARGS_NOKEYWORD, ARGS_NOBREAK]))
+    )
+
+
+def _init_file_worker(state: tuple) -> None:
+    """
+    initialize the global variables of a worker process.
+
+    Parameters:
+    state (tuple):
+        the global variables of the main process
+    """
+    global default_color_dic, color_dic, const_dic
+    global arg_parser, converter, u_files, u_args
+    default_color_dic, color_dic, const_dic, arg_parser, converter, u_files, u_args = state
+
+
+def _edit_file_worker(file_index: int, raw_view_mode: str = None) -> tuple:
+    """
+    edit a single file within a worker process.
+
+    Parameters:
+    file_index (int):
+        the index regarding which file is currently being edited
+    raw_view_mode (str):
+        the mode of the raw view, or None if the file should be edited
+
+    Returns:
+    (tuple):
+        the output to the stdout and the stderr and the
+        contains_queried and plaintext attributes of the file
+    """
+    stdout, stderr = OutputCapture(sys.stdout), OutputCapture(sys.stderr)
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        if raw_view_mode is None:
+            edit_file(file_index)
+        else:
+            print_raw_view(file_index, raw_view_mode)
+    file = u_files[file_index]
+    return stdout.getvalue(), stderr.getvalue(), file.contains_queried, file.plaintext
+
+
+def _edit_files_parallel(file_indices: range, raw_view_mode: str = None) -> None:
+    """
+    edit the files using a pool of worker processes.
+    the output of each file is being written in the original order.
+    a worker holds the output of a file in memory as a whole, therefor
+    large files are being edited by the main process, which streams their output.
+
+    Parameters:
+    file_indices (range):
+        the indices of the files to edit in the order of the output
+    raw_view_mode (str):
+        the mode of the raw view, or None if the files should be edited
+    """
+    def write_result(file_index: int, future) -> None:
+        stdout, stderr, contains_queried, plaintext = future.result()
+        if stderr:
+            sys.stderr.write(stderr)
+            sys.stderr.flush()
+        sys.stdout.write(stdout)
+        u_files[file_index].set_contains_queried(contains_queried)
+        u_files[file_index].set_plaintext(plaintext)
+
+    workers = min(const_dic[DKW.FILE_WORKERS], len(file_indices))
+    max_file_size = const_dic[DKW.LARGE_FILE_SIZE] // (2 * workers)
+    state = (default_color_dic, color_dic, const_dic, arg_parser, converter, u_files, u_args)
+    with ProcessPoolExecutor(workers, initializer=_init_file_worker,
+                             initargs=(state,)) as executor:
+        # only a limited amount of files is being edited ahead of the output,
+        # so that the finished (not yet written) files stay bounded in memory
+        pending = deque()
+        for file_index in file_indices:
+            if u_files[file_index].file_size >= max_file_size:
+                while pending:
+                    write_result(*pending.popleft())
+                sys.stdout.flush()
+                if raw_view_mode is None:
+                    edit_file(file_index)
+                else:
+                    print_raw_view(file_index, raw_view_mode)
+                continue
+            pending.append((file_index,
+                            executor.submit(_edit_file_worker, file_index, raw_view_mode)))
+            if len(pending) >= 2 * workers:
+                write_result(*pending.popleft())
+        while pending:
+            write_result(*pending.popleft())
+    sys.stdout.flush()
+
+
 def edit_files() -> None:
     """
     manage the calls to edit_file() for each file.
@@ -862,11 +1501,15 @@ def edit_files() -> None:
             'X' if raw_view_mode[1].isupper() else 'x'
         )
 
-    for i in range(start, end, -1 if u_args[ARGS_REVERSE] else 1):
-        if raw_view_mode is None:
-            edit_file(i)
-        else:
-            print_raw_view(i, raw_view_mode)
+    file_indices = range(start, end, -1 if u_args[ARGS_REVERSE] else 1)
+    if _can_edit_files_parallel():
+        _edit_files_parallel(file_indices, raw_view_mode)
+    else:
+        for i in file_indices:
+            if raw_view_mode is None:
+                edit_file(i)
+            else:
+                print_raw_view(i, raw_view_mode)
     if u_args[ARGS_FILES] or u_args[ARGS_DIRECTORIES]:
         print()
         if u_args[ARGS_FILES]:
@@ -1033,10 +1676,17 @@ def init(repl: bool = False) -> tuple:
                      const_dic[DKW.UNICODE_ESCAPED_EDITOR_SEARCH],
                      const_dic[DKW.UNICODE_ESCAPED_EDITOR_REPLACE],
                      arg_parser.file_encoding)
+    FileLines.set_flags(const_dic[DKW.EDITOR_CACHE_SIZE])
+    LongLine.set_flags(const_dic[DKW.EDITOR_LONG_LINE_LENGTH])
+    History.set_flags(const_dic[DKW.EDITOR_HISTORY_SIZE])
     HexEditor.set_flags(u_args[ARGS_STDIN] and on_windows_os, u_args[ARGS_DEBUG],
                         const_dic[DKW.UNICODE_ESCAPED_EDITOR_SEARCH],
                         const_dic[DKW.HEX_EDITOR_COLUMNS])
+    PageCache.set_flags(const_dic[DKW.HEX_EDITOR_CACHE_SIZE])
+    HexSearch.set_flags(const_dic[DKW.HEX_EDITOR_SEARCH_MATCHES])
     More.set_flags(const_dic[DKW.MORE_STEP_LENGTH])
+    LineIndex.set_flags(os.path.join(get_cache_dir(), 'lineindex'),
+                        const_dic[DKW.LINE_INDEX_CACHE_SIZE])
     Visualizer.set_flags(u_args[ARGS_DEBUG])
     Summary.set_flags(const_dic[DKW.SUMMARY_UNIQUE_ELEMENTS])
     Summary.set_colors(color_dic[CKW.SUMMARY], color_dic[CKW.RESET_ALL])
@@ -1172,7 +1822,9 @@ def handle_args(tmp_file_helper: TmpFileHelper) -> None:
         decode_files_base64(tmp_file_helper)
     u_files.generate_values(
         u_args[ARGS_SUM] or u_args[ARGS_SSUM] or u_args[ARGS_NUMBER],
-        u_args[ARGS_LLENGTH]
+        u_args[ARGS_LLENGTH],
+        arg_parser.file_encoding,
+        _needs_line_count()
     )
 
     if u_args[ARGS_SSUM]:
@@ -1205,8 +1857,6 @@ def cleanup(tmp_file_helper: TmpFileHelper) -> None:
             remove_ansi_codes_from_line,
             _calculate_line_prefix_spacing,
             _calculate_line_length_prefix_spacing,
-            u_files._get_file_lines_sum_,
-            u_files._calc_max_line_length_,
             Visualizer.get_color_byte_view,
             Visualizer.get_color_entropy,
         ]
@@ -1383,4 +2033,5 @@ def repl_main():
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     main()
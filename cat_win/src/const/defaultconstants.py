@@ -10,6 +10,8 @@ class DKW:
     DEFAULT_COMMAND_LINE = 'default_command_line'
     DEFAULT_FILE_ENCODING = 'default_file_encoding'
     LARGE_FILE_SIZE = 'large_file_size'
+    FILE_WORKERS = 'file_workers'
+    LINE_INDEX_CACHE_SIZE = 'line_index_cache_size'
     STRIP_COLOR_ON_PIPE = 'strip_color_on_pipe'
     IGNORE_UNKNOWN_BYTES = 'ignore_unknown_bytes'
     END_MARKER_SYMBOL = 'end_marker_symbol'
@@ -20,7 +22,12 @@ class DKW:
     STRINGS_DELIMETER = 'strings_delimeter'
     EDITOR_INDENTATION = 'editor_indentation'
     EDITOR_AUTO_INDENT = 'editor_auto_indent'
+    EDITOR_CACHE_SIZE = 'editor_cache_size'
+    EDITOR_LONG_LINE_LENGTH = 'editor_long_line_length'
+    EDITOR_HISTORY_SIZE = 'editor_history_size'
     HEX_EDITOR_COLUMNS = 'hex_editor_columns'
+    HEX_EDITOR_CACHE_SIZE = 'hex_editor_cache_size'
+    HEX_EDITOR_SEARCH_MATCHES = 'hex_editor_search_matches'
     MORE_STEP_LENGTH = 'more_step_length'
     UNICODE_ESCAPED_ECHO = 'unicode_escaped_echo'
     UNICODE_ESCAPED_EDITOR_SEARCH = 'unicode_escaped_editor_search'
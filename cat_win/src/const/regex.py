@@ -25,12 +25,16 @@ RE_Q_FIND        = re.compile(r"\Afind[\=\:].*\Z",    re.IGNORECASE)
 RE_F_IND         = re.compile(r"\Af[\=\:].*\Z",       re.IGNORECASE)
 RE_Q_REPLACE     = re.compile(r"\Areplace[\=\:].*\Z", re.IGNORECASE)
 RE_R_EPLACE      = re.compile(r"\Ar[\=\:].*\Z",       re.IGNORECASE)
-RE_Q_TRUNC       = re.compile(r"\Atrunc[\=\:][0-9\(\)\+\-\*\/]*"
-                              r"\:[0-9\(\)\+\-\*\/]*\:?"
-                              r"[0-9\(\)\+\-\*\/]*\Z",re.IGNORECASE)
-RE_T_RUNC       = re.compile(r"\At[\=\:][0-9\(\)\+\-\*\/]*"
-                              r"\:[0-9\(\)\+\-\*\/]*\:?"
-                              r"[0-9\(\)\+\-\*\/]*\Z",re.IGNORECASE)
+# (the bounds may also contain hex-, octal- or binary-numbers, e.g. for the --hexview,
+# but no other letters, as the bounds are being evaluated)
+_TRUNC_BOUND     = r"(?:0x[0-9a-f]+(?![0-9a-f])|0o[0-7]+(?![0-9])|0b[01]+(?![0-9])|" \
+                   r"[0-9\(\)\+\-\*\/])*"
+RE_Q_TRUNC       = re.compile(r"\Atrunc[\=\:]" + _TRUNC_BOUND +
+                              r"\:" + _TRUNC_BOUND + r"\:?" +
+                              _TRUNC_BOUND + r"\Z",re.IGNORECASE)
+RE_T_RUNC       = re.compile(r"\At[\=\:]" + _TRUNC_BOUND +
+                              r"\:" + _TRUNC_BOUND + r"\:?" +
+                              _TRUNC_BOUND + r"\Z",re.IGNORECASE)
 RE_CUT           = re.compile(r"\A\[[0-9\(\)\+\-\*\/]*\:"
                               r"[0-9\(\)\+\-\*\/]*\:?"
                               r"[0-9\(\)\+\-\*\/]*\]\Z")
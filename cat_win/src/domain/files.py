@@ -2,9 +2,7 @@
 files
 """
 
-from functools import lru_cache
 from pathlib import Path
-import heapq
 
 from cat_win.src.domain.file import File
 from cat_win.src.service.helper.iohelper import IoHelper
@@ -32,6 +30,10 @@ class Files:
         # the amount of chars neccessary to display the longest line within all files
         # (breaks on base64 decoding)
         self.file_line_length_place_holder = 0
+        # the statistics of each scanned file (see IoHelper.scan_file())
+        self.file_stats = {}
+        # the results of self._scan_file_() for each file and collected statistics
+        self.file_scans = {}
 
     def get_file_display_name(self, file: Path) -> str:
         """
@@ -115,40 +117,97 @@ class Files:
     def _calc_file_number_place_holder_(self) -> None:
         self.file_number_place_holder = len(str(len(self.files)))
 
-    def _count_generator_(self, reader):
+    def _scan_file_(self, file: Path, file_encoding: str = 'utf-8',
+                    longest_line: bool = True, line_count: bool = True) -> tuple:
         """
+        collect the statistics of a file within a single pass.
+
+        Parameters:
+        file (Path):
+            a string representation of a file (-path)
+        file_encoding (str):
+            the encoding of the file
+        longest_line (bool):
+            indicates if the length of the longest line should be collected
+        line_count (bool):
+            indicates if the amount of lines should be collected
+
+        Returns:
+        (tuple):
+            the result of IoHelper.scan_file(), like
+            (lines_sum, max_line_length, line_count).
+            (0, -1, -1) if the file could not be read
+        """
+        key = (file, file_encoding, longest_line, line_count)
+        if key not in self.file_scans:
+            try:
+                self.file_scans[key] = IoHelper.scan_file(file, file_encoding,
+                                                          longest_line=longest_line,
+                                                          line_count=line_count)
+            except OSError:
+                self.file_scans[key] = (0, -1, -1)
+        return self.file_scans[key]
+
+    def _scan_files_(self, file_encoding: str = 'utf-8', longest_line: bool = True,
+                     line_count: bool = True) -> dict:
+        """
+        scan all (unique) files.
+        the results are being stored in self.file_stats.
+
         Parameters:
-        reader (method):
-            the method to read from
+        file_encoding (str):
+            the encoding of the files
+        longest_line (bool):
+            indicates if the length of the longest line should be collected
+        line_count (bool):
+            indicates if the amount of lines should be collected
 
-        Yields:
-        byt (bytes):
-            the bytes in chunks read from the reader
+        Returns:
+        (dict):
+            containing the results of self._scan_file_() for each file path
+        """
+        paths = list(dict.fromkeys(file.path for file in self.files))
+        # the threads of a pool would not scan the files any faster, as the
+        # scanning (e.g. splitting the lines) holds the GIL most of the time
+        scans = [self._scan_file_(path, file_encoding, longest_line, line_count)
+                 for path in paths]
+        self.file_stats = dict(zip(paths, scans))
+        return self.file_stats
+
+    def get_line_count(self, file: Path) -> int:
         """
-        byt = reader(1024 * 1024)
-        while byt:
-            yield byt
-            byt = reader(1024 * 1024)
+        get the amount of lines of a file like IoHelper.count_lines(),
+        if the file has already been scanned.
+
+        Parameters:
+        file (Path):
+            a string representation of a file (-path)
+
+        Returns:
+        (int):
+            the amount of lines, or -1 if it is unknown
+        """
+        return self.file_stats.get(file, (0, -1, -1))[2]
 
-    @lru_cache(maxsize=10)
     def _get_file_lines_sum_(self, file: Path) -> int:
-        try:
-            with open(file, 'rb') as raw_f:
-                c_generator = self._count_generator_(raw_f.raw.read)
-                lines_sum = sum(buffer.count(b'\n') for buffer in c_generator) + 1
-            return lines_sum
-        except OSError:
-            return 0
-
-    def _calc_place_holder_(self) -> None:
+        return self._scan_file_(file, longest_line=False, line_count=False)[0]
+
+    def _calc_place_holder_(self, scans: dict = None) -> None:
+        """
+        calculate self.all_files_lines and self.all_line_number_place_holder.
+
+        Parameters:
+        scans (dict):
+            the (optional) precomputed results of self._scan_files_()
+        """
+        scans = scans if scans is not None else self._scan_files_()
         file_lines = []
         for file in self.files:
-            file_line_sum = self._get_file_lines_sum_(file.path)
+            file_line_sum = scans[file.path][0]
             file_lines.append(file_line_sum)
             self.all_files_lines[str(file.path)] = file_line_sum
         self.all_line_number_place_holder = len(str(max(file_lines)))
 
-    @lru_cache(maxsize=10)
     def _calc_max_line_length_(self, file: Path) -> int:
         """
         Calculate self.file_line_length_place_holder for a single file.
@@ -162,20 +221,25 @@ class Files:
             the length of the placeholder to represent
             the longest line within the file
         """
-        try:
-            lines = IoHelper.read_file(file, True).splitlines()
-        except OSError:
-            return 0
-        heap = heapq.nlargest(1, lines, len)
-        if not heap:
-            return 0
-        return len(str(len(heap[0])))
+        max_line_length = self._scan_file_(file, line_count=False)[1]
+        return len(str(max_line_length)) if max_line_length >= 0 else 0
 
-    def _calc_file_line_length_place_holder_(self) -> None:
-        self.file_line_length_place_holder = max(self._calc_max_line_length_(file.path)
-                                             for file in self.files)
+    def _calc_file_line_length_place_holder_(self, scans: dict = None) -> None:
+        """
+        calculate self.file_line_length_place_holder.
 
-    def generate_values(self, calc_l_: bool, calc_ll_: bool) -> None:
+        Parameters:
+        scans (dict):
+            the (optional) precomputed results of self._scan_files_()
+        """
+        scans = scans if scans is not None else self._scan_files_()
+        self.file_line_length_place_holder = max(
+            len(str(scans[file.path][1])) if scans[file.path][1] >= 0 else 0
+            for file in self.files
+        )
+
+    def generate_values(self, calc_l_: bool, calc_ll_: bool,
+                        file_encoding: str = 'utf-8', calc_lc_: bool = False) -> None:
         """
         generate the metadata for all files
 
@@ -184,12 +248,21 @@ class Files:
             calculate the place holders
         calc_ll_ (bool):
             calculate the file line length place holder
+        file_encoding (str):
+            the encoding of the files
+        calc_lc_ (bool):
+            count the lines of the files for get_line_count(), if they are scanned anyway
         """
         self._calc_file_number_place_holder_()
+        if not (calc_l_ or calc_ll_):
+            return
+        # all needed statistics are being collected within the same pass over each file,
+        # so that later stages can reuse them instead of reading the files again
+        scans = self._scan_files_(file_encoding, calc_ll_, calc_lc_)
         if calc_l_:
-            self._calc_place_holder_()
+            self._calc_place_holder_(scans)
         if calc_ll_:
-            self._calc_file_line_length_place_holder_()
+            self._calc_file_line_length_place_holder_(scans)
 
     def __getitem__(self, o: int) -> str:
         return self.files[o]
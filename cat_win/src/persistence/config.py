@@ -61,6 +61,8 @@ class Config:
         DKW.DEFAULT_COMMAND_LINE: '',
         DKW.DEFAULT_FILE_ENCODING: 'utf-8',
         DKW.LARGE_FILE_SIZE: 1024 * 1024 * 100,  # 100 Megabytes
+        DKW.FILE_WORKERS: 1,
+        DKW.LINE_INDEX_CACHE_SIZE: 1024 * 1024 * 64,  # 64 Megabytes
         DKW.STRIP_COLOR_ON_PIPE: True,
         DKW.IGNORE_UNKNOWN_BYTES: False,
         DKW.END_MARKER_SYMBOL: '$',
@@ -71,7 +73,12 @@ class Config:
         DKW.STRINGS_DELIMETER: '\n',
         DKW.EDITOR_INDENTATION: '\t',
         DKW.EDITOR_AUTO_INDENT: False,
+        DKW.EDITOR_CACHE_SIZE: 1024 * 1024 * 64,  # 64 Megabytes
+        DKW.EDITOR_LONG_LINE_LENGTH: 1024 * 64,
+        DKW.EDITOR_HISTORY_SIZE: 1024 * 1024 * 16,  # 16 Megabytes
         DKW.HEX_EDITOR_COLUMNS: 16,
+        DKW.HEX_EDITOR_CACHE_SIZE: 1024 * 1024 * 64,  # 64 Megabytes
+        DKW.HEX_EDITOR_SEARCH_MATCHES: 1024 * 1024 * 4,
         DKW.MORE_STEP_LENGTH: 0,
         DKW.UNICODE_ESCAPED_ECHO: True,
         DKW.UNICODE_ESCAPED_EDITOR_SEARCH: True,
@@ -84,6 +91,8 @@ class Config:
         DKW.DEFAULT_COMMAND_LINE: validator_string,
         DKW.DEFAULT_FILE_ENCODING: validator_encoding,
         DKW.LARGE_FILE_SIZE: validator_int,
+        DKW.FILE_WORKERS: validator_int_pos,
+        DKW.LINE_INDEX_CACHE_SIZE: validator_int,
         DKW.STRIP_COLOR_ON_PIPE: validator_bool,
         DKW.IGNORE_UNKNOWN_BYTES: validator_bool,
         DKW.END_MARKER_SYMBOL: validator_string,
@@ -94,7 +103,12 @@ class Config:
         DKW.STRINGS_DELIMETER: validator_string,
         DKW.EDITOR_INDENTATION: validator_string,
         DKW.EDITOR_AUTO_INDENT: validator_bool,
+        DKW.EDITOR_CACHE_SIZE: validator_int_pos,
+        DKW.EDITOR_LONG_LINE_LENGTH: validator_int_pos,
+        DKW.EDITOR_HISTORY_SIZE: validator_int_pos,
         DKW.HEX_EDITOR_COLUMNS: validator_int_pos,
+        DKW.HEX_EDITOR_CACHE_SIZE: validator_int_pos,
+        DKW.HEX_EDITOR_SEARCH_MATCHES: validator_int_pos,
         DKW.MORE_STEP_LENGTH: validator_int,
         DKW.UNICODE_ESCAPED_ECHO: validator_bool,
         DKW.UNICODE_ESCAPED_EDITOR_SEARCH: validator_bool,
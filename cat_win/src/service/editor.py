@@ -2,6 +2,8 @@
 editor
 """
 
+from collections import OrderedDict
+from itertools import islice
 from pathlib import Path
 try:
     import curses
@@ -16,15 +18,27 @@ import unicodedata
 
 from cat_win.src.const.escapecodes import ESC_CODE
 from cat_win.src.const.regex import compile_re
+from cat_win.src.service.helper.editorsavehelper import EditorSave
 from cat_win.src.service.helper.editorsearchhelper import _SearchIterBase, search_iter_factory
 from cat_win.src.service.helper.editorhelper import History, Position, frepr, \
     UNIFY_HOTKEYS, KEY_HOTKEYS, ACTION_HOTKEYS, SCROLL_HOTKEYS, MOVE_HOTKEYS, \
         SELECT_HOTKEYS, HISTORY_HOTKEYS, INDENT_HOTKEYS, FUNCTION_HOTKEYS, HEX_BYTE_KEYS
 from cat_win.src.service.helper.environment import on_windows_os
-from cat_win.src.service.helper.iohelper import IoHelper, err_print
+from cat_win.src.service.helper.filelines import FileLines
+from cat_win.src.service.helper.iohelper import IoHelper, err_print, encoded_line_breaks
+from cat_win.src.service.helper.lineindex import LineIndex, LineIndexer
+from cat_win.src.service.helper.longline import LongLine, replace_range, rstrip_length
+from cat_win.src.service.helper.textbuffer import TextBuffer
 from cat_win.src.service.clipboard import Clipboard
 from cat_win.src.service.rawviewer import SPECIAL_CHARS
 
+# the kind of a displayed character, that is too wide to be displayed
+# (drawn with the color of special characters, even when selected)
+KIND_WIDE = 8
+# the runs of characters of the same kind within a row
+KIND_RUNS = re.compile(rb'(.)\1*', re.DOTALL)
+# the kinds of the characters within the selected area
+SELECTED_KINDS = bytes(KIND_WIDE if kind == KIND_WIDE else 5 for kind in range(256))
 
 class Editor:
     """
@@ -41,6 +55,9 @@ class Editor:
     unicode_escaped_replace = True
     file_encoding = 'utf-8'
 
+    # the amount of lines, whose displayed characters are cached
+    line_cache_lines = 1024
+
     def __init__(self, file: Path, display_name: str) -> None:
         """
         defines an Editor object.
@@ -59,15 +76,25 @@ class Editor:
         self.display_name = display_name
         self._f_content_gen = None
         self.line_sep = '\n'
-        self.window_content = []
+        self.window_content = TextBuffer()
+        # the save running in the background
+        self.editor_save = None
+        # the index of a large file being built in the background
+        self.line_indexer = None
 
         self.special_chars: dict = {}
+        # the displayed characters of the most recently drawn lines
+        self._line_cache = OrderedDict()
+        # what has been drawn on every row of the screen (None if it has to be redrawn)
+        self._drawn_rows = []
         self.search  = '' # str | re.Pattern
         self.replace = ''
         self.search_items: dict = {}
 
         self.status_bar_size = 1
         self.error_bar = ''
+        # a message shown in the status bar until the next key is pressed
+        self.status_msg = ''
         self.unsaved_progress = False
         self.changes_made = False
         self.scrolling = False
@@ -96,7 +123,7 @@ class Editor:
         if not self.selecting:
             sel_from_y, sel_from_x = self.cpos.get_pos()
             sel_to_y, sel_to_x = sel_from_y, sel_from_x+1
-        content_window = self.window_content[sel_from_y:sel_to_y+1]
+        content_window = list(map(str, self.window_content[sel_from_y:sel_to_y+1]))
         content_window[-1] = content_window[-1][:sel_to_x]
         content_window[0] = content_window[0][sel_from_x:]
         return content_window
@@ -108,28 +135,87 @@ class Editor:
         return self.special_chars.get(char, '?')
 
     def _build_file(self) -> None:
-        for line in self._f_content_gen:
-            self.window_content.append(line)
+        # all lines of a large file are read using its index instead
+        self._attach_index(True)
+        if self._f_content_gen is None:
+            return
+        self.window_content.load(self._f_content_gen)
 
     def _build_file_upto(self, to_row: int = None) -> None:
+        if self._f_content_gen is None:
+            return
         if to_row is None:
             to_row = self.getxymax()[0]+max(self.cpos.row, self.wpos.row)+1
         if len(self.window_content) >= to_row:
             return
-        for line in self._f_content_gen:
-            self.window_content.append(line)
-            if len(self.window_content) >= to_row:
-                break
+        self.window_content.load(islice(self._f_content_gen, to_row-len(self.window_content)))
+
+    def _load_content(self) -> None:
+        """
+        open the content of the given file. large files are read in blocks
+        of lines on demand (and re-read when needed again), so only the
+        viewed and the edited lines are kept in memory. other files are read
+        forward as far as needed. a large file, that has not been indexed yet,
+        is read forward as well, until its index has been built in the background.
+        """
+        # a running save replaces the file
+        self._finish_save(True)
+        self._stop_indexer()
+        self.window_content.close()
+        self.window_content = TextBuffer()
+        self._f_content_gen = None
+        index = None
+        if encoded_line_breaks(self.file_encoding):
+            index = LineIndex.get(self.file, build=False)
+        if index is None and encoded_line_breaks(self.file_encoding):
+            try:
+                if os.path.getsize(self.file) >= LineIndex.min_file_size:
+                    self.line_indexer = LineIndexer(self.file)
+            except OSError:
+                pass
+        if index is None:
+            self._f_content_gen = IoHelper.yield_file(self.file, False, self.file_encoding)
+            self._build_file_upto(30)
+            return
+        file_lines = FileLines(self.file, index, self.file_encoding)
+        # decode the first lines at once to detect encoding errors (e.g. of binary files)
+        file_lines.get_block(0)
+        self.window_content = TextBuffer(source=file_lines)
+
+    def _attach_index(self, wait: bool = False) -> None:
+        """
+        read the lines of a large file using its index, once it has been
+        built in the background. the lines read so far are referenced within
+        the file from then on.
+
+        Parameters:
+        wait (bool):
+            indicates if the index should be awaited, instead of only
+            attaching an already built index
+        """
+        line_indexer = self.line_indexer
+        if line_indexer is None or not (wait or line_indexer.done):
+            return
+        line_indexer.join()
+        self.line_indexer = None
+        if line_indexer.index is None or self._f_content_gen is None:
+            return
+        self.window_content.attach(FileLines(self.file, line_indexer.index, self.file_encoding))
+        self._f_content_gen.close()
+        self._f_content_gen = None
+
+    def _stop_indexer(self) -> None:
+        if self.line_indexer is not None:
+            self.line_indexer.stop()
+            self.line_indexer = None
 
     def _setup_file(self) -> None:
         """
         setup the editor content screen by reading the given file.
         """
-        self.window_content = []
         try:
             self.line_sep = IoHelper.get_newline(self.file)
-            self._f_content_gen = IoHelper.yield_file(self.file, False, self.file_encoding)
-            self._build_file_upto(30)
+            self._load_content()
             self.unsaved_progress = False
             self.error_bar = ''
             self.status_bar_size = 1
@@ -160,28 +246,35 @@ class Editor:
             self.error_bar = 'An error occured pasting the clipboard!'
         return clipboard
 
+    def _join_lines(self, row: int) -> None:
+        """
+        append the line following a row to the row.
+        """
+        self.window_content.replace_lines(
+            row, 2, [self.window_content[row] + self.window_content[row+1]]
+        )
+
     def _key_enter(self, _) -> str:
-        new_line = self.window_content[self.cpos.row][self.cpos.col:]
-        self.window_content[self.cpos.row] = self.window_content[self.cpos.row][:self.cpos.col]
+        line = self.window_content[self.cpos.row]
+        self.window_content.replace_lines(
+            self.cpos.row, 1, [line[:self.cpos.col], line[self.cpos.col:]]
+        )
         self.cpos.row += 1
         self.cpos.col = 0
-        self.window_content.insert(self.cpos.row, new_line)
         self.unsaved_progress = True
         return ''
 
     def _key_dc(self, _) -> str:
         if self.selecting:
             return None
-        if self.cpos.col < len(self.window_content[self.cpos.row]):
-            deleted = self.window_content[self.cpos.row][self.cpos.col]
-            self.window_content[self.cpos.row] = \
-                self.window_content[self.cpos.row][:self.cpos.col] + \
-                self.window_content[self.cpos.row][self.cpos.col+1:]
+        line = self.window_content[self.cpos.row]
+        if self.cpos.col < len(line):
+            deleted = line[self.cpos.col]
+            self.window_content[self.cpos.row] = replace_range(line, self.cpos.col, 1, '')
             self.unsaved_progress = True
             return deleted
         if self.cpos.row < len(self.window_content)-1:
-            self.window_content[self.cpos.row] += self.window_content[self.cpos.row+1]
-            del self.window_content[self.cpos.row+1]
+            self._join_lines(self.cpos.row)
             self.unsaved_progress = True
             self.deleted_line = True
             return ''
@@ -190,22 +283,19 @@ class Editor:
     def _key_dl(self, _) -> str:
         if self.selecting:
             return None
-        if self.cpos.col < len(self.window_content[self.cpos.row]):
+        line = self.window_content[self.cpos.row]
+        if self.cpos.col < len(line):
             cur_col = self.cpos.col
-            t_p = self.window_content[self.cpos.row][cur_col].isalnum()
-            while cur_col < len(self.window_content[self.cpos.row]) and \
-                t_p == self.window_content[self.cpos.row][cur_col].isalnum():
+            t_p = line[cur_col].isalnum()
+            while cur_col < len(line) and t_p == line[cur_col].isalnum():
                 cur_col += 1
-            deleted = self.window_content[self.cpos.row][self.cpos.col:cur_col]
-            self.window_content[self.cpos.row] = (
-                self.window_content[self.cpos.row][:self.cpos.col] + \
-                self.window_content[self.cpos.row][cur_col:]
-            )
+            deleted = line[self.cpos.col:cur_col]
+            self.window_content[self.cpos.row] = \
+                replace_range(line, self.cpos.col, cur_col-self.cpos.col, '')
             self.unsaved_progress = True
             return deleted
         if self.cpos.row < len(self.window_content)-1:
-            self.window_content[self.cpos.row] += self.window_content[self.cpos.row+1]
-            del self.window_content[self.cpos.row+1]
+            self._join_lines(self.cpos.row)
             self.unsaved_progress = True
             self.deleted_line = True
             return ''
@@ -219,18 +309,15 @@ class Editor:
         wchar_l = len(wchars) if isinstance(wchars, str) else 1
         if self.cpos.col: # delete char
             self.cpos.col -= wchar_l
-            deleted = self.window_content[self.cpos.row][self.cpos.col:self.cpos.col+wchar_l]
-            self.window_content[self.cpos.row] = \
-                self.window_content[self.cpos.row][:self.cpos.col] + \
-                self.window_content[self.cpos.row][self.cpos.col+wchar_l:]
+            line = self.window_content[self.cpos.row]
+            deleted = line[self.cpos.col:self.cpos.col+wchar_l]
+            self.window_content[self.cpos.row] = replace_range(line, self.cpos.col, wchar_l, '')
             self.unsaved_progress = True
             return deleted
         if self.cpos.row: # or delete line
-            line = self.window_content[self.cpos.row]
-            del self.window_content[self.cpos.row]
             self.cpos.row -= 1
             self.cpos.col = len(self.window_content[self.cpos.row])
-            self.window_content[self.cpos.row] += line
+            self._join_lines(self.cpos.row)
             self.unsaved_progress = True
             self.deleted_line = True
             return wchars
@@ -242,22 +329,19 @@ class Editor:
         if self.cpos.col:
             old_col = self.cpos.col
             self.cpos.col -= 1
-            t_p = self.window_content[self.cpos.row][self.cpos.col].isalnum()
-            while self.cpos.col > 0 and \
-                t_p == self.window_content[self.cpos.row][self.cpos.col-1].isalnum():
+            line = self.window_content[self.cpos.row]
+            t_p = line[self.cpos.col].isalnum()
+            while self.cpos.col > 0 and t_p == line[self.cpos.col-1].isalnum():
                 self.cpos.col -= 1
-            deleted = self.window_content[self.cpos.row][self.cpos.col:old_col]
+            deleted = line[self.cpos.col:old_col]
             self.window_content[self.cpos.row] = \
-                self.window_content[self.cpos.row][:self.cpos.col] + \
-                self.window_content[self.cpos.row][old_col:]
+                replace_range(line, self.cpos.col, old_col-self.cpos.col, '')
             self.unsaved_progress = True
             return deleted
         if self.cpos.row: # or delete line
-            line = self.window_content[self.cpos.row]
-            del self.window_content[self.cpos.row]
             self.cpos.row -= 1
             self.cpos.col = len(self.window_content[self.cpos.row])
-            self.window_content[self.cpos.row] += line
+            self._join_lines(self.cpos.row)
             self.unsaved_progress = True
             self.deleted_line = True
             return ''
@@ -300,9 +384,9 @@ class Editor:
             self.cpos.col = 0
         elif self.cpos.col > 1:
             self.cpos.col -= 2
-            t_p = self.window_content[self.cpos.row][self.cpos.col].isalnum()
-            while self.cpos.col > 0 and \
-                t_p == self.window_content[self.cpos.row][self.cpos.col].isalnum():
+            line = self.window_content[self.cpos.row]
+            t_p = line[self.cpos.col].isalnum()
+            while self.cpos.col > 0 and t_p == line[self.cpos.col].isalnum():
                 self.cpos.col -= 1
             if self.cpos.col:
                 self.cpos.col += 1
@@ -313,13 +397,13 @@ class Editor:
     def _move_key_ctl_right(self) -> None:
         if self.selecting:
             self.cpos.set_pos(self.selected_area[1])
-        if self.cpos.col == len(self.window_content[self.cpos.row])-1:
-            self.cpos.col = len(self.window_content[self.cpos.row])
-        elif self.cpos.col < len(self.window_content[self.cpos.row])-1:
+        line = self.window_content[self.cpos.row]
+        if self.cpos.col == len(line)-1:
+            self.cpos.col = len(line)
+        elif self.cpos.col < len(line)-1:
             self.cpos.col += 1
-            t_p = self.window_content[self.cpos.row][self.cpos.col].isalnum()
-            while self.cpos.col < len(self.window_content[self.cpos.row]) and \
-                t_p == self.window_content[self.cpos.row][self.cpos.col].isalnum():
+            t_p = line[self.cpos.col].isalnum()
+            while self.cpos.col < len(line) and t_p == line[self.cpos.col].isalnum():
                 self.cpos.col += 1
         elif self.cpos.row < len(self.window_content)-1:
             self.cpos.row += 1
@@ -488,8 +572,9 @@ class Editor:
         return None
 
     def _key_replace_search(self, r_this: str, r_with: str) -> str:
-        self.window_content[self.cpos.row] = self.window_content[self.cpos.row][:self.cpos.col] + \
-            r_with + self.window_content[self.cpos.row][self.cpos.col+len(r_this):]
+        line = self.window_content[self.cpos.row]
+        self.window_content[self.cpos.row] = \
+            replace_range(line, self.cpos.col, len(r_this), r_with)
         self.cpos.col += len(r_with)
         self.unsaved_progress = True
 
@@ -497,6 +582,100 @@ class Editor:
         self.cpos.col -= len(r_with)
         return self._key_replace_search(r_this=r_with, r_with=r_this)
 
+    def _key_replace_all(self, rows: str, _this_lengths: str, _r_this: str,
+                         with_lengths: str, r_with: str) -> str:
+        """
+        set all lines changed by replacing all matches at once.
+
+        Parameters:
+        rows (str):
+            the changed rows (space separated)
+        _this_lengths (str), _r_this (str):
+            the lengths of the original lines and the original lines joined
+        with_lengths (str), r_with (str):
+            the lengths of the changed lines and the changed lines joined
+        """
+        rows_lines, pos = [], 0
+        for row, length in zip(map(int, rows.split()), map(int, with_lengths.split())):
+            rows_lines.append((row, r_with[pos:pos+length]))
+            pos += length
+        self.window_content.set_lines(rows_lines)
+        self.unsaved_progress = True
+        return rows
+
+    def _key_replace_all_(self, rows: str, this_lengths: str, r_this: str,
+                          with_lengths: str, r_with: str) -> str:
+        return self._key_replace_all(rows, with_lengths, r_with, this_lengths, r_this)
+
+    def _replace_all(self) -> int:
+        """
+        replace all matches of the search (within the selection) in a single pass.
+        every line is replaced (str.replace or re.finditer) at most once, the changed
+        lines are set at once and recorded as a single action of the history.
+        patterns are matched against the whole line, so that anchors and lookarounds
+        do not match at the bounds of the selection.
+
+        Returns:
+        (int):
+            the amount of replaced matches
+        """
+        self._build_file()
+        (sel_from_y, sel_from_x), (sel_to_y, sel_to_x) = self.selected_area
+        if not self.selecting:
+            sel_from_y, sel_from_x, sel_to_y, sel_to_x = 0, 0, len(self.window_content)-1, -1
+        search, replace = self.search, self.replace
+        if isinstance(search, str):
+            def subn(line: str, start: int, stop: int) -> tuple:
+                count = line.count(search, start, stop)
+                if not count:
+                    return line, 0
+                return (line[:start] + line[start:stop].replace(search, replace) + line[stop:],
+                        count)
+        else:
+            def subn(line: str, start: int, stop: int) -> tuple:
+                parts, pos, count = [line[:start]], start, 0
+                for match_ in search.finditer(line, start):
+                    if match_.end() > stop:
+                        break
+                    try:
+                        r_with = match_.expand(replace)
+                    except re.error:
+                        r_with = replace
+                    parts += [line[pos:match_.start()], r_with]
+                    pos = match_.end()
+                    count += 1
+                parts.append(line[pos:])
+                return ''.join(parts), count
+
+        rows, this_lines, with_lines, count = [], [], [], 0
+        lines = islice(self.window_content, sel_from_y, sel_to_y+1)
+        for row, line in enumerate(lines, start=sel_from_y):
+            start = sel_from_x if row == sel_from_y else 0
+            stop = sel_to_x if row == sel_to_y and sel_to_x >= 0 else len(line)
+            replaced, r_count = subn(str(line), start, stop)
+            if not r_count:
+                continue
+            rows.append(row)
+            this_lines.append(str(line))
+            with_lines.append(replaced)
+            count += r_count
+        if not count:
+            return 0
+
+        pre_cpos, pre_spos = self.cpos.get_pos(), self.spos.get_pos()
+        action_text = (' '.join(map(str, rows)),
+                       ' '.join(map(str, map(len, this_lines))), ''.join(this_lines),
+                       ' '.join(map(str, map(len, with_lines))), ''.join(with_lines))
+        self._key_replace_all(*action_text)
+        self.cpos.col = min(self.cpos.col, len(self.window_content[self.cpos.row]))
+        self.spos.col = min(self.spos.col, len(self.window_content[self.spos.row]))
+        self.history.add(b'_key_replace_all', False,
+                         pre_cpos, self.cpos.get_pos(),
+                         pre_spos, self.spos.get_pos(),
+                         self.selecting, self.selecting,
+                         *action_text)
+        return count
+
     def _replace_search(self, r_this, r_with: str, search_: _SearchIterBase) -> None:
         pre_cpos = self.cpos.get_pos()
         pre_spos = self.spos.get_pos()
@@ -515,38 +694,26 @@ class Editor:
     def _key_remove_chunk(self, _) -> str:
         (sel_from_y, sel_from_x), (sel_to_y, sel_to_x) = self.selected_area
         self.cpos.set_pos((sel_from_y, sel_from_x))
-        if sel_from_y == sel_to_y:
-            deleted = self.window_content[sel_from_y][sel_from_x:sel_to_x]
-            self.window_content[sel_from_y] = \
-                self.window_content[sel_from_y][:sel_from_x] + \
-                self.window_content[sel_from_y][sel_to_x:]
-            self.unsaved_progress = True
-            return deleted
-        deleted = self.window_content[sel_from_y][sel_from_x:]
-        self.window_content[sel_from_y] = self.window_content[sel_from_y][:sel_from_x]
-        deleted_middle = ''
-        for row in range(sel_to_y-1, sel_from_y, -1):
-            deleted_middle = self.window_content[row] + '\n' + deleted_middle
-            del self.window_content[row]
-        deleted += '\n' + deleted_middle + self.window_content[sel_from_y+1][:sel_to_x]
-        self.window_content[sel_from_y] += self.window_content[sel_from_y+1][sel_to_x:]
-        del self.window_content[sel_from_y+1]
+        lines = self.window_content[sel_from_y:sel_to_y+1]
+        if len(lines) == 1:
+            deleted = lines[0][sel_from_x:sel_to_x]
+        else:
+            deleted = '\n'.join([lines[0][sel_from_x:], *map(str, lines[1:-1]),
+                                 lines[-1][:sel_to_x]])
+        # the selected lines are replaced at once
+        self.window_content.replace_lines(
+            sel_from_y, len(lines), [lines[0][:sel_from_x] + lines[-1][sel_to_x:]]
+        )
         self.unsaved_progress = True
         return deleted
 
     def _key_add_chunk(self, wchars_: str) -> str:
         segments = wchars_.split('\n')
-        segments.reverse()
-        end_segment = self.window_content[self.cpos.row][self.cpos.col:]
-        self.window_content[self.cpos.row] = \
-            self.window_content[self.cpos.row][:self.cpos.col] + segments[-1]
-        if len(segments) == 1:
-            self.window_content[self.cpos.row] += end_segment
-            self.unsaved_progress = True
-            return wchars_
-        self.window_content.insert(self.cpos.row+1, segments[0] + end_segment)
-        for row in segments[1:-1]:
-            self.window_content.insert(self.cpos.row+1, row)
+        line = self.window_content[self.cpos.row]
+        segments[0] = line[:self.cpos.col] + segments[0]
+        segments[-1] += line[self.cpos.col:]
+        # the lines of the chunk are inserted at once
+        self.window_content.replace_lines(self.cpos.row, 1, segments)
         self.unsaved_progress = True
         return wchars_
 
@@ -626,9 +793,8 @@ class Editor:
             ) + ' ').isspace():
             return self._key_string(self.special_indentation)
         self.unsaved_progress = True
-        self.window_content[self.cpos.row] = \
-            self.window_content[self.cpos.row][:self.cpos.col] + wchars + \
-            self.window_content[self.cpos.row][self.cpos.col:]
+        line = self.window_content[self.cpos.row]
+        self.window_content[self.cpos.row] = replace_range(line, self.cpos.col, 0, wchars)
         self.cpos.col += len(wchars)
         return wchars
 
@@ -680,6 +846,7 @@ class Editor:
                 self.curse_window.addstr(max_y + self.status_bar_size - 2, 0,
                                         self.error_bar[:max_x].ljust(max_x),
                                         self._get_color(error_color))
+                self._invalidate_row(max_y + self.status_bar_size - 2)
             self.curse_window.addstr(max_y + self.status_bar_size - 1, 0,
                                         msg[:max_x].ljust(max_x),
                                         self._get_color(3))
@@ -688,21 +855,37 @@ class Editor:
         self.error_bar = error_bar_backup
         self.curse_window.refresh()
 
-    def _action_save(self) -> bool:
+    def _finish_save(self, wait: bool = False) -> None:
         """
-        handle the save file action.
+        finish the save running in the background, once the file has been
+        written, by replacing the file. the lines of a large file are read
+        from the saved file from then on.
 
-        Returns
-        (bool):
-            indicates if the editor should keep running
+        Parameters:
+        wait (bool):
+            indicates if the save should be awaited, instead of only
+            finishing an already written file
         """
-        self._build_file()
-        content = self.line_sep.join(self.window_content)
+        editor_save = self.editor_save
+        if editor_save is None or not (wait or editor_save.done):
+            return
+        editor_save.join()
+        self.editor_save = None
         try:
-            # encode here to potentially trigger the unicodeerror event before erasing the file
-            IoHelper.write_file(self.file, content.encode(self.file_encoding))
+            if editor_save.error is not None:
+                raise editor_save.error
+            source = self.window_content.source
+            if isinstance(source, FileLines):
+                # the file cannot be replaced while it is still open (on windows)
+                source.close()
+            IoHelper.replace_file(self.file, editor_save.tmp_file)
+            if isinstance(source, FileLines):
+                self.window_content.rebase(
+                    FileLines(self.file, editor_save.index, self.file_encoding),
+                    editor_save.mapping
+                )
+                LineIndex.put(self.file, editor_save.index)
             self.changes_made = True
-            self.unsaved_progress = False
             self.error_bar = ''
             self.status_bar_size = 1
         except (OSError, UnicodeError) as exc:
@@ -711,6 +894,36 @@ class Editor:
             self.status_bar_size = 2
             if self.debug_mode:
                 err_print(self.error_bar)
+
+    def _action_save(self, wait: bool = False) -> bool:
+        """
+        handle the save file action. the file is written in the background,
+        while the editing continues.
+
+        Parameters:
+        wait (bool):
+            indicates if the save should be awaited (e.g. when quitting)
+
+        Returns
+        (bool):
+            indicates if the editor should keep running
+        """
+        # the content may have changed since a running save has been started
+        self._finish_save(True)
+        # the file is replaced, so an index not built yet would be outdated
+        self._attach_index()
+        self._stop_indexer()
+        # the lines, that have not been loaded yet, are read by the save
+        # and loaded from there, instead of reading them all beforehand
+        tail, self._f_content_gen = self._f_content_gen, None
+        self.editor_save = EditorSave(self.file, self.window_content.snapshot(),
+                                      self.line_sep, self.file_encoding, tail)
+        if tail is not None:
+            self._f_content_gen = self.editor_save.yield_tail()
+        # any change from now on is not part of the saved content
+        self.unsaved_progress = False
+        if wait:
+            self._finish_save(True)
         return True
 
     def _action_transform(self) -> bool:
@@ -1055,6 +1268,16 @@ class Editor:
                 elif self.selecting and self.cpos.get_pos() == sel_pos_a and replace_next < 0:
                     self.cpos.set_pos(sel_pos_b)
                     self.spos.set_pos(sel_pos_a)
+                if replace_all:
+                    self.cpos.set_pos(cpos_tmp)
+                    self.spos.set_pos(spos_tmp)
+                    count = self._replace_all()
+                    if count:
+                        self.status_msg = f"Replaced {count} occurrence{'s' * (count != 1)}"
+                        break
+                    tmp_error = 'no matches were found'
+                    tmp_error+= ' within the selection!' if self.selecting else '!'
+                    continue
                 try:
                     search = search_iter_factory(
                         self,
@@ -1072,11 +1295,7 @@ class Editor:
                     self._replace_search(self.search, self.replace, search)
                     if replace_next < 0:
                         self.cpos.set_pos(search_pos)
-                    if not replace_all:
-                        break
-                else:
-                    if search.yielded_result:
-                        self.cpos.col -= search.r_len
+                    break
                 if self.selecting:
                     self.cpos.set_pos(cpos_tmp)
                     self.spos.set_pos(spos_tmp)
@@ -1183,6 +1402,7 @@ class Editor:
         curses.endwin()
         os.kill(os.getpid(), signal.SIGSTOP)
         self._init_screen()
+        self._drawn_rows = []
         self.get_char = self._get_new_char()
         return True
 
@@ -1194,6 +1414,8 @@ class Editor:
         (bool):
             indicates if the editor should keep running
         """
+        # a failing save leaves the changes unsaved
+        self._finish_save(True)
         if self.unsaved_progress:
             curses.curs_set(0)
 
@@ -1209,7 +1431,7 @@ class Editor:
                     if key == b'_action_background':
                         getattr(self, key.decode(), lambda *_: False)()
                     if key == b'_action_save':
-                        getattr(self, key.decode(), lambda *_: False)()
+                        self._action_save(True)
                     if key == b'_action_resize':
                         getattr(self, key.decode(), lambda *_: False)()
                         self._render_scr()
@@ -1217,7 +1439,7 @@ class Editor:
                 if not isinstance(wchar, str):
                     continue
                 if wchar.upper() in ['Y', 'J']:
-                    self._action_save()
+                    self._action_save(True)
                 elif wchar == ESC_CODE: # ESC
                     return True
 
@@ -1248,12 +1470,14 @@ class Editor:
         except curses.error:
             pass
         self.curse_window.clear()
+        self._drawn_rows = []
         return True
 
     def _function_help(self) -> None:
         curses.curs_set(0)
         self.curse_window.move(0, 0)
         self.curse_window.clear()
+        self._drawn_rows = []
         coff = 20
 
         help_text = [
@@ -1419,50 +1643,152 @@ class Editor:
             elif self.cpos.col >= self.wpos.col + max_x:
                 self.wpos.col = self.cpos.col - max_x + 1
 
+    def _invalidate_row(self, row: int) -> None:
+        """
+        mark a row of the screen to be redrawn, e.g. after drawing over it.
+
+        Parameters:
+        row (int):
+            the row of the screen
+        """
+        if 0 <= row < len(self._drawn_rows):
+            self._drawn_rows[row] = None
+
+    def _get_display(self, line: str, trailing: int) -> tuple:
+        """
+        get the displayed characters of a line and the kind of every character
+        (0: default, 3: special character or trailing whitespace, 4: tab,
+        KIND_WIDE: wide character).
+
+        Parameters:
+        line (str):
+            the line (or part of a line) to display
+        trailing (int):
+            the column from which on only whitespace follows
+
+        Returns:
+        (tuple):
+            the displayed characters and their kinds, like (display, kinds)
+        """
+        trailing = min(trailing, len(line))
+        kinds = bytearray(trailing) + b'\3' * (len(line) - trailing)
+        if max(line, default='') < '\u1100' and line.replace('\t', ' ').isprintable():
+            # no character is special or wide (most lines)
+            display = line.replace('\t', '>')
+            tab = line.find('\t')
+            while tab >= 0:
+                kinds[tab] = 4
+                tab = line.find('\t', tab+1)
+        else:
+            display = []
+            for col, char in enumerate(line):
+                if char == '\t':
+                    char, kinds[col] = '>', 4
+                elif not char.isprintable():
+                    char, kinds[col] = self._get_special_char(char), 3
+                if unicodedata.east_asian_width(char) in 'WF':
+                    # CJK unicode (problems in windows-terminal) fix:
+                    # if 12799 < ord(char) < 65103:
+                    char, kinds[col] = '�', KIND_WIDE
+                display.append(char)
+            display = ''.join(display)
+        return (display, bytes(kinds))
+
+    def _get_line_display(self, line: str) -> tuple:
+        """
+        get the displayed characters of a line and the kind of every character.
+        the result is cached until the line changes.
+
+        Parameters:
+        line (str):
+            the line to display
+
+        Returns:
+        (tuple):
+            the displayed characters and their kinds, like (display, kinds)
+        """
+        cached = self._line_cache.get(line)
+        if cached is not None:
+            self._line_cache.move_to_end(line)
+            return cached
+        cached = self._get_display(line, rstrip_length(line))
+        self._line_cache[line] = cached
+        if len(self._line_cache) > Editor.line_cache_lines:
+            self._line_cache.popitem(last=False)
+        return cached
+
+    def _render_row(self, row: int, line: str, selection: tuple, max_x: int, colors: dict) -> None:
+        """
+        draw a line on a row of the screen, as runs of characters of the same color.
+
+        Parameters:
+        row (int):
+            the row of the screen
+        line (str|LongLine):
+            the line to draw
+        selection (tuple):
+            the selected columns of the line like (start, stop), or None
+        max_x (int):
+            the width of the screen
+        colors (dict):
+            the curses color of every kind of character
+        """
+        start = self.wpos.col
+        if len(line) > LongLine.min_length:
+            # only the visible part of a long line is displayed
+            display, kinds = self._get_display(line[start:start+max_x],
+                                               max(rstrip_length(line) - start, 0))
+        else:
+            display, kinds = self._get_line_display(line)
+            display, kinds = display[start:start+max_x], kinds[start:start+max_x]
+        kinds = bytearray(kinds)
+        if selection is not None:
+            sel_start, sel_stop = selection[0]-start, selection[1]-start
+            kinds[sel_start:sel_stop] = kinds[sel_start:sel_stop].translate(SELECTED_KINDS)
+        for run in KIND_RUNS.finditer(kinds):
+            self.curse_window.addstr(row, run.start(), display[run.start():run.end()],
+                                     colors[kinds[run.start()]])
+        # a full row moves the cursor to the next row, which must not be cleared
+        if len(display) < max_x:
+            self.curse_window.move(row, len(display))
+            self.curse_window.clrtoeol()
+
     def _render_scr(self) -> None:
         """
         render the curses window.
+        only the rows, that have changed since they were drawn, are redrawn.
         """
         max_y, max_x = self.getxymax()
         # self._enforce_boundaries()
 
         # display screen
-        self.curse_window.move(0, 0)
+        if len(self._drawn_rows) != max_y:
+            self._drawn_rows = [None] * max_y
+        colors = {kind: self._get_color(3 if kind == KIND_WIDE else kind)
+                  for kind in (0, 3, 4, 5, KIND_WIDE)}
+        (sel_from_y, sel_from_x), (sel_to_y, sel_to_x) = self.selected_area
+        lines = self.window_content[self.wpos.row:self.wpos.row+max_y]
         for row in range(max_y):
-            brow = row + self.wpos.row
-            if brow >= len(self.window_content):
-                self.curse_window.clrtobot()
-                break
-            for col in range(max_x):
-                bcol = col + self.wpos.col
-                if bcol >= len(self.window_content[brow]):
-                    break
-                cur_char = self.window_content[brow][bcol]
-                color = 0
-
-                if cur_char == '\t':
-                    cur_char = '>'
-                    color = self._get_color(4)
-                elif not cur_char.isprintable():
-                    cur_char = self._get_special_char(cur_char)
-                    color = self._get_color(3)
-                elif self.window_content[brow][bcol:].isspace():
-                    color = self._get_color(3)
-
-                sel_from, sel_to = self.selected_area
-                if self.selecting and sel_from <= (brow, bcol) < sel_to:
-                    color = self._get_color(5)
-                try:
-                    if unicodedata.east_asian_width(cur_char) in 'WF':
-                        raise TypeError
-                    # CJK unicode (problems in windows-terminal) fix:
-                    # if 12799 < ord(cur_char) < 65103:
-                    #     raise TypeError
-                    self.curse_window.addch(row, col, cur_char, color)
-                except TypeError:
-                    self.curse_window.addch(row, col, '�', self._get_color(3))
-            self.curse_window.clrtoeol()
-            self.curse_window.move(row+1, 0)
+            if row >= len(lines):
+                if self._drawn_rows[row] != ():
+                    self.curse_window.move(row, 0)
+                    self.curse_window.clrtoeol()
+                    self._drawn_rows[row] = ()
+                continue
+            brow, line = row + self.wpos.row, lines[row]
+            selection = None
+            if self.selecting and sel_from_y <= brow <= sel_to_y:
+                # only the visible part of the selection matters
+                sel_start = max(sel_from_x if brow == sel_from_y else 0, self.wpos.col)
+                sel_stop = min(sel_to_x if brow == sel_to_y else len(line),
+                               self.wpos.col + max_x)
+                if sel_start < sel_stop:
+                    selection = (sel_start, sel_stop)
+            drawn = (line, self.wpos.col, selection, max_x)
+            if self._drawn_rows[row] == drawn:
+                continue
+            self._render_row(row, line, selection, max_x, colors)
+            self._drawn_rows[row] = drawn
 
         for (row, col), length in self.search_items.items():
             if row < self.wpos.row or row >= self.wpos.row+max_y:
@@ -1478,6 +1804,7 @@ class Editor:
                 length,
                 self._get_color(6)
             )
+            self._invalidate_row(row-self.wpos.row)
         if self.cpos.get_pos() in self.search_items:
             self.curse_window.chgat(
                 self.cpos.row-self.wpos.row,
@@ -1485,6 +1812,7 @@ class Editor:
                 self.search_items[self.cpos.get_pos()],
                 self._get_color(4)
             )
+            self._invalidate_row(self.cpos.row-self.wpos.row)
         self.search_items.clear()
 
         # display status/error_bar
@@ -1492,10 +1820,15 @@ class Editor:
             if self.error_bar:
                 self.curse_window.addstr(max_y + self.status_bar_size - 2, 0,
                                          self.error_bar[:max_x].ljust(max_x), self._get_color(2))
+                self._invalidate_row(max_y + self.status_bar_size - 2)
 
+            status_msg = f" | {self.status_msg}" if self.status_msg else ''
+            saved = f"{'NOT ' * self.unsaved_progress}Saved!"
+            if self.editor_save is not None:
+                saved = f"Saving: {self.editor_save.progress}%"
             status_bar = f"File: {self.display_name} | Help: F1 | "
             status_bar += f"Ln {self.cpos.row+1}, Col {self.cpos.col+1} "
-            status_bar += f"| {'NOT ' * self.unsaved_progress}Saved!"
+            status_bar += f"| {saved}{status_msg}"
             if self.debug_mode:
                 status_bar += f" - Win: {self.wpos.col+1} {self.wpos.row+1} | {max_y}x{max_x}"
             if len(status_bar) > max_x:
@@ -1503,7 +1836,7 @@ class Editor:
                 status_bar = f"File: ...{self.display_name[-necc_space:] * bool(necc_space)} "
                 status_bar += '| Help: F1 | '
                 status_bar += f"Ln {self.cpos.row+1}, Col {self.cpos.col+1} "
-                status_bar += f"| {'NOT ' * self.unsaved_progress}Saved!"
+                status_bar += f"| {saved}{status_msg}"
                 if self.debug_mode:
                     status_bar += f" - Win: {self.wpos.col+1} {self.wpos.row+1} | {max_y}x{max_x}"
             # this throws an error (should be max_x-1), but looks better:
@@ -1512,6 +1845,7 @@ class Editor:
                                      status_bar, self._get_color(1))
         except curses.error:
             pass
+        self.status_msg = ''
 
         try:
             # can throw an error when using the scrolling functionality:
@@ -1540,7 +1874,14 @@ class Editor:
         running = True
 
         while running:
+            self._finish_save()
+            self._attach_index()
             self._render_scr()
+            # keep rendering the progress of a running save (and check for the
+            # index of the file), while waiting for a key
+            self.curse_window.timeout(
+                100 if self.editor_save is not None or self.line_indexer is not None else -1
+            )
             force_render = 0
             while True:
                 self._build_file_upto()
@@ -1685,17 +2026,22 @@ class Editor:
                 user_input = input('Do you want to save the changes? [Y/N]').upper()
             if user_input == 'N':
                 raise e
-            self._action_save()
+            self._action_save(True)
             if self.unsaved_progress:
                 err_print('Oops..! Something went wrong. The file could not be saved.')
             else:
                 err_print('The file has been successfully saved.')
             raise e
         finally:
+            # the file must not be left unsaved, while the save is running
+            self._finish_save(True)
+            self._stop_indexer()
             try: # cleanup - close file
-                self._f_content_gen.throw(StopIteration)
+                if self._f_content_gen is not None:
+                    self._f_content_gen.throw(StopIteration)
             except StopIteration:
                 pass
+            self.window_content.close()
             curses.endwin()
 
     @classmethod
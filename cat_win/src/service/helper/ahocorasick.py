@@ -0,0 +1,70 @@
+"""
+ahocorasick
+"""
+
+from collections import deque
+
+
+class AhoCorasick:
+    """
+    defines an Aho-Corasick automaton, to find all (possibly overlapping)
+    occurences of multiple literals within a single pass over a string.
+    """
+    def __init__(self, literals: list) -> None:
+        """
+        build the automaton.
+
+        Parameters:
+        literals (list):
+            the (non-empty) literals to search for
+        """
+        goto = [{}]
+        self.output = [()]
+        for index, literal in enumerate(literals):
+            state = 0
+            for char in literal:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    self.output.append(())
+                state = next_state
+            self.output[state] += ((len(literal), index),)
+
+        # compute the failure links in breadth-first order, such that the
+        # failure state of each state has already been completed
+        fail = [0] * len(goto)
+        self.delta = [None] * len(goto)
+        self.delta[0] = goto[0]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                if state:
+                    fail[next_state] = self.delta[fail[state]].get(char, 0)
+                self.output[next_state] += self.output[fail[next_state]]
+            # the complete transitions of a state are the transitions of
+            # its failure state, overwritten by its own transitions
+            self.delta[state] = {**self.delta[fail[state]], **goto[state]}
+
+    def find_all(self, _s: str):
+        """
+        Generate tuples containing the position of every literal in s.
+
+        Parameters:
+        s (str):
+            the string to search in
+
+        Yields:
+        (tuple):
+            containing the start and end indeces and the index of the literal
+            like (start, end, index)
+        """
+        delta, output = self.delta, self.output
+        state = 0
+        for end, char in enumerate(_s, start=1):
+            state = delta[state].get(char, 0)
+            for length, index in output[state]:
+                yield (end-length, end, index)
@@ -2,6 +2,10 @@
 editorhelper
 """
 
+from collections import deque
+import sys
+import zlib
+
 try:
     import curses
     def initscr():
@@ -204,7 +208,8 @@ REVERSE_ACTION = {
     b'_key_enter'          : b'_key_backspace',
     b'_key_remove_chunk'   : b'_key_add_chunk',
     b'_key_add_chunk'      : b'_key_remove_chunk',
-    b'_key_replace_search' : b'_key_replace_search_'
+    b'_key_replace_search' : b'_key_replace_search_',
+    b'_key_replace_all'    : b'_key_replace_all_',
 } # defines the counter action if no line was deleted
 
 REVERSE_ACTION_MULTI_LINE = {
@@ -227,6 +232,10 @@ ACTION_STACKABLE = {
 # these actions will be chained
 # (e.g. when writing a word, the entire word should be undone/redone)
 
+ACTION_MERGEABLE = {b'_key_backspace', b'_key_string'}
+# these actions will be merged into a single action when they are recorded,
+# if they do not change the amount of lines
+
 
 HEX_BYTE_KEYS = ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9',
                  'A', 'B', 'C', 'D', 'E', 'F']
@@ -280,6 +289,13 @@ class _Action:
     """
     _Action
     """
+    __slots__ = ('key_action', 'size_change', 'pre_cpos', 'post_cpos',
+                 'pre_spos', 'post_spos', 'pre_selecting', 'post_selecting',
+                 '_action_text', 'size')
+
+    # the length from which on a text is compressed
+    compress_length = 1024 * 4
+
     def __init__(self, key_action: bytes, size_change: bool,
                  pre_cpos: tuple, post_cpos: tuple,
                  pre_spos: tuple, post_spos: tuple,
@@ -318,6 +334,59 @@ class _Action:
         self.post_selecting: bool = post_selecting
         self.action_text: tuple   = action_text
 
+    @property
+    def action_text(self) -> tuple:
+        return tuple(zlib.decompress(text).decode('utf-8', 'surrogatepass')
+                     if isinstance(text, bytes) else text for text in self._action_text)
+
+    @action_text.setter
+    def action_text(self, action_text: tuple) -> None:
+        """
+        store the texts, large texts are compressed (if that makes them smaller).
+        """
+        texts = []
+        for text in action_text:
+            if isinstance(text, str) and len(text) >= _Action.compress_length:
+                compressed = zlib.compress(text.encode('utf-8', 'surrogatepass'))
+                if sys.getsizeof(compressed) < sys.getsizeof(text):
+                    text = compressed
+            texts.append(text)
+        self._action_text = tuple(texts)
+        self.size = sys.getsizeof(self) + sys.getsizeof(self._action_text) + \
+            sum(map(sys.getsizeof, self._action_text))
+
+    def merge(self, action) -> bool:
+        """
+        merge a following action into this action, if both change
+        consecutive characters of a line (e.g. when writing a word).
+
+        Parameters:
+        action (_Action):
+            the action following this action
+
+        Returns:
+        (bool):
+            indicates if the action has been merged
+        """
+        if self.key_action != action.key_action or self.key_action not in ACTION_MERGEABLE or \
+            self.size_change or action.size_change or self.post_cpos != action.pre_cpos or \
+            len(self._action_text) != 1 or len(action._action_text) != 1:
+            return False
+        text, n_text = self._action_text[0], action._action_text[0]
+        if not isinstance(text, str) or not isinstance(n_text, str) or \
+            len(text) + len(n_text) > History.merge_length or \
+            text.isspace() != n_text.isspace():
+            return False
+        if self.key_action == b'_key_backspace':
+            # the following backspace deleted the characters in front
+            text = n_text + text
+        else:
+            text = text + n_text
+        self.post_cpos, self.post_spos = action.post_cpos, action.post_spos
+        self.post_selecting = action.post_selecting
+        self.action_text = (text,)
+        return True
+
     def __str__(self) -> str:
         s_self = f"{self.key_action}|{repr(self.action_text)}|"
         s_self+= f"{self.size_change}{self.pre_cpos}{self.post_cpos}"
@@ -328,15 +397,30 @@ class History:
     keeps track of editing history and provided
     undo/redo functionality.
     """
-    def __init__(self, stack_size: int = 800) -> None:
-        self.stack_size = max(stack_size, 1)
+    max_size = 1024 * 1024 * 16
+    # the maximum length of the text of merged actions
+    merge_length = 1024
+
+    @staticmethod
+    def set_flags(max_size: int) -> None:
+        """
+        setup the configuration
+
+        Parameters:
+        max_size (int):
+            the maximum amount of bytes the actions of both stacks may use
+        """
+        History.max_size = max_size
+
+    def __init__(self, max_size: int = None) -> None:
+        self.max_size = max(History.max_size if max_size is None else max_size, 1)
 
-        # following stacks/lists will contain _Action objects.
-        # each object needs ~300Bytes, meaning that both lists
-        # together will be, at max, of the size ~600*stack_size (Bytes)
-        # 500KB = 500_000B, 500_000/600 ~= 800
-        self._stack_undo: list = []
-        self._stack_redo: list = []
+        # following stacks will contain _Action objects.
+        # the actions of both stacks together use at most ~max_size (Bytes),
+        # the oldest actions are dropped first.
+        self._stack_undo = deque()
+        self._stack_redo = deque()
+        self._size = 0
 
     def clear(self) -> None:
         """
@@ -344,6 +428,16 @@ class History:
         """
         self._stack_undo.clear()
         self._stack_redo.clear()
+        self._size = 0
+
+    def _pop(self, _stack: deque) -> _Action:
+        action: _Action = _stack.pop()
+        self._size -= action.size
+        return action
+
+    def _clear_redo(self) -> None:
+        self._size -= sum(action.size for action in self._stack_redo)
+        self._stack_redo.clear()
 
     def _add(self, action: _Action, stack_type: str = 'undo') -> None:
         """
@@ -362,9 +456,12 @@ class History:
         else:
             return
 
-        if len(_stack) == self.stack_size:
-            del _stack[0]
         _stack.append(action)
+        self._size += action.size
+        # drop the oldest actions (the bottom of the undo stack first)
+        while self._size > self.max_size and len(self._stack_undo) + len(self._stack_redo) > 1:
+            _stack = self._stack_undo if self._stack_undo else self._stack_redo
+            self._size -= _stack.popleft().size
 
     def add(self, key_action: bytes, size_change: bool,
             pre_cpos: tuple, post_cpos: tuple,
@@ -373,6 +470,8 @@ class History:
             *action_text: str, stack_type: str = 'undo') -> None:
         """
         Add an action to the stack.
+        an action continuing the last action (e.g. the next character of a word)
+        is merged into the last action.
 
         Parameters:
         __init__ variables of _Action
@@ -387,13 +486,19 @@ class History:
             return
 
         if stack_type == 'undo':
-            self._stack_redo.clear()
+            self._clear_redo()
 
         action = _Action(key_action, size_change,
                          pre_cpos, post_cpos,
                          pre_spos, post_spos,
                          pre_selecting, post_selecting,
                          *action_text)
+        if stack_type == 'undo' and self._stack_undo:
+            last_action: _Action = self._stack_undo[-1]
+            size = last_action.size
+            if last_action.merge(action):
+                self._size += last_action.size - size
+                return
         self._add(action, stack_type)
         # print('Added', list(map(str, self._stack_undo)))
         # print('     ', list(map(str, self._stack_redo)))
@@ -424,21 +529,21 @@ class History:
             the editor in use
         """
         try:
-            action: _Action = self._stack_undo.pop()
+            action: _Action = self._pop(self._stack_undo)
         except IndexError:
             return
 
         self._undo(editor, action)
         is_space = action.action_text[0].isspace()
         while self._stack_undo:
-            n_action: _Action = self._stack_undo.pop()
+            n_action: _Action = self._pop(self._stack_undo)
             if action.pre_cpos == n_action.post_cpos and \
                 n_action.key_action in ACTION_STACKABLE.get(action.key_action, []) and \
                 is_space == n_action.action_text[0].isspace():
                 action = n_action
                 self._undo(editor, action)
             else:
-                self._stack_undo.append(n_action)
+                self._add(n_action, 'undo')
                 break
         # print('Undo ', list(map(str, self._stack_undo)))
         # print('     ', list(map(str, self._stack_redo)))
@@ -464,21 +569,21 @@ class History:
             the editor in use
         """
         try:
-            action: _Action = self._stack_redo.pop()
+            action: _Action = self._pop(self._stack_redo)
         except IndexError:
             return
 
         self._redo(editor, action)
         is_space = action.action_text[0].isspace()
         while self._stack_redo:
-            n_action: _Action = self._stack_redo.pop()
+            n_action: _Action = self._pop(self._stack_redo)
             if action.post_cpos == n_action.pre_cpos and \
                 action.key_action in ACTION_STACKABLE.get(n_action.key_action, []) and \
                 is_space == n_action.action_text[0].isspace():
                 action = n_action
                 self._redo(editor, action)
             else:
-                self._stack_redo.append(n_action)
+                self._add(n_action, 'redo')
                 break
         # print('Redo ', list(map(str, self._stack_undo)))
         # print('     ', list(map(str, self._stack_redo)))
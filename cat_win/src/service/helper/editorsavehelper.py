@@ -0,0 +1,345 @@
+"""
+editorsavehelper
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from pathlib import Path
+import codecs
+import os
+import re
+import threading
+
+from cat_win.src.service.helper.filelines import FileLines
+from cat_win.src.service.helper.iohelper import IoHelper
+from cat_win.src.service.helper.lineindex import LineIndex
+
+
+class EditorSave:
+    """
+    defines an EditorSave, that writes the lines of the editor into a temporary
+    file next to the file in a background thread, so the editing can continue
+    meanwhile. the unchanged blocks of a large file are copied from the file
+    as they are, without decoding them. the written file is indexed on the fly,
+    so its lines can be read from it afterwards (see TextBuffer.rebase()).
+    the lines of the file, that have not been loaded by the editor yet, are
+    read and written by the background thread as well (see yield_tail()).
+    once a line contains a line break, the lines written after it are moved
+    within the file, so the written file is indexed again afterwards.
+    """
+    def __init__(self, file: Path, pieces: list, line_sep: str, file_encoding: str,
+                 tail=None) -> None:
+        """
+        Parameters:
+        file (Path):
+            a string representation of the file (-path) to save
+        pieces (list):
+            the pieces of the lines to save (see TextBuffer.snapshot())
+        line_sep (str):
+            the line separator to join the lines with
+        file_encoding (str):
+            the encoding to write the file with
+        tail (iterable):
+            the (not yet read) lines of the file, that follow the pieces
+        """
+        self.file = file
+        self.pieces = pieces
+        self.line_sep = line_sep
+        self.file_encoding = file_encoding
+        self.tail = tail
+        # the lines read from the tail so far
+        self.tail_lines = []
+        self.total = sum(length for _, _, length in pieces)
+        # the amount of lines written so far
+        self.written = 0
+        # where the pieces can be found within the written file,
+        # like (lines, start, new_row, length)
+        self.mapping = []
+        self.index = None
+        self.tmp_file = None
+        self.error = None
+        self.done = False
+        self._sep_raw = line_sep.encode('ascii')
+        self._offsets = array('Q', [0])
+        self._indexable = True
+        # once the lines are not indexable: the rows, that have been written as
+        # multiple lines, the rows from which on the rows are moved within the
+        # file, like (row, shift), and the amount of line breaks written so far
+        self._split_rows = []
+        self._shifts = []
+        self._breaks = 0
+        # indicates if the content written so far ends with '\r'
+        self._cr = False
+        # the amount of bytes written so far
+        self._position = 0
+        self._encoder = codecs.getincrementalencoder(file_encoding)()
+        self._raw_f = None
+        # the size of the file, as the amount of lines to write is unknown
+        # until the tail has been read
+        self._file_size = 0
+        if tail is not None:
+            try:
+                self._file_size = os.path.getsize(file)
+            except OSError:
+                pass
+        self._tail_read = threading.Condition()
+        self._tail_done = False
+        self._thread = threading.Thread(target=self._save, daemon=True)
+        self._thread.start()
+
+    @property
+    def progress(self) -> int:
+        """
+        the percentage of the lines, that have been written.
+        """
+        if self.done:
+            return 100
+        if self.tail is None:
+            return self.written * 100 // max(self.total, 1)
+        return min(self._position * 100 // max(self._file_size, 1), 99)
+
+    def join(self) -> None:
+        """
+        wait for the file to be written.
+        """
+        self._thread.join()
+
+    def yield_tail(self):
+        """
+        yield the lines of the tail, as soon as they have been read by the
+        background thread. the lines, that are left when the save has
+        failed, are read from the tail directly.
+
+        Yields:
+        (str):
+            the next line of the tail
+        """
+        row = 0
+        try:
+            while True:
+                with self._tail_read:
+                    while row >= len(self.tail_lines) and not self._tail_done:
+                        self._tail_read.wait()
+                    lines = self.tail_lines[row:]
+                if not lines:
+                    break
+                row += len(lines)
+                yield from lines
+            yield from self.tail
+        except StopIteration:
+            pass
+
+    def _save(self) -> None:
+        try:
+            self.tmp_file = IoHelper.write_temp_file(self.file, self._yield_content())
+            if self._indexable:
+                self.index = LineIndex(self._offsets, max(self.total-1, 0))
+            else:
+                # the lines, that have been moved, are found in the saved file again
+                self.index = LineIndex.build(self.tmp_file)
+                self.mapping = self._remap()
+        except Exception as exc:
+            # the error is raised again, when the save is finished
+            self.error = exc
+        finally:
+            with self._tail_read:
+                self._tail_done = True
+                self._tail_read.notify_all()
+            self.done = True
+
+    def _encode(self, text: str) -> bytes:
+        content = self._encoder.encode(text)
+        self._position += len(content)
+        if text:
+            self._cr = text.endswith('\r')
+        return content
+
+    def _count_breaks(self, text: str, cr: bool) -> int:
+        """
+        count the line breaks of a text like LineIndex, when it is written
+        after a text, that (does not) end with '\r'.
+        """
+        breaks = text.count('\n') + text.count('\r') - text.count('\r\n')
+        if cr and text.startswith('\n'):
+            breaks -= 1
+        return breaks
+
+    def _track_rows(self, lines: list) -> None:
+        """
+        find the lines of the written file, that the lines are written as
+        (must be called before writing the lines and their leading line separator).
+        """
+        cr = self._cr
+        for row, line in enumerate(map(str, lines), self.written):
+            if row:
+                self._breaks += self._count_breaks(self.line_sep, cr)
+                cr = self.line_sep.endswith('\r')
+            shift = self._breaks - row
+            if (self._shifts[-1][1] if self._shifts else 0) != shift:
+                self._shifts.append((row, shift))
+            if '\n' in line or '\r' in line:
+                self._split_rows.append(row)
+                self._breaks += self._count_breaks(line, cr)
+            if line:
+                cr = line.endswith('\r')
+
+    def _remap(self) -> list:
+        """
+        find the rows of the pieces within the written file, once a line has been
+        written as multiple lines. the rows written as multiple lines are left out.
+
+        Returns:
+        (list):
+            the mapping like (lines, start, new_row, length)
+        """
+        shift_rows = [row for row, _ in self._shifts]
+        mapping = []
+        for lines, start, row, length in self.mapping:
+            stop = row + length
+            while row < stop:
+                s_index = bisect_right(shift_rows, row) - 1
+                end = min(stop, shift_rows[s_index+1]) if s_index+1 < len(shift_rows) else stop
+                split_index = bisect_left(self._split_rows, row)
+                if split_index < len(self._split_rows):
+                    if self._split_rows[split_index] == row:
+                        start, row = start + 1, row + 1
+                        continue
+                    end = min(end, self._split_rows[split_index])
+                shift = self._shifts[s_index][1] if s_index >= 0 else 0
+                mapping.append((lines, start, row + shift, end - row))
+                start, row = start + end - row, end
+        return mapping
+
+    def _yield_content(self):
+        """
+        yield the encoded content of the file, without joining all lines at once.
+
+        Yields:
+        (bytes):
+            the next part of the content
+        """
+        try:
+            for lines, start, length in self.pieces:
+                self.mapping.append((lines, start, self.written, length))
+                if isinstance(lines, FileLines):
+                    yield from self._yield_file_lines(lines, start, start + length)
+                    continue
+                for c_start in range(start, start + length, LineIndex.step):
+                    yield from self._yield_lines(
+                        lines[c_start:min(c_start + LineIndex.step, start + length)]
+                    )
+            if self.tail is not None:
+                yield from self._yield_tail_lines()
+            yield self._encoder.encode('', True)
+        finally:
+            if self._raw_f is not None:
+                self._raw_f.close()
+
+    def _yield_tail_lines(self):
+        """
+        yield the encoded lines of the tail, while sharing
+        the read lines with yield_tail().
+        """
+        while True:
+            lines = list(islice(self.tail, LineIndex.step))
+            if not lines:
+                return
+            with self._tail_read:
+                self.tail_lines += lines
+                self._tail_read.notify_all()
+            self.total += len(lines)
+            yield from self._yield_lines(lines)
+
+    def _yield_lines(self, lines: list):
+        """
+        yield the encoded lines, such that every indexed line
+        starts a new chunk.
+        """
+        step = LineIndex.step
+        while lines:
+            count = step - self.written % step
+            chunk, lines = lines[:count], lines[count:]
+            text = self.line_sep.join(map(str, chunk))
+            if self._indexable and text.count('\n') + text.count('\r') != \
+                (len(chunk)-1) * (self.line_sep.count('\n') + self.line_sep.count('\r')):
+                # a line contains a line break, so the written lines cannot be indexed
+                self._indexable = False
+                self._breaks = max(self.written - 1, 0)
+            if not self._indexable:
+                self._track_rows(chunk)
+            if self.written:
+                yield self._encode(self.line_sep)
+                if not self.written % step:
+                    self._offsets.append(self._position)
+            yield self._encode(text)
+            self.written += len(chunk)
+
+    def _yield_file_lines(self, lines: FileLines, start: int, stop: int):
+        """
+        yield a range of lines of the source file block by block. the blocks
+        containing only lines of the range are copied without decoding them.
+        """
+        step = LineIndex.step
+        row = start
+        while row < stop:
+            b_start = row // step * step
+            b_stop = min(b_start + step, len(lines))
+            r_stop = min(stop, b_stop)
+            raw = None
+            # the first block of the file can start with a BOM, while
+            # the encoder has to write it in front of the first line
+            if self.written and b_start and row == b_start and r_stop == b_stop:
+                raw = self._read_block(lines, b_start // step, b_stop - b_start)
+            if raw is None:
+                yield from self._yield_lines(list(lines.iter_lines(row, r_stop)))
+            else:
+                yield from self._yield_block(raw, b_stop - b_start)
+            row = r_stop
+
+    def _read_block(self, lines: FileLines, b_index: int, count: int):
+        """
+        read the bytes of a block of lines from the source file.
+
+        Returns:
+        (bytes|None):
+            the content of the block without its trailing line break, or None
+            if the lines are not only separated by the line separator
+        """
+        if self._raw_f is None:
+            self._raw_f = open(lines.src_file, 'rb')
+        offsets = lines.index.offsets
+        self._raw_f.seek(offsets[b_index])
+        if b_index + 1 < len(offsets):
+            raw = self._raw_f.read(offsets[b_index+1] - offsets[b_index])
+            if not raw.endswith(self._sep_raw):
+                return None
+            raw = raw[:-len(self._sep_raw)]
+        else:
+            raw = self._raw_f.read()
+        if raw.count(self._sep_raw) != count-1 or \
+            raw.count(b'\n') + raw.count(b'\r') != (count-1) * len(self._sep_raw):
+            return None
+        return raw
+
+    def _yield_block(self, raw: bytes, count: int):
+        """
+        yield the bytes of a block of lines as they are.
+        """
+        if not self._indexable:
+            # only the line separators of the block are line breaks
+            self._track_rows([''] * count)
+        yield self._encode(self.line_sep)
+        # the block can contain at most one indexed line
+        line = -self.written % LineIndex.step
+        if line < count:
+            offset = 0
+            if line:
+                offset = next(islice(re.finditer(re.escape(self._sep_raw), raw),
+                                     line-1, None)).end()
+            self._offsets.append(self._position + offset)
+        self._position += len(raw)
+        if raw:
+            self._cr = raw.endswith(b'\r')
+        self.written += count
+        yield raw
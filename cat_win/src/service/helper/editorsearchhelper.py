@@ -1,7 +1,10 @@
 """
 editorsearchhelper
 """
+from array import array
+from bisect import bisect_left, bisect_right
 import re
+import threading
 
 
 class _SearchIterBase:
@@ -186,140 +189,273 @@ def search_iter_factory(*args, downwards: bool = True) -> _SearchIterBase:
     return _SearchIterUp(*args)
 
 
-class _SearchIterHexBase:
-    def __init__(self, editor, offset: int) -> None:
-        self.editor = editor
-        self.offset = offset
-        self.wrapped = False
-        self._start_y = editor.cpos.row
-        self._start_x = editor.cpos.col + offset
-        self.yielded_result = False
-        self.search = self.editor.search
-        self.s_len = len(self.search)
+class HexSearch:
+    """
+    defines a HexSearch, that finds all matches of a byte pattern within
+    the current state of a HexBuffer. the content is searched in windows by
+    a background thread, collecting the offsets of all matches, so that the
+    next or previous match can be found by bisecting them. once too many
+    matches have been collected, the rest of the content is searched
+    window by window whenever a match is requested (so a regular expression
+    matches from the cursor on there).
+    """
+    window_size = 1024 * 1024
+    # the maximum length of a regular expression match, that is found across two windows
+    regex_overlap = 1024 * 4
+    max_matches = 1024 * 1024 * 4
 
-    def __iter__(self):
-        return self
+    @staticmethod
+    def set_flags(max_matches: int) -> None:
+        """
+        setup the configuration
 
-    def _stop_if_past_original(self, row: int, f_col: int) -> tuple:
-        raise NotImplementedError
+        Parameters:
+        max_matches (int):
+            the maximum amount of matches to collect
+        """
+        HexSearch.max_matches = max_matches
 
-    def __next__(self) -> tuple:
-        raise NotImplementedError
+    def __init__(self, hex_buffer, search) -> None:
+        """
+        Parameters:
+        hex_buffer (HexBuffer):
+            the buffer to search in (a copy is searched, so it may be changed meanwhile)
+        search (str|re.Pattern):
+            the hex representation of the bytes to search for (an odd length
+            matches the high nibble of the last byte), or a compiled bytes pattern
+        """
+        self.search = search
+        self.changes = hex_buffer.changes
+        self.hex_buffer = hex_buffer.copy()
+        self.pattern, self.match_length = self._compile(search)
+        # the windows have to overlap, so matches spanning two windows are found
+        self.overlap = HexSearch.regex_overlap if self.match_length is None else \
+            max(self.match_length-1, 0)
+        self.offsets = array('Q')
+        # the length of the hex representation of every match (only if it varies)
+        self.lengths = array('Q') if self.match_length is None else None
+        if self.match_length is not None:
+            self.length = self.match_length * 2 - (isinstance(search, str) and len(search) % 2)
+        self.scanned = 0
+        # the position up to which all matches have been collected
+        self.indexed = 0
+        self.truncated = False
+        self.done = False
+        self.error = None
+        self._resume = 0
+        self._stopped = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._build, daemon=True)
+        self._thread.start()
 
+    @staticmethod
+    def _compile(search) -> tuple:
+        """
+        get the pattern to search for and the length of its matches
+        (None if the length is variable).
+        """
+        if not isinstance(search, str):
+            return (search, None)
+        pattern = bytes.fromhex(search[:len(search)//2*2])
+        if len(search) % 2:
+            nibble = int(search[-1], 16) << 4
+            # a lookahead also finds overlapping matches
+            return (re.compile(b'(?=' + re.escape(pattern) + b'[' + re.escape(bytes([nibble])) +
+                               b'-' + re.escape(bytes([nibble | 15])) + b'])', re.DOTALL),
+                    len(pattern)+1)
+        return (pattern, len(pattern))
 
-class _SearchIterHexUp(_SearchIterHexBase):
-    def _get_next_pos(self, row: int, col: int = None):
-        search_in = ''.join(self.editor._get_current_state_row(row))
-        if col is None:
-            col = len(search_in)//2
-        search_wrap = ''
-        while self.s_len-1 > len(search_wrap) and row < len(self.editor.hex_array)-1:
-            row += 1
-            search_wrap += ''.join(self.editor._get_current_state_row(row))
-        search_in += search_wrap[:self.s_len-1]
-        for i in range(col*2, -1, -2):
-            if search_in[i:].startswith(self.search):
-                return i//2
-        return -1
+    @property
+    def progress(self) -> int:
+        """
+        the percentage of the content, that has been searched.
+        """
+        return 100 if self.done else self.scanned * 100 // max(len(self.hex_buffer), 1)
 
-    def _stop_if_past_original(self, row: int, f_col: int) -> tuple:
-        if self.wrapped and (
-            row < self._start_y or
-            row == self._start_y and f_col < self._start_x
-        ):
-            raise StopIteration()
-        if self.editor.selecting and (
-            (row, f_col) < self.editor.selected_area[0]
-        ):
-            raise StopIteration()
-        self.yielded_result = True
-        return (row, f_col)
+    def stop(self) -> None:
+        """
+        stop the background search.
+        """
+        self._stopped = True
+        self._thread.join()
 
-    def __next__(self) -> tuple:
-        row = self.editor.cpos.row
-        col = self.editor.cpos.col - self.offset
+    def _find(self, window: bytes, blocked: list, limit: int, resume: int = 0):
+        """
+        find all matches within a window, that start in front of the limit
+        and contain only bytes with a value.
 
-        found_pos = self._get_next_pos(row, col)
-        if found_pos >= 0:
-            return self._stop_if_past_original(row, found_pos)
-        if self.wrapped:
-            for line_y in range(row - 1, self._start_y - 1, -1):
-                found_pos = self._get_next_pos(line_y)
-                if found_pos >= 0:
-                    return self._stop_if_past_original(line_y, found_pos)
+        Parameters:
+        window (bytes):
+            the content to search in
+        blocked (list):
+            the sorted positions of the bytes without a value
+        limit (int):
+            the position the next window starts at
+        resume (int):
+            the position to continue a regular expression search at, so that
+            a match reaching into the window is not found again
+
+        Yields:
+        (tuple):
+            the position of the match and the length of the hex representation
+        """
+        odd = isinstance(self.search, str) and len(self.search) % 2
+        if isinstance(self.pattern, bytes):
+            matches = self._find_bytes(window, limit)
         else:
-            for line_y in range(row-1, -1, -1):
-                found_pos = self._get_next_pos(line_y)
-                if found_pos >= 0:
-                    return self._stop_if_past_original(line_y, found_pos)
-            self.editor._build_file()
-            if self.editor.selecting:
-                raise StopIteration()
-            self.wrapped = True
-            for line_y in range(len(self.editor.hex_array)-1, self._start_y-1, -1):
-                found_pos = self._get_next_pos(line_y)
-                if found_pos >= 0:
-                    return self._stop_if_past_original(line_y, found_pos)
-        raise StopIteration()
+            matches = self._find_regex(window, limit, resume)
+        for start, end in matches:
+            b_index = bisect_left(blocked, start)
+            if b_index < len(blocked) and blocked[b_index] < end:
+                continue
+            yield (start, (end - start) * 2 - odd)
 
-class _SearchIterHexDown(_SearchIterHexBase):
-    def _get_next_pos(self, row: int, col: int = 0):
-        search_in = ''.join(self.editor._get_current_state_row(row)[col:])
-        search_wrap = ''
-        while self.s_len-1 > len(search_wrap) and row < len(self.editor.hex_array)-1:
-            row += 1
-            search_wrap += ''.join(self.editor._get_current_state_row(row))
-        search_in += search_wrap[:self.s_len-1]
+    def _find_bytes(self, window: bytes, limit: int):
+        pos = window.find(self.pattern)
+        while 0 <= pos < limit:
+            yield (pos, pos + self.match_length)
+            pos = window.find(self.pattern, pos+1)
 
-        for i in range(0, len(search_in)-len(self.search)+1, 2):
-            if search_in[i:].startswith(self.search):
-                return i//2
-        return -1
+    def _find_regex(self, window: bytes, limit: int, resume: int):
+        for match in self.pattern.finditer(window, resume):
+            if match.start() >= limit:
+                break
+            end = match.start() + self.match_length if self.match_length else match.end()
+            self._resume = match.end()
+            # empty matches cannot be displayed
+            if end > match.start():
+                yield (match.start(), end)
 
-    def _stop_if_past_original(self, row: int, f_col: int) -> tuple:
-        if self.wrapped and (
-            row > self._start_y or
-            row == self._start_y and f_col >= self._start_x
-        ):
-            raise StopIteration()
-        if self.editor.selecting and (
-            (row, f_col) > self.editor.selected_area[1]
-        ):
-            raise StopIteration()
-        self.yielded_result = True
-        return (row, f_col)
+    def _build(self) -> None:
+        size = len(self.hex_buffer)
+        edit_keys = sorted(self.hex_buffer.edits)
+        try:
+            for w_start in range(0, size, HexSearch.window_size):
+                if self._stopped:
+                    return
+                limit = min(HexSearch.window_size, size - w_start)
+                window, blocked = self.hex_buffer.get_content(w_start, limit + self.overlap,
+                                                              edit_keys)
+                resume = max(self._resume - HexSearch.window_size, 0)
+                self._resume = 0
+                room = HexSearch.max_matches - len(self.offsets)
+                offsets, lengths, truncated = array('Q'), array('Q'), False
+                for pos, length in self._find(window, blocked, limit, resume):
+                    if len(offsets) == room:
+                        limit, truncated = pos, True
+                        break
+                    offsets.append(w_start + pos)
+                    if self.lengths is not None:
+                        lengths.append(length)
+                with self._condition:
+                    self.offsets.extend(offsets)
+                    if self.lengths is not None:
+                        self.lengths.extend(lengths)
+                    self.indexed = self.scanned = w_start + limit
+                    self.truncated = truncated
+                    self._condition.notify_all()
+                if self.truncated:
+                    return
+        except (OSError, ValueError) as exc:
+            self.error = exc
+        finally:
+            with self._condition:
+                self.done = True
+                self._condition.notify_all()
 
-    def __next__(self) -> tuple:
-        row = self.editor.cpos.row
-        col = self.editor.cpos.col + self.offset
+    def _get_match(self, index: int) -> tuple:
+        return (self.offsets[index],
+                self.length if self.lengths is None else self.lengths[index])
 
-        found_pos = self._get_next_pos(row, col)
-        if found_pos >= 0:
-            return self._stop_if_past_original(row, found_pos+col)
-        if self.wrapped:
-            for line_y in range(row + 1, self._start_y + 1):
-                found_pos = self._get_next_pos(line_y)
-                if found_pos >= 0:
-                    return self._stop_if_past_original(line_y, found_pos)
-        else:
-            content_len = -1
-            while content_len != len(self.editor.hex_array):
-                content_len = len(self.editor.hex_array)
-                for line_y in range(row + 1, len(self.editor.hex_array)):
-                    found_pos = self._get_next_pos(line_y)
-                    if found_pos >= 0:
-                        return self._stop_if_past_original(line_y, found_pos)
-                self.editor._build_file_upto(content_len+30)
-            if self.editor.selecting:
-                raise StopIteration()
-            self.wrapped = True
-            for line_y in range(0, self._start_y + 1):
-                found_pos = self._get_next_pos(line_y)
-                if found_pos >= 0:
-                    return self._stop_if_past_original(line_y, found_pos)
-        raise StopIteration()
+    def _find_between(self, start: int, end: int):
+        """
+        search the content for all matches starting within a range of
+        positions directly, instead of using the collected matches.
 
-def search_iter_hex_factory(*args, downwards: bool = True) -> _SearchIterHexBase:
-    if downwards:
-        return _SearchIterHexDown(*args)
-    return _SearchIterHexUp(*args)
+        Yields:
+        (tuple):
+            the position of the match and the length of its hex representation
+        """
+        edit_keys = sorted(self.hex_buffer.edits)
+        self._resume = 0
+        for w_start in range(start, end, HexSearch.window_size):
+            limit = min(HexSearch.window_size, end - w_start)
+            window, blocked = self.hex_buffer.get_content(w_start, limit + self.overlap,
+                                                          edit_keys)
+            resume = max(self._resume - HexSearch.window_size, 0)
+            self._resume = 0
+            for pos, length in self._find(window, blocked, limit, resume):
+                yield (w_start + pos, length)
+
+    def _wait_for(self, pos: int) -> None:
+        """
+        wait until the content up to a given position has been searched.
+        must be called while holding the condition.
+        """
+        while not self.done and self.scanned <= pos:
+            self._condition.wait()
+
+    def next_match(self, pos: int):
+        """
+        find the first match starting at or after a given position.
+
+        Returns:
+        (tuple|None):
+            the position of the match and the length of its hex representation,
+            or None if there is no such match
+        """
+        with self._condition:
+            self._wait_for(pos)
+            index = bisect_left(self.offsets, pos)
+            while index >= len(self.offsets) and not self.done:
+                self._wait_for(self.scanned)
+                index = bisect_left(self.offsets, pos)
+            if index < len(self.offsets):
+                return self._get_match(index)
+            if not self.truncated:
+                return None
+            return next(self._find_between(max(pos, self.indexed), len(self.hex_buffer)), None)
+
+    def previous_match(self, pos: int):
+        """
+        find the last match starting at or before a given position.
+
+        Returns:
+        (tuple|None):
+            the position of the match and the length of its hex representation,
+            or None if there is no such match
+        """
+        with self._condition:
+            self._wait_for(pos)
+            w_end = min(pos + 1, len(self.hex_buffer))
+            # search backwards in growing windows, as dense matches are close by
+            w_size = HexSearch.regex_overlap
+            while self.truncated and w_end > self.indexed:
+                w_start = max(w_end - w_size, self.indexed)
+                match = None
+                for match in self._find_between(w_start, w_end):
+                    pass
+                if match is not None:
+                    return match
+                w_end, w_size = w_start, min(w_size * 2, HexSearch.window_size)
+            index = bisect_right(self.offsets, pos) - 1
+            if index < 0:
+                return None
+            return self._get_match(index)
+
+    def matches_between(self, start: int, end: int) -> list:
+        """
+        get all matches starting within a range of positions.
+
+        Returns:
+        (list):
+            the position and the length of the hex representation
+            of the matches, like [(pos, length), ...]
+        """
+        with self._condition:
+            self._wait_for(end - 1)
+            first, last = bisect_left(self.offsets, start), bisect_left(self.offsets, end)
+            matches = [self._get_match(index) for index in range(first, last)]
+            if self.truncated and end > self.indexed:
+                matches += self._find_between(max(start, self.indexed), end)
+            return matches
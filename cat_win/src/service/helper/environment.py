@@ -23,3 +23,17 @@ def get_py_executable() -> str:
     elif ' ' in py_executable:
         py_executable = f'"{py_executable}"' if on_windows_os else py_executable.replace(' ', '\\ ')
     return py_executable
+
+def get_cache_dir() -> str:
+    """
+    get the directory to store cached data in
+
+    Returns:
+    (str):
+        the user specific cache directory of cat_win
+    """
+    if on_windows_os:
+        cache_dir = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_dir, 'cat_win')
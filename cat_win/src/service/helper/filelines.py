@@ -0,0 +1,140 @@
+"""
+filelines
+"""
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+import re
+import threading
+
+from cat_win.src.service.helper.lineindex import LineIndex
+
+
+# the line breaks used when reading a file in text mode with newline=''
+LINE_BREAK_PATTERN = re.compile(r'\r\n|\r|\n')
+
+
+class FileLines(Sequence):
+    """
+    defines FileLines, that give random access to the lines of a (large) file
+    by decoding blocks of lines on demand. the blocks start at the lines indexed
+    by a LineIndex, so a line can be read without reading any line in front of it.
+    only the most recently used blocks are kept in memory.
+    the blocks can be accessed from multiple threads.
+    """
+    cache_size = 1024 * 1024 * 64
+
+    @staticmethod
+    def set_flags(cache_size: int) -> None:
+        """
+        setup the configuration
+
+        Parameters:
+        cache_size (int):
+            the maximum amount of (encoded) bytes the cached lines of a file may use
+        """
+        FileLines.cache_size = cache_size
+
+    def __init__(self, src_file: Path, index: LineIndex, file_encoding: str = 'utf-8') -> None:
+        """
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        index (LineIndex):
+            the index of the file, built with the universal line breaks
+        file_encoding (str):
+            an (ascii compatible) encoding to decode the file with
+        """
+        self.src_file = src_file
+        self.index = index
+        self.file_encoding = file_encoding
+        self.size = index.breaks_sum + 1
+        self.raw_f = None
+        # the decoded lines and the encoded size of every cached block
+        self.blocks = OrderedDict()
+        self.cached = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def close(self) -> None:
+        """
+        close the file and drop all blocks. the file is opened again when needed.
+        """
+        with self._lock:
+            if self.raw_f is not None:
+                self.raw_f.close()
+                self.raw_f = None
+            self.blocks.clear()
+            self.cached = 0
+
+    def _read_block(self, b_index: int) -> tuple:
+        """
+        read and decode a block of lines from the file.
+
+        Returns:
+        (tuple):
+            the lines of the block and its encoded size, like (lines, size)
+        """
+        if self.raw_f is None:
+            self.raw_f = open(self.src_file, 'rb')
+        offsets = self.index.offsets
+        self.raw_f.seek(offsets[b_index])
+        if b_index + 1 < len(offsets):
+            content = self.raw_f.read(offsets[b_index+1] - offsets[b_index])
+        else:
+            content = self.raw_f.read()
+        lines = LINE_BREAK_PATTERN.split(content.decode(self.file_encoding))
+        if b_index + 1 < len(offsets):
+            # every block but the last ends with a line break
+            lines.pop()
+        if len(lines) != min(LineIndex.step, self.size - b_index * LineIndex.step):
+            raise OSError(f"the file {self.src_file} has been changed")
+        return (lines, len(content))
+
+    def get_block(self, b_index: int) -> list:
+        """
+        get a block of lines from the cache, or read it from the file.
+        """
+        with self._lock:
+            block = self.blocks.get(b_index)
+            if block is not None:
+                self.blocks.move_to_end(b_index)
+                return block[0]
+            block = self._read_block(b_index)
+            self.blocks[b_index] = block
+            self.cached += block[1]
+            # evict the least recently used blocks
+            while self.cached > FileLines.cache_size and len(self.blocks) > 1:
+                self.cached -= self.blocks.popitem(last=False)[1][1]
+            return block[0]
+
+    def iter_lines(self, start: int, stop: int):
+        """
+        yield the lines within a range of rows block by block,
+        such that the amount of lines in memory stays limited.
+
+        Yields:
+        (str):
+            the next line
+        """
+        stop = min(stop, self.size)
+        if start >= stop:
+            return
+        for b_index in range(start // LineIndex.step, (stop-1) // LineIndex.step + 1):
+            b_start = b_index * LineIndex.step
+            yield from self.get_block(b_index)[max(start - b_start, 0):stop - b_start]
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            start, stop, step = row.indices(self.size)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return list(self.iter_lines(start, stop))
+        if row < 0:
+            row += self.size
+        if not 0 <= row < self.size:
+            raise IndexError('line index out of range')
+        return self.get_block(row // LineIndex.step)[row % LineIndex.step]
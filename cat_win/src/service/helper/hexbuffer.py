@@ -0,0 +1,389 @@
+"""
+hexbuffer
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+
+
+HEX_BYTES = [f"{byte:02X}" for byte in range(256)]
+# the representation of a byte, that has been inserted but has no value yet
+EMPTY_BYTE = '--'
+
+
+class HexBuffer:
+    """
+    defines a HexBuffer, that holds the bytes of a file as a piece table.
+    every byte has a stable key: the bytes of the (read-only) source are keyed
+    by their offset, inserted bytes are keyed by len(source) + the amount of
+    bytes inserted before them. the pieces reference ranges of these keys in order,
+    the edits (and deletions) of bytes are stored in a sparse overlay by key,
+    so nothing has to be shifted when inserting a byte.
+    """
+    def __init__(self, source=b'') -> None:
+        """
+        Parameters:
+        source (bytes|PageCache):
+            the original content of the file
+        """
+        self.source = source
+        self.source_size = len(source)
+        self.inserted = 0
+        # (key, length) of every piece and the position of every piece
+        self.pieces = [(0, self.source_size)] if self.source_size else []
+        self.positions = [0] * len(self.pieces)
+        # the amount of pieces, whose position is up to date. the positions
+        # of the following pieces are only recomputed when needed
+        self._valid = len(self.pieces)
+        self.size = self.source_size
+        # the edited hex bytes by key ('--' marks a deleted byte)
+        self.edits = {}
+        # the amount of changes made, to recognize outdated search results
+        self.changes = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def close(self) -> None:
+        """
+        release the source (e.g. close the file).
+        """
+        if hasattr(self.source, 'close'):
+            self.source.close()
+
+    def _find_piece(self, pos: int) -> int:
+        valid = self._valid
+        position = self.positions[valid-1] + self.pieces[valid-1][1] if valid else 0
+        if pos < position:
+            return bisect_right(self.positions, pos, 0, valid) - 1
+        # update the positions of the following pieces up to the piece containing the position
+        while valid < len(self.pieces):
+            self.positions[valid] = position
+            position += self.pieces[valid][1]
+            valid += 1
+            if pos < position:
+                break
+        self._valid = valid
+        return valid - 1
+
+    def _iter_keys(self, pos: int, length: int):
+        """
+        yield the ranges of keys of all bytes within a range of positions.
+
+        Yields:
+        (tuple):
+            the first key and the amount of bytes, like (key, length)
+        """
+        length = min(length, self.size - pos)
+        if length <= 0:
+            return
+        p_index = self._find_piece(pos)
+        key, p_length = self.pieces[p_index]
+        offset = pos - self.positions[p_index]
+        while length > 0:
+            count = min(p_length - offset, length)
+            yield (key + offset, count)
+            length -= count
+            p_index += 1
+            if length > 0:
+                key, p_length = self.pieces[p_index]
+                offset = 0
+
+    def key(self, pos: int) -> int:
+        """
+        get the key of the byte at a given position.
+        """
+        p_index = self._find_piece(pos)
+        return self.pieces[p_index][0] + pos - self.positions[p_index]
+
+    def get_originals(self, pos: int, length: int) -> list:
+        """
+        get the original hex bytes within a range of positions.
+
+        Returns:
+        (list):
+            the hex representation of the bytes, '--' for inserted bytes
+        """
+        originals = []
+        for key, count in self._iter_keys(pos, length):
+            if key < self.source_size:
+                originals += map(HEX_BYTES.__getitem__, self.source[key:key+count])
+            else:
+                originals += [EMPTY_BYTE] * count
+        return originals
+
+    def get_edits(self, pos: int, length: int) -> list:
+        """
+        get the edited hex bytes within a range of positions.
+
+        Returns:
+        (list):
+            the edited hex bytes, None for unedited bytes
+        """
+        if not self.edits:
+            return [None] * max(min(length, self.size - pos), 0)
+        return [self.edits.get(key + i) for key, count in self._iter_keys(pos, length)
+                for i in range(count)]
+
+    def get_state(self, pos: int, length: int) -> list:
+        """
+        get the current state (edited or original) of the hex bytes within a range of positions.
+        """
+        return [original if edit is None else edit for original, edit in zip(
+            self.get_originals(pos, length), self.get_edits(pos, length)
+        )]
+
+    def get_content(self, pos: int, length: int, edit_keys: list = None) -> tuple:
+        """
+        get the current state of the bytes within a range of positions as bytes.
+
+        Parameters:
+        pos (int):
+            the position of the first byte
+        length (int):
+            the amount of bytes
+        edit_keys (list):
+            the sorted keys of the edits (sorted on every call if not given)
+
+        Returns:
+        (tuple):
+            the content and the sorted positions (relative to pos) of the bytes
+            without a (complete) value, which must not be matched, like (content, blocked)
+        """
+        if edit_keys is None:
+            edit_keys = sorted(self.edits)
+        content, blocked = bytearray(), []
+        for key, count in self._iter_keys(pos, length):
+            start, unset = len(content), set()
+            if key < self.source_size:
+                content += self.source[key:key+count]
+            else:
+                content += bytes(count)
+                unset.update(range(key, key+count))
+            for edit_key in edit_keys[bisect_left(edit_keys, key):bisect_left(edit_keys, key+count)]:
+                byte = HexBuffer._to_bytes(self.edits[edit_key])
+                if byte:
+                    content[start + edit_key - key] = byte[0]
+                    unset.discard(edit_key)
+                else:
+                    blocked.append(start + edit_key - key)
+            blocked += [start + unset_key - key for unset_key in unset]
+        blocked.sort()
+        return (bytes(content), blocked)
+
+    def copy(self):
+        """
+        get a copy of the buffer, that is not affected by later changes.
+        the source is shared.
+        """
+        hex_buffer = HexBuffer()
+        hex_buffer.source, hex_buffer.source_size = self.source, self.source_size
+        hex_buffer.inserted, hex_buffer.size = self.inserted, self.size
+        hex_buffer.pieces, hex_buffer.positions = self.pieces[:], self.positions[:]
+        hex_buffer._valid = self._valid
+        hex_buffer.edits, hex_buffer.changes = dict(self.edits), self.changes
+        return hex_buffer
+
+    def get_edit(self, pos: int):
+        """
+        get the edited hex byte at a given position (None if it is unedited).
+        """
+        return self.edits.get(self.key(pos))
+
+    def set_edit(self, pos: int, hex_byte) -> None:
+        """
+        edit the byte at a given position.
+
+        Parameters:
+        pos (int):
+            the position of the byte
+        hex_byte (str|None):
+            the new hex value ('--' to delete the byte), or None to revert the edit
+        """
+        key = self.key(pos)
+        if hex_byte is None:
+            self.edits.pop(key, None)
+        else:
+            self.edits[key] = hex_byte
+        self.changes += 1
+
+    def insert(self, pos: int) -> None:
+        """
+        insert an empty byte at a given position.
+        only the pieces have to be updated, the bytes themselves are never shifted,
+        and the positions of the following pieces are updated when needed.
+
+        Parameters:
+        pos (int):
+            the position to insert the byte at (a position past the end appends it)
+        """
+        pos = max(min(pos, self.size), 0)
+        key = self.source_size + self.inserted
+        self.inserted += 1
+        self.size += 1
+        self.changes += 1
+        p_index = self._find_piece(pos) if pos < self.size-1 else len(self.pieces)
+        if p_index < len(self.pieces) and self.positions[p_index] < pos:
+            # split the piece containing the position
+            p_key, p_length = self.pieces[p_index]
+            split = pos - self.positions[p_index]
+            self.pieces[p_index:p_index+1] = [(p_key, split), (key, 1),
+                                              (p_key + split, p_length - split)]
+            self.positions[p_index+1:p_index+1] = [pos, pos + 1]
+            p_index += 1
+        elif p_index > 0 and self.pieces[p_index-1][0] >= self.source_size and \
+            self.pieces[p_index-1][0] + self.pieces[p_index-1][1] == key:
+            # continue the previously inserted bytes
+            self.pieces[p_index-1] = (self.pieces[p_index-1][0], self.pieces[p_index-1][1] + 1)
+        else:
+            self.pieces.insert(p_index, (key, 1))
+            self.positions.insert(p_index, pos)
+        # only the positions of the following pieces have changed
+        self._valid = min(self._valid, p_index)
+
+    @staticmethod
+    def _to_bytes(hex_byte: str) -> bytes:
+        """
+        convert an edited hex byte, empty if it is deleted or incomplete.
+        """
+        try:
+            return bytes.fromhex(hex_byte)
+        except ValueError:
+            return b''
+
+    def get_patches(self):
+        """
+        get the edits as ranges of the source, if no byte of the source
+        has been moved, i.e. the content can be saved by overwriting these ranges.
+
+        Returns:
+        (list|None):
+            the changed ranges like [(offset, content), ...], or None if
+            bytes have been inserted or deleted
+        """
+        position = 0
+        for key, length in self.pieces:
+            if key >= self.source_size:
+                # inserted bytes without a value will not be saved anyway
+                if any(HexBuffer._to_bytes(self.edits.get(key + i, EMPTY_BYTE))
+                       for i in range(length)):
+                    return None
+                continue
+            if key != position:
+                return None
+            position += length
+        patches = []
+        for key in sorted(self.edits):
+            if key >= self.source_size:
+                continue
+            byte = HexBuffer._to_bytes(self.edits[key])
+            if not byte:
+                return None
+            if patches and patches[-1][0] + len(patches[-1][1]) == key:
+                patches[-1][1].extend(byte)
+            else:
+                patches.append((key, bytearray(byte)))
+        return [(offset, bytes(content)) for offset, content in patches]
+
+    def _read(self, key: int, end: int, chunk_size: int):
+        if key >= self.source_size:
+            return
+        for i in range(key, end, chunk_size):
+            yield self.source[i:min(i + chunk_size, end)]
+
+    def yield_bytes(self, chunk_size: int = 1024 * 1024):
+        """
+        yield the current state of the content. inserted bytes without a value,
+        deleted bytes and partially edited bytes are omitted.
+
+        Yields:
+        (bytes):
+            the next part of the content
+        """
+        edit_keys = sorted(self.edits)
+        for key, length in self.pieces:
+            end = key + length
+            for edit_key in edit_keys[bisect_left(edit_keys, key):bisect_left(edit_keys, end)]:
+                yield from self._read(key, edit_key, chunk_size)
+                yield HexBuffer._to_bytes(self.edits[edit_key])
+                key = edit_key + 1
+            yield from self._read(key, end, chunk_size)
+
+
+class HexRows(Sequence):
+    """
+    defines a view of the rows of a HexBuffer. the hex bytes are only
+    created for the rows being accessed.
+    """
+    def __init__(self, hex_buffer: HexBuffer, columns: int, edits: bool = False) -> None:
+        """
+        Parameters:
+        hex_buffer (HexBuffer):
+            the buffer to view
+        columns (int):
+            the amount of bytes per row
+        edits (bool):
+            indicates if the edited bytes should be viewed instead of the original bytes
+        """
+        self.hex_buffer = hex_buffer
+        self.columns = columns
+        self.edits = edits
+
+    def __len__(self) -> int:
+        return max(-(-len(self.hex_buffer) // self.columns), 1)
+
+    def _get_row(self, row: int):
+        pos = row * self.columns
+        if self.edits:
+            return HexEditRow(self.hex_buffer, pos, self.columns)
+        return self.hex_buffer.get_originals(pos, self.columns)
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self._get_row(i) for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError('row index out of range')
+        return self._get_row(row)
+
+    def __setitem__(self, row: int, hex_bytes: list) -> None:
+        self[row][:] = hex_bytes
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class HexEditRow(Sequence):
+    """
+    defines a (writable) view of the edited bytes within a row of a HexBuffer.
+    """
+    def __init__(self, hex_buffer: HexBuffer, pos: int, length: int) -> None:
+        self.hex_buffer = hex_buffer
+        self.pos = pos
+        self.row_edits = hex_buffer.get_edits(pos, length)
+
+    def __len__(self) -> int:
+        return len(self.row_edits)
+
+    def __getitem__(self, col):
+        return self.row_edits[col]
+
+    def __setitem__(self, col, hex_byte) -> None:
+        cols = range(len(self))[col]
+        if isinstance(col, slice):
+            for i, hex_byte_ in zip(cols, hex_byte):
+                self.hex_buffer.set_edit(self.pos + i, hex_byte_)
+                self.row_edits[i] = hex_byte_
+            return
+        self.hex_buffer.set_edit(self.pos + cols, hex_byte)
+        self.row_edits[cols] = hex_byte
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Sequence) and self.row_edits == list(other)
+
+    def __repr__(self) -> str:
+        return repr(self.row_edits)
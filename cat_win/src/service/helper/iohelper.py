@@ -2,15 +2,94 @@
 iohelper
 """
 
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+import codecs
 import contextlib
 import ctypes
 import io
 import os
+import re
+import shutil
 import sys
 
 from cat_win.src.service.helper.environment import on_windows_os
-from cat_win.src.service.helper.progressbar import PBar
+
+
+# all characters str.splitlines() splits on
+LINE_BREAKS = '\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029'
+
+
+@lru_cache(maxsize=10)
+def encoded_line_breaks(file_encoding: str) -> tuple:
+    """
+    encode all line breaks str.splitlines() splits on.
+
+    Parameters:
+    file_encoding (str):
+        the encoding to use
+
+    Returns:
+    (tuple):
+        all encodable line breaks as bytes. the tuple is empty if the encoding
+        is not ascii compatible, since then the line breaks cannot be searched
+        for without decoding the whole content.
+    """
+    try:
+        if '\r\n'.encode(file_encoding) != b'\r\n':
+            return ()
+    except (LookupError, UnicodeError):
+        return ()
+    line_breaks = []
+    for line_break in LINE_BREAKS:
+        try:
+            line_breaks.append(line_break.encode(file_encoding))
+        except UnicodeError:
+            continue
+    return tuple(line_breaks)
+
+
+@lru_cache(maxsize=10)
+def line_break_pattern(line_breaks: tuple):
+    """
+    compile a pattern matching any of the given (encoded) line breaks.
+    '\r\n' is always matched as a single line break.
+
+    Parameters:
+    line_breaks (tuple):
+        the encoded line breaks (see encoded_line_breaks())
+
+    Returns:
+    (re.Pattern):
+        the compiled pattern
+    """
+    return re.compile(b'|'.join(
+        map(re.escape, sorted({b'\r\n', *line_breaks}, key=len, reverse=True))
+    ))
+
+
+def _count_line_breaks(buffer: bytes, line_breaks: tuple) -> int:
+    """
+    count the line breaks in a buffer. '\r\n' only counts as a single line break.
+    """
+    return sum(map(buffer.count, line_breaks)) - buffer.count(b'\r\n')
+
+
+def _find_line_start(buffer: bytes, line_breaks: tuple) -> int:
+    """
+    find the start of the first line in a buffer, that is guaranteed
+    to be complete regardless of the bytes preceding the buffer.
+    returns -1 if the buffer does not contain any line break.
+    """
+    cut = min(((buffer.find(l_b), len(l_b)) for l_b in line_breaks),
+              key=lambda x: (x[0] < 0, x[0]), default=(-1, 0))
+    if cut[0] < 0:
+        return -1
+    cut = sum(cut)
+    if buffer[cut-1:cut+1] == b'\r\n':
+        cut += 1
+    return cut
 
 
 def err_print(*args, **kwargs) -> None:
@@ -92,8 +171,7 @@ class IoHelper:
 
     @staticmethod
     def read_file(src_file: Path, binary: bool = False,
-                  file_encoding: str = 'utf-8', errors: str = 'strict',
-                  file_length: int = -1):
+                  file_encoding: str = 'utf-8', errors: str = 'strict'):
         """
         Reades content from a given file.
 
@@ -106,30 +184,11 @@ class IoHelper:
             an encoding to open the file with
         errors (str):
             the type of error handling when opening the file
-        file_length (int):
-            the size of the file for the total value of the progress bar
-            in case the progress bar is being displayed
 
         Returns:
         src_content (str|bytes):
             the content of the given file
         """
-        if file_length >= 0 and not binary:
-            src_content, src_length = '', 0
-            with PBar(
-                file_length, 'Reading file',
-                length=50, fill_l='━', fill_r='╺', erase=True
-            ).init() as p_bar, open(src_file, 'rb') as file:
-                buf_reader = io.BufferedReader(file, buffer_size=262144000) # 250MB
-                while True:
-                    byte_chunk = buf_reader.read(262144000)
-                    src_length += 262144000
-                    if not byte_chunk:
-                        break
-                    p_bar(src_length)
-                    src_content += byte_chunk.decode(file_encoding, errors)
-                p_bar(file_length)
-            return src_content
         if not binary:
             with open(src_file, 'r', encoding=file_encoding, errors=errors) as file:
                 src_content = file.read()
@@ -140,9 +199,78 @@ class IoHelper:
         return src_content
 
 
+    @staticmethod
+    def yield_file_chunks(src_file: Path, file_encoding: str = 'utf-8', errors: str = 'strict',
+                          chunk_size: int = 1024 * 1024 * 8):
+        """
+        Yields the decoded content of a given file in chunks. Characters (and '\r\n')
+        spanning the border of two chunks are decoded as a whole.
+        Line endings are translated like when opening the file in text mode.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        file_encoding (str):
+            an encoding to open the file with
+        errors (str):
+            the type of error handling when decoding the file
+        chunk_size (int):
+            the amount of bytes to read at once
+
+        Yields:
+        (str):
+            the next decoded chunk of the file
+        """
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(file_encoding)(errors), translate=True
+        )
+        with open(src_file, 'rb') as file:
+            while True:
+                byte_chunk = file.read(chunk_size)
+                chunk = decoder.decode(byte_chunk, final=not byte_chunk)
+                if chunk:
+                    yield chunk
+                if not byte_chunk:
+                    break
+
+    @staticmethod
+    def yield_line_chunks(src_file: Path, file_encoding: str = 'utf-8', errors: str = 'strict',
+                          chunk_size: int = 1024 * 1024 * 8):
+        """
+        Yields the decoded content of a given file in chunks, that consist of
+        complete lines only. Line endings are translated like when opening the
+        file in text mode.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        file_encoding (str):
+            an encoding to open the file with
+        errors (str):
+            the type of error handling when decoding the file
+        chunk_size (int):
+            the amount of bytes to read at once
+
+        Yields:
+        (str):
+            the next chunk of the file, ending with a line break
+            (unless it is the end of the file)
+        """
+        pending = []
+        for chunk in IoHelper.yield_file_chunks(src_file, file_encoding, errors, chunk_size):
+            cut = max(chunk.rfind(l_b) for l_b in LINE_BREAKS) + 1
+            if not cut:
+                pending.append(chunk)
+                continue
+            pending.append(chunk[:cut])
+            yield ''.join(pending)
+            pending = [chunk[cut:]]
+        if any(pending):
+            yield ''.join(pending)
+
     @staticmethod
     def yield_file(src_file: Path, binary: bool = False,
-                   file_encoding: str = 'utf-8', errors: str = 'strict'):
+                   file_encoding: str = 'utf-8', errors: str = 'strict', offset: int = 0):
         """
         Yields content from a given file. Appends an empty line if the last
         line ends with a newline, so the lines can be joined.
@@ -156,6 +284,9 @@ class IoHelper:
             an encoding to open the file with
         errors (str):
             the type of error handling when opening the file
+        offset (int):
+            the byte offset to start reading at (in text mode it has to be
+            the start of a line, see LineIndex)
 
         Yields:
         line (str):
@@ -167,6 +298,8 @@ class IoHelper:
             last_line = None
             file = open(src_file, 'r', encoding=file_encoding, errors=errors, newline='')
             try:
+                if offset:
+                    file.seek(offset)
                 for line in file:
                     last_line = line
                     yield line.rstrip('\r\n')
@@ -179,6 +312,7 @@ class IoHelper:
             return
         file = open(src_file, 'rb')
         try:
+            file.seek(offset)
             for line in file:
                 yield from line
         except StopIteration:
@@ -186,6 +320,336 @@ class IoHelper:
         finally:
             file.close()
 
+    @staticmethod
+    def yield_lines(src_file: Path, file_encoding: str = 'utf-8', errors: str = 'strict',
+                    chunk_size: int = 1024 * 64, offset: int = 0):
+        """
+        Yields the lines of a given file without their line endings.
+        The file is read and decoded chunk by chunk, the lines are split exactly
+        like str.splitlines() would split the entire content of the file.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        file_encoding (str):
+            an encoding to open the file with
+        errors (str):
+            the type of error handling when opening the file
+        chunk_size (int):
+            the amount of characters to read at once
+        offset (int):
+            the byte offset to start reading at (has to be the start of a line)
+
+        Yields:
+        line (str):
+            the next line of the given file
+        """
+        with open(src_file, 'r', encoding=file_encoding, errors=errors, newline='') as file:
+            if offset:
+                file.seek(offset)
+            pending = [] # the parts of a line, that has not been terminated yet
+            chunk = file.read(chunk_size)
+            while chunk:
+                # a trailing '\r' could be the first half of '\r\n'
+                while chunk[-1] == '\r':
+                    next_char = file.read(1)
+                    if not next_char:
+                        break
+                    chunk += next_char
+                lines = chunk.splitlines()
+                tail = None if chunk[-1] in LINE_BREAKS else lines.pop()
+                if lines:
+                    if pending:
+                        lines[0] = ''.join(pending) + lines[0]
+                        pending = []
+                    yield from lines
+                if tail is not None:
+                    pending.append(tail)
+                chunk = file.read(chunk_size)
+            if pending:
+                yield ''.join(pending)
+
+    @staticmethod
+    def read_bytes(src_file: Path, offset: int = 0, length: int = -1) -> bytes:
+        """
+        Reads a range of bytes from a given file by seeking to the offset.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        offset (int):
+            the position in the file to start reading from
+        length (int):
+            the maximum amount of bytes to read, a negative value reads until EOF
+
+        Returns:
+        (bytes):
+            the content of the file in the given range
+        """
+        with open(src_file, 'rb') as raw_f:
+            raw_f.seek(offset)
+            return raw_f.read(length)
+
+    @staticmethod
+    def yield_bytes(src_file: Path, offset: int = 0, length: int = -1,
+                    chunk_size: int = 1024 * 64):
+        """
+        Yields a range of bytes from a given file in chunks, so that the
+        file never has to be held in memory as a whole.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        offset (int):
+            the position in the file to start reading from
+        length (int):
+            the maximum amount of bytes to read, a negative value reads until EOF
+        chunk_size (int):
+            the amount of bytes to read at once
+
+        Yields:
+        (bytes):
+            the next chunk of the file
+        """
+        with open(src_file, 'rb') as raw_f:
+            if offset:
+                raw_f.seek(offset)
+            while length:
+                chunk = raw_f.read(chunk_size if length < 0 else min(chunk_size, length))
+                if not chunk:
+                    break
+                length -= len(chunk) if length > 0 else 0
+                yield chunk
+
+    @staticmethod
+    def count_lines(src_file: Path, file_encoding: str = 'utf-8',
+                    chunk_size: int = 1024 * 1024) -> int:
+        """
+        Counts the lines of a given file, equal to len(str.splitlines()), without
+        decoding the content. Expects an ascii compatible encoding
+        (see encoded_line_breaks()).
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        file_encoding (str):
+            the encoding of the file
+        chunk_size (int):
+            the amount of bytes to read at once
+
+        Returns:
+        (int):
+            the amount of lines in the file
+        """
+        line_breaks = encoded_line_breaks(file_encoding)
+        # line breaks consisting of multiple bytes can be split between two chunks
+        carry_size = max(map(len, line_breaks)) - 1
+        lines_sum, carry = 0, b''
+        with open(src_file, 'rb') as raw_f:
+            chunk = raw_f.read(chunk_size)
+            while chunk:
+                buffer = carry + chunk
+                lines_sum += _count_line_breaks(buffer, line_breaks) - \
+                    _count_line_breaks(carry, line_breaks)
+                carry = buffer[-carry_size-1:]
+                chunk = raw_f.read(chunk_size)
+        # the last line does not necessarily end with a line break
+        if carry and not carry.endswith(line_breaks):
+            lines_sum += 1
+        return lines_sum
+
+    @staticmethod
+    def scan_file(src_file: Path, file_encoding: str = 'utf-8',
+                  chunk_size: int = 1024 * 1024, longest_line: bool = True,
+                  line_count: bool = True) -> tuple:
+        """
+        collect multiple statistics of a given file within a single pass,
+        without holding the whole file in memory. only the amount of b'\\n'
+        is always being collected, as it is the cheapest.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        file_encoding (str):
+            the encoding of the file, used to count the lines like count_lines()
+        chunk_size (int):
+            the amount of bytes to read at once
+        longest_line (bool):
+            indicates if the length of the longest line should be collected
+        line_count (bool):
+            indicates if the amount of lines like count_lines() should be collected
+
+        Returns:
+        (tuple):
+            containing
+            the amount of b'\\n' + 1,
+            the length of the longest line as defined by bytes.splitlines()
+            (-1 if the file is empty or it has not been collected),
+            the amount of lines like count_lines() (-1 if the encoding is not
+            ascii compatible or it has not been collected),
+            like (lines_sum, max_line_length, line_count)
+        """
+        line_breaks = encoded_line_breaks(file_encoding) if line_count else ()
+        # line breaks consisting of multiple bytes (at least '\r\n')
+        # can be split between two chunks
+        carry_size = max([2, *map(len, line_breaks)]) - 1
+        lines_sum, max_line_length, line_length = 1, -1, 0
+        lines_found, carry = 0, b''
+        with open(src_file, 'rb') as raw_f:
+            chunk = raw_f.read(chunk_size)
+            while chunk:
+                lines_sum += chunk.count(b'\n')
+                if line_breaks:
+                    head = chunk[:carry_size]
+                    lines_found += _count_line_breaks(chunk, line_breaks) + \
+                        _count_line_breaks(carry + head, line_breaks) - \
+                        _count_line_breaks(carry, line_breaks) - \
+                        _count_line_breaks(head, line_breaks)
+                    carry = (carry + chunk)[-carry_size-1:]
+                if longest_line:
+                    lines = chunk.splitlines()
+                    # the first line may continue the last line of the previous chunk
+                    lines[0] = line_length + len(lines[0])
+                    max_line_length = max(max_line_length, lines[0], *map(len, lines[1:]))
+                    line_length = 0 if chunk.endswith((b'\n', b'\r')) else \
+                        (lines[0] if len(lines) == 1 else len(lines[-1]))
+                chunk = raw_f.read(chunk_size)
+        if not line_breaks:
+            lines_found = -1
+        # the last line does not necessarily end with a line break
+        elif carry and not carry.endswith(line_breaks):
+            lines_found += 1
+        return (lines_sum, max_line_length, lines_found)
+
+    @staticmethod
+    def read_last_lines(src_file: Path, line_count: int, file_encoding: str = 'utf-8',
+                        errors: str = 'strict', chunk_size: int = 1024 * 64) -> list:
+        """
+        Reads the last lines of a given file, by seeking to the end of the file
+        and scanning backwards until enough line breaks have been found.
+        The lines are split like str.splitlines() would split the entire content.
+        Expects an ascii compatible encoding (see encoded_line_breaks()).
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        line_count (int):
+            the amount of lines to read
+        file_encoding (str):
+            an encoding to open the file with
+        errors (str):
+            the type of error handling when decoding the file
+        chunk_size (int):
+            the amount of bytes to read initially (doubles on each step)
+
+        Returns:
+        (list):
+            the last line_count lines of the file
+        """
+        offset, _ = IoHelper.find_last_lines(src_file, line_count, file_encoding, chunk_size)
+        return IoHelper.read_bytes(src_file, offset).decode(file_encoding, errors).splitlines()
+
+    @staticmethod
+    def find_last_lines(src_file: Path, line_count: int, file_encoding: str = 'utf-8',
+                        chunk_size: int = 1024 * 64) -> tuple:
+        """
+        Finds the start of the last lines of a given file without decoding them,
+        by seeking to the end of the file and scanning backwards until enough
+        line breaks have been found.
+        The lines are split like str.splitlines() would split the entire content.
+        Expects an ascii compatible encoding (see encoded_line_breaks()).
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        line_count (int):
+            the amount of lines to find
+        file_encoding (str):
+            the encoding of the file
+        chunk_size (int):
+            the amount of bytes to read initially (doubles on each step)
+
+        Returns:
+        (tuple):
+            the byte offset of the first of the last lines and the amount of
+            lines found (less than line_count if the file is shorter),
+            like (offset, lines_found)
+        """
+        line_breaks = encoded_line_breaks(file_encoding)
+        with open(src_file, 'rb') as raw_f:
+            position = raw_f.seek(0, os.SEEK_END)
+            if line_count <= 0:
+                return (position, 0)
+            buffer = b''
+            while True:
+                read_size = min(chunk_size, position)
+                position -= read_size
+                raw_f.seek(position)
+                buffer = raw_f.read(read_size) + buffer
+                chunk_size *= 2
+                # the first line in the buffer may be incomplete
+                cut = 0 if position == 0 else _find_line_start(buffer, line_breaks)
+                if cut < 0:
+                    continue
+                lines_found = _count_line_breaks(buffer[cut:], line_breaks) + \
+                    bool(buffer[cut:]) - buffer.endswith(line_breaks)
+                if lines_found >= line_count or position == 0:
+                    break
+        # skip the lines in front of the last lines
+        skip = max(lines_found - line_count, 0)
+        if skip:
+            match = next(islice(line_break_pattern(line_breaks).finditer(buffer, cut),
+                                skip-1, None))
+            cut = match.end()
+        return (position + cut, lines_found - skip)
+
+    @staticmethod
+    def yield_lines_reversed(src_file: Path, file_encoding: str = 'utf-8',
+                             errors: str = 'strict', chunk_size: int = 1024 * 64):
+        """
+        Yields the lines of a given file from the last to the first one,
+        by reading the file in chunks starting at the end of the file.
+        The lines are split like str.splitlines() would split the entire content.
+        Expects an ascii compatible encoding (see encoded_line_breaks()).
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        file_encoding (str):
+            an encoding to open the file with
+        errors (str):
+            the type of error handling when decoding the file
+        chunk_size (int):
+            the amount of bytes to read at once
+
+        Yields:
+        (str):
+            the lines of the file in reversed order
+        """
+        line_breaks = encoded_line_breaks(file_encoding)
+        with open(src_file, 'rb') as raw_f:
+            position = raw_f.seek(0, os.SEEK_END)
+            buffer = b''
+            read_size = chunk_size
+            while position > 0:
+                read_size = min(read_size, position)
+                position -= read_size
+                raw_f.seek(position)
+                buffer = raw_f.read(read_size) + buffer
+                if position == 0:
+                    break
+                # the first line in the buffer may be incomplete, it will be
+                # completed by the chunks that precede it in the file
+                cut = _find_line_start(buffer, line_breaks)
+                if cut < 0 or cut == len(buffer):
+                    # read larger chunks to not copy a long line over and over again
+                    read_size *= 2
+                    continue
+                yield from reversed(buffer[cut:].decode(file_encoding, errors).splitlines())
+                buffer = buffer[:cut]
+                read_size = chunk_size
+            yield from reversed(buffer.decode(file_encoding, errors).splitlines())
+
     @staticmethod
     def get_newline(file: Path, default: str = '\n') -> str:
         """
@@ -239,6 +703,138 @@ class IoHelper:
             raw_f.write(content)
         return src_file
 
+    @staticmethod
+    def patch_file(src_file: Path, patches: list, p_bar=None) -> Path:
+        """
+        Overwrites ranges of bytes within a given file in place.
+        The rest of the file is neither read nor written.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        patches (list):
+            the ranges to overwrite, like [(offset, content), ...]
+        p_bar (callable):
+            called with the amount of bytes written so far
+
+        Returns:
+        src_file (Path):
+            the path to the file written
+        """
+        written = 0
+        with open(src_file, 'r+b') as raw_f:
+            for offset, content in patches:
+                if hasattr(os, 'pwrite'):
+                    content = memoryview(content)
+                    while content:
+                        bytes_written = os.pwrite(raw_f.fileno(), content, offset)
+                        content, offset = content[bytes_written:], offset + bytes_written
+                        written += bytes_written
+                else:
+                    raw_f.seek(offset)
+                    raw_f.write(content)
+                    written += len(content)
+                if p_bar is not None:
+                    p_bar(written)
+        return src_file
+
+    @staticmethod
+    def write_temp_file(src_file: Path, chunks, p_bar=None) -> str:
+        """
+        Writes content into a temporary file next to a given file and
+        flushes it to the disk. The given file itself is not touched.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        chunks (iterable):
+            the content to write in the file as bytes
+        p_bar (callable):
+            called with the amount of bytes written so far
+
+        Returns:
+        tmp_file (str):
+            the path to the temporary file written
+        """
+        # replace the file itself, not a symbolic link to it
+        tmp_file = f"{os.path.realpath(src_file)}.{os.getpid()}.tmp"
+        written = 0
+        try:
+            with open(tmp_file, 'wb') as raw_f:
+                for chunk in chunks:
+                    raw_f.write(chunk)
+                    written += len(chunk)
+                    if p_bar is not None:
+                        p_bar(written)
+                raw_f.flush()
+                os.fsync(raw_f.fileno())
+        except BaseException:
+            IoHelper.remove_file(tmp_file)
+            raise
+        return tmp_file
+
+    @staticmethod
+    def replace_file(src_file: Path, tmp_file: str) -> Path:
+        """
+        Replaces a given file with a temporary file (see write_temp_file()).
+        The temporary file is removed, if it cannot replace the file.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        tmp_file (str):
+            the path to the temporary file
+
+        Returns:
+        src_file (Path):
+            the path to the file written
+        """
+        src_file = os.path.realpath(src_file)
+        try:
+            try:
+                shutil.copymode(src_file, tmp_file)
+            except OSError:
+                pass
+            os.replace(tmp_file, src_file)
+        except BaseException:
+            IoHelper.remove_file(tmp_file)
+            raise
+        return src_file
+
+    @staticmethod
+    def remove_file(src_file: Path) -> None:
+        """
+        Removes a file, if it exists.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        """
+        try:
+            os.remove(src_file)
+        except OSError:
+            pass
+
+    @staticmethod
+    def write_file_atomic(src_file: Path, chunks, p_bar=None) -> Path:
+        """
+        Writes content into a temporary file next to a given file and replaces
+        the given file with it, so the file is never left partially written.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        chunks (iterable):
+            the content to write in the file as bytes
+        p_bar (callable):
+            called with the amount of bytes written so far
+
+        Returns:
+        src_file (Path):
+            the path to the file written
+        """
+        return IoHelper.replace_file(src_file, IoHelper.write_temp_file(src_file, chunks, p_bar))
+
 
     @staticmethod
     def get_stdin_content(one_line: bool = False, raw: bool = False):
@@ -0,0 +1,426 @@
+"""
+lineindex
+"""
+
+from array import array
+from hashlib import sha1
+from itertools import islice
+from pathlib import Path
+import os
+import struct
+import sys
+import threading
+
+from cat_win.src.service.helper.iohelper import line_break_pattern
+
+
+# the line breaks used when reading a file in text mode with newline=''
+# ('\r\n' always counts as a single line break)
+UNIVERSAL_LINE_BREAKS = (b'\n', b'\r')
+# the other line breaks str.splitlines() splits on, as encoded by ascii, latin-1 and utf-8
+# (or part of their encoding), so an index of the universal line breaks can be used
+# instead, if a file does not contain any of them
+OTHER_LINE_BREAKS = (b'\x0b', b'\x0c', b'\x1c', b'\x1d', b'\x1e', b'\x85',
+                     b'\xe2\x80\xa8', b'\xe2\x80\xa9')
+
+
+class LineIndex:
+    """
+    defines a LineIndex, containing the byte offset of every step-th line
+    of a file, so that a specific line can be reached by seeking close to it,
+    instead of reading every line before it.
+    the indices are being stored within a cache directory, so they only have to be
+    built once for each version of a file.
+    """
+    step = 1024
+    # smaller files can be read faster than an index can be built or loaded
+    min_file_size = 1024 * 1024
+    chunk_size = 1024 * 1024
+
+    cache_dir = None
+    cache_size = 0
+
+    _header = struct.Struct('<4sQQQ')
+    _magic = b'CWL2'
+    # the indices that have already been loaded in this process
+    _loaded = {}
+
+    @staticmethod
+    def set_flags(cache_dir: str, cache_size: int) -> None:
+        """
+        setup the configuration
+
+        Parameters:
+        cache_dir (str):
+            the directory to store the indices in
+        cache_size (int):
+            the maximum amount of bytes all stored indices may use.
+            a value of 0 disables the persistence of the indices
+        """
+        LineIndex.cache_dir = cache_dir
+        LineIndex.cache_size = cache_size
+
+    def __init__(self, offsets: array, breaks_sum: int, other_breaks: bool = True) -> None:
+        """
+        Parameters:
+        offsets (array):
+            the byte offsets of the lines 0, step, 2*step, ...
+        breaks_sum (int):
+            the amount of line breaks within the file
+        other_breaks (bool):
+            indicates if the file may contain any of the OTHER_LINE_BREAKS
+        """
+        self.offsets = offsets
+        self.breaks_sum = breaks_sum
+        self.other_breaks = other_breaks
+
+    def covers(self, line_breaks: tuple) -> bool:
+        """
+        check if the index of the universal line breaks is also the index
+        of a file split on other line breaks, because the file does not
+        contain any of the additional line breaks.
+
+        Parameters:
+        line_breaks (tuple):
+            the encoded line breaks to split the lines on (see encoded_line_breaks())
+
+        Returns:
+        (bool):
+            indicates if the index can be used for the line breaks
+        """
+        return not self.other_breaks and set(UNIVERSAL_LINE_BREAKS) <= set(line_breaks) and \
+            all(l_b in UNIVERSAL_LINE_BREAKS or any(o_b in l_b for o_b in OTHER_LINE_BREAKS)
+                for l_b in line_breaks)
+
+    def seek(self, line: int) -> tuple:
+        """
+        find the closest indexed line, that does not come after a given line.
+
+        Parameters:
+        line (int):
+            the (0-based) line to find
+
+        Returns:
+        (tuple):
+            containing the indexed line and its byte offset within the file,
+            like (indexed_line, offset)
+        """
+        index = min(max(line, 0) // LineIndex.step, len(self.offsets)-1)
+        return (index * LineIndex.step, self.offsets[index])
+
+    @staticmethod
+    def _yield_buffers(raw_f, line_breaks: tuple):
+        """
+        read a file in chunks, such that the line breaks within the
+        yielded part of each buffer are complete.
+
+        Parameters:
+        raw_f (BufferedReader):
+            the file to read from the current position on
+        line_breaks (tuple):
+            the encoded line breaks to split the lines on
+
+        Yields:
+        (tuple):
+            the buffer, the file offset of the buffer and the end of the part
+            of the buffer that has not been yielded before and only contains
+            complete line breaks, like (buffer, buffer_offset, cut)
+        """
+        # line breaks consisting of multiple bytes (at least '\r\n')
+        # can be split between two chunks
+        carry_size = max([2, *map(len, line_breaks), *map(len, OTHER_LINE_BREAKS)]) - 1
+        position, carry = raw_f.tell(), b''
+        while True:
+            chunk = raw_f.read(LineIndex.chunk_size)
+            buffer = carry + chunk
+            position += len(chunk)
+            cut = len(buffer)
+            if chunk:
+                # a trailing '\r' could still be followed by '\n'
+                search_buffer = buffer[:-1] if buffer.endswith(b'\r') else buffer
+                cut = max(search_buffer.rfind(l_b) + len(l_b) if l_b in search_buffer else 0
+                          for l_b in line_breaks)
+            yield (buffer, position - len(buffer), cut)
+            if not chunk:
+                return
+            carry = buffer[max(cut, len(buffer)-carry_size):]
+
+    @staticmethod
+    def _count(buffer: bytes, cut: int, line_breaks: tuple) -> int:
+        """
+        count the line breaks in front of the cut. '\r\n' only counts as a single line break.
+        """
+        return sum(buffer.count(l_b, 0, cut) for l_b in line_breaks) - \
+            buffer.count(b'\r\n', 0, cut)
+
+    @staticmethod
+    def build(src_file: Path, line_breaks: tuple = UNIVERSAL_LINE_BREAKS, stop=None):
+        """
+        build the index of a file by scanning it once.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        line_breaks (tuple):
+            the encoded line breaks to split the lines on (see encoded_line_breaks())
+        stop (threading.Event):
+            an event to cancel the building with (e.g. from another thread)
+
+        Returns:
+        (LineIndex|None):
+            the index of the file, or None if the building has been cancelled
+        """
+        pattern = line_break_pattern(line_breaks)
+        offsets, breaks_sum, other_breaks = array('Q', [0]), 0, False
+        with open(src_file, 'rb') as raw_f:
+            for buffer, buffer_offset, cut in LineIndex._yield_buffers(raw_f, line_breaks):
+                if stop is not None and stop.is_set():
+                    return None
+                # the carry of the buffers is long enough to contain any other line break
+                other_breaks = other_breaks or any(o_b in buffer for o_b in OTHER_LINE_BREAKS)
+                # the line after every step-th line break is an indexed line
+                missing = LineIndex.step - breaks_sum % LineIndex.step
+                offsets.extend(buffer_offset + match.end() for match in islice(
+                    pattern.finditer(buffer, 0, cut), missing-1, None, LineIndex.step
+                ))
+                breaks_sum += LineIndex._count(buffer, cut, line_breaks)
+        return LineIndex(offsets, breaks_sum, other_breaks)
+
+    @staticmethod
+    def find_line(src_file: Path, line: int, line_breaks: tuple = UNIVERSAL_LINE_BREAKS,
+                  start: tuple = (0, 0)) -> int:
+        """
+        find the start of a line by scanning the file from a known line on.
+        the line breaks are only counted, until the chunk containing the line is found.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        line (int):
+            the (0-based) line to find
+        line_breaks (tuple):
+            the encoded line breaks to split the lines on (see encoded_line_breaks())
+        start (tuple):
+            a known line and its offset, that does not come after the line
+            (e.g. the result of LineIndex.seek()), like (line, offset)
+
+        Returns:
+        (int):
+            the byte offset of the line, or the size of the file if the file
+            does not contain the line
+        """
+        missing, offset = line - start[0], start[1]
+        with open(src_file, 'rb') as raw_f:
+            raw_f.seek(offset)
+            if missing <= 0:
+                return offset
+            for buffer, buffer_offset, cut in LineIndex._yield_buffers(raw_f, line_breaks):
+                breaks_sum = LineIndex._count(buffer, cut, line_breaks)
+                if breaks_sum >= missing:
+                    match = next(islice(line_break_pattern(line_breaks).finditer(buffer, 0, cut),
+                                        missing-1, None))
+                    return buffer_offset + match.end()
+                missing -= breaks_sum
+                offset = buffer_offset + len(buffer)
+        return offset
+
+    @staticmethod
+    def _get_cache_file(cache_key: tuple) -> str:
+        """
+        get the path of the stored index of a file. the name of the cache file
+        changes whenever the file has been modified.
+        """
+        key = repr((*cache_key, LineIndex.step))
+        return os.path.join(LineIndex.cache_dir, sha1(key.encode()).hexdigest() + '.idx')
+
+    @staticmethod
+    def _load(cache_file: str):
+        try:
+            with open(cache_file, 'rb') as raw_f:
+                magic, step, breaks_sum, other_breaks = LineIndex._header.unpack(
+                    raw_f.read(LineIndex._header.size)
+                )
+                offsets = array('Q')
+                offsets.frombytes(raw_f.read())
+            # mark the index as recently used
+            os.utime(cache_file)
+        except (OSError, struct.error, ValueError):
+            return None
+        if magic != LineIndex._magic or step != LineIndex.step or not offsets:
+            return None
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+        return LineIndex(offsets, breaks_sum, bool(other_breaks))
+
+    @staticmethod
+    def _store(cache_file: str, index) -> None:
+        offsets = array('Q', index.offsets)
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+        try:
+            os.makedirs(LineIndex.cache_dir, exist_ok=True)
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, 'wb') as raw_f:
+                raw_f.write(LineIndex._header.pack(LineIndex._magic, LineIndex.step,
+                                                   index.breaks_sum, index.other_breaks))
+                raw_f.write(offsets.tobytes())
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            return
+        LineIndex._evict()
+
+    @staticmethod
+    def _evict() -> None:
+        """
+        remove the least recently used indices, until all stored indices
+        fit into the cache size.
+        """
+        try:
+            with os.scandir(LineIndex.cache_dir) as entries:
+                cache_files = [(entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                               for entry in entries if entry.name.endswith('.idx')]
+        except OSError:
+            return
+        cache_files.sort(reverse=True)
+        total_size = 0
+        for _, size, path in cache_files:
+            total_size += size
+            if total_size > LineIndex.cache_size:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def get(src_file: Path, line_breaks: tuple = UNIVERSAL_LINE_BREAKS, build: bool = True):
+        """
+        get the index of a file. the index is being loaded from the cache directory,
+        or built (and stored) on the first access. an index of the universal line
+        breaks is being used for other line breaks as well, if it covers them.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        line_breaks (tuple):
+            the encoded line breaks to split the lines on (see encoded_line_breaks())
+        build (bool):
+            indicates if the index should be built, if it has not been stored yet
+
+        Returns:
+        (LineIndex|None):
+            the index of the file, or None if the file is too small
+            to be indexed, cannot be read, or the index is not available
+        """
+        if not line_breaks:
+            return None
+        try:
+            cache_key = LineIndex._get_cache_key(src_file, line_breaks)
+            if cache_key is None:
+                return None
+            if cache_key in LineIndex._loaded:
+                return LineIndex._loaded[cache_key]
+            cache_file, index = None, None
+            if LineIndex.cache_dir and LineIndex.cache_size:
+                cache_file = LineIndex._get_cache_file(cache_key)
+                index = LineIndex._load(cache_file)
+            if index is None and tuple(line_breaks) != UNIVERSAL_LINE_BREAKS:
+                index = LineIndex.get(src_file, build=False)
+                if index is not None and not index.covers(line_breaks):
+                    index = None
+            if index is None:
+                if not build:
+                    return None
+                index = LineIndex.build(src_file, line_breaks)
+                if cache_file is not None:
+                    LineIndex._store(cache_file, index)
+        except OSError:
+            return None
+        LineIndex._remember(cache_key, index)
+        return index
+
+    @staticmethod
+    def put(src_file: Path, index, line_breaks: tuple = UNIVERSAL_LINE_BREAKS) -> None:
+        """
+        store the index of a file, that is already known (e.g. because the file
+        has just been written), so it does not have to be built on the next access.
+
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        index (LineIndex):
+            the index of the file
+        line_breaks (tuple):
+            the encoded line breaks the index has been built with
+        """
+        try:
+            cache_key = LineIndex._get_cache_key(src_file, line_breaks)
+        except OSError:
+            return
+        if cache_key is None:
+            return
+        if LineIndex.cache_dir and LineIndex.cache_size:
+            LineIndex._store(LineIndex._get_cache_file(cache_key), index)
+        LineIndex._remember(cache_key, index)
+
+    @staticmethod
+    def _get_cache_key(src_file: Path, line_breaks: tuple):
+        """
+        get the key identifying the current version of a file, or None
+        if the file is too small to be indexed.
+        """
+        stats = os.stat(src_file)
+        if stats.st_size < LineIndex.min_file_size:
+            return None
+        return (os.path.realpath(src_file), stats.st_size,
+                stats.st_mtime_ns, stats.st_ino, tuple(line_breaks))
+
+    @staticmethod
+    def _remember(cache_key: tuple, index) -> None:
+        # keep the most recent indices in memory
+        if len(LineIndex._loaded) >= 10:
+            del LineIndex._loaded[next(iter(LineIndex._loaded))]
+        LineIndex._loaded[cache_key] = index
+
+
+class LineIndexer:
+    """
+    defines a LineIndexer, that builds (and stores) the index of a file
+    in a background thread, so the first lines of the file can be shown
+    meanwhile, instead of scanning the whole file beforehand.
+    """
+    def __init__(self, src_file: Path) -> None:
+        """
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        """
+        self.src_file = src_file
+        self.index = None
+        self.done = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._build, daemon=True)
+        self._thread.start()
+
+    def _build(self) -> None:
+        try:
+            self.index = LineIndex.build(self.src_file, stop=self._stop)
+            if self.index is not None:
+                LineIndex.put(self.src_file, self.index)
+        except OSError:
+            pass
+        finally:
+            self.done = True
+
+    def join(self) -> None:
+        """
+        wait until the index has been built.
+        """
+        self._thread.join()
+
+    def stop(self) -> None:
+        """
+        cancel the building and wait until the file has been closed
+        (e.g. before the file is replaced).
+        """
+        self._stop.set()
+        self._thread.join()
@@ -0,0 +1,208 @@
+"""
+longline
+"""
+
+from bisect import bisect_right
+
+
+class LongLine:
+    """
+    defines a LongLine, that holds a very long line (e.g. minified code) as a
+    list of chunks. like a str it is never changed, but replacing a range of
+    characters only copies the chunk(s) containing the range instead of the
+    whole line, the other chunks are shared with the new line.
+    slicing a LongLine returns a str, any other str-method is called on the
+    whole line.
+    """
+    min_length = 1024 * 64
+    chunk_size = 1024 * 8
+
+    @staticmethod
+    def set_flags(min_length: int) -> None:
+        """
+        setup the configuration
+
+        Parameters:
+        min_length (int):
+            the length from which on a line is edited in chunks
+        """
+        LongLine.min_length = min_length
+
+    def __init__(self, line: str = '', chunks: list = None, offsets: list = None) -> None:
+        """
+        Parameters:
+        line (str):
+            the content of the line
+        chunks (list):
+            the chunks of the line to use instead
+        offsets (list):
+            the column of every chunk
+        """
+        if chunks is None:
+            step = LongLine.chunk_size
+            chunks = [line[i:i+step] for i in range(0, len(line), step)] or ['']
+            offsets = list(range(0, len(line), step)) or [0]
+        self.chunks = chunks
+        self.offsets = offsets
+        self.size = offsets[-1] + len(chunks[-1])
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __str__(self) -> str:
+        return ''.join(self.chunks)
+
+    def __repr__(self) -> str:
+        return f"LongLine({str(self)!r})"
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LongLine):
+            return self is other or (self.size == other.size and str(self) == str(other))
+        if isinstance(other, str):
+            return self.size == len(other) and str(self) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __add__(self, other) -> str:
+        if not isinstance(other, (str, LongLine)):
+            return NotImplemented
+        return str(self) + str(other)
+
+    def __radd__(self, other) -> str:
+        if not isinstance(other, str):
+            return NotImplemented
+        return other + str(self)
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from chunk
+
+    def __contains__(self, sub: str) -> bool:
+        return sub in str(self)
+
+    def __getattr__(self, name: str):
+        # every other str-method works on the whole line
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(str(self), name)
+
+    def _find_chunk(self, col: int) -> int:
+        return bisect_right(self.offsets, col) - 1
+
+    def __getitem__(self, col):
+        if isinstance(col, slice):
+            start, stop, step = col.indices(self.size)
+            if step != 1:
+                return self[start:stop][::step]
+            if start >= stop:
+                return ''
+            first, last = self._find_chunk(start), self._find_chunk(stop-1)
+            offset = self.offsets[first]
+            if first == last:
+                return self.chunks[first][start-offset:stop-offset]
+            return ''.join(self.chunks[first:last+1])[start-offset:stop-offset]
+        if col < 0:
+            col += self.size
+        if not 0 <= col < self.size:
+            raise IndexError('string index out of range')
+        c_index = self._find_chunk(col)
+        return self.chunks[c_index][col-self.offsets[c_index]]
+
+    def rstrip_length(self) -> int:
+        """
+        get the length of the line without trailing whitespace,
+        only reading the chunks at the end of the line.
+        """
+        for c_index in range(len(self.chunks)-1, -1, -1):
+            stripped = self.chunks[c_index].rstrip()
+            if stripped:
+                return self.offsets[c_index] + len(stripped)
+        return 0
+
+    def replace_range(self, col: int, count: int, text: str):
+        """
+        replace a range of characters.
+
+        Parameters:
+        col (int):
+            the first column to replace
+        count (int):
+            the amount of characters to replace (0 to only insert text)
+        text (str):
+            the new text
+
+        Returns:
+        (LongLine):
+            the changed line
+        """
+        col = max(min(col, self.size), 0)
+        stop = max(min(col + count, self.size), col)
+        first, last = self._find_chunk(col), self._find_chunk(max(stop-1, col))
+        offset = self.offsets[first]
+        merged = ''.join(self.chunks[first:last+1])
+        merged = merged[:col-offset] + text + merged[stop-offset:]
+        # keep the chunks small, so a change never copies much
+        step = LongLine.chunk_size
+        if len(merged) > step * 2:
+            new_chunks = [merged[i:i+step] for i in range(0, len(merged), step)]
+        else:
+            new_chunks = [merged] if merged else []
+        new_offsets = list(range(offset, offset + len(merged), step))[:len(new_chunks)]
+        change = len(text) - (stop - col)
+        chunks = self.chunks[:first] + new_chunks + self.chunks[last+1:]
+        offsets = self.offsets[:first] + new_offsets + \
+            [c_offset + change for c_offset in self.offsets[last+1:]]
+        if not chunks:
+            chunks, offsets = [''], [0]
+        return LongLine(chunks=chunks, offsets=offsets)
+
+
+def replace_range(line, col: int, count: int, text: str):
+    """
+    replace a range of characters within a line. a long line is changed
+    in chunks, such that only a small part of it has to be copied.
+
+    Parameters:
+    line (str|LongLine):
+        the line to change
+    col (int):
+        the first column to replace
+    count (int):
+        the amount of characters to replace (0 to only insert text)
+    text (str):
+        the new text
+
+    Returns:
+    (str|LongLine):
+        the changed line
+    """
+    if isinstance(line, LongLine):
+        line = line.replace_range(col, count, text)
+        return str(line) if len(line) < LongLine.min_length // 2 else line
+    if len(line) + len(text) > LongLine.min_length:
+        return LongLine(line).replace_range(col, count, text)
+    return line[:col] + text + line[col+count:]
+
+
+def rstrip_length(line) -> int:
+    """
+    get the length of a line without trailing whitespace.
+
+    Parameters:
+    line (str|LongLine):
+        the line
+
+    Returns:
+    (int):
+        the length of the stripped line
+    """
+    if isinstance(line, LongLine):
+        return line.rstrip_length()
+    if not line[-1:].isspace():
+        return len(line)
+    return len(line.rstrip())
@@ -0,0 +1,103 @@
+"""
+outputsink
+"""
+
+from time import monotonic
+import io
+import sys
+
+from cat_win.src.service.helper.environment import on_windows_os
+
+
+class OutputSink:
+    """
+    defines an OutputSink, that collects lines and writes them
+    to the (binary) stdout in large batches, instead of encoding and
+    writing every line on its own.
+    a BrokenPipeError (e.g. when piping into 'head') is not being caught,
+    so it will stop the (lazily evaluated) pipeline that produces the lines.
+    """
+    def __init__(self, flush_size: int = 1024 * 64, flush_interval: float = 0.1) -> None:
+        """
+        Parameters:
+        flush_size (int):
+            the amount of chars to collect before writing them
+        flush_interval (float):
+            the amount of seconds after which the collected lines will be written
+            (checked whenever a line is being added)
+        """
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+
+        self.stream = sys.stdout
+        # other streams (e.g. from colorama) may need to process the text
+        self.binary = self.stream.buffer if isinstance(self.stream, io.TextIOWrapper) else None
+        self.encoding = getattr(self.stream, 'encoding', None) or 'utf-8'
+        self.errors = getattr(self.stream, 'errors', None) or 'strict'
+        # the text layer of the stdout translates '\n' on windows
+        self.translate_newline = on_windows_os and self.binary is not None
+
+        self.lines = []
+        self.size = 0
+        self.last_flush = monotonic()
+
+    def __enter__(self):
+        # the text layer may still hold some output, that has to be written first
+        self.stream.flush()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None or not issubclass(exc_type, OSError):
+            self.flush()
+
+    def write_line(self, line: str) -> None:
+        """
+        add a line to the output.
+
+        Parameters:
+        line (str):
+            the line to write (without a line ending)
+        """
+        self.lines.append(line)
+        self.size += len(line) + 1
+        if self.size >= self.flush_size or monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        write all collected lines to the stdout.
+        """
+        self.last_flush = monotonic()
+        if not self.lines:
+            return
+        self.lines.append('')
+        output = '\n'.join(self.lines)
+        self.lines.clear()
+        self.size = 0
+        if self.binary is None:
+            self.stream.write(output)
+            self.stream.flush()
+            return
+        if self.translate_newline:
+            output = output.replace('\n', '\r\n')
+        self.binary.write(output.encode(self.encoding, self.errors))
+        self.binary.flush()
+
+
+class OutputCapture(io.StringIO):
+    """
+    defines an OutputCapture, that collects the output (e.g. of a worker process),
+    while still identifying as the original stream, so that checks
+    like os.isatty() behave the same.
+    """
+    def __init__(self, stream) -> None:
+        """
+        Parameters:
+        stream (TextIO):
+            the original stream, that is being replaced
+        """
+        super().__init__()
+        self.stream_fileno = stream.fileno()
+
+    def fileno(self) -> int:
+        return self.stream_fileno
@@ -0,0 +1,98 @@
+"""
+pagecache
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+import threading
+
+
+class PageCache:
+    """
+    defines a PageCache, that gives random access to the bytes of a file
+    by reading fixed-size pages on demand. only the most recently used pages
+    are kept in memory, so the size of the file does not matter.
+    the pages can be accessed from multiple threads.
+    """
+    page_size = 1024 * 64
+    cache_size = 1024 * 1024 * 64
+
+    @staticmethod
+    def set_flags(cache_size: int) -> None:
+        """
+        setup the configuration
+
+        Parameters:
+        cache_size (int):
+            the maximum amount of bytes the pages of a file may use
+        """
+        PageCache.cache_size = cache_size
+
+    def __init__(self, src_file: Path) -> None:
+        """
+        Parameters:
+        src_file (Path):
+            a string representation of a file (-path)
+        """
+        self.raw_f = open(src_file, 'rb')
+        self.raw_f.seek(0, 2)
+        self.size = self.raw_f.tell()
+        self.pages = OrderedDict()
+        self.max_pages = max(PageCache.cache_size // PageCache.page_size, 1)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def close(self) -> None:
+        """
+        close the file and drop all pages.
+        """
+        with self._lock:
+            self.raw_f.close()
+            self.pages.clear()
+
+    def _get_page(self, index: int) -> bytes:
+        """
+        get a page from the cache, or read it from the file.
+
+        Parameters:
+        index (int):
+            the index of the page
+
+        Returns:
+        (bytes):
+            the content of the page
+        """
+        with self._lock:
+            page = self.pages.get(index)
+            if page is not None:
+                self.pages.move_to_end(index)
+                return page
+            self.raw_f.seek(index * PageCache.page_size)
+            page = self.raw_f.read(PageCache.page_size)
+            self.pages[index] = page
+            # evict the least recently used pages
+            while len(self.pages) > self.max_pages:
+                self.pages.popitem(last=False)
+            return page
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            if index < 0:
+                index += self.size
+            if not 0 <= index < self.size:
+                raise IndexError('index out of range')
+            return self._get_page(index // PageCache.page_size)[index % PageCache.page_size]
+        start, stop, step = index.indices(self.size)
+        if step != 1:
+            return self[start:stop][::step]
+        if start >= stop:
+            return b''
+        first_page, last_page = start // PageCache.page_size, (stop-1) // PageCache.page_size
+        if first_page == last_page:
+            offset = first_page * PageCache.page_size
+            return self._get_page(first_page)[start-offset:stop-offset]
+        content = b''.join(map(self._get_page, range(first_page, last_page+1)))
+        offset = first_page * PageCache.page_size
+        return content[start-offset:stop-offset]
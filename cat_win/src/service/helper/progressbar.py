@@ -64,23 +64,42 @@ class PBar:
                     self.erase_progress_bar()
                 print(CURSOR_VISIBLE, end='\n'*(not self.erase), flush=True)
 
-    def print_progress_bar(self, iteration: int) -> None:
+    def get_progress_bar(self, iteration: int, colored: bool = True) -> str:
         """
-        print the current state of the progress bar
+        get the current state of the progress bar
 
         Parameters:
         iteration (int):
             the current progress iteration
+        colored (bool):
+            indicates if the progress bar should contain the ansi colors
+
+        Returns:
+        (str):
+            the progress bar as a single line
         """
         if iteration < 0 or iteration > self.total:
             iteration = self.total
         percentage = min(100 * (iteration / float(self.total)), 100.0)
-        percent_color = PBar.COLOR_DONE if percentage == 100.0 else PBar.COLOR_MISSING
+        color_done, color_missing, color_reset = '', '', ''
+        if colored:
+            color_done, color_missing, color_reset = \
+                PBar.COLOR_DONE, PBar.COLOR_MISSING, PBar.COLOR_RESET
+        percent_color = color_done if percentage == 100.0 else color_missing
         percent = f"{percentage:5.{self.decimals}f}"
         length_l = int(self.length * iteration // self.total)
-        bars = f"{PBar.COLOR_DONE}{self.fill_l * length_l}{PBar.COLOR_MISSING}{self.fill_r * (self.length - length_l)}"
-        progress = f"\r{self.prefix} {bars} {percent_color}{percent}%{PBar.COLOR_RESET} {self.suffix}"
-        print(progress, end='', flush=True)
+        bars = f"{color_done}{self.fill_l * length_l}{color_missing}{self.fill_r * (self.length - length_l)}"
+        return f"{self.prefix} {bars} {percent_color}{percent}%{color_reset} {self.suffix}"
+
+    def print_progress_bar(self, iteration: int) -> None:
+        """
+        print the current state of the progress bar
+
+        Parameters:
+        iteration (int):
+            the current progress iteration
+        """
+        print(f"\r{self.get_progress_bar(iteration)}", end='', flush=True)
 
     def erase_progress_bar(self) -> None:
         """
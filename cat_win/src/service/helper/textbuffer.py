@@ -0,0 +1,392 @@
+"""
+textbuffer
+"""
+
+from bisect import bisect_right
+from collections.abc import MutableSequence, Sequence
+
+
+def _append_piece(pieces: list, lines, start: int, length: int) -> None:
+    """
+    append a piece, or continue the last piece if it references the preceding lines.
+    """
+    if pieces and pieces[-1][0] is lines and pieces[-1][1] + pieces[-1][2] == start:
+        pieces[-1] = (lines, pieces[-1][1], pieces[-1][2] + length)
+    else:
+        pieces.append((lines, start, length))
+
+
+class TextBuffer(MutableSequence):
+    """
+    defines a TextBuffer, that holds the lines of a file as a piece table.
+    the pieces reference ranges of lines within the (read-only) source lines
+    or the appended-only added lines. every line that is changed is added once,
+    changing it again replaces it within the added lines, so neither the source
+    nor any other line has to be touched or shifted when editing.
+    """
+    def __init__(self, lines=(), source=None) -> None:
+        """
+        Parameters:
+        lines (iterable):
+            the initial lines of the source
+        source (Sequence):
+            a read-only source of lines to use instead (e.g. FileLines),
+            that cannot be loaded lazily
+        """
+        self.source = []
+        self.added = []
+        # (lines, start, length) of every piece and the row of every piece
+        self.pieces = []
+        self.positions = []
+        self.size = 0
+        # the amount of pieces, whose row is up to date. the rows of the following
+        # pieces are only recomputed when needed, so an edit does not update
+        # the rows of all pieces after it
+        self._valid = 0
+        # the index of the last piece found, since rows are mostly accessed in order
+        self._last = 0
+        if source is not None:
+            self.source = source
+            self.size = len(source)
+            self.pieces, self.positions = [(source, 0, self.size)], [0]
+        self.load(lines)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def close(self) -> None:
+        """
+        release the source (e.g. close the file).
+        """
+        if hasattr(self.source, 'close'):
+            self.source.close()
+
+    def load(self, lines) -> int:
+        """
+        append lines to the source (e.g. when lazily reading a file).
+
+        Parameters:
+        lines (iterable):
+            the lines to append
+
+        Returns:
+        (int):
+            the amount of lines appended
+        """
+        lines = list(lines)
+        if not lines:
+            return 0
+        start = len(self.source)
+        self.source.extend(lines)
+        count = len(lines)
+        if self.pieces and self.pieces[-1][0] is self.source and \
+            self.pieces[-1][1] + self.pieces[-1][2] == start:
+            # continue the last piece
+            self.pieces[-1] = (self.source, self.pieces[-1][1], self.pieces[-1][2] + count)
+        else:
+            self.pieces.append((self.source, start, count))
+            self.positions.append(self.size)
+        self.size += count
+        return count
+
+    def _find_piece(self, row: int) -> int:
+        last, valid = self._last, self._valid
+        if last < valid and \
+            self.positions[last] <= row < self.positions[last] + self.pieces[last][2]:
+            return last
+        position = self.positions[valid-1] + self.pieces[valid-1][2] if valid else 0
+        if row < position:
+            self._last = bisect_right(self.positions, row, 0, valid) - 1
+            return self._last
+        # update the rows of the following pieces up to the piece containing the row
+        while valid < len(self.pieces):
+            self.positions[valid] = position
+            position += self.pieces[valid][2]
+            valid += 1
+            if row < position:
+                break
+        self._valid = valid
+        self._last = valid - 1
+        return self._last
+
+    def _normalize(self, row: int) -> int:
+        if row < 0:
+            row += self.size
+        if not 0 <= row < self.size:
+            raise IndexError('line index out of range')
+        return row
+
+    @staticmethod
+    def _iter_piece(lines, start: int, length: int):
+        """
+        yield a range of lines of a piece.
+        """
+        if isinstance(lines, list):
+            yield from lines[start:start+length]
+        else:
+            # do not load the whole range of the source at once
+            yield from lines.iter_lines(start, start + length)
+
+    def _iter_lines(self, start: int, stop: int):
+        """
+        yield the lines within a range of rows.
+        """
+        if start >= stop:
+            return
+        p_index = self._find_piece(start)
+        offset = start - self.positions[p_index]
+        count = stop - start
+        for p_index in range(p_index, len(self.pieces)):
+            lines, p_start, p_length = self.pieces[p_index]
+            length = min(p_length - offset, count)
+            yield from self._iter_piece(lines, p_start + offset, length)
+            count -= length
+            offset = 0
+            if count <= 0:
+                return
+
+    def __iter__(self):
+        return self._iter_lines(0, self.size)
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            start, stop, step = row.indices(self.size)
+            if step != 1:
+                return self[start:stop][::step]
+            return list(self._iter_lines(start, stop))
+        row = self._normalize(row)
+        p_index = self._find_piece(row)
+        lines, p_start, _ = self.pieces[p_index]
+        return lines[p_start + row - self.positions[p_index]]
+
+    def __setitem__(self, row, line) -> None:
+        if isinstance(row, slice):
+            start, stop, step = row.indices(self.size)
+            if step != 1:
+                raise ValueError('extended slices are not supported')
+            self.replace_lines(start, max(stop - start, 0), line)
+            return
+        row = self._normalize(row)
+        p_index = self._find_piece(row)
+        lines, p_start, _ = self.pieces[p_index]
+        if lines is self.added:
+            # the line has already been changed before and is referenced only once
+            self.added[p_start + row - self.positions[p_index]] = line
+            return
+        self.replace_lines(row, 1, [line])
+
+    def __delitem__(self, row) -> None:
+        if isinstance(row, slice):
+            start, stop, step = row.indices(self.size)
+            if step != 1:
+                raise ValueError('extended slices are not supported')
+            self.replace_lines(start, max(stop - start, 0), ())
+            return
+        self.replace_lines(self._normalize(row), 1, ())
+
+    def insert(self, row: int, line: str) -> None:
+        if row < 0:
+            row = max(row + self.size, 0)
+        self.replace_lines(min(row, self.size), 0, [line])
+
+    def insert_lines(self, row: int, lines) -> None:
+        """
+        insert multiple lines at once.
+
+        Parameters:
+        row (int):
+            the row to insert the lines at
+        lines (iterable):
+            the lines to insert
+        """
+        self.replace_lines(max(min(row, self.size), 0), 0, lines)
+
+    def set_lines(self, rows_lines) -> None:
+        """
+        replace many single lines at once. the pieces are rebuilt in a single
+        pass, instead of updating them for every line.
+
+        Parameters:
+        rows_lines (iterable):
+            the rows (ascending) and their new lines, like (row, line)
+        """
+        new_pieces = []
+        pieces = iter(self.pieces)
+        # the remaining part of the current piece and its row
+        piece, p_row = next(pieces, None), 0
+        for row, line in rows_lines:
+            while piece is not None and p_row + piece[2] <= row:
+                _append_piece(new_pieces, *piece)
+                p_row += piece[2]
+                piece = next(pieces, None)
+            if piece is None:
+                raise IndexError('line index out of range')
+            lines, p_start, p_length = piece
+            offset = row - p_row
+            if offset:
+                _append_piece(new_pieces, lines, p_start, offset)
+            self.added.append(line)
+            _append_piece(new_pieces, self.added, len(self.added)-1, 1)
+            if p_length - offset > 1:
+                piece = (lines, p_start + offset + 1, p_length - offset - 1)
+            else:
+                piece = next(pieces, None)
+            p_row = row + 1
+        while piece is not None:
+            _append_piece(new_pieces, *piece)
+            piece = next(pieces, None)
+        self._set_pieces(new_pieces)
+
+    def _set_pieces(self, pieces: list) -> None:
+        """
+        replace all pieces and recompute their rows.
+        """
+        self.pieces = pieces
+        self.positions = [0] * len(pieces)
+        for p_index in range(1, len(pieces)):
+            self.positions[p_index] = self.positions[p_index-1] + pieces[p_index-1][2]
+        self._valid = len(pieces)
+        self._last = 0
+
+    def snapshot(self) -> list:
+        """
+        get the current pieces, such that later changes do not affect them
+        (e.g. to save the lines in the background). the added lines are frozen
+        and later changes are added to new added lines, so no line is copied.
+
+        Returns:
+        (list):
+            the pieces, like (lines, start, length)
+        """
+        if self.added:
+            self.added = []
+        return list(self.pieces)
+
+    def rebase(self, source, mapping: list) -> None:
+        """
+        reference the lines of a new source instead of the lines of a snapshot
+        (e.g. after the snapshot has been saved to the file of the new source).
+
+        Parameters:
+        source (Sequence):
+            the new (read-only) source
+        mapping (list):
+            where the pieces of the snapshot can be found within the new source,
+            like (lines, start, new_row, length). the added lines, that are not
+            mapped, are kept
+        """
+        # the ranges of every snapshot lines sorted by their start
+        ranges = {}
+        for lines, start, new_row, length in mapping:
+            ranges.setdefault(id(lines), []).append((start, new_row, length))
+        for l_ranges in ranges.values():
+            l_ranges.sort()
+        new_pieces = []
+        for lines, start, length in self.pieces:
+            l_ranges = ranges.get(id(lines))
+            if l_ranges is None:
+                _append_piece(new_pieces, lines, start, length)
+                continue
+            # a piece can be split within the new source
+            r_index, stop = bisect_right(l_ranges, (start, float('inf'))) - 1, start + length
+            while start < stop:
+                if r_index >= 0 and start < l_ranges[r_index][0] + l_ranges[r_index][2]:
+                    r_start, new_row, r_length = l_ranges[r_index]
+                    part = min(stop, r_start + r_length) - start
+                    _append_piece(new_pieces, source, new_row + start - r_start, part)
+                elif lines is self.source:
+                    raise ValueError('the line is not part of the new source')
+                else:
+                    # keep the lines, that are not part of the new source
+                    # (e.g. a line, that has been saved as multiple lines)
+                    part = min(stop, l_ranges[r_index+1][0]) - start \
+                        if r_index + 1 < len(l_ranges) else stop - start
+                    _append_piece(new_pieces, lines, start, part)
+                start += part
+                if r_index + 1 < len(l_ranges) and l_ranges[r_index+1][0] <= start:
+                    r_index += 1
+        self.close()
+        self.source = source
+        self._set_pieces(new_pieces)
+
+    def attach(self, source) -> None:
+        """
+        reference the lines of a new source, that starts with the lines
+        loaded so far, instead of the loaded lines, and append the rest of
+        its lines (e.g. once the index of a lazily read file has been built).
+
+        Parameters:
+        source (Sequence):
+            the new (read-only) source
+        """
+        loaded = len(self.source)
+        self.rebase(source, [(self.source, 0, 0, loaded)])
+        if len(source) > loaded:
+            _append_piece(self.pieces, source, loaded, len(source) - loaded)
+            self.size += len(source) - loaded
+            self._set_pieces(self.pieces)
+
+    def _split(self, row: int) -> int:
+        """
+        make sure a piece starts at a given row.
+
+        Returns:
+        (int):
+            the index of the piece starting at the row
+        """
+        if row >= self.size:
+            return len(self.pieces)
+        p_index = self._find_piece(row)
+        offset = row - self.positions[p_index]
+        if offset:
+            lines, p_start, p_length = self.pieces[p_index]
+            self.pieces[p_index:p_index+1] = [(lines, p_start, offset),
+                                              (lines, p_start + offset, p_length - offset)]
+            self.positions.insert(p_index+1, row)
+            self._valid += 1
+            p_index += 1
+        return p_index
+
+    def replace_lines(self, row: int, count: int, lines) -> None:
+        """
+        replace a range of lines with other lines. only the pieces
+        have to be updated, the lines themselves are never shifted.
+
+        Parameters:
+        row (int):
+            the first row to replace
+        count (int):
+            the amount of lines to replace (0 to only insert lines)
+        lines (iterable):
+            the new lines
+        """
+        count = max(min(count, self.size - row), 0)
+        start = len(self.added)
+        self.added.extend(lines)
+        new_count = len(self.added) - start
+        if not count and not new_count:
+            return
+        first = self._split(row)
+        last = self._split(row + count)
+        new_pieces = [(self.added, start, new_count)] if new_count else []
+        self.pieces[first:last] = new_pieces
+        del self.positions[first:last]
+        self.positions[first:first] = [row] * len(new_pieces)
+        self.size += new_count - count
+        # merge neighbouring pieces, that reference consecutive lines
+        for p_index in (first + len(new_pieces), first):
+            if 0 < p_index < len(self.pieces):
+                (lines_a, start_a, length_a), (lines_b, start_b, length_b) = \
+                    self.pieces[p_index-1], self.pieces[p_index]
+                if lines_a is lines_b and start_a + length_a == start_b:
+                    self.pieces[p_index-1:p_index+1] = [(lines_a, start_a, length_a + length_b)]
+                    del self.positions[p_index]
+        # only the rows of the following pieces have changed
+        self._valid = min(self._valid, first)
+        self._last = 0
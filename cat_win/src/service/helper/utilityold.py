@@ -1,44 +1,42 @@
 """
-A collection of methods for list comprehension in regard to the converter.py module
+A collection of methods for (generator) comprehension in regard to the converter.py module
 for Python < 3.8 (not using the Walrus operator).
 """
 
 from cat_win.src.service.converter import Converter
 
 
-def comp_eval(converter: Converter, content: list, param: str, cleaner: object) -> list:
+def comp_eval(converter: Converter, content, param: str, cleaner: object):
     """
     comprehend the content list for the eval parameter
 
     Parameters:
     converter (Converter):
         the converter object instance to use
-    content (list):
+    content (iterable):
         the file content to comprehend
     param (str):
         the parameter used
     cleaner (function):
         the method to call on each line in order to strip ansi color codes
 
-    Returns:
-    (list):
-        the new comprehended content list with all equations evaluated
+    Yields:
+    (tuple):
+        the new comprehended content with all equations evaluated
     """
-    new_content = []
     for prefix, line in content:
         evaluated = converter.evaluate(cleaner(line), (param.islower()))
         if evaluated is not None:
-            new_content.append((prefix, evaluated))
-    return new_content
+            yield (prefix, evaluated)
 
-def comp_conv(converter: Converter, content: list, param: str, cleaner: object):
+def comp_conv(converter: Converter, content, param: str, cleaner: object):
     """
     comprehend the content list for the dec/hex/bin parameters
 
     Parameters:
     converter (Converter):
         the converter object instance to use
-    content (list):
+    content (iterable):
         the file content to comprehend
     param (str):
         the parameter used
@@ -47,18 +45,15 @@ def comp_conv(converter: Converter, content: list, param: str, cleaner: object):
     cleaner (function):
         the method to call on each line in order to strip ansi color codes
 
-    Returns:
-    (list):
-        the new comprehended content list with all numbers converted
+    Yields:
+    (tuple):
+        the new comprehended content with all numbers converted
     """
     base = param.lstrip('-').lower()
     method_is_convertable = getattr(converter, 'is_' + base, lambda _: False)
     method_convert = getattr(converter, 'c_from_' + base, lambda x: x)
 
-    new_content = []
     for prefix, line in content:
         cleaned = cleaner(line)
         if cleaned and method_is_convertable(cleaned):
-            new_content.append((prefix, line + \
-                f" {method_convert(cleaned, param.islower())}"))
-    return new_content
+            yield (prefix, line + f" {method_convert(cleaned, param.islower())}")
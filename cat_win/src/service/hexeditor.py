@@ -9,19 +9,27 @@ try:
 except ImportError:
     CURSES_MODULE_ERROR = True
 import os
+import re
 import signal
 import sys
 
 from cat_win.src.const.escapecodes import ESC_CODE
-from cat_win.src.service.helper.editorsearchhelper import search_iter_hex_factory
+from cat_win.src.const.regex import compile_re
+from cat_win.src.service.helper.editorsearchhelper import HexSearch
 from cat_win.src.service.helper.editorhelper import Position, frepr, \
     UNIFY_HOTKEYS, KEY_HOTKEYS, ACTION_HOTKEYS, MOVE_HOTKEYS, SELECT_HOTKEYS, \
         FUNCTION_HOTKEYS, HEX_BYTE_KEYS
 from cat_win.src.service.helper.environment import on_windows_os
+from cat_win.src.service.helper.hexbuffer import HexBuffer, HexRows
 from cat_win.src.service.helper.iohelper import IoHelper, err_print
+from cat_win.src.service.helper.pagecache import PageCache
+from cat_win.src.service.helper.progressbar import PBar
 from cat_win.src.service.clipboard import Clipboard
 from cat_win.src.service.rawviewer import get_display_char_gen
 
+# the indicators of searching for bytes, text or a regular expression
+SEARCH_MODES = ['0x', '', 're:']
+
 
 class HexEditor:
     """
@@ -41,14 +49,16 @@ class HexEditor:
 
         self.file = file
         self.display_name = display_name
-        self._f_content_gen = None
-        self.hex_array = [[]]
-        self.hex_array_edit = [[]]
+        self.hex_buffer = HexBuffer()
+        # views of the original and the edited bytes, row by row
+        self.hex_array = HexRows(self.hex_buffer, HexEditor.columns)
+        self.hex_array_edit = HexRows(self.hex_buffer, HexEditor.columns, True)
 
         self.edited_byte_pos = 0
 
         self.search = ''
         self.search_items: dict = {}
+        self.hex_search = None
 
         self.status_bar_size = 1
         self.error_bar = ''
@@ -101,41 +111,15 @@ class HexEditor:
             from_y += (from_x // HexEditor.columns)
             from_x = from_x % HexEditor.columns
 
-    def _build_file(self):
-        for _byte in self._f_content_gen:
-            if len(self.hex_array[-1]) >= HexEditor.columns:
-                self.hex_array.append([])
-                self.hex_array_edit.append([])
-            self.hex_array[-1].append(f"{_byte:02X}")
-            self.hex_array_edit[-1].append(None)
-
-    def _yield_next_bytes(self, n: int):
-        for _ in range(n):
-            try:
-                yield f"{next(self._f_content_gen):02X}"
-            except StopIteration:
-                break
-
-    def _build_file_upto(self, to_row: int) -> None:
-        if len(self.hex_array) >= to_row:
-            return
-        next_bytes = self._yield_next_bytes((to_row-len(self.hex_array))*HexEditor.columns)
-        for _byte in next_bytes:
-            if len(self.hex_array[-1]) >= HexEditor.columns:
-                self.hex_array.append([])
-                self.hex_array_edit.append([])
-            self.hex_array[-1].append(_byte)
-            self.hex_array_edit[-1].append(None)
-
     def _setup_file(self) -> None:
         """
-        setup the editor content screen by reading the given file.
+        setup the editor content screen by opening the given file.
         """
-        self.hex_array = [[]]
-        self.hex_array_edit = [[]]
+        self._stop_search()
+        self.hex_buffer.close()
+        self.hex_buffer = HexBuffer()
         try:
-            self._f_content_gen = IoHelper.yield_file(self.file, True)
-            self._build_file_upto(31)
+            self.hex_buffer = HexBuffer(PageCache(self.file))
             self.unsaved_progress = False
             self.error_bar = ''
             self.status_bar_size = 1
@@ -145,6 +129,11 @@ class HexEditor:
             self.status_bar_size = 2
             if self.debug_mode:
                 err_print(self.error_bar)
+        self.hex_array = HexRows(self.hex_buffer, HexEditor.columns)
+        self.hex_array_edit = HexRows(self.hex_buffer, HexEditor.columns, True)
+
+    def _get_pos(self, row: int, col: int) -> int:
+        return row * HexEditor.columns + col
 
     def _get_current_state_row(self, row: int) -> list:
         """
@@ -158,13 +147,7 @@ class HexEditor:
         hex_row (list):
             the row in the current edited state
         """
-        hex_row = []
-        for j, byte in enumerate(self.hex_array[row]):
-            hex_byte = self.hex_array_edit[row][j]
-            if hex_byte is None:
-                hex_byte = byte
-            hex_row.append(hex_byte)
-        return hex_row
+        return self.hex_buffer.get_state(self._get_pos(row, 0), HexEditor.columns)
 
     def getxymax(self) -> tuple:
         """
@@ -189,11 +172,11 @@ class HexEditor:
             return
         if self.selecting:
             sel_from, sel_to = self.selected_area
-            for (pos_y, pos_x) in HexEditor.pos_between(sel_from, sel_to):
-                self.hex_array_edit[pos_y][pos_x] = None
+            for pos in range(self._get_pos(*sel_from), self._get_pos(*sel_to)+1):
+                self.hex_buffer.set_edit(pos, None)
             self.cpos.set_pos(sel_to)
         else:
-            self.hex_array_edit[self.cpos.row][self.cpos.col] = None
+            self.hex_buffer.set_edit(self._get_pos(*self.cpos.get_pos()), None)
         self.cpos.col += 1
 
     def _key_dl(self, _) -> str:
@@ -201,12 +184,11 @@ class HexEditor:
             return
         if self.selecting:
             sel_from, sel_to = self.selected_area
-            for (pos_y, pos_x) in HexEditor.pos_between(sel_from, sel_to):
-                self.hex_array_edit[pos_y][pos_x] = '--'
+            for pos in range(self._get_pos(*sel_from), self._get_pos(*sel_to)+1):
+                self.hex_buffer.set_edit(pos, '--')
             self.cpos.set_pos(sel_to)
         else:
-            self.hex_array_edit[self.cpos.row][self.cpos.col] = '--'
-            # self.hex_array[self.cpos.row][self.cpos.col] = '--'
+            self.hex_buffer.set_edit(self._get_pos(*self.cpos.get_pos()), '--')
         self.unsaved_progress = True
         self.cpos.col += 1
 
@@ -215,11 +197,11 @@ class HexEditor:
             return
         if self.selecting:
             sel_from, sel_to = self.selected_area
-            for (pos_y, pos_x) in HexEditor.pos_between(sel_from, sel_to):
-                self.hex_array_edit[pos_y][pos_x] = None
+            for pos in range(self._get_pos(*sel_from), self._get_pos(*sel_to)+1):
+                self.hex_buffer.set_edit(pos, None)
             self.cpos.set_pos(sel_from)
         else:
-            self.hex_array_edit[self.cpos.row][self.cpos.col] = None
+            self.hex_buffer.set_edit(self._get_pos(*self.cpos.get_pos()), None)
         self.cpos.col -= 1
 
     def _key_ctl_backspace(self, _) -> str:
@@ -227,12 +209,11 @@ class HexEditor:
             return
         if self.selecting:
             sel_from, sel_to = self.selected_area
-            for (pos_y, pos_x) in HexEditor.pos_between(sel_from, sel_to):
-                self.hex_array_edit[pos_y][pos_x] = '--'
+            for pos in range(self._get_pos(*sel_from), self._get_pos(*sel_to)+1):
+                self.hex_buffer.set_edit(pos, '--')
             self.cpos.set_pos(sel_from)
         else:
-            self.hex_array_edit[self.cpos.row][self.cpos.col] = '--'
-            # self.hex_array[self.cpos.row][self.cpos.col] = '--'
+            self.hex_buffer.set_edit(self._get_pos(*self.cpos.get_pos()), '--')
         self.unsaved_progress = True
         self.cpos.col -= 1
 
@@ -304,7 +285,6 @@ class HexEditor:
             self.cpos.set_pos(self.selected_area[1])
         max_y, _ = self.getxymax()
         self.cpos.row += max_y
-        self._build_file_upto(max_y+self.cpos.row+2)
 
     def _select_key_page_up(self) -> None:
         self.selecting = False
@@ -315,11 +295,10 @@ class HexEditor:
         self._move_key_page_down()
 
     def _move_key_end(self) -> None:
-        self.cpos.col = len(self.hex_array[self.cpos.row])-1
+        self.cpos.col = len(self.hex_array_edit[self.cpos.row])-1
 
     def _move_key_ctl_end(self) -> None:
-        self._build_file()
-        self.cpos.set_pos((len(self.hex_array)-1, len(self.hex_array[-1])-1))
+        self.cpos.set_pos((len(self.hex_array)-1, len(self.hex_array_edit[-1])-1))
 
     def _select_key_end(self) -> None:
         self._move_key_end()
@@ -335,23 +314,9 @@ class HexEditor:
         self._move_key_home()
 
     def _insert_byte(self, wchar: str) -> None:
-        pos_offset = int(wchar!='<')
-        self.hex_array[self.cpos.row].insert(self.cpos.col+pos_offset, '--')
-        self.hex_array_edit[self.cpos.row].insert(self.cpos.col+pos_offset, '--')
-        for i in range(self.cpos.row+1, len(self.hex_array)):
-            extracted_byte = self.hex_array[i-1][-1]
-            self.hex_array[i-1] = self.hex_array[i-1][:-1]
-            self.hex_array[i].insert(0, extracted_byte)
-            extracted_byte = self.hex_array_edit[i-1][-1]
-            self.hex_array_edit[i-1] = self.hex_array_edit[i-1][:-1]
-            self.hex_array_edit[i].insert(0, extracted_byte)
-        if len(self.hex_array[-1]) > HexEditor.columns:
-            extracted_byte = self.hex_array[-1][-1]
-            self.hex_array[-1] = self.hex_array[-1][:-1]
-            self.hex_array.append([extracted_byte])
-            extracted_byte = self.hex_array_edit[-1][-1]
-            self.hex_array_edit[-1] = self.hex_array_edit[-1][:-1]
-            self.hex_array_edit.append([extracted_byte])
+        pos = self._get_pos(*self.cpos.get_pos()) + int(wchar!='<')
+        self.hex_buffer.insert(pos)
+        self.hex_buffer.set_edit(min(pos, len(self.hex_buffer)-1), '--')
         if wchar != '<':
             self.cpos.col += 1
 
@@ -366,13 +331,11 @@ class HexEditor:
         if not isinstance(wchar, str) or not wchar:
             return
         wchar = wchar.upper()
-        if wchar in HEX_BYTE_KEYS and self.hex_array_edit[self.cpos.row]:
-            if self.hex_array_edit[self.cpos.row][self.cpos.col] is None:
-                self.hex_array_edit[self.cpos.row][self.cpos.col] = \
-                    self.hex_array[self.cpos.row][self.cpos.col]
-            self.hex_array_edit[self.cpos.row][self.cpos.col] = \
-                self.hex_array_edit[self.cpos.row][self.cpos.col][:self.edited_byte_pos] + \
-                wchar + self.hex_array_edit[self.cpos.row][self.cpos.col][self.edited_byte_pos+1:]
+        if wchar in HEX_BYTE_KEYS and len(self.hex_buffer):
+            pos = self._get_pos(*self.cpos.get_pos())
+            hex_byte = self.hex_buffer.get_state(pos, 1)[0]
+            self.hex_buffer.set_edit(pos, hex_byte[:self.edited_byte_pos] + wchar + \
+                hex_byte[self.edited_byte_pos+1:])
             if self.edited_byte_pos:
                 self.cpos.col += 1
             self.edited_byte_pos = (self.edited_byte_pos+1)%2
@@ -382,21 +345,18 @@ class HexEditor:
             self._insert_byte(wchar)
 
     def _select_key_all(self) -> None:
-        self._build_file()
         self.spos.set_pos((0, 0))
-        self.cpos.set_pos((len(self.hex_array)-1, len(self.hex_array[-1])-1))
+        self.cpos.set_pos((len(self.hex_array)-1, len(self.hex_array_edit[-1])-1))
         return None
 
     def _action_copy(self) -> bool:
         sel_from, sel_to = self.selected_area
         if not self.selecting:
             sel_from = sel_to = self.cpos.get_pos()
-        sel_bytes = ''
-        for row, col in HexEditor.pos_between(sel_from, sel_to):
-            hex_byte = self.hex_array_edit[row][col]
-            if hex_byte is None:
-                hex_byte = self.hex_array[row][col]
-            sel_bytes += hex_byte
+        sel_from = self._get_pos(*sel_from)
+        sel_bytes = ''.join(self.hex_buffer.get_state(
+            sel_from, self._get_pos(*sel_to)-sel_from+1
+        ))
         self.error_bar = self.error_bar if (
             Clipboard.put(sel_bytes)
         ) else 'An error occured copying the selected bytes to the clipboard!'
@@ -408,8 +368,9 @@ class HexEditor:
             return True
         max_y, _ = self.getxymax()
         i_chars = clipboard.encode('utf-16', 'surrogatepass').decode('utf-16')
-        insert_paste = self.hex_array_edit[self.cpos.row][self.cpos.col] in ['--', None] and \
-            self.hex_array[self.cpos.row][self.cpos.col] == '--'
+        pos = self._get_pos(*self.cpos.get_pos())
+        insert_paste = self.hex_buffer.get_edits(pos, 1) in [['--'], [None]] and \
+            self.hex_buffer.get_originals(pos, 1) == ['--']
         for i_char in filter(HEX_BYTE_KEYS.__contains__, i_chars.upper()):
             self._key_string(i_char)
             if insert_paste and not self.edited_byte_pos%2:
@@ -442,6 +403,53 @@ class HexEditor:
         self.error_bar = error_bar_backup
         self.curse_window.refresh()
 
+    def _get_save_patches(self):
+        """
+        get the edited ranges, if the file can be saved in place.
+
+        Returns:
+        (list|None):
+            the ranges to overwrite, or None if the file has to be rewritten
+        """
+        patches = self.hex_buffer.get_patches()
+        try:
+            if patches is not None and os.path.getsize(self.file) == self.hex_buffer.source_size:
+                return patches
+        except OSError:
+            pass
+        return None
+
+    def _yield_save_content(self):
+        yield from self.hex_buffer.yield_bytes()
+        # the file cannot be replaced while it is still open (on windows)
+        self.hex_buffer.close()
+
+    def _get_save_progress(self, total: int):
+        """
+        get a callback, that displays the progress of saving the file
+        within the status bar.
+
+        Parameters:
+        total (int):
+            the amount of bytes to write
+
+        Returns:
+        (callable):
+            to be called with the amount of bytes written so far
+        """
+        if self.curse_window is None:
+            return None
+        _, max_x = self.getxymax()
+        p_bar = PBar(max(total, 1), 'Saving', length=max(min(max_x-16, 50), 0),
+                     fill_l='━', fill_r='╺')
+        rendered = {'percent': -1}
+        def render(written: int) -> None:
+            percent = written * 100 // max(total, 1)
+            if percent != rendered['percent']:
+                rendered['percent'] = percent
+                self._action_render_scr(p_bar.get_progress_bar(written, False))
+        return render
+
     def _action_save(self) -> bool:
         """
         handle the save file action.
@@ -450,19 +458,19 @@ class HexEditor:
         (bool):
             indicates if the editor should keep running
         """
-        bytes_loaded = len(self.hex_array)*HexEditor.columns
-        bytes_loaded-= HexEditor.columns
-        bytes_loaded+= len(self.hex_array[-1])
-        content = b''
-        for i in range(len(self.hex_array)):
-            for hex_byte in self._get_current_state_row(i):
-                try:
-                    content += bytes.fromhex(hex_byte)
-                except ValueError:
-                    pass
-        content += bytes(self._f_content_gen)
+        self._stop_search()
+        patches = self._get_save_patches()
+        p_bar = self._get_save_progress(
+            sum(len(content) for _, content in patches) if patches is not None
+            else len(self.hex_buffer)
+        )
         try:
-            IoHelper.write_file(self.file, content)
+            if patches is not None:
+                # the size of the file does not change, only the edited bytes are written
+                self.hex_buffer.close()
+                IoHelper.patch_file(self.file, patches, p_bar)
+            else:
+                IoHelper.write_file_atomic(self.file, self._yield_save_content(), p_bar)
             self.changes_made = True
             self.unsaved_progress = False
             self.error_bar = ''
@@ -470,6 +478,11 @@ class HexEditor:
 
             self._setup_file()
         except OSError as exc:
+            try:
+                self.hex_buffer.close()
+                self.hex_buffer.source = PageCache(self.file)
+            except OSError:
+                pass
             self.unsaved_progress = True
             self.error_bar = str(exc)
             self.status_bar_size = 2
@@ -524,16 +537,20 @@ class HexEditor:
         (bool):
             indicates if the editor should keep running
         """
-        search_byte_mode, bm_ind = True, '0x'
+        # search for bytes, text or a regular expression
+        search_mode = 0 if isinstance(self.search, str) else 2
+        bm_ind = SEARCH_MODES[search_mode]
         sub_s_encoded = self.search
         wchar, sub_s, tmp_error= '', '', ''
         key, running = b'_key_enter', False
         while str(wchar) != ESC_CODE:
             if not find_next:
                 pre_s = ''
-                if self.search:
+                if self.search and not isinstance(self.search, str):
+                    pre_s = f" [re:{repr(self.search.pattern)[2:-1]}]"
+                elif self.search:
                     pre_s = f" [{bm_ind}{repr(self.search)[1:-1]}]"
-                    if not search_byte_mode:
+                    if search_mode:
                         try:
                             pre_s = f" [{bm_ind}{repr(bytes.fromhex(self.search))[2:-1]}]"
                         except ValueError:
@@ -552,16 +569,17 @@ class HexEditor:
                 if key == b'_action_paste':
                     clipboard = self._get_clipboard()
                     if clipboard is not None:
-                        if search_byte_mode:
+                        if not search_mode:
                             sub_s += ''.join(filter(HEX_BYTE_KEYS.__contains__, clipboard.upper()))
                         else:
                             sub_s += clipboard
                 if key == b'_action_find':
                     wchar, key = '', b'_key_enter'
                 if key == b'_action_insert':
-                    search_byte_mode = not search_byte_mode
-                    bm_ind = '0x' * search_byte_mode
-                    self.search = self.search[:-1] if len(self.search) % 2 else self.search
+                    search_mode = (search_mode+1) % len(SEARCH_MODES)
+                    bm_ind = SEARCH_MODES[search_mode]
+                    if isinstance(self.search, str) and len(self.search) % 2:
+                        self.search = self.search[:-1]
                     sub_s_encoded = self.search
                     sub_s = ''
                 if key == b'_action_background':
@@ -577,7 +595,7 @@ class HexEditor:
                 t_p = sub_s[-1:].isalpha()
                 while sub_s and sub_s[-1:].isalpha() == t_p:
                     sub_s = sub_s[:-1]
-            elif key == b'_key_string' and not search_byte_mode:
+            elif key == b'_key_string' and search_mode:
                 sub_s += wchar
             elif key == b'_key_string' and wchar.upper() in HEX_BYTE_KEYS:
                 sub_s += wchar.upper()
@@ -585,7 +603,14 @@ class HexEditor:
                 self.search = sub_s if sub_s else self.search
                 if not self.search:
                     break
-                if not search_byte_mode and self.search != sub_s_encoded:
+                if search_mode == 2 and sub_s:
+                    try:
+                        self.search = compile_re(sub_s.encode('utf-16', 'surrogatepass').decode(
+                            'utf-16').encode(), False)
+                    except re.error as exc:
+                        tmp_error = 'invalid regular expression: ' + str(exc)
+                        continue
+                elif search_mode == 1 and self.search != sub_s_encoded:
                     i_chars = self.search.encode('utf-16', 'surrogatepass').decode('utf-16')
                     if HexEditor.unicode_escaped_search and sub_s:
                         try:
@@ -599,52 +624,86 @@ class HexEditor:
                 sub_s_encoded = self.search
 
                 cpos_tmp, spos_tmp = self.cpos.get_pos(), self.spos.get_pos()
-                try:
-                    sel_pos_a, sel_pos_b = self.selected_area
-                    if self.selecting and self.cpos.get_pos() == sel_pos_b and find_next >= 0:
-                        self.cpos.set_pos(sel_pos_a)
-                        self.spos.set_pos(sel_pos_b)
-                    elif self.selecting and self.cpos.get_pos() == sel_pos_a and find_next < 0:
-                        self.cpos.set_pos(sel_pos_b)
-                        self.spos.set_pos(sel_pos_a)
-                    try:
-                        search = search_iter_hex_factory(
-                            self,
-                            1-self.selecting,
-                            downwards=(find_next >= 0)
-                        )
-                    except ValueError as exc:
-                        tmp_error = str(exc)
-                        continue
-                    max_y, _ = self.getxymax()
-                    cpos = next(search)
-                    self.search_items[cpos] = search.s_len
-                    if not self.selecting:
-                        if find_next >= 0:
-                            self.cpos.set_pos((max(cpos[0]-max_y, 0), 0))
-                        else:
-                            self.cpos.set_pos((min(cpos[0]+max_y, len(self.hex_array)-1),
-                                               len(self.hex_array[cpos[0]])-1))
-                    search = search_iter_hex_factory(
-                        self,
-                        1,
-                        downwards=(find_next >= 0)
-                    )
-                    for search_pos in search:
-                        if search_pos[0] < cpos[0]-max_y or search_pos[0] > cpos[0]+max_y:
-                            break
-                        self.cpos.set_pos(search_pos)
-                        self.search_items[search_pos] = search.s_len
-                    self.cpos.set_pos(cpos)
-                    break
-                except StopIteration:
+                sel_pos_a, sel_pos_b = self.selected_area
+                if self.selecting and self.cpos.get_pos() == sel_pos_b and find_next >= 0:
+                    self.cpos.set_pos(sel_pos_a)
+                    self.spos.set_pos(sel_pos_b)
+                elif self.selecting and self.cpos.get_pos() == sel_pos_a and find_next < 0:
+                    self.cpos.set_pos(sel_pos_b)
+                    self.spos.set_pos(sel_pos_a)
+                match = self._find_match(find_next >= 0)
+                if match is None:
                     if self.selecting:
                         self.cpos.set_pos(cpos_tmp)
                         self.spos.set_pos(spos_tmp)
                     tmp_error = 'no matches were found'
                     tmp_error+= ' within the selection!' if self.selecting else '!'
+                    continue
+                # highlight all matches on the screen around the found match
+                max_y, _ = self.getxymax()
+                cpos = divmod(match[0], HexEditor.columns)
+                area_from, area_to = self._get_pos(max(cpos[0]-max_y, 0), 0), \
+                    self._get_pos(cpos[0]+max_y+1, 0)
+                if self.selecting:
+                    sel_pos_a, sel_pos_b = self.selected_area
+                    area_from = max(area_from, self._get_pos(*sel_pos_a))
+                    area_to = min(area_to, self._get_pos(*sel_pos_b)+1)
+                for pos, length in self.hex_search.matches_between(area_from, area_to):
+                    self.search_items[divmod(pos, HexEditor.columns)] = length
+                self.search_items[cpos] = match[1]
+                self.cpos.set_pos(cpos)
+                break
         return True
 
+    def _get_search(self) -> HexSearch:
+        """
+        get the search for the current search pattern. the search
+        is started again whenever the content or the pattern have changed.
+        """
+        if self.hex_search is None or self.hex_search.search != self.search or \
+            self.hex_search.changes != self.hex_buffer.changes:
+            self._stop_search()
+            self.hex_search = HexSearch(self.hex_buffer, self.search)
+        return self.hex_search
+
+    def _stop_search(self) -> None:
+        if self.hex_search is not None:
+            self.hex_search.stop()
+            self.hex_search = None
+
+    def _find_match(self, downwards: bool):
+        """
+        find the next match from the cursor on. the search wraps around
+        the end of the content, unless searching within a selection.
+
+        Parameters:
+        downwards (bool):
+            indicates if the next or the previous match should be found
+
+        Returns:
+        (tuple|None):
+            the position of the match and the length of its hex representation
+        """
+        search = self._get_search()
+        pos = self._get_pos(*self.cpos.get_pos())
+        offset = 1 - self.selecting
+        sel_pos_a, sel_pos_b = self.selected_area
+        if downwards:
+            match = search.next_match(pos + offset)
+            if match is None and not self.selecting:
+                match = search.next_match(0)
+            if self.selecting and match is not None and match[0] > self._get_pos(*sel_pos_b):
+                match = None
+        else:
+            match = search.previous_match(pos - offset) if pos - offset >= 0 else None
+            if match is None and not self.selecting:
+                match = search.previous_match(len(self.hex_buffer))
+            if self.selecting and match is not None and match[0] < self._get_pos(*sel_pos_a):
+                match = None
+        if search.error is not None:
+            self.error_bar = str(search.error)
+        return match
+
     def _action_reload(self) -> bool:
         """
         prompt to reload the file.
@@ -718,7 +777,8 @@ class HexEditor:
                     for byte_ in i_char.encode():
                         self._insert_byte('>')
                         self._fix_cursor_position(max_y)
-                        self.hex_array_edit[self.cpos.row][self.cpos.col] = f"{byte_:02X}"
+                        self.hex_buffer.set_edit(self._get_pos(*self.cpos.get_pos()),
+                                                 f"{byte_:02X}")
                 self.unsaved_progress = True
                 break
         return True
@@ -868,6 +928,26 @@ class HexEditor:
         debug_out(wchar, _key, key)
         return (wchar, key)
 
+    def _await_next_char(self) -> tuple:
+        """
+        get next char, while updating the progress of a running search.
+
+        Returns
+        (wchar, key) (tuple):
+            the char received and the possible action it means.
+        """
+        while self.hex_search is not None and not self.hex_search.done:
+            self.curse_window.timeout(100)
+            try:
+                return self._get_next_char()
+            except curses.error:
+                # no input yet
+                self._render_status_bar(*self.getxymax())
+                self.curse_window.refresh()
+            finally:
+                self.curse_window.timeout(-1)
+        return self._get_next_char()
+
     def _get_color(self, c_id: int) -> int:
         """
         get curses color by id.
@@ -977,9 +1057,10 @@ class HexEditor:
                 continue
             if row >= self.wpos.row+max_y:
                 break
-            color_id = 7 if self.hex_array_edit[row][col] is None else 8
+            edited = self.hex_buffer.get_edit(self._get_pos(row, col)) is not None
+            color_id = 8 if edited else 7
             if (row, col) == self.cpos.get_pos():
-                color_id = 4 if self.hex_array_edit[row][col] is None else 6
+                color_id = 6 if edited else 4
             try:
                 self.curse_window.chgat(row-self.wpos.row+2, 13 + col*3,
                                         2, self._get_color(color_id))
@@ -1048,9 +1129,12 @@ class HexEditor:
                 self.curse_window.addstr(max_y + self.status_bar_size + 1, 0,
                                          self.error_bar[:max_x].ljust(max_x), self._get_color(2))
 
+            search_progress = ''
+            if self.hex_search is not None and not self.hex_search.done:
+                search_progress = f" | Searching: {self.hex_search.progress}%"
             status_bar = f"File: {self.display_name} | Help: F1 | "
             status_bar += f"{self.cpos.row*HexEditor.columns+self.cpos.col:08X}"
-            status_bar += f" | {'NOT ' * self.unsaved_progress}Saved!"
+            status_bar += f" | {'NOT ' * self.unsaved_progress}Saved!{search_progress}"
             if self.debug_mode:
                 status_bar += f" - Win: {self.wpos.col+1} {self.wpos.row+1} | {max_y}x{max_x}"
             if len(status_bar) > max_x:
@@ -1058,7 +1142,7 @@ class HexEditor:
                 status_bar = f"File: ...{self.display_name[-necc_space:] * bool(necc_space)} "
                 status_bar += '| Help: F1 | '
                 status_bar += f"{self.cpos.row*HexEditor.columns+self.cpos.col:08X}"
-                status_bar += f" | {'NOT ' * self.unsaved_progress}Saved!"
+                status_bar += f" | {'NOT ' * self.unsaved_progress}Saved!{search_progress}"
                 if self.debug_mode:
                     status_bar += f" - Win: {self.wpos.col+1} {self.wpos.row+1} | {max_y}x{max_x}"
             # this throws an error (should be max_x-1), but looks better:
@@ -1073,8 +1157,6 @@ class HexEditor:
         render the curses window.
         """
         max_y, max_x = self.getxymax()
-        self._build_file_upto(max_y+self.cpos.row+2)
-
         self._fix_cursor_position(max_y)
 
         self._render_title_offset(max_x)
@@ -1095,7 +1177,7 @@ class HexEditor:
 
         while running:
             self._render_scr()
-            wchar, key = self._get_next_char()
+            wchar, key = self._await_next_char()
             if key != b'_key_string':
                 self.edited_byte_pos = 0
 
@@ -1194,10 +1276,9 @@ class HexEditor:
                 err_print('The file has been successfully saved.')
             raise e
         finally:
-            try: # cleanup - close file
-                self._f_content_gen.throw(StopIteration)
-            except StopIteration:
-                pass
+            # cleanup - close file
+            self._stop_search()
+            self.hex_buffer.close()
             curses.endwin()
 
     @classmethod
@@ -1,6 +1,7 @@
 """
 more
 """
+from itertools import islice
 from pathlib import Path
 
 import os
@@ -8,7 +9,8 @@ import shutil
 import sys
 
 from cat_win.src.const.escapecodes import ESC_CODE, CURSOR_START_ABOVE_1, ERASE_LINE
-from cat_win.src.service.helper.iohelper import IoHelper
+from cat_win.src.service.helper.iohelper import IoHelper, encoded_line_breaks
+from cat_win.src.service.helper.lineindex import LineIndex
 
 
 class More:
@@ -40,6 +42,9 @@ class More:
         self.lines = lines if lines else []
         self._f_content_gen = None
         self.lazy_load = False
+        self._file, self._file_encoding, self._errors = None, 'utf-8', 'strict'
+        # the line number of the first loaded line (of a lazy loaded file)
+        self._line_offset = 0
 
     def lazy_load_file(self, file: Path, file_encoding: str = 'utf-8',
                        errors: str = 'strict') -> None:
@@ -55,9 +60,41 @@ class More:
             the error setting to open the file with
         """
         self.lazy_load = True
+        self._file, self._file_encoding, self._errors = file, file_encoding, errors
         self._f_content_gen = IoHelper.yield_file(file, False, file_encoding, errors)
         self._build_file_upto(More.t_height)
 
+    def _load_file_from(self, row: int) -> bool:
+        """
+        replace the loaded lines of a lazy loaded file with the lines
+        starting at a given row, by seeking close to it using the line index.
+
+        Parameters:
+        row (int):
+            the (0-based) row to load the file from
+
+        Returns:
+        (bool):
+            indicates if the file could be loaded from the given row
+        """
+        if not self.lazy_load or not encoded_line_breaks(self._file_encoding):
+            return False
+        index = LineIndex.get(self._file)
+        if index is None:
+            return False
+        indexed_row, offset = index.seek(row)
+        self._f_content_gen = IoHelper.yield_file(self._file, False, self._file_encoding,
+                                                  self._errors, offset)
+        skipped = sum(1 for _ in islice(self._f_content_gen, row - indexed_row))
+        self.lines, self._line_offset = [], indexed_row + skipped
+        return True
+
+    def _get_line(self, row: int) -> str:
+        if row < self._line_offset:
+            self._load_file_from(row)
+            self._build_file_upto(row + max(More.t_height, More.step_length))
+        return self.lines[row - self._line_offset]
+
     def add_line(self, line: str) -> None:
         """
         add a single line.
@@ -83,14 +120,15 @@ class More:
             return len(self.lines)
         if to_row < 0:
             self.lines += list(self._f_content_gen)
-            return len(self.lines)
+            return self._line_offset + len(self.lines)
+        to_row -= self._line_offset
         if len(self.lines) >= to_row:
-            return len(self.lines)
+            return self._line_offset + len(self.lines)
         for line in self._f_content_gen:
             self.lines.append(line)
             if len(self.lines) >= to_row:
                 break
-        return len(self.lines)
+        return self._line_offset + len(self.lines)
 
     @staticmethod
     def _pause_output(percentage: int, info: str, clear_size: int = 0) -> str:
@@ -150,7 +188,7 @@ class More:
         skip_line_parts = 0
 
         while line_index < i_length:
-            for line_part in More._yield_parts(self.lines[line_index]):
+            for line_part in More._yield_parts(self._get_line(line_index)):
                 if skip_line_parts > 0:
                     skip_line_parts -= 1
                     continue
@@ -235,6 +273,10 @@ class More:
                                 elif line_index < -2:
                                     i_length = self._build_file_upto(-1)
                                     line_index = max(i_length+line_index+1, -1)
+                                # seek close to lines far ahead, instead of
+                                # reading every line before them
+                                elif line_index+1 > i_length + LineIndex.step:
+                                    self._load_file_from(line_index+1)
                             except ValueError:
                                 info = f"invalid input: {ijump}"
                                 continue
@@ -2,7 +2,10 @@
 rawviewer
 """
 
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
+import codecs
 
 from cat_win.src.service.helper.iohelper import IoHelper
 
@@ -45,6 +48,48 @@ SPECIAL_CHARS = [
 # (ord[dec],char,symbol,use in --chr)
 
 
+# whether bytes.hex() supports a separator (python >= 3.8)
+try:
+    HEX_SEP = bool(bytes(1).hex(' '))
+except TypeError:
+    HEX_SEP = False
+
+# the representation of every byte value for each mode
+BYTE_TABLES = {
+    'x': [f"{b:02x}" for b in range(256)],
+    'X': [f"{b:02X}" for b in range(256)],
+    'b': [f"{b:08b}" for b in range(256)],
+}
+ROW_SIZE = 16
+
+
+@lru_cache(maxsize=4)
+def get_display_chars(file_encoding: str = 'utf-8') -> str:
+    """
+    get the displayable char of every byte value
+
+    Parameters:
+    file_encoding (str):
+        the file encoding to test with if the special chars can be displayed
+
+    Returns:
+    (str):
+        a string of length 257, containing the char to display for every byte value
+        (usable as a decoding table) followed by the fallback symbol
+    """
+    special_chars = dict(map(lambda x: (x[0], x[2]), SPECIAL_CHARS))
+    special_chars[-1] = '·' # default fallback symbol
+    try:
+        if len(special_chars[0].encode(file_encoding)) != 3:
+            raise UnicodeEncodeError('', '', -1, -1, '')
+    except UnicodeEncodeError:
+        special_chars = dict.fromkeys(special_chars, '.')
+    # 32 - 126 => ' ' - '~' (ASCII)
+    return ''.join(chr(byte) if 32 <= byte <= 126 else
+                   special_chars.get(byte, special_chars[-1])
+                   for byte in range(256)) + special_chars[-1]
+
+
 def get_display_char_gen(file_encoding: str = 'utf-8', base: int = 16):
     """
     generate a function to decode bytes
@@ -59,13 +104,7 @@ def get_display_char_gen(file_encoding: str = 'utf-8', base: int = 16):
     get_display_char (function):
         the function to decode any byte/int/str
     """
-    special_chars = dict(map(lambda x: (x[0], x[2]), SPECIAL_CHARS))
-    special_chars[-1] = '·' # default fallback symbol
-    try:
-        if len(special_chars[0].encode(file_encoding)) != 3:
-            raise UnicodeEncodeError('', '', -1, -1, '')
-    except UnicodeEncodeError:
-        special_chars = dict.fromkeys(special_chars, '.')
+    display_chars = get_display_chars(file_encoding)
 
     def get_display_char(byte) -> str:
         """
@@ -78,19 +117,55 @@ def get_display_char_gen(file_encoding: str = 'utf-8', base: int = 16):
             try:
                 byte = int(byte, base)
             except ValueError:
-                return special_chars[-1]
-        # 32 - 126 => ' ' - '~' (ASCII)
-        if 32 <= byte <= 126:
-            return chr(byte)
-        if byte in special_chars.keys():
-            return special_chars[byte]
-        return special_chars[-1]
+                return display_chars[-1]
+        if 0 <= byte <= 255:
+            return display_chars[byte]
+        return display_chars[-1]
 
     return get_display_char
 
 
+def _format_bytes(chunk: bytes, mode: str) -> str:
+    """
+    get the representation of all bytes within a chunk, separated by spaces.
+    """
+    if HEX_SEP and mode in 'xX':
+        hex_str = chunk.hex(' ')
+        return hex_str.upper() if mode == 'X' else hex_str
+    return ' '.join(map(BYTE_TABLES[mode].__getitem__, chunk))
+
+
+def _format_chars(chunk: bytes, display_chars: str) -> str:
+    """
+    get the displayable chars of all bytes within a chunk, each followed by a space.
+    """
+    # interleave the bytes with spaces (which are displayed as they are) to decode
+    # everything at once, as the decoding table can only map a byte to a single char
+    spaced = bytearray(b' ') * (2 * len(chunk))
+    spaced[::2] = chunk
+    return codecs.charmap_decode(spaced, 'strict', display_chars[:256])[0]
+
+
+def _yield_rows(chunks, lead: int = 0):
+    """
+    regroup chunks of bytes, so that every chunk (except the last)
+    ends with a complete row. the first row may be preceded by lead empty columns.
+    """
+    carry = b''
+    for chunk in chunks:
+        if carry:
+            chunk = carry + chunk
+        cut = max(len(chunk) - (lead + len(chunk)) % ROW_SIZE, 0)
+        carry = chunk[cut:]
+        if cut:
+            yield chunk[:cut]
+            lead = 0
+    if carry:
+        yield carry
+
+
 def get_raw_view_lines_gen(file: Path, mode: str = 'X', colors: list = None,
-                           file_encoding: str = 'utf-8'):
+                           file_encoding: str = 'utf-8', offset: int = 0, length: int = -1):
     """
     return the raw byte representation of a file in hexadecimal or binary
     line by line
@@ -106,6 +181,11 @@ def get_raw_view_lines_gen(file: Path, mode: str = 'X', colors: list = None,
         Index 1 holds the color CKW.RESET_ALL
     file_encoding (str):
         the encoding used (possibly for stdout)
+    offset (int):
+        the position in the file to start the view at. the addresses of the rows
+        stay aligned to the file, so the first row may be incomplete
+    length (int):
+        the maximum amount of bytes to display, a negative value displays until EOF
 
     Yields:
     current_line (str):
@@ -118,16 +198,20 @@ def get_raw_view_lines_gen(file: Path, mode: str = 'X', colors: list = None,
     if not (mode and mode in 'xXb'):
         mode = 'X'
 
-    get_display_char = get_display_char_gen(file_encoding)
+    display_chars = get_display_chars(file_encoding)
 
     try:
-        raw_file_content = IoHelper.read_file(file, True)
-        raw_file_content_length = len(raw_file_content)
+        chunks = IoHelper.yield_bytes(file, offset, length)
+        # open the file before the header is displayed
+        first_chunk = next(chunks, b'')
     except OSError as exc:
         yield type(exc).__name__
         return ''
 
     repr_length = 2 * (mode in 'xX') + 8 * (mode == 'b')
+    bytes_stride = (repr_length + 1) * ROW_SIZE
+    chars_stride = 2 * ROW_SIZE
+    separator = f" {colors[0]}#{colors[1]} "
 
     current_line = f"{colors[0]}Address  "
     for i in range(16):
@@ -135,21 +219,17 @@ def get_raw_view_lines_gen(file: Path, mode: str = 'X', colors: list = None,
     current_line += f"# Decoded Text                   {colors[1]}"
     yield current_line
 
-    current_line = f"{colors[0]}{0:0{8}X}{colors[1]} "
-    line = []
-    for i, byte in enumerate(raw_file_content, start=1):
-        line.append(byte)
-        if not i % 16:
-            current_line +=  ' '.join(f"{b:0{repr_length}{mode}}" for b in line) + \
-                            f" {colors[0]}#{colors[1]} " + \
-                            ' '.join(map(get_display_char, line))
-            yield current_line
-            if i < raw_file_content_length:
-                current_line = f"{colors[0]}{i:0{8}X}{colors[1]} "
-            line = []
-    if line:
-        current_line +=  ' '.join(f"{b:0{repr_length}{mode}}" for b in line) + ' ' + \
-                        ' ' * ((repr_length + 1) * (16-len(line)) - 1) + \
-                        f" {colors[0]}#{colors[1]} " + \
-                        ' '.join(map(get_display_char, line))
-        yield current_line
+    lead = offset % ROW_SIZE
+    address = offset - lead
+    for chunk in _yield_rows(chain((first_chunk,), chunks), lead):
+        # format the whole chunk at once and cut it into rows afterwards
+        rows = -(-(lead + len(chunk)) // ROW_SIZE)
+        bytes_str = (' ' * (lead * (repr_length + 1)) + \
+            _format_bytes(chunk, mode)).ljust(rows * bytes_stride)
+        chars_str = '  ' * lead + _format_chars(chunk, display_chars)[:-1]
+        for row in range(rows):
+            yield f"{colors[0]}{address:08X}{colors[1]} " \
+                f"{bytes_str[row*bytes_stride:(row+1)*bytes_stride-1]}{separator}" \
+                f"{chars_str[row*chars_stride:(row+1)*chars_stride-1]}"
+            address += ROW_SIZE
+        lead = 0
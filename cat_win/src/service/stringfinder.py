@@ -3,14 +3,42 @@ stringfinder
 """
 
 from cat_win.src.const.colorconstants import CKW
+from cat_win.src.service.helper.ahocorasick import AhoCorasick
+from cat_win.src.service.helper.iohelper import LINE_BREAKS
+
+# the amount of literals, from which on searching all of them at once
+# is faster than searching each of them on its own
+AUTOMATON_THRESHOLD = 50
+# the share of lines containing a literal, from which on searching every
+# line on its own is faster than searching the entire text at once
+LINE_DENSITY_THRESHOLD = 4
 
 
 class StringFinder:
     """
     defines a stringfinder
     """
-    def __init__(self, queries: set = None) -> None:
-        self.kw_queries = queries
+    def __init__(self, queries: list = None) -> None:
+        self.kw_queries = queries if queries is not None else []
+
+        # the literals are prepared once, for all lines to search in like
+        # [(query_index, query, ignore_case, search_literal), ...]
+        literals = [(i, query, ignore_case, query.lower() if ignore_case else query)
+                    for i, (query, ignore_case) in enumerate(self.kw_queries)
+                    if isinstance(query, str)]
+        self.ignore_case = any(ignore_case for _, _, ignore_case, _ in literals)
+        self.automatons = []
+        for case in [False, True]:
+            case_literals = [lit for lit in literals if lit[2] == case and lit[3]]
+            if len(case_literals) < AUTOMATON_THRESHOLD:
+                continue
+            self.automatons.append(
+                (case, case_literals, AhoCorasick([lit[3] for lit in case_literals]))
+            )
+            literals = [lit for lit in literals if lit[2] != case or not lit[3]]
+        self.literals = literals
+        self.patterns = [(i, query) for i, (query, _) in enumerate(self.kw_queries)
+                         if not isinstance(query, str)]
 
     def find_literals(self, sub: str, _s: str, ignore_case: bool):
         """
@@ -51,6 +79,65 @@ class StringFinder:
         for _match in pattern.finditer(_s):
             yield list(_match.span())
 
+    def find_literal_lines(self, text: str):
+        """
+        Generate the lines of a text that contain any of the queried literals,
+        by searching the entire text at once, instead of searching every line.
+        The lines are split like str.splitlines() would split the text.
+        Queried patterns are not taken into account.
+        If too many lines contain a literal, all lines are yielded instead,
+        so that they are only searched once by find_keywords().
+
+        Parameters:
+        text (str):
+            the text to search in
+
+        Yields:
+        (tuple):
+            containing the index of the line within the text and the line like (index, line)
+        """
+        line_breaks = [l_b for l_b in LINE_BREAKS if l_b in text]
+        text_lower = text.lower() if self.ignore_case else text
+        literals = self.literals + [lit for _, lits, _ in self.automatons for lit in lits]
+        if len(text_lower) != len(text) or any(not lit[3] for lit in literals):
+            # some chars change their length when being lowered, therefor
+            # the positions of both texts do not match.
+            # an empty literal would be found in every line.
+            yield from enumerate(text.splitlines())
+            return
+
+        max_spans = sum(map(text.count, line_breaks)) // LINE_DENSITY_THRESHOLD
+        spans = set()
+        for _, _, ignore_case, literal in literals:
+            if any(l_b in literal for l_b in LINE_BREAKS):
+                # cannot be found within a single line
+                continue
+            _s = text_lower if ignore_case else text
+            # the next position of every line break, so that rare line breaks
+            # do not have to be searched again for every found literal
+            next_breaks = dict.fromkeys(line_breaks, -1)
+            start, end = 0, 0
+            i = _s.find(literal)
+            while i != -1:
+                start = max([_s.rfind(l_b, end, i) for l_b in line_breaks], default=-1) + 1
+                for l_b, e in next_breaks.items():
+                    if e < i:
+                        e = _s.find(l_b, i)
+                        next_breaks[l_b] = e if e != -1 else len(_s)
+                end = min(next_breaks.values(), default=len(_s))
+                spans.add((start, end))
+                if len(spans) > max_spans:
+                    yield from enumerate(text.splitlines())
+                    return
+                i = _s.find(literal, end)
+
+        index, position = 0, 0
+        for start, end in sorted(spans):
+            index += sum(text.count(l_b, position, start) for l_b in line_breaks)
+            index -= text.count('\r\n', position, start)
+            position = start
+            yield (index, text[start:end])
+
     def _optimize_intervals(self, intervals: list) -> list:
         """
         optimize/shorten/merge overlapping intervalls for partially
@@ -111,17 +198,33 @@ class StringFinder:
         matched_list = []
         matched_position = []
 
-        for query, ignore_case in self.kw_queries:
-            if isinstance(query, str):
-                for _f in self.find_literals(query, line, ignore_case):
-                    found_position.append(_f[:])
-                    found_list.append((query, _f))
-            else:
-                for _m in self.find_regex(query, line):
-                    matched_position.append(_m[:])
-                    matched_list.append((query.pattern, _m))
+        # the line only has to be lowered once for all queries ignoring the case
+        line_lower = line.lower() if self.ignore_case else line
+
+        # collect like (start, query_index, query, end)
+        found = []
+        for q_index, query, ignore_case, literal in self.literals:
+            _s = line_lower if ignore_case else line
+            _l = len(literal)
+            i = _s.find(literal)
+            while i != -1:
+                found.append((i, q_index, query, i+_l))
+                i = _s.find(literal, i+1)
+        for ignore_case, literals, automaton in self.automatons:
+            for start, end, l_index in automaton.find_all(line_lower if ignore_case else line):
+                found.append((start, literals[l_index][0], literals[l_index][1], end))
+        # sort by start position (necessary for a deterministic output)
+        # and by the order of the queries
+        found.sort(key = lambda x: x[:2])
+        for start, _, query, end in found:
+            found_position.append([start, end])
+            found_list.append((query, [start, end]))
+
+        for _, pattern in self.patterns:
+            for _m in self.find_regex(pattern, line):
+                matched_position.append(_m[:])
+                matched_list.append((pattern.pattern, _m))
         # sort by start position (necessary for a deterministic output)
-        found_list.sort(key = lambda x: x[1][0])
         matched_list.sort(key = lambda x: x[1][0])
 
         return (self._merge_keyword_intervals(found_position, matched_position),
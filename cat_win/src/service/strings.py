@@ -2,27 +2,25 @@
 strings
 """
 
-def get_strings(content: list, min_seq_len: int, delim: str) -> list:
+def get_strings(content, min_seq_len: int, delim: str):
     """
     find all strings in any given file content.
 
     Parameters:
-    content (list):
+    content (iterable):
         the file content [('', line), ...]
     min_seq_len (int):
         the minimum required length of a string
     delim (str):
         the delimeter to display the found strings on the same line
 
-    Returns:
-    new_content (list):
-        the new file content containing all found strings [('', string), ...]
+    Yields:
+    (tuple):
+        the new file content containing all found strings ('', string)
     """
-    content_type_raw = bool(content) and isinstance(content[0][1], bytes)
-    new_content = []
     new_string = ''
     for _, line in content:
-        if content_type_raw:
+        if isinstance(line, bytes):
             line = line.decode(errors='replace')
         new_line = []
         for char in line:
@@ -36,6 +34,4 @@ def get_strings(content: list, min_seq_len: int, delim: str) -> list:
             new_line.append(new_string)
         new_string = ''
         for line in delim.join(new_line).splitlines():
-            new_content.append(('', line))
-
-    return new_content
+            yield ('', line)
@@ -229,9 +229,10 @@ class Summary:
 
         for hfile in files:
             try:
-                f_content = IoHelper.read_file(hfile.path, file_encoding=file_encoding,
-                                               errors='replace')
-                char_count.update(f_content)
+                f_char_count = Counter()
+                for f_chunk in IoHelper.yield_file_chunks(hfile.path, file_encoding, 'replace'):
+                    f_char_count.update(f_chunk)
+                char_count.update(f_char_count)
                 used_files.append(hfile.displayname)
             except (OSError, UnicodeError):
                 pass
@@ -4,6 +4,7 @@ visualizer
 
 from functools import lru_cache
 from pathlib import Path
+import os
 import shutil
 
 from cat_win.src.const.colorconstants import CVis
@@ -102,6 +103,25 @@ class Visualizer:
                 vis_row = ''
         print(CVis.COLOR_RESET)
 
+    def _read_content(self, file_p: Path) -> bytes:
+        """
+        read the bytes of a file within the bounds of the truncate parameter.
+        only the bytes within the bounds are being read from the file.
+
+        Parameters:
+        file_p (Path):
+            a string representation of a file (-path)
+
+        Returns:
+        (bytes):
+            the truncated content of the file
+        """
+        c_slice = slice(*self.truncate)
+        if c_slice.step is not None and c_slice.step < 0:
+            return IoHelper.read_file(file_p, True)[c_slice]
+        start, stop, step = c_slice.indices(os.path.getsize(file_p))
+        return IoHelper.read_bytes(file_p, start, max(stop - start, 0))[::step]
+
     def visualize_byte_view(self, file_p: Path) -> None:
         """
         visualize all bytes in a given file.
@@ -112,7 +132,7 @@ class Visualizer:
             a string representation of a file (-path)
         """
         width = shutil.get_terminal_size()[0] // 2
-        bin_content = IoHelper.read_file(file_p, True).__getitem__(slice(*self.truncate))
+        bin_content = self._read_content(file_p)
         Visualizer.display_data(SpaceFilling.get_scan_curve(bin_content, width),
                                 Visualizer.get_color_byte_view)
 
@@ -126,7 +146,7 @@ class Visualizer:
             a string representation of a file (-path)
         """
         width = shutil.get_terminal_size()[0] // 2
-        bin_content = IoHelper.read_file(file_p, True).__getitem__(slice(*self.truncate))
+        bin_content = self._read_content(file_p)
         Visualizer.display_data(SpaceFilling.get_zorder_curve(bin_content, width),
                                 Visualizer.get_color_byte_view)
 
@@ -140,7 +160,7 @@ class Visualizer:
             a string representation of a file (-path)
         """
         width = shutil.get_terminal_size()[0] // 2
-        bin_content = IoHelper.read_file(file_p, True).__getitem__(slice(*self.truncate))
+        bin_content = self._read_content(file_p)
         Visualizer.display_data(SpaceFilling.get_hilbert_curve(bin_content, width),
                                 Visualizer.get_color_byte_view)
 
@@ -154,7 +174,7 @@ class Visualizer:
             a string representation of a file (-path)
         """
         width = shutil.get_terminal_size()[0] // 2
-        bin_content = IoHelper.read_file(file_p, True).__getitem__(slice(*self.truncate))
+        bin_content = self._read_content(file_p)
         bin_content = Entropy.normalized_shannon_entropy(bin_content)
         Visualizer.display_data(SpaceFilling.get_hilbert_curve(bin_content, width),
                                 Visualizer.get_color_entropy)
@@ -168,7 +188,7 @@ class Visualizer:
         file_p (Path):
             a string representation of a file (-path)
         """
-        bin_content = IoHelper.read_file(file_p, True).__getitem__(slice(*self.truncate))
+        bin_content = self._read_content(file_p)
         digraph = [0] * 65536
 
         bin_content_it = iter(bin_content)
@@ -1,4 +1,5 @@
 from unittest import TestCase
+from unittest.mock import patch
 import os
 
 from cat_win.src.domain.files import Files
@@ -56,6 +57,45 @@ class TestFiles(TestCase):
         self.assertEqual(u_files._get_file_lines_sum_(test_file_empty), 1)
         self.assertEqual(u_files._get_file_lines_sum_('randomFileThatHopefullyDoesNotExistWithWeirdCharsForSafety*!?\\/:<>|'), 0)
 
+    def test__scan_file_(self):
+        u_files = Files()
+        self.assertEqual(u_files._scan_file_(test_file_path), (8, 37, 8))
+        self.assertEqual(u_files._scan_file_(test_file_empty), (1, -1, 0))
+        self.assertEqual(u_files._scan_file_('randomFileThatHopefullyDoesNotExistWithWeirdCharsForSafety*!?\\/:<>|'), (0, -1, -1))
+
+    def test__scan_file_cached(self):
+        u_files = Files()
+        with patch('cat_win.src.domain.files.IoHelper.scan_file', return_value=(1, 2, 3)) as scan:
+            self.assertEqual(u_files._scan_file_(test_file_path), (1, 2, 3))
+            self.assertEqual(u_files._scan_file_(test_file_path), (1, 2, 3))
+            self.assertEqual(scan.call_count, 1)
+            u_files._scan_file_(test_file_path, line_count=False)
+            self.assertEqual(scan.call_count, 2)
+            # the results are cached for each instance
+            Files()._scan_file_(test_file_path)
+            self.assertEqual(scan.call_count, 3)
+
+    def test_generate_values(self):
+        u_files = Files()
+        u_files.set_files([test_file_path, test_file_edge_case_3, test_file_empty, test_file_path])
+        u_files.generate_values(True, True, calc_lc_=True)
+        self.assertEqual(u_files.all_files_lines[test_file_path], 8)
+        self.assertEqual(u_files.all_files_lines[test_file_edge_case_3], 10)
+        self.assertEqual(u_files.all_files_lines[test_file_empty], 1)
+        self.assertEqual(u_files.all_line_number_place_holder, 2)
+        self.assertEqual(u_files.file_line_length_place_holder, 2)
+        self.assertEqual(u_files.get_line_count(test_file_path), 8)
+        self.assertEqual(u_files.get_line_count(test_file_empty), 0)
+        self.assertEqual(u_files.get_line_count(test_file_edge_case_1), -1)
+
+    def test_generate_values_partial(self):
+        u_files = Files()
+        u_files.set_files([test_file_path])
+        u_files.generate_values(True, False)
+        self.assertEqual(u_files.all_files_lines[test_file_path], 8)
+        self.assertEqual(u_files.file_stats[test_file_path], (8, -1, -1))
+        self.assertEqual(u_files.get_line_count(test_file_path), -1)
+
     def test_all_line_number_place_holder(self):
         u_files = Files()
         u_files.set_files([test_file_path])
@@ -0,0 +1,27 @@
+from unittest import TestCase
+
+from cat_win.src.service.helper.ahocorasick import AhoCorasick
+# import sys
+# sys.path.append('../cat_win')
+
+
+class TestAhoCorasick(TestCase):
+    maxDiff = None
+
+    def test_find_all(self):
+        automaton = AhoCorasick(['he', 'she', 'his', 'hers'])
+        self.assertListEqual(sorted(automaton.find_all('ushers')),
+                             [(1, 4, 1), (2, 4, 0), (2, 6, 3)])
+
+    def test_find_all_overlapping(self):
+        automaton = AhoCorasick(['aa', 'a'])
+        self.assertListEqual(sorted(automaton.find_all('aaa')),
+                             [(0, 1, 1), (0, 2, 0), (1, 2, 1), (1, 3, 0), (2, 3, 1)])
+
+    def test_find_all_duplicates(self):
+        automaton = AhoCorasick(['ab', 'ab'])
+        self.assertListEqual(sorted(automaton.find_all('xabx')), [(1, 3, 0), (1, 3, 1)])
+
+    def test_find_all_empty(self):
+        self.assertListEqual(list(AhoCorasick(['abc']).find_all('')), [])
+        self.assertListEqual(list(AhoCorasick([]).find_all('abc')), [])
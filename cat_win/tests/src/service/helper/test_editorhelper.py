@@ -0,0 +1,76 @@
+from unittest import TestCase
+from unittest.mock import patch
+import os
+import tracemalloc
+
+from cat_win.src.service.helper.editorhelper import History, _Action
+# import sys
+# sys.path.append('../cat_win')
+
+
+class TestHistory(TestCase):
+    def add_string(self, history: History, row: int, col: int, text: str) -> None:
+        history.add(b'_key_string', False, (row, col), (row, col+len(text)),
+                    (0, 0), (0, 0), False, False, text)
+
+    def test_action_slots(self):
+        action = _Action(b'_key_string', False, (0, 0), (0, 1), (0, 0), (0, 0), False, False, 'a')
+        self.assertFalse(hasattr(action, '__dict__'))
+        self.assertEqual(action.action_text, ('a',))
+
+    def test_action_compressed(self):
+        text = 'abc\ud83d' * 4096
+        action = _Action(b'_key_add_chunk', True, (0, 0), (0, 1), (0, 0), (0, 0), False, False, text)
+        self.assertIsInstance(action._action_text[0], bytes)
+        self.assertLess(action.size, len(text) // 10)
+        self.assertEqual(action.action_text, (text,))
+
+    def test_add_merge(self):
+        history = History()
+        for col, char in enumerate('abc def'):
+            self.add_string(history, 0, col, char)
+        self.assertListEqual([action.action_text for action in history._stack_undo],
+                             [('abc',), (' ',), ('def',)])
+        self.assertEqual(history._stack_undo[0].pre_cpos, (0, 0))
+        self.assertEqual(history._stack_undo[0].post_cpos, (0, 3))
+        # not consecutive
+        self.add_string(history, 1, 0, 'g')
+        self.assertEqual(len(history._stack_undo), 4)
+        history.add(b'_key_backspace', False, (1, 1), (1, 0), (0, 0), (0, 0), False, False, 'g')
+        history.add(b'_key_backspace', False, (0, 7), (0, 6), (0, 0), (0, 0), False, False, 'f')
+        history.add(b'_key_backspace', False, (0, 6), (0, 5), (0, 0), (0, 0), False, False, 'e')
+        self.assertEqual(history._stack_undo[-1].action_text, ('ef',))
+        self.assertEqual(history._size, sum(action.size for action in history._stack_undo))
+
+    def test_add_merge_length(self):
+        history = History()
+        for col in range(History.merge_length * 3):
+            self.add_string(history, 0, col, 'a')
+        self.assertEqual(len(history._stack_undo), 3)
+
+    def test_max_size(self):
+        history = History(1000)
+        for row in range(100):
+            self.add_string(history, row, 0, 'a' * 50)
+        self.assertLessEqual(history._size, 1000)
+        self.assertGreater(len(history._stack_undo), 1)
+        self.assertEqual(history._stack_undo[-1].pre_cpos, (99, 0))
+        # a single action larger than the limit is kept anyway
+        self.add_string(history, 100, 0, 'b' * 2000)
+        self.assertEqual(len(history._stack_undo), 1)
+
+    @patch.object(_Action, 'compress_length', 1024)
+    def test_memory_tracemalloc(self):
+        max_size = 1024 * 1024
+        history = History(max_size)
+        tracemalloc.start()
+        try:
+            for row in range(64):
+                # hex digits only compress to about half of their size
+                self.add_string(history, row, 0, os.urandom(1024 * 64).hex())
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLessEqual(history._size, max_size)
+        self.assertLess(current, max_size * 1.2)
+        self.assertGreater(len(history._stack_undo), 8)
@@ -0,0 +1,159 @@
+from unittest import TestCase
+from unittest.mock import patch
+from itertools import islice
+import os
+import tempfile
+
+from cat_win.src.service.helper.editorsavehelper import EditorSave
+from cat_win.src.service.helper.filelines import FileLines
+from cat_win.src.service.helper.lineindex import LineIndex
+from cat_win.src.service.helper.textbuffer import TextBuffer
+# import sys
+# sys.path.append('../cat_win')
+
+
+@patch.object(LineIndex, 'step', 3)
+class TestEditorSave(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_file = os.path.join(self.tmp_dir.name, 'test.txt')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def get_buffer(self, content: bytes, file_encoding: str = 'utf-8') -> TextBuffer:
+        with open(self.tmp_file, 'wb') as raw_f:
+            raw_f.write(content)
+        return TextBuffer(source=FileLines(self.tmp_file, LineIndex.build(self.tmp_file),
+                                           file_encoding))
+
+    def save(self, text_buffer: TextBuffer, line_sep: str = '\n',
+             file_encoding: str = 'utf-8') -> EditorSave:
+        editor_save = EditorSave(self.tmp_file, text_buffer.snapshot(), line_sep, file_encoding)
+        editor_save.join()
+        self.assertIsNone(editor_save.error)
+        self.assertEqual(editor_save.progress, 100)
+        return editor_save
+
+    def read_saved(self, editor_save: EditorSave) -> bytes:
+        with open(editor_save.tmp_file, 'rb') as raw_f:
+            return raw_f.read()
+
+    def test_save(self):
+        text_buffer = self.get_buffer('\n'.join(map(str, range(20))).encode())
+        text_buffer[1] = 'ä'
+        del text_buffer[7:9]
+        text_buffer.insert_lines(12, ['x', 'y'])
+        expected = list(text_buffer)
+        editor_save = self.save(text_buffer, '\r\n')
+        self.assertEqual(self.read_saved(editor_save), '\r\n'.join(expected).encode())
+        index = LineIndex.build(editor_save.tmp_file)
+        self.assertListEqual(list(editor_save.index.offsets), list(index.offsets))
+        self.assertEqual(editor_save.index.breaks_sum, index.breaks_sum)
+        os.remove(editor_save.tmp_file)
+        text_buffer.close()
+
+    def test_save_copy_blocks(self):
+        text_buffer = self.get_buffer('\n'.join(map(str, range(20))).encode())
+        text_buffer[0] = 'x'
+        text_buffer[10] = 'y'
+        with patch.object(FileLines, 'get_block', side_effect=FileLines.get_block,
+                          autospec=True) as get_block:
+            editor_save = self.save(text_buffer)
+        # only the blocks containing changed lines are decoded
+        self.assertSetEqual({c[0][1] for c in get_block.call_args_list}, {0, 3})
+        self.assertEqual(self.read_saved(editor_save),
+                         '\n'.join(['x', *map(str, range(1, 10)), 'y',
+                                    *map(str, range(11, 20))]).encode())
+        os.remove(editor_save.tmp_file)
+        text_buffer.close()
+
+    def test_save_line_breaks(self):
+        text_buffer = self.get_buffer(b'0\n1\n2\n3\r\n4\n5\n6\n7\n8')
+        text_buffer[0] = 'x'
+        editor_save = self.save(text_buffer)
+        # the line breaks of the file are replaced by the line separator
+        self.assertEqual(self.read_saved(editor_save), b'x\n1\n2\n3\n4\n5\n6\n7\n8')
+        os.remove(editor_save.tmp_file)
+        text_buffer[1] = 'a\nb'
+        editor_save = self.save(text_buffer)
+        self.assertEqual(self.read_saved(editor_save), b'x\na\nb\n2\n3\n4\n5\n6\n7\n8')
+        # the saved file is indexed again, as the following lines have been moved
+        self.assertListEqual(list(editor_save.index.offsets), [0, 6, 12, 18])
+        self.assertListEqual([(start, new_row, length) for _, start, new_row, length
+                              in editor_save.mapping], [(0, 0, 1), (2, 3, 7)])
+        os.remove(editor_save.tmp_file)
+        text_buffer.close()
+
+    def test_save_rebase_line_breaks(self):
+        for line_sep in ['\n', '\r\n', '\r']:
+            text_buffer = self.get_buffer('\n'.join(map(str, range(20))).encode())
+            text_buffer.set_lines([(2, 'a\rb'), (5, 'c\r'), (6, ''), (9, '\nd'), (15, 'e\r\n')])
+            expected = list(text_buffer)
+            editor_save = self.save(text_buffer, line_sep)
+            text_buffer.close()
+            os.replace(editor_save.tmp_file, self.tmp_file)
+            self.assertListEqual(list(editor_save.index.offsets),
+                                 list(LineIndex.build(self.tmp_file).offsets))
+            text_buffer.rebase(FileLines(self.tmp_file, editor_save.index), editor_save.mapping)
+            self.assertListEqual(list(text_buffer), expected)
+            # only the lines saved as multiple lines are kept in memory
+            self.assertListEqual([lines[start] for lines, start, _ in text_buffer.pieces
+                                  if lines is not text_buffer.source],
+                                 ['a\rb', 'c\r', '\nd', 'e\r\n'])
+            text_buffer.close()
+
+    def test_save_rebase(self):
+        text_buffer = self.get_buffer('\n'.join(map(str, range(20))).encode())
+        del text_buffer[2:5]
+        text_buffer[8] = 'x'
+        snapshot = text_buffer.snapshot()
+        saved = list(text_buffer)
+        text_buffer.insert(3, 'y')
+        text_buffer[10] = 'z'
+        expected = list(text_buffer)
+        editor_save = EditorSave(self.tmp_file, snapshot, '\n', 'utf-8')
+        editor_save.join()
+        text_buffer.close()
+        os.replace(editor_save.tmp_file, self.tmp_file)
+        text_buffer.rebase(FileLines(self.tmp_file, editor_save.index), editor_save.mapping)
+        self.assertListEqual(list(text_buffer.source), saved)
+        self.assertListEqual(list(text_buffer), expected)
+        self.assertListEqual(text_buffer.added, ['y', 'z'])
+        text_buffer.close()
+
+    def test_save_tail(self):
+        with open(self.tmp_file, 'wb') as raw_f:
+            raw_f.write(b'0123456789')
+        text_buffer = TextBuffer()
+        text_buffer.load(['a', 'b'])
+        tail = iter(map(str, range(10)))
+        editor_save = EditorSave(self.tmp_file, text_buffer.snapshot(), '\n', 'utf-8', tail)
+        self.assertListEqual(list(islice(editor_save.yield_tail(), 4)), ['0', '1', '2', '3'])
+        editor_save.join()
+        self.assertIsNone(editor_save.error)
+        self.assertEqual(editor_save.progress, 100)
+        self.assertEqual(self.read_saved(editor_save), '\n'.join('ab0123456789').encode())
+        self.assertEqual(editor_save.total, 12)
+        self.assertListEqual(list(editor_save.yield_tail()), list(map(str, range(10))))
+        os.remove(editor_save.tmp_file)
+
+    def test_save_tail_error(self):
+        text_buffer = TextBuffer()
+        text_buffer.load(['\udc80'])
+        tail = iter(['a', 'b'])
+        editor_save = EditorSave(self.tmp_file, text_buffer.snapshot(), '\n', 'utf-8', tail)
+        editor_save.join()
+        self.assertIsInstance(editor_save.error, UnicodeError)
+        # the lines, that have not been read by the save, are still available
+        self.assertListEqual(list(editor_save.yield_tail()), ['a', 'b'])
+
+    def test_save_error(self):
+        text_buffer = self.get_buffer(b'a\nb')
+        text_buffer[0] = '\udc80'
+        editor_save = EditorSave(self.tmp_file, text_buffer.snapshot(), '\n', 'utf-8')
+        editor_save.join()
+        self.assertIsInstance(editor_save.error, UnicodeError)
+        self.assertIsNone(editor_save.tmp_file)
+        self.assertListEqual(os.listdir(self.tmp_dir.name), ['test.txt'])
+        text_buffer.close()
@@ -0,0 +1,90 @@
+from unittest import TestCase
+from unittest.mock import patch
+import re
+
+from cat_win.src.service.helper.editorsearchhelper import HexSearch
+from cat_win.src.service.helper.hexbuffer import HexBuffer
+# import sys
+# sys.path.append('../cat_win')
+
+
+@patch.object(HexSearch, 'window_size', 4)
+class TestHexSearch(TestCase):
+    def get_matches(self, hex_buffer: HexBuffer, search) -> list:
+        hex_search = HexSearch(hex_buffer, search)
+        matches = hex_search.matches_between(0, len(hex_buffer))
+        self.assertTrue(hex_search.done)
+        self.assertEqual(hex_search.progress, 100)
+        return matches
+
+    def test_find(self):
+        hex_buffer = HexBuffer(b'aaaXaaYaa')
+        # overlapping matches and matches across windows are found
+        self.assertListEqual(self.get_matches(hex_buffer, '6161'),
+                             [(0, 4), (1, 4), (4, 4), (7, 4)])
+        self.assertListEqual(self.get_matches(hex_buffer, '58'), [(3, 2)])
+        self.assertListEqual(self.get_matches(hex_buffer, '00'), [])
+
+    def test_find_nibble(self):
+        hex_buffer = HexBuffer(b'\x01\x12\x01\x1f\x01\x20')
+        self.assertListEqual(self.get_matches(hex_buffer, '011'), [(0, 3), (2, 3)])
+        self.assertListEqual(self.get_matches(hex_buffer, '1'), [(1, 1), (3, 1)])
+
+    def test_find_edits(self):
+        hex_buffer = HexBuffer(b'abcabc')
+        hex_buffer.set_edit(1, '--')
+        hex_buffer.set_edit(3, '78')
+        hex_buffer.insert(5)
+        self.assertListEqual(self.get_matches(hex_buffer, '6263'), [])
+        self.assertListEqual(self.get_matches(hex_buffer, '7862'), [(3, 4)])
+        # bytes without a value are never matched
+        self.assertListEqual(self.get_matches(hex_buffer, '00'), [])
+        hex_buffer.set_edit(5, '00')
+        self.assertListEqual(self.get_matches(hex_buffer, '00'), [(5, 2)])
+
+    def test_find_regex(self):
+        hex_buffer = HexBuffer(b'ab12cd345ef')
+        self.assertListEqual(self.get_matches(hex_buffer, re.compile(rb'\d+')),
+                             [(2, 4), (6, 6)])
+        self.assertListEqual(self.get_matches(hex_buffer, re.compile(rb'x*')), [])
+
+    def test_next_previous_match(self):
+        hex_search = HexSearch(HexBuffer(b'a-a-a--'), '61')
+        self.assertEqual(hex_search.next_match(0), (0, 2))
+        self.assertEqual(hex_search.next_match(1), (2, 2))
+        self.assertIsNone(hex_search.next_match(5))
+        self.assertEqual(hex_search.previous_match(3), (2, 2))
+        self.assertEqual(hex_search.previous_match(100), (4, 2))
+        self.assertIsNone(hex_search.previous_match(-1))
+        self.assertListEqual(hex_search.matches_between(1, 5), [(2, 2), (4, 2)])
+
+    @patch.object(HexSearch, 'max_matches', 3)
+    def test_max_matches(self):
+        hex_buffer = HexBuffer(b'a-a-a-a-aa-a')
+        hex_buffer.set_edit(11, '--')
+        for search in ['61', re.compile(b'a+')]:
+            hex_search = HexSearch(hex_buffer, search)
+            hex_search._thread.join()
+            self.assertTrue(hex_search.truncated)
+            self.assertEqual(len(hex_search.offsets), 3)
+            self.assertEqual(hex_search.indexed, 6)
+            # the matches behind the collected ones are searched directly
+            expected = [(0, 2), (2, 2), (4, 2), (6, 2), (8, 2), (9, 2)] if search == '61' else \
+                [(0, 2), (2, 2), (4, 2), (6, 2), (8, 4)]
+            self.assertListEqual(hex_search.matches_between(0, len(hex_buffer)), expected)
+            self.assertListEqual(hex_search.matches_between(5, 9), expected[3:5])
+            self.assertEqual(hex_search.next_match(3), (4, 2))
+            self.assertEqual(hex_search.next_match(5), (6, 2))
+            self.assertEqual(hex_search.next_match(7), expected[4])
+            self.assertIsNone(hex_search.next_match(10))
+            self.assertEqual(hex_search.previous_match(100), expected[-1])
+            self.assertEqual(hex_search.previous_match(7), (6, 2))
+            self.assertEqual(hex_search.previous_match(5), (4, 2))
+
+    def test_changes(self):
+        hex_buffer = HexBuffer(b'abc')
+        hex_search = HexSearch(hex_buffer, '62')
+        hex_buffer.set_edit(1, '00')
+        # the search is not affected by later changes
+        self.assertEqual(hex_search.next_match(0), (1, 2))
+        self.assertNotEqual(hex_search.changes, hex_buffer.changes)
@@ -0,0 +1,71 @@
+from unittest import TestCase
+from unittest.mock import patch
+import os
+import tempfile
+
+from cat_win.src.service.helper.filelines import FileLines
+from cat_win.src.service.helper.lineindex import LineIndex
+# import sys
+# sys.path.append('../cat_win')
+
+
+@patch.object(LineIndex, 'step', 3)
+class TestFileLines(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_file = os.path.join(self.tmp_dir.name, 'test.txt')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def get_lines(self, content: bytes, file_encoding: str = 'utf-8') -> FileLines:
+        with open(self.tmp_file, 'wb') as raw_f:
+            raw_f.write(content)
+        return FileLines(self.tmp_file, LineIndex.build(self.tmp_file), file_encoding)
+
+    def test_lines(self):
+        contents = [b'', b'a', b'a\n', b'a\r\nb\rc\nd\n\ne', b'0\n1\n2\n', b'0\n1\n2\n3\r\n']
+        for content in contents:
+            file_lines = self.get_lines(content)
+            expected = content.decode().replace('\r\n', '\n').replace('\r', '\n').split('\n')
+            self.assertEqual(len(file_lines), len(expected))
+            self.assertListEqual(list(file_lines), expected)
+            self.assertListEqual(file_lines[1:-1], expected[1:-1])
+            self.assertListEqual(file_lines[::-2], expected[::-2])
+            self.assertEqual(file_lines[-1], expected[-1])
+            file_lines.close()
+
+    def test_iter_lines(self):
+        file_lines = self.get_lines('\n'.join(map(str, range(10))).encode())
+        self.assertListEqual(list(file_lines.iter_lines(2, 8)), list(map(str, range(2, 8))))
+        self.assertListEqual(list(file_lines.iter_lines(8, 100)), ['8', '9'])
+        self.assertListEqual(list(file_lines.iter_lines(5, 5)), [])
+        file_lines.close()
+
+    def test_decoding(self):
+        file_lines = self.get_lines('ä\nö\nü\nß'.encode('latin-1'), 'latin-1')
+        self.assertListEqual(list(file_lines), ['ä', 'ö', 'ü', 'ß'])
+        file_lines.close()
+        file_lines = self.get_lines('ä\nö\nü\nß'.encode('latin-1'))
+        self.assertRaises(UnicodeError, file_lines.__getitem__, 0)
+        file_lines.close()
+
+    def test_cache_size(self):
+        file_lines = self.get_lines(b'aaaaa\n' * 30)
+        with patch.object(FileLines, 'cache_size', 40):
+            self.assertListEqual(list(file_lines), ['aaaaa'] * 30 + [''])
+            # only two blocks of 18 bytes (and the empty last block) fit into the cache
+            self.assertListEqual(list(file_lines.blocks), [8, 9, 10])
+            self.assertEqual(file_lines.cached, 36)
+            self.assertEqual(file_lines[0], 'aaaaa')
+            self.assertListEqual(list(file_lines.blocks), [9, 10, 0])
+        file_lines.close()
+        self.assertIsNone(file_lines.raw_f)
+        self.assertEqual(file_lines[3], 'aaaaa')
+
+    def test_changed_file(self):
+        file_lines = self.get_lines(b'0\n1\n2\n3\n4\n5')
+        with open(self.tmp_file, 'wb') as raw_f:
+            raw_f.write(b'0\n1\n2\n3\n4\n5\n6\n7')
+        self.assertRaises(OSError, file_lines.__getitem__, 4)
+        file_lines.close()
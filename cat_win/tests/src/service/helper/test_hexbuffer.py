@@ -0,0 +1,132 @@
+from unittest import TestCase
+
+from cat_win.src.service.helper.hexbuffer import HexBuffer, HexRows
+# import sys
+# sys.path.append('../cat_win')
+
+
+class TestHexBuffer(TestCase):
+    def test_empty(self):
+        hex_buffer = HexBuffer()
+        self.assertEqual(len(hex_buffer), 0)
+        self.assertListEqual(hex_buffer.get_originals(0, 16), [])
+        self.assertListEqual(hex_buffer.get_edits(0, 16), [])
+        self.assertListEqual(list(hex_buffer.yield_bytes()), [])
+
+    def test_get_originals(self):
+        hex_buffer = HexBuffer(b'\x00\x01\xfe\xff')
+        self.assertListEqual(hex_buffer.get_originals(0, 16), ['00', '01', 'FE', 'FF'])
+        self.assertListEqual(hex_buffer.get_originals(1, 2), ['01', 'FE'])
+        self.assertListEqual(hex_buffer.get_originals(4, 2), [])
+
+    def test_set_edit(self):
+        hex_buffer = HexBuffer(b'abc')
+        hex_buffer.set_edit(1, '00')
+        hex_buffer.set_edit(2, '--')
+        self.assertListEqual(hex_buffer.get_edits(0, 3), [None, '00', '--'])
+        self.assertListEqual(hex_buffer.get_state(0, 3), ['61', '00', '--'])
+        self.assertEqual(hex_buffer.get_edit(1), '00')
+        hex_buffer.set_edit(1, None)
+        self.assertIsNone(hex_buffer.get_edit(1))
+        self.assertEqual(b''.join(hex_buffer.yield_bytes()), b'ab')
+
+    def test_insert(self):
+        hex_buffer = HexBuffer(b'abcd')
+        hex_buffer.insert(2)
+        hex_buffer.insert(3)
+        hex_buffer.insert(0)
+        hex_buffer.insert(len(hex_buffer))
+        self.assertEqual(len(hex_buffer), 8)
+        self.assertListEqual(hex_buffer.get_originals(0, 8),
+                             ['--', '61', '62', '--', '--', '63', '64', '--'])
+        # the inserted bytes are kept apart from the original bytes
+        self.assertListEqual(hex_buffer.pieces, [(6, 1), (0, 2), (4, 2), (2, 2), (7, 1)])
+        hex_buffer.set_edit(3, '31')
+        hex_buffer.set_edit(7, '3')
+        self.assertListEqual(hex_buffer.get_state(0, 8),
+                             ['--', '61', '62', '31', '--', '63', '64', '3'])
+        # inserted bytes without a (complete) value are not saved
+        self.assertEqual(b''.join(hex_buffer.yield_bytes()), b'ab1cd')
+
+    def test_insert_positions_lazy(self):
+        hex_buffer = HexBuffer(b'abcdef')
+        hex_buffer.insert(4)
+        hex_buffer.insert(2)
+        # the positions of the pieces after the insertion are only updated when needed
+        self.assertEqual(hex_buffer._valid, 1)
+        self.assertEqual(hex_buffer.key(3), 2)
+        self.assertEqual(hex_buffer._valid, 3)
+        self.assertEqual(hex_buffer.key(7), 5)
+        self.assertListEqual(hex_buffer.pieces, [(0, 2), (7, 1), (2, 2), (6, 1), (4, 2)])
+        self.assertListEqual(hex_buffer.positions, [0, 2, 3, 5, 6])
+
+    def test_get_patches(self):
+        hex_buffer = HexBuffer(b'@' * 10)
+        self.assertListEqual(hex_buffer.get_patches(), [])
+        hex_buffer.set_edit(2, '21')
+        hex_buffer.set_edit(3, '22')
+        hex_buffer.set_edit(9, '00')
+        self.assertListEqual(hex_buffer.get_patches(), [(2, b'!"'), (9, b'\x00')])
+        # inserted bytes without a value do not move the original bytes
+        hex_buffer.insert(5)
+        self.assertListEqual(hex_buffer.get_patches(), [(2, b'!"'), (9, b'\x00')])
+        hex_buffer.set_edit(5, '23')
+        self.assertIsNone(hex_buffer.get_patches())
+        hex_buffer.set_edit(5, '--')
+        hex_buffer.set_edit(0, '2')
+        self.assertIsNone(hex_buffer.get_patches())
+
+    def test_yield_bytes_chunks(self):
+        hex_buffer = HexBuffer(bytes(range(100)))
+        hex_buffer.set_edit(50, 'FF')
+        hex_buffer.insert(10)
+        hex_buffer.set_edit(10, '00')
+        chunks = list(hex_buffer.yield_bytes(7))
+        self.assertTrue(all(len(chunk) <= 7 for chunk in chunks))
+        self.assertEqual(b''.join(chunks),
+                         bytes(range(10)) + b'\x00' + bytes(range(10, 50)) + b'\xff' +
+                         bytes(range(51, 100)))
+
+    def test_get_content(self):
+        hex_buffer = HexBuffer(b'abcdef')
+        hex_buffer.set_edit(1, '--')
+        hex_buffer.set_edit(2, '7')
+        hex_buffer.set_edit(3, '78')
+        hex_buffer.insert(4)
+        hex_buffer.insert(4)
+        hex_buffer.set_edit(5, '79')
+        self.assertEqual(hex_buffer.get_content(0, 100), (b'abcx\x00yef', [1, 2, 4]))
+        self.assertEqual(hex_buffer.get_content(3, 3), (b'x\x00y', [1]))
+
+    def test_copy(self):
+        hex_buffer = HexBuffer(b'abc')
+        hex_buffer.set_edit(1, '78')
+        hex_buffer_copy = hex_buffer.copy()
+        hex_buffer.insert(0)
+        hex_buffer.set_edit(2, '79')
+        self.assertNotEqual(hex_buffer.changes, hex_buffer_copy.changes)
+        self.assertEqual(b''.join(hex_buffer_copy.yield_bytes()), b'axc')
+        self.assertEqual(b''.join(hex_buffer.yield_bytes()), b'ayc')
+
+
+class TestHexRows(TestCase):
+    def test_rows(self):
+        hex_buffer = HexBuffer(b'@' * 10)
+        hex_rows = HexRows(hex_buffer, 4)
+        self.assertEqual(len(hex_rows), 3)
+        self.assertListEqual(hex_rows[-1], ['40'] * 2)
+        self.assertListEqual(hex_rows[1:], [['40'] * 4, ['40'] * 2])
+        self.assertRaises(IndexError, hex_rows.__getitem__, 3)
+        self.assertEqual(len(HexRows(HexBuffer(), 4)), 1)
+        self.assertSequenceEqual(HexRows(HexBuffer(), 4), [[]])
+
+    def test_edit_rows(self):
+        hex_buffer = HexBuffer(b'@' * 10)
+        hex_rows = HexRows(hex_buffer, 4, True)
+        hex_rows[1][2] = '00'
+        hex_rows[2] = ['--', '21']
+        self.assertSequenceEqual(hex_rows, [[None] * 4, [None, None, '00', None], ['--', '21']])
+        self.assertListEqual(hex_buffer.get_state(0, 10), ['40'] * 6 + ['00', '40', '--', '21'])
+        hex_buffer.insert(0)
+        self.assertSequenceEqual(hex_rows, [[None] * 4, [None, None, None, '00'],
+                                            [None, '--', '21']])
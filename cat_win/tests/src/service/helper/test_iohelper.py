@@ -2,15 +2,17 @@ from unittest import TestCase
 from unittest.mock import patch
 import inspect
 import os
+import tempfile
 
 from cat_win.tests.mocks.std import StdInMock
-from cat_win.src.service.helper.iohelper import IoHelper, path_parts
+from cat_win.src.service.helper.iohelper import IoHelper, path_parts, encoded_line_breaks
 
 
 test_file_dir = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'texts')
 test_file_path  = os.path.join(test_file_dir, 'test.txt')
 test_file_path_empty = os.path.join(test_file_dir, 'test_empty.txt')
 test_file_path_oneline = os.path.join(test_file_dir, 'test_oneline.txt')
+test_file_path_peek = os.path.join(test_file_dir, 'test_peek.txt')
 
 stdin_mock = StdInMock()
 
@@ -29,6 +31,27 @@ class TestStdInHelper(TestCase):
     def test_read_file_binary(self):
         self.assertEqual(IoHelper.read_file(test_file_path_empty, True), b'')
 
+    def test_yield_file_chunks(self):
+        with open(test_file_path, 'r', encoding='utf-8') as raw_f:
+            expected_output = raw_f.read()
+        # the multibyte chars and '\r\n' will be cut by the small chunk sizes
+        for chunk_size in [1, 2, 3, 1024]:
+            self.assertEqual(
+                ''.join(IoHelper.yield_file_chunks(test_file_path, chunk_size=chunk_size)),
+                expected_output
+            )
+        self.assertListEqual(list(IoHelper.yield_file_chunks(test_file_path_empty)), [])
+
+    def test_yield_line_chunks(self):
+        with open(test_file_path, 'r', encoding='utf-8') as raw_f:
+            expected_output = raw_f.read()
+        for chunk_size in [1, 2, 3, 1024]:
+            chunks = list(IoHelper.yield_line_chunks(test_file_path, chunk_size=chunk_size))
+            self.assertEqual(''.join(chunks), expected_output)
+            for chunk in chunks[:-1]:
+                self.assertEqual(chunk[-1], '\n')
+        self.assertListEqual(list(IoHelper.yield_line_chunks(test_file_path_empty)), [])
+
     def test_yield_file(self):
         gen = IoHelper.yield_file(__file__)
         for line in gen:
@@ -51,6 +74,185 @@ class TestStdInHelper(TestCase):
         self.assertEqual(inspect.getgeneratorstate(gen), 'GEN_CLOSED')
         self.assertIn(str(*context.exception.args), 'generator raised StopIteration')
 
+    def test_yield_lines(self):
+        with open(test_file_path, 'r', encoding='utf-8', newline='') as raw_f:
+            expected_output = raw_f.read().splitlines()
+        for chunk_size in [1, 2, 3, 5, 1024]:
+            self.assertListEqual(
+                list(IoHelper.yield_lines(test_file_path, chunk_size=chunk_size)),
+                expected_output
+            )
+        self.assertListEqual(list(IoHelper.yield_lines(test_file_path_empty)), [])
+
+    def test_yield_lines_lazy(self):
+        gen = IoHelper.yield_lines(test_file_path, chunk_size=2)
+        self.assertEqual(inspect.getgeneratorstate(gen), 'GEN_CREATED')
+        self.assertEqual(next(gen), 'Sample Text:')
+        self.assertEqual(inspect.getgeneratorstate(gen), 'GEN_SUSPENDED')
+        gen.close()
+
+    def test_encoded_line_breaks(self):
+        self.assertIn(b'\n', encoded_line_breaks('utf-8'))
+        self.assertIn(b'\xe2\x80\xa8', encoded_line_breaks('utf-8'))
+        self.assertIn(b'\x85', encoded_line_breaks('latin-1'))
+        self.assertNotIn(b'\x85', encoded_line_breaks('cp1252'))
+        self.assertEqual(encoded_line_breaks('utf-16'), ())
+
+    def test_count_lines(self):
+        for file in [test_file_path, test_file_path_empty, test_file_path_peek]:
+            with open(file, 'r', encoding='utf-8', newline='') as raw_f:
+                expected_output = len(raw_f.read().splitlines())
+            for chunk_size in [1, 2, 1024]:
+                self.assertEqual(IoHelper.count_lines(file, chunk_size=chunk_size),
+                                 expected_output)
+
+    def test_scan_file(self):
+        for file in [test_file_path, test_file_path_empty, test_file_path_peek]:
+            with open(file, 'rb') as raw_f:
+                content = raw_f.read()
+            lines = content.splitlines()
+            expected_output = (
+                content.count(b'\n') + 1,
+                max(map(len, lines)) if lines else -1,
+                len(content.decode().splitlines()),
+            )
+            for chunk_size in [1, 2, 1024]:
+                self.assertEqual(IoHelper.scan_file(file, chunk_size=chunk_size),
+                                 expected_output)
+                self.assertEqual(IoHelper.scan_file(file, chunk_size=chunk_size,
+                                                    longest_line=False),
+                                 (expected_output[0], -1, expected_output[2]))
+                self.assertEqual(IoHelper.scan_file(file, chunk_size=chunk_size,
+                                                    line_count=False),
+                                 (*expected_output[:2], -1))
+
+    def test_scan_file_split_line_breaks(self):
+        test_file_path_tmp = test_file_path_empty + '.tmp'
+        with open(test_file_path_tmp, 'wb') as raw_f:
+            raw_f.write('a\r\nbb\u2028c\r'.encode())
+        try:
+            for chunk_size in [1, 2, 3, 1024]:
+                self.assertEqual(IoHelper.scan_file(test_file_path_tmp, chunk_size=chunk_size),
+                                 (2, 6, 3))
+            self.assertEqual(IoHelper.scan_file(test_file_path_tmp, 'utf-16'),
+                             (2, 6, -1))
+        finally:
+            os.remove(test_file_path_tmp)
+
+    def test_read_last_lines(self):
+        with open(test_file_path, 'r', encoding='utf-8', newline='') as raw_f:
+            expected_output = raw_f.read().splitlines()
+        for chunk_size in [1, 2, 1024]:
+            for line_count in [1, 3, 100]:
+                self.assertListEqual(
+                    IoHelper.read_last_lines(test_file_path, line_count, chunk_size=chunk_size),
+                    expected_output[-line_count:]
+                )
+        self.assertListEqual(IoHelper.read_last_lines(test_file_path_empty, 5), [])
+
+    def test_find_last_lines(self):
+        for file in [test_file_path, test_file_path_empty, test_file_path_peek]:
+            with open(file, 'rb') as raw_f:
+                content = raw_f.read()
+            lines = content.decode().splitlines()
+            for chunk_size in [1, 2, 1024]:
+                for line_count in [0, 1, 3, 100]:
+                    offset, lines_found = IoHelper.find_last_lines(file, line_count,
+                                                                   chunk_size=chunk_size)
+                    self.assertEqual(lines_found, min(line_count, len(lines)))
+                    self.assertListEqual(content[offset:].decode().splitlines(),
+                                         lines[len(lines)-lines_found:])
+
+    def test_yield_lines_offset(self):
+        with open(test_file_path, 'rb') as raw_f:
+            content = raw_f.read()
+        offset = content.index(b'N-Ary')
+        self.assertListEqual(list(IoHelper.yield_lines(test_file_path, offset=offset)),
+                             content[offset:].decode().splitlines())
+
+    def test_yield_lines_reversed(self):
+        for file in [test_file_path, test_file_path_empty, test_file_path_peek]:
+            with open(file, 'r', encoding='utf-8', newline='') as raw_f:
+                expected_output = raw_f.read().splitlines()
+            expected_output.reverse()
+            for chunk_size in [1, 2, 3, 1024]:
+                self.assertListEqual(
+                    list(IoHelper.yield_lines_reversed(file, chunk_size=chunk_size)),
+                    expected_output
+                )
+
+    def test_yield_lines_reversed_lazy(self):
+        gen = IoHelper.yield_lines_reversed(test_file_path_peek, chunk_size=2)
+        self.assertEqual(inspect.getgeneratorstate(gen), 'GEN_CREATED')
+        self.assertEqual(next(gen), '10')
+        self.assertEqual(inspect.getgeneratorstate(gen), 'GEN_SUSPENDED')
+        gen.close()
+
+    def test_read_bytes(self):
+        with open(test_file_path, 'rb') as raw_f:
+            expected_output = raw_f.read()
+        self.assertEqual(IoHelper.read_bytes(test_file_path), expected_output)
+        self.assertEqual(IoHelper.read_bytes(test_file_path, 5, 10), expected_output[5:15])
+
+    def test_yield_bytes(self):
+        with open(test_file_path, 'rb') as raw_f:
+            expected_output = raw_f.read()
+        for chunk_size in [1, 3, 16, 1024]:
+            chunks = list(IoHelper.yield_bytes(test_file_path, chunk_size=chunk_size))
+            self.assertTrue(all(len(chunk) <= chunk_size for chunk in chunks))
+            self.assertEqual(b''.join(chunks), expected_output)
+            self.assertEqual(b''.join(IoHelper.yield_bytes(test_file_path, 5, 10, chunk_size)),
+                             expected_output[5:15])
+        self.assertListEqual(list(IoHelper.yield_bytes(test_file_path_empty)), [])
+        self.assertListEqual(list(IoHelper.yield_bytes(test_file_path, 5, 0)), [])
+
+    def test_patch_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, 'test.bin')
+            with open(tmp_file, 'wb') as raw_f:
+                raw_f.write(bytes(10))
+            progress = []
+            IoHelper.patch_file(tmp_file, [(1, b'ab'), (9, b'c')], progress.append)
+            with open(tmp_file, 'rb') as raw_f:
+                self.assertEqual(raw_f.read(), b'\x00ab' + bytes(6) + b'c')
+            self.assertListEqual(progress, [2, 3])
+
+    def test_write_file_atomic(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, 'test.bin')
+            with open(tmp_file, 'wb') as raw_f:
+                raw_f.write(bytes(10))
+            progress = []
+            IoHelper.write_file_atomic(tmp_file, iter([b'ab', b'cde']), progress.append)
+            with open(tmp_file, 'rb') as raw_f:
+                self.assertEqual(raw_f.read(), b'abcde')
+            self.assertListEqual(progress, [2, 5])
+
+            def failing_chunks():
+                yield b'fg'
+                raise OSError('failed')
+            self.assertRaises(OSError, IoHelper.write_file_atomic, tmp_file, failing_chunks())
+            with open(tmp_file, 'rb') as raw_f:
+                self.assertEqual(raw_f.read(), b'abcde')
+            self.assertListEqual(os.listdir(tmp_dir), ['test.bin'])
+
+    def test_write_temp_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, 'test.bin')
+            with open(tmp_file, 'wb') as raw_f:
+                raw_f.write(bytes(10))
+            written = IoHelper.write_temp_file(tmp_file, iter([b'ab', b'cde']))
+            self.assertEqual(os.path.dirname(written), os.path.realpath(tmp_dir))
+            with open(tmp_file, 'rb') as raw_f:
+                self.assertEqual(raw_f.read(), bytes(10))
+            self.assertEqual(IoHelper.replace_file(tmp_file, written), os.path.realpath(tmp_file))
+            with open(tmp_file, 'rb') as raw_f:
+                self.assertEqual(raw_f.read(), b'abcde')
+            self.assertListEqual(os.listdir(tmp_dir), ['test.bin'])
+            self.assertRaises(OSError, IoHelper.replace_file, os.path.join(tmp_dir, 'x', 'y'),
+                              IoHelper.write_temp_file(tmp_file, iter([b'f'])))
+            self.assertListEqual(os.listdir(tmp_dir), ['test.bin'])
+
     def test_get_newline(self):
         self.assertEqual(IoHelper.get_newline(test_file_path), '\r\n')
         self.assertEqual(IoHelper.get_newline(test_file_path_empty), '\n')
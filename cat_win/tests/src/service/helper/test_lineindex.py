@@ -0,0 +1,158 @@
+from unittest import TestCase
+from unittest.mock import patch
+import os
+import tempfile
+import threading
+
+from cat_win.src.service.helper.iohelper import encoded_line_breaks
+from cat_win.src.service.helper.lineindex import LineIndex, LineIndexer
+# import sys
+# sys.path.append('../cat_win')
+
+
+def line_starts(content: bytes) -> list:
+    starts, position = [0], 0
+    for line in content.decode().splitlines(True):
+        position += len(line.encode())
+        if line.splitlines()[0] != line:
+            starts.append(position)
+    return starts
+
+
+@patch.object(LineIndex, 'step', 3)
+@patch.object(LineIndex, 'min_file_size', 0)
+class TestLineIndex(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_file = os.path.join(self.tmp_dir.name, 'test.txt')
+        self.cache_dir = os.path.join(self.tmp_dir.name, 'cache')
+
+    def tearDown(self):
+        LineIndex._loaded.clear()
+        self.tmp_dir.cleanup()
+
+    def write(self, content: bytes) -> None:
+        with open(self.tmp_file, 'wb') as raw_f:
+            raw_f.write(content)
+
+    def test_build(self):
+        content = b'a\r\nbb\rc\n\nd\r\r\neee\n\r\nf'
+        self.write(content)
+        for chunk_size in [1, 2, 3, 1024]:
+            with patch.object(LineIndex, 'chunk_size', chunk_size):
+                index = LineIndex.build(self.tmp_file)
+            self.assertListEqual(list(index.offsets), line_starts(content)[::3])
+            self.assertEqual(index.breaks_sum, 8)
+
+    def test_build_encoded_line_breaks(self):
+        content = 'a b\x85c\x0bd\r\ne '.encode()
+        self.write(content)
+        for chunk_size in [1, 2, 3, 1024]:
+            with patch.object(LineIndex, 'chunk_size', chunk_size):
+                index = LineIndex.build(self.tmp_file, encoded_line_breaks('utf-8'))
+            self.assertListEqual(list(index.offsets), line_starts(content)[::3])
+            self.assertEqual(index.breaks_sum, 5)
+
+    def test_build_stop(self):
+        self.write(b'0\n1\n2\n3')
+        stop = threading.Event()
+        self.assertEqual(LineIndex.build(self.tmp_file, stop=stop).breaks_sum, 3)
+        stop.set()
+        self.assertIsNone(LineIndex.build(self.tmp_file, stop=stop))
+
+    def test_line_indexer(self):
+        self.write(b'0\n1\n2\n3\n4\n5\n6')
+        line_indexer = LineIndexer(self.tmp_file)
+        line_indexer.join()
+        self.assertTrue(line_indexer.done)
+        self.assertListEqual(list(line_indexer.index.offsets), [0, 6, 12])
+        self.assertIs(LineIndex.get(self.tmp_file, build=False), line_indexer.index)
+        line_indexer = LineIndexer(os.path.join(self.tmp_dir.name, 'missing.txt'))
+        line_indexer.stop()
+        self.assertTrue(line_indexer.done)
+        self.assertIsNone(line_indexer.index)
+
+    def test_seek(self):
+        self.write(b'0\n1\n2\n3\n4\n5\n6')
+        index = LineIndex.build(self.tmp_file)
+        self.assertEqual(index.seek(0), (0, 0))
+        self.assertEqual(index.seek(2), (0, 0))
+        self.assertEqual(index.seek(4), (3, 6))
+        self.assertEqual(index.seek(100), (6, 12))
+
+    def test_find_line(self):
+        content = b'0\r\n1\r\n2\r3\n4\r\n5\n6'
+        self.write(content)
+        starts = line_starts(content)
+        for chunk_size in [1, 2, 1024]:
+            with patch.object(LineIndex, 'chunk_size', chunk_size):
+                for line, start in enumerate(starts):
+                    self.assertEqual(LineIndex.find_line(self.tmp_file, line), start)
+                    self.assertEqual(LineIndex.find_line(self.tmp_file, line, start=(2, 6)),
+                                     max(start, 6))
+                self.assertEqual(LineIndex.find_line(self.tmp_file, 7), len(content))
+                self.assertEqual(LineIndex.find_line(self.tmp_file, 100), len(content))
+
+    def test_get_build(self):
+        self.write(b'0\n1\n2\n3\n4\n5\n6')
+        with patch.object(LineIndex, 'cache_dir', self.cache_dir), \
+            patch.object(LineIndex, 'cache_size', 1024):
+            self.assertIsNone(LineIndex.get(self.tmp_file, build=False))
+            index = LineIndex.get(self.tmp_file)
+            self.assertIs(LineIndex.get(self.tmp_file, build=False), index)
+            LineIndex._loaded.clear()
+            self.assertListEqual(list(LineIndex.get(self.tmp_file, build=False).offsets),
+                                 [0, 6, 12])
+
+    def test_get_other_line_breaks(self):
+        for content, covered in [(b'0\n1\r\n2\r3', True), ('0\n1\u20282\r3'.encode(), False),
+                                 (b'0\n1\x0c2\r3', False), (b'0\n1\xe2\x80', True)]:
+            self.write(content)
+            index = LineIndex.get(self.tmp_file)
+            self.assertEqual(index.other_breaks, not covered)
+            for file_encoding in ['utf-8', 'latin-1', 'cp1252']:
+                self.assertEqual(index.covers(encoded_line_breaks(file_encoding)), covered)
+                self.assertEqual(LineIndex.get(self.tmp_file, encoded_line_breaks(file_encoding),
+                                               build=False) is index, covered)
+            self.assertFalse(index.covers(encoded_line_breaks('gb18030')))
+            self.assertFalse(index.covers((b'\n',)))
+            LineIndex._loaded.clear()
+        # the index of a saved file may contain any line break
+        self.assertFalse(LineIndex(index.offsets, 3).covers(encoded_line_breaks('utf-8')))
+
+    def test_get_min_file_size(self):
+        self.write(b'0\n1\n2\n3\n4\n5\n6')
+        with patch.object(LineIndex, 'min_file_size', 100):
+            self.assertIsNone(LineIndex.get(self.tmp_file))
+        self.assertIsNone(LineIndex.get(self.tmp_file, ()))
+        self.assertIsNone(LineIndex.get(os.path.join(self.tmp_dir.name, 'missing.txt')))
+        self.assertListEqual(list(LineIndex.get(self.tmp_file).offsets), [0, 6, 12])
+
+    def test_get_persistent(self):
+        self.write(b'0\n1\n2\n3\n4\n5\n6')
+        with patch.object(LineIndex, 'cache_dir', self.cache_dir), \
+            patch.object(LineIndex, 'cache_size', 1024):
+            self.assertListEqual(list(LineIndex.get(self.tmp_file).offsets), [0, 6, 12])
+            self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+            LineIndex._loaded.clear()
+            with patch.object(LineIndex, 'build') as build_mock:
+                index = LineIndex.get(self.tmp_file)
+            build_mock.assert_not_called()
+            self.assertListEqual(list(index.offsets), [0, 6, 12])
+            self.assertFalse(index.other_breaks)
+            self.assertEqual(index.breaks_sum, 6)
+
+    def test_get_evict(self):
+        cache_files = []
+        with patch.object(LineIndex, 'cache_dir', self.cache_dir), \
+            patch.object(LineIndex, 'cache_size', 2 * (LineIndex._header.size + 3 * 8)):
+            for i in range(3):
+                tmp_file = os.path.join(self.tmp_dir.name, f"test{i}.txt")
+                with open(tmp_file, 'wb') as raw_f:
+                    raw_f.write(b'0\n1\n2\n3\n4\n5\n6')
+                LineIndex.get(tmp_file)
+                cache_file = (set(os.listdir(self.cache_dir)) - set(cache_files)).pop()
+                # mark the cache files as used one after another
+                os.utime(os.path.join(self.cache_dir, cache_file), (1000 * (i+1),) * 2)
+                cache_files.append(cache_file)
+            self.assertSetEqual(set(os.listdir(self.cache_dir)), set(cache_files[1:]))
@@ -0,0 +1,80 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from cat_win.src.service.helper.longline import LongLine, replace_range, rstrip_length
+# import sys
+# sys.path.append('../cat_win')
+
+
+@patch.object(LongLine, 'chunk_size', 4)
+@patch.object(LongLine, 'min_length', 10)
+class TestLongLine(TestCase):
+    def test_chunks(self):
+        line = LongLine('abcdefghij')
+        self.assertListEqual(line.chunks, ['abcd', 'efgh', 'ij'])
+        self.assertListEqual(line.offsets, [0, 4, 8])
+        self.assertEqual(len(line), 10)
+        self.assertEqual(str(line), 'abcdefghij')
+        self.assertListEqual(LongLine().chunks, [''])
+        self.assertEqual(len(LongLine()), 0)
+
+    def test_getitem(self):
+        line = LongLine('abcdefghij')
+        self.assertEqual(line[0], 'a')
+        self.assertEqual(line[5], 'f')
+        self.assertEqual(line[-1], 'j')
+        self.assertEqual(line[3:9], 'defghi')
+        self.assertEqual(line[5:7], 'fg')
+        self.assertEqual(line[7:], 'hij')
+        self.assertEqual(line[::3], 'adgj')
+        self.assertEqual(line[6:2], '')
+        with self.assertRaises(IndexError):
+            _ = line[10]
+
+    def test_str_behaviour(self):
+        line = LongLine('abcdefghij')
+        self.assertEqual(line, 'abcdefghij')
+        self.assertEqual('abcdefghij', line)
+        self.assertNotEqual(line, 'abcdefghi')
+        self.assertEqual(line, LongLine('abcdefghij'))
+        self.assertEqual(hash(line), hash('abcdefghij'))
+        self.assertEqual(line + '!', 'abcdefghij!')
+        self.assertEqual('!' + line, '!abcdefghij')
+        self.assertIn('def', line)
+        self.assertEqual(line.find('e'), 4)
+        self.assertTrue(line.startswith('abc'))
+        self.assertEqual(f"{line}", 'abcdefghij')
+        self.assertEqual(''.join(line), 'abcdefghij')
+
+    def test_replace_range(self):
+        line = LongLine('abcdefghij')
+        new_line = line.replace_range(5, 1, 'XYZ')
+        self.assertEqual(new_line, 'abcdeXYZghij')
+        self.assertEqual(line, 'abcdefghij')
+        # the unchanged chunks are shared
+        self.assertIs(new_line.chunks[0], line.chunks[0])
+        self.assertIs(new_line.chunks[-1], line.chunks[-1])
+        self.assertListEqual(new_line.offsets, [0, 4, 10])
+        self.assertEqual(new_line.replace_range(2, 8, ''), 'abij')
+        self.assertEqual(new_line.replace_range(12, 5, '!'), 'abcdeXYZghij!')
+        self.assertEqual(new_line.replace_range(0, 12, ''), '')
+        self.assertEqual(LongLine().replace_range(0, 0, 'x' * 10).chunks, ['xxxx', 'xxxx', 'xx'])
+
+    def test_replace_range_function(self):
+        self.assertEqual(replace_range('abc', 1, 1, 'X'), 'aXc')
+        line = replace_range('abcdefghi', 9, 0, 'jk')
+        self.assertIsInstance(line, LongLine)
+        self.assertEqual(line, 'abcdefghijk')
+        line = replace_range(line, 0, 3, '')
+        self.assertIsInstance(line, LongLine)
+        self.assertEqual(line, 'defghijk')
+        line = replace_range(line, 0, 4, '')
+        self.assertIsInstance(line, str)
+        self.assertEqual(line, 'hijk')
+
+    def test_rstrip_length(self):
+        self.assertEqual(rstrip_length('ab  '), 2)
+        self.assertEqual(rstrip_length('ab'), 2)
+        self.assertEqual(rstrip_length(LongLine('ab  \t     ')), 2)
+        self.assertEqual(rstrip_length(LongLine('abcdefg  \t')), 7)
+        self.assertEqual(rstrip_length(LongLine('          ')), 0)
@@ -0,0 +1,68 @@
+from unittest import TestCase
+from unittest.mock import patch
+import io
+
+from cat_win.tests.mocks.std import StdOutMock
+from cat_win.src.service.helper.outputsink import OutputSink
+# import sys
+# sys.path.append('../cat_win')
+
+
+class BrokenPipeMock(io.BytesIO):
+    def write(self, _) -> int:
+        raise BrokenPipeError
+
+
+class TestOutputSink(TestCase):
+    maxDiff = None
+
+    def test_outputsink_text(self):
+        with patch('sys.stdout', new=StdOutMock()) as fake_out:
+            with OutputSink() as sink:
+                sink.write_line('hello')
+                sink.write_line('')
+                sink.write_line('world')
+                self.assertEqual(fake_out.getvalue(), '')
+            self.assertEqual(fake_out.getvalue(), 'hello\n\nworld\n')
+
+    def test_outputsink_binary(self):
+        fake_out = io.TextIOWrapper(io.BytesIO(), encoding='utf-8', newline='\n')
+        with patch('sys.stdout', new=fake_out):
+            print('before', end='')
+            with OutputSink() as sink:
+                sink.write_line('äöü')
+            print('after')
+        fake_out.flush()
+        self.assertEqual(fake_out.buffer.getvalue(), 'beforeäöü\nafter\n'.encode())
+
+    def test_outputsink_flush_size(self):
+        with patch('sys.stdout', new=StdOutMock()) as fake_out:
+            with OutputSink(flush_size=10, flush_interval=60) as sink:
+                sink.write_line('abcd')
+                self.assertEqual(fake_out.getvalue(), '')
+                sink.write_line('efgh')
+                self.assertEqual(fake_out.getvalue(), 'abcd\nefgh\n')
+                sink.write_line('ijkl')
+                self.assertEqual(fake_out.getvalue(), 'abcd\nefgh\n')
+            self.assertEqual(fake_out.getvalue(), 'abcd\nefgh\nijkl\n')
+
+    def test_outputsink_flush_interval(self):
+        with patch('sys.stdout', new=StdOutMock()) as fake_out:
+            with OutputSink(flush_interval=0) as sink:
+                sink.write_line('abcd')
+                self.assertEqual(fake_out.getvalue(), 'abcd\n')
+
+    def test_outputsink_broken_pipe(self):
+        consumed = []
+        def content_gen():
+            for i in range(10):
+                consumed.append(i)
+                yield str(i)
+
+        fake_out = io.TextIOWrapper(BrokenPipeMock(), encoding='utf-8')
+        with patch('sys.stdout', new=fake_out):
+            with self.assertRaises(BrokenPipeError):
+                with OutputSink(flush_size=3) as sink:
+                    for line in content_gen():
+                        sink.write_line(line)
+        self.assertListEqual(consumed, [0, 1])
@@ -0,0 +1,55 @@
+from unittest import TestCase
+from unittest.mock import patch
+import os
+import tempfile
+
+from cat_win.src.service.helper.pagecache import PageCache
+# import sys
+# sys.path.append('../cat_win')
+
+
+@patch.object(PageCache, 'page_size', 4)
+class TestPageCache(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_file = os.path.join(self.tmp_dir.name, 'test.bin')
+        self.content = bytes(range(30))
+        with open(self.tmp_file, 'wb') as raw_f:
+            raw_f.write(self.content)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_getitem(self):
+        page_cache = PageCache(self.tmp_file)
+        self.assertEqual(len(page_cache), 30)
+        for start in range(-2, 33):
+            for stop in range(-2, 33):
+                self.assertEqual(page_cache[start:stop], self.content[start:stop])
+        self.assertEqual(page_cache[::3], self.content[::3])
+        self.assertEqual(page_cache[5], 5)
+        self.assertEqual(page_cache[-1], 29)
+        self.assertRaises(IndexError, page_cache.__getitem__, 30)
+        page_cache.close()
+
+    def test_empty(self):
+        with open(self.tmp_file, 'wb'):
+            pass
+        page_cache = PageCache(self.tmp_file)
+        self.assertEqual(len(page_cache), 0)
+        self.assertEqual(page_cache[0:10], b'')
+        page_cache.close()
+
+    @patch.object(PageCache, 'cache_size', 8)
+    def test_evict(self):
+        page_cache = PageCache(self.tmp_file)
+        self.assertEqual(page_cache[0:2], b'\x00\x01')
+        self.assertEqual(page_cache[28:30], b'\x1c\x1d')
+        self.assertListEqual(list(page_cache.pages), [0, 7])
+        page_cache[1:2]
+        page_cache[8:9]
+        # the least recently used page has been dropped
+        self.assertListEqual(list(page_cache.pages), [0, 2])
+        self.assertEqual(page_cache[0:30], self.content)
+        self.assertEqual(len(page_cache.pages), 2)
+        page_cache.close()
@@ -58,3 +58,9 @@ class TestPBar(TestCase):
             self.assertIn('__', fake_out.getvalue())
             self.assertIn('XX', fake_out.getvalue())
             self.assertIn('\b \b', fake_out.getvalue())
+
+    def test_get_progress_bar(self):
+        p_bar = PBar(4, prefix='PREFIX', suffix='SUFFIX', length=4, fill_l='X', fill_r='_')
+        self.assertEqual(p_bar.get_progress_bar(1, False), 'PREFIX X___  25.0% SUFFIX')
+        self.assertEqual(p_bar.get_progress_bar(5, False), 'PREFIX XXXX 100.0% SUFFIX')
+        self.assertIn(PBar.COLOR_DONE, p_bar.get_progress_bar(1))
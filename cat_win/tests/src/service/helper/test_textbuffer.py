@@ -0,0 +1,137 @@
+from unittest import TestCase
+
+from cat_win.src.service.helper.textbuffer import TextBuffer
+# import sys
+# sys.path.append('../cat_win')
+
+
+class TestTextBuffer(TestCase):
+    def test_empty(self):
+        text_buffer = TextBuffer()
+        self.assertEqual(len(text_buffer), 0)
+        self.assertListEqual(list(text_buffer), [])
+        self.assertRaises(IndexError, text_buffer.__getitem__, 0)
+        text_buffer.append('a')
+        self.assertListEqual(list(text_buffer), ['a'])
+
+    def test_load(self):
+        text_buffer = TextBuffer(['a', 'b'])
+        self.assertEqual(text_buffer.load(iter(['c', 'd'])), 2)
+        self.assertEqual(text_buffer.load([]), 0)
+        self.assertListEqual(text_buffer.pieces, [(text_buffer.source, 0, 4)])
+        text_buffer.append('e')
+        text_buffer.load(['f'])
+        self.assertListEqual(list(text_buffer), ['a', 'b', 'c', 'd', 'e', 'f'])
+
+    def test_getitem(self):
+        text_buffer = TextBuffer(['a', 'b', 'c', 'd'])
+        text_buffer.insert(2, 'x')
+        self.assertEqual(text_buffer[2], 'x')
+        self.assertEqual(text_buffer[-1], 'd')
+        self.assertListEqual(text_buffer[1:4], ['b', 'x', 'c'])
+        self.assertListEqual(text_buffer[-2:], ['c', 'd'])
+        self.assertListEqual(text_buffer[::2], ['a', 'x', 'd'])
+        self.assertRaises(IndexError, text_buffer.__getitem__, 5)
+
+    def test_setitem(self):
+        text_buffer = TextBuffer(['a', 'b', 'c'])
+        text_buffer[1] = 'x'
+        self.assertEqual(len(text_buffer.pieces), 3)
+        # changing the line again does not add another line
+        text_buffer[1] += 'y'
+        self.assertListEqual(text_buffer.added, ['xy'])
+        self.assertListEqual(list(text_buffer), ['a', 'xy', 'c'])
+        self.assertListEqual(text_buffer.source, ['a', 'b', 'c'])
+
+    def test_replace_lines(self):
+        text_buffer = TextBuffer(['a', 'b', 'c', 'd', 'e'])
+        text_buffer.replace_lines(1, 3, ['x'])
+        self.assertListEqual(list(text_buffer), ['a', 'x', 'e'])
+        text_buffer.replace_lines(1, 1, ['x', 'y', 'z'])
+        self.assertListEqual(list(text_buffer), ['a', 'x', 'y', 'z', 'e'])
+        text_buffer.replace_lines(0, 100, [])
+        self.assertListEqual(list(text_buffer), [])
+        self.assertListEqual(text_buffer.pieces, [])
+
+    def test_set_lines(self):
+        text_buffer = TextBuffer(['a', 'b', 'c', 'd', 'e'])
+        text_buffer.insert(2, 'x')
+        text_buffer.set_lines([(0, 'A'), (1, 'B'), (3, 'C'), (5, 'E')])
+        self.assertListEqual(list(text_buffer), ['A', 'B', 'x', 'C', 'd', 'E'])
+        self.assertListEqual(text_buffer.source, ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(len(text_buffer.pieces), 5)
+        self.assertListEqual(text_buffer.positions, [0, 2, 3, 4, 5])
+        self.assertEqual(text_buffer[4], 'd')
+        self.assertRaises(IndexError, text_buffer.set_lines, [(6, 'F')])
+
+    def test_snapshot(self):
+        text_buffer = TextBuffer(['a', 'b', 'c'])
+        text_buffer[1] = 'x'
+        snapshot = text_buffer.snapshot()
+        added = text_buffer.pieces[1][0]
+        text_buffer[1] = 'y'
+        self.assertListEqual(added, ['x'])
+        self.assertListEqual([line for lines, start, length in snapshot
+                              for line in lines[start:start+length]], ['a', 'x', 'c'])
+        self.assertListEqual(list(text_buffer), ['a', 'y', 'c'])
+
+    def test_rebase(self):
+        text_buffer = TextBuffer(['a', 'b', 'c', 'd'])
+        text_buffer[1] = 'x'
+        snapshot = text_buffer.snapshot()
+        text_buffer.insert(2, 'y')
+        del text_buffer[4]
+        new_source = ['a', 'x', 'c', 'd']
+        mapping = [(lines, start, new_row, length) for (lines, start, length), new_row
+                   in zip(snapshot, [0, 1, 2])]
+        text_buffer.rebase(new_source, mapping)
+        self.assertIs(text_buffer.source, new_source)
+        self.assertListEqual(list(text_buffer), ['a', 'x', 'y', 'c'])
+        self.assertListEqual(text_buffer.pieces, [(new_source, 0, 2), (text_buffer.added, 0, 1),
+                                                  (new_source, 2, 1)])
+        self.assertRaises(ValueError, text_buffer.rebase, [], [(new_source, 0, 0, 1)])
+
+    def test_attach(self):
+        text_buffer = TextBuffer(['a', 'b'])
+        text_buffer[1] = 'x'
+        text_buffer.load(['c'])
+        new_source = ['a', 'b', 'c', 'd', 'e']
+        text_buffer.attach(new_source)
+        self.assertIs(text_buffer.source, new_source)
+        self.assertListEqual(list(text_buffer), ['a', 'x', 'c', 'd', 'e'])
+        self.assertListEqual(text_buffer.pieces, [(new_source, 0, 1), (text_buffer.added, 0, 1),
+                                                  (new_source, 2, 3)])
+        self.assertListEqual(text_buffer.positions, [0, 1, 2])
+
+    def test_delitem(self):
+        text_buffer = TextBuffer(['a', 'b', 'c', 'd', 'e'])
+        del text_buffer[1:3]
+        del text_buffer[-1]
+        self.assertListEqual(list(text_buffer), ['a', 'd'])
+        self.assertListEqual(text_buffer.positions, [0, 1])
+
+    def test_positions_lazy(self):
+        text_buffer = TextBuffer([str(i) for i in range(10)])
+        text_buffer.set_lines((row, 'x') for row in range(0, 10, 2))
+        self.assertEqual(len(text_buffer.pieces), 10)
+        text_buffer.insert(3, 'y')
+        # the rows of the pieces after the change are only updated when needed
+        self.assertEqual(text_buffer._valid, 3)
+        self.assertEqual(text_buffer[4], '3')
+        self.assertEqual(text_buffer._valid, 5)
+        self.assertEqual(text_buffer[-1], '9')
+        self.assertEqual(text_buffer._valid, 11)
+        self.assertListEqual(text_buffer.positions, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+
+    def test_merge_pieces(self):
+        text_buffer = TextBuffer(['a', 'b', 'c'])
+        text_buffer.insert(1, 'x')
+        text_buffer.insert(2, 'y')
+        del text_buffer[1:3]
+        # the source is referenced as a whole again
+        self.assertListEqual(text_buffer.pieces, [(text_buffer.source, 0, 3)])
+        text_buffer.insert_lines(3, ['d', 'e'])
+        text_buffer.append('f')
+        self.assertListEqual(text_buffer.pieces, [(text_buffer.source, 0, 3),
+                                                  (text_buffer.added, 2, 3)])
+        self.assertListEqual(list(text_buffer), ['a', 'b', 'c', 'd', 'e', 'f'])
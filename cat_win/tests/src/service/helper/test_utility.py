@@ -51,7 +51,7 @@ class TestConverterComp(TestCase):
             ('', 'xyz ((3 xyz'),
             ('', 'xyz 3)) xyz'),
         ]
-        new_content = comp_eval(converter, test_content_in, param_lowercase, cleaner)
+        new_content = list(comp_eval(converter, test_content_in, param_lowercase, cleaner))
         self.assertListEqual(new_content, test_content_out)
 
     def test_comp_eval_uppercase(self):
@@ -82,7 +82,7 @@ class TestConverterComp(TestCase):
             ('', '3'),
             ('', '3'),
         ]
-        new_content = comp_eval(converter, test_content_in, param_uppercase, cleaner)
+        new_content = list(comp_eval(converter, test_content_in, param_uppercase, cleaner))
         self.assertListEqual(new_content, test_content_out)
 
     def test_comp_conv_dec(self):
@@ -102,7 +102,7 @@ class TestConverterComp(TestCase):
             ('', '48 [Bin: 0b110000, Oct: 0o60, Hex: 0x30]'),
             ('', '1001 [Bin: 0b1111101001, Oct: 0o1751, Hex: 0x3e9]'),
         ]
-        new_content = comp_conv(converter, test_content_in, '--dec', cleaner)
+        new_content = list(comp_conv(converter, test_content_in, '--dec', cleaner))
         self.assertListEqual(new_content, test_content_out)
 
     def test_comp_conv_hex(self):
@@ -125,7 +125,7 @@ class TestConverterComp(TestCase):
             ('', '0b1001 [Bin: 0b10110001000000000001, Oct: 0o2610001, Dec: 724993]'),
             ('', '0x1001 [Bin: 0b1000000000001, Oct: 0o10001, Dec: 4097]'),
         ]
-        new_content = comp_conv(converter, test_content_in, '--hex', cleaner)
+        new_content = list(comp_conv(converter, test_content_in, '--hex', cleaner))
         self.assertListEqual(new_content, test_content_out)
 
     def test_comp_conv_oct(self):
@@ -144,7 +144,7 @@ class TestConverterComp(TestCase):
             ('', '30 [Bin: 0b11000, Dec: 24, Hex: 0x18]'),
             ('', '1001 [Bin: 0b1000000001, Dec: 513, Hex: 0x201]'),
         ]
-        new_content = comp_conv(converter, test_content_in, '--oct', cleaner)
+        new_content = list(comp_conv(converter, test_content_in, '--oct', cleaner))
         self.assertListEqual(new_content, test_content_out)
 
     def test_comp_conv_bin(self):
@@ -163,7 +163,7 @@ class TestConverterComp(TestCase):
             ('', '1001 [Oct: 0o11, Dec: 9, Hex: 0x9]'),
             ('', '0b1001 [Oct: 0o11, Dec: 9, Hex: 0x9]'),
         ]
-        new_content = comp_conv(converter, test_content_in, '--bin', cleaner)
+        new_content = list(comp_conv(converter, test_content_in, '--bin', cleaner))
         self.assertListEqual(new_content, test_content_out)
 
 # python -m unittest discover -s cat_win.tests -p test*.py
@@ -1,6 +1,8 @@
 from unittest.mock import patch, MagicMock
 from unittest import TestCase
 import os
+import re
+import tempfile
 
 from cat_win.tests.mocks.edit import getxymax
 from cat_win.tests.mocks.error import ErrorDefGen
@@ -10,6 +12,9 @@ from cat_win.src.service import editor
 if editor.CURSES_MODULE_ERROR:
     setattr(editor, 'curses', None)
 from cat_win.src.service.editor import Editor
+from cat_win.src.service.helper.filelines import FileLines
+from cat_win.src.service.helper.lineindex import LineIndex
+from cat_win.src.service.helper.longline import LongLine
 
 mm = MagicMock()
 
@@ -20,6 +25,16 @@ test_file_path_oneline = os.path.join(test_file_dir, 'test_oneline.txt')
 test_file_path_editor = os.path.join(test_file_dir, 'test_editor.txt')
 
 
+def get_save_content(editor: Editor) -> bytes:
+    written = []
+    def write_temp_file(_, chunks):
+        written.append(b''.join(chunks))
+    with patch('cat_win.src.service.helper.iohelper.IoHelper.write_temp_file', write_temp_file), \
+        patch('cat_win.src.service.helper.iohelper.IoHelper.replace_file', lambda *_: None):
+        editor._action_save(True)
+    return written[0]
+
+
 @patch('cat_win.src.service.editor.Editor.getxymax', getxymax)
 @patch('cat_win.src.service.editor.curses', mm)
 @patch('cat_win.src.service.helper.iohelper.IoHelper.get_newline', lambda *_: '\n')
@@ -36,7 +51,7 @@ class TestEditor(TestCase):
     def test_editor_unknown_file(self):
         editor = Editor('', '')
         self.assertEqual(editor.error_bar, "[Errno 2] No such file or directory: ''")
-        self.assertListEqual(editor.window_content, [''])
+        self.assertSequenceEqual(editor.window_content, [''])
 
     def test_selected_area(self):
         editor = Editor('', '')
@@ -70,93 +85,171 @@ class TestEditor(TestCase):
         editor._build_file_upto(60)
         self.assertSequenceEqual(editor.window_content, ['a' * 10] * 15 + ['0'] + ['a' * 10] * 34)
 
+    def test__setup_file_windowed(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, 'test.txt')
+            with open(tmp_file, 'wb') as raw_f:
+                raw_f.write(b'\n'.join(b'line %d' % i for i in range(100)))
+            with patch.object(LineIndex, 'min_file_size', 0), patch.object(LineIndex, 'step', 4), \
+                patch.object(LineIndex, 'cache_size', 0), patch.object(FileLines, 'cache_size', 20):
+                editor = Editor(tmp_file, '')
+                # the first lines are shown, while the file is being indexed
+                self.assertIsInstance(editor.window_content.source, list)
+                self.assertEqual(len(editor.window_content), 30)
+                editor.window_content[1] = 'x'
+                editor.line_indexer.join()
+                editor._attach_index()
+                self.assertIsNone(editor.line_indexer)
+                self.assertIsNone(editor._f_content_gen)
+                self.assertIsInstance(editor.window_content.source, FileLines)
+                self.assertEqual(len(editor.window_content), 100)
+                self.assertSequenceEqual(editor.window_content[:3], ['line 0', 'x', 'line 2'])
+                editor.window_content[1] = 'line 1'
+                editor.cpos.set_pos((98, 4))
+                editor._key_string('!')
+                editor._key_enter(None)
+                self.assertSequenceEqual(editor.window_content[97:],
+                                         ['line 97', 'line!', ' 98', 'line 99'])
+                # only the last block read is kept in memory
+                self.assertListEqual(list(editor.window_content.source.blocks), [24])
+                self.assertEqual(editor.window_content[0], 'line 0')
+                self.assertListEqual(list(editor.window_content.source.blocks), [0])
+                editor._action_save(True)
+                self.assertEqual(editor.error_bar, '')
+                with open(tmp_file, 'rb') as raw_f:
+                    self.assertEqual(raw_f.read().split(b'\n')[97:], [b'line 97', b'line!', b' 98', b'line 99'])
+                self.assertIsInstance(editor.window_content.source, FileLines)
+                self.assertEqual(len(editor.window_content), 101)
+                self.assertListEqual(editor.window_content.added, [])
+                editor.window_content.close()
+                LineIndex._loaded.clear()
+                # an already built index is used at once
+                LineIndex.put(tmp_file, LineIndex.build(tmp_file))
+                editor = Editor(tmp_file, '')
+                self.assertIsNone(editor.line_indexer)
+                self.assertIsInstance(editor.window_content.source, FileLines)
+                editor.window_content.close()
+            LineIndex._loaded.clear()
+
+    def test__action_save_background(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, 'test.txt')
+            with open(tmp_file, 'wb') as raw_f:
+                raw_f.write(b'\n'.join(b'line %d' % i for i in range(100)))
+            with patch.object(LineIndex, 'min_file_size', 0), patch.object(LineIndex, 'step', 4), \
+                patch.object(LineIndex, 'cache_size', 0):
+                editor = Editor(tmp_file, '')
+                editor.curse_window = MagicMock()
+                editor._attach_index(True)
+                editor.cpos.set_pos((50, 0))
+                editor._key_string('!')
+                editor._action_save()
+                # the editing continues while saving
+                editor._key_string('?')
+                self.assertEqual(editor.unsaved_progress, True)
+                editor._render_scr()
+                self.assertIn('| Saving: ', editor.curse_window.addstr.call_args_list[-1][0][2])
+                editor.editor_save.join()
+                editor._finish_save()
+                self.assertIsNone(editor.editor_save)
+                self.assertEqual(editor.error_bar, '')
+                self.assertEqual(editor.unsaved_progress, True)
+                with open(tmp_file, 'rb') as raw_f:
+                    self.assertEqual(raw_f.read().split(b'\n')[49:52], [b'line 49', b'!line 50', b'line 51'])
+                self.assertSequenceEqual(editor.window_content[49:52], ['line 49', '!?line 50', 'line 51'])
+                self.assertListEqual(editor.window_content.added, ['!?line 50'])
+                self.assertEqual(len(editor.window_content.pieces), 3)
+                self.assertListEqual(os.listdir(tmp_dir), ['test.txt'])
+                editor.window_content.close()
+            LineIndex._loaded.clear()
+
     def test_editor_key_enter(self):
         editor = Editor(test_file_path_oneline, '')
         editor._key_enter(None)
-        self.assertListEqual(editor.window_content, ['', 'test'])
+        self.assertSequenceEqual(editor.window_content, ['', 'test'])
         editor._move_key_right()
         editor._key_enter(None)
-        self.assertListEqual(editor.window_content, ['', 't', 'est'])
+        self.assertSequenceEqual(editor.window_content, ['', 't', 'est'])
         editor._move_key_end()
         editor._key_enter(None)
-        self.assertListEqual(editor.window_content, ['', 't', 'est', ''])
+        self.assertSequenceEqual(editor.window_content, ['', 't', 'est', ''])
 
     def test_editor_key_dc(self):
         editor = Editor(test_file_path_editor, '')
         self.assertEqual(editor._key_dc(None), 'l')
-        self.assertListEqual(editor.window_content, ['ine 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['ine 1', 'line 2'])
         editor._move_key_right()
         editor._key_dc(None)
-        self.assertListEqual(editor.window_content, ['ie 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['ie 1', 'line 2'])
         editor._move_key_end()
         editor._key_dc(None)
-        self.assertListEqual(editor.window_content, ['ie 1line 2'])
+        self.assertSequenceEqual(editor.window_content, ['ie 1line 2'])
         editor._move_key_end()
         editor._key_dc(None)
-        self.assertListEqual(editor.window_content, ['ie 1line 2'])
+        self.assertSequenceEqual(editor.window_content, ['ie 1line 2'])
         editor.selecting = True
         editor.cpos.set_pos((0, 3))
         self.assertEqual(editor._key_dc(None), None)
-        self.assertListEqual(editor.window_content, ['ie 1line 2'])
+        self.assertSequenceEqual(editor.window_content, ['ie 1line 2'])
 
     def test_editor_key_dl(self):
         editor = Editor(test_file_path_editor, '')
         self.assertEqual(editor._key_dl(None), 'line')
-        self.assertListEqual(editor.window_content, [' 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, [' 1', 'line 2'])
         editor._move_key_right()
         editor._key_dl(None)
-        self.assertListEqual(editor.window_content, [' ', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, [' ', 'line 2'])
         editor._key_dl(None)
-        self.assertListEqual(editor.window_content, [' line 2'])
+        self.assertSequenceEqual(editor.window_content, [' line 2'])
         editor._move_key_end()
         editor._key_dl(None)
-        self.assertListEqual(editor.window_content, [' line 2'])
+        self.assertSequenceEqual(editor.window_content, [' line 2'])
         editor.selecting = True
         editor.cpos.set_pos((0, 3))
         self.assertEqual(editor._key_dl(None), None)
-        self.assertListEqual(editor.window_content, [' line 2'])
+        self.assertSequenceEqual(editor.window_content, [' line 2'])
 
     def test_editor_key_backspace(self):
         editor = Editor(test_file_path_editor, '')
         self.assertEqual(editor._key_backspace('\b'), None)
-        self.assertListEqual(editor.window_content, ['line 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['line 1', 'line 2'])
         editor._move_key_ctl_end()
         self.assertEqual(editor._key_backspace('\b'), '2')
-        self.assertListEqual(editor.window_content, ['line 1', 'line '])
+        self.assertSequenceEqual(editor.window_content, ['line 1', 'line '])
         editor._move_key_left()
         editor._key_backspace('\b')
-        self.assertListEqual(editor.window_content, ['line 1', 'lin '])
+        self.assertSequenceEqual(editor.window_content, ['line 1', 'lin '])
         editor._move_key_home()
         editor._key_backspace('\b')
-        self.assertListEqual(editor.window_content, ['line 1lin '])
+        self.assertSequenceEqual(editor.window_content, ['line 1lin '])
         editor.selecting = True
         editor.cpos.set_pos((0, 4))
         self.assertEqual(editor._key_backspace('\b'), None)
-        self.assertListEqual(editor.window_content, ['line 1lin '])
+        self.assertSequenceEqual(editor.window_content, ['line 1lin '])
 
     def test_editor_key_ctl_backspace(self):
         editor = Editor(test_file_path_editor, '')
         editor._key_ctl_backspace(None)
-        self.assertListEqual(editor.window_content, ['line 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['line 1', 'line 2'])
         editor._move_key_ctl_end()
         editor._key_ctl_backspace(None)
-        self.assertListEqual(editor.window_content, ['line 1', 'line '])
+        self.assertSequenceEqual(editor.window_content, ['line 1', 'line '])
         editor._move_key_home()
         editor._move_key_right()
         editor._key_ctl_backspace(None)
-        self.assertListEqual(editor.window_content, ['line 1', 'ine '])
+        self.assertSequenceEqual(editor.window_content, ['line 1', 'ine '])
         editor._key_ctl_backspace(None)
-        self.assertListEqual(editor.window_content, ['line 1ine '])
+        self.assertSequenceEqual(editor.window_content, ['line 1ine '])
         editor._key_ctl_backspace(None)
-        self.assertListEqual(editor.window_content, ['line ine '])
+        self.assertSequenceEqual(editor.window_content, ['line ine '])
         editor._key_ctl_backspace(None)
-        self.assertListEqual(editor.window_content, ['lineine '])
+        self.assertSequenceEqual(editor.window_content, ['lineine '])
         self.assertEqual(editor._key_ctl_backspace(None), 'line')
-        self.assertListEqual(editor.window_content, ['ine '])
+        self.assertSequenceEqual(editor.window_content, ['ine '])
         editor.selecting = True
         editor.cpos.set_pos((0, 2))
         self.assertEqual(editor._key_ctl_backspace(None), None)
-        self.assertListEqual(editor.window_content, ['ine '])
+        self.assertSequenceEqual(editor.window_content, ['ine '])
 
     def test_editor_move_key_left(self):
         editor = Editor(test_file_path_editor, '')
@@ -497,13 +590,13 @@ class TestEditor(TestCase):
     def test_editor_indent_tab(self):
         editor = Editor(test_file_path_editor, '')
         editor._key_string('TEST')
-        self.assertListEqual(editor.window_content, ['TESTline 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['TESTline 1', 'line 2'])
         editor._move_key_ctl_right()
         self.assertEqual(editor._indent_tab('\t'), '\t')
-        self.assertListEqual(editor.window_content, ['TESTline\t 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['TESTline\t 1', 'line 2'])
         editor._move_key_home()
         self.assertEqual(editor._indent_tab('\t'), ':)')
-        self.assertListEqual(editor.window_content, [':)TESTline\t 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, [':)TESTline\t 1', 'line 2'])
 
     @patch('cat_win.src.service.editor.Editor.special_indentation', ':)')
     def test_editor_indent_tab_select(self):
@@ -512,30 +605,30 @@ class TestEditor(TestCase):
         editor.spos.set_pos((0,2))
         editor.cpos.set_pos((0,4))
         self.assertEqual(editor._indent_tab('\t'), ':)\0')
-        self.assertListEqual(editor.window_content, [':)line 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, [':)line 1', 'line 2'])
         editor.spos.set_pos((0,2))
         editor.cpos.set_pos((1,4))
         self.assertEqual(editor._indent_tab('\t'), ':)\0:)\0')
-        self.assertListEqual(editor.window_content, [':):)line 1', ':)line 2'])
+        self.assertSequenceEqual(editor.window_content, [':):)line 1', ':)line 2'])
         self.assertEqual(editor._indent_tab(':)\0'), ':)\0')
-        self.assertListEqual(editor.window_content, [':):)line 1', ':):)line 2'])
+        self.assertSequenceEqual(editor.window_content, [':):)line 1', ':):)line 2'])
         self.assertEqual(editor._indent_tab(':)\0:)\0'), ':)\0:)\0')
-        self.assertListEqual(editor.window_content, [':):):)line 1', ':):):)line 2'])
+        self.assertSequenceEqual(editor.window_content, [':):):)line 1', ':):):)line 2'])
 
     @patch('cat_win.src.service.editor.Editor.special_indentation', ':)')
     def test_editor_indent_btab(self):
         editor = Editor(test_file_path_editor, '')
         editor._key_string(':):):)')
-        self.assertListEqual(editor.window_content, [':):):)line 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, [':):):)line 1', 'line 2'])
         editor._move_key_ctl_right()
         self.assertEqual(editor._indent_btab(''), ':)\0')
-        self.assertListEqual(editor.window_content, [':):)line 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, [':):)line 1', 'line 2'])
         self.assertEqual(editor._indent_btab(''), ':)\0')
-        self.assertListEqual(editor.window_content, [':)line 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, [':)line 1', 'line 2'])
         self.assertEqual(editor._indent_btab(''), ':)\0')
-        self.assertListEqual(editor.window_content, ['line 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['line 1', 'line 2'])
         self.assertEqual(editor._indent_btab(''), None)
-        self.assertListEqual(editor.window_content, ['line 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['line 1', 'line 2'])
 
     @patch('cat_win.src.service.editor.Editor.special_indentation', ':)')
     def test_editor_indent_btab_select(self):
@@ -544,26 +637,26 @@ class TestEditor(TestCase):
         editor.spos.set_pos((0,2))
         editor.cpos.set_pos((0,4))
         self.assertEqual(editor._indent_btab(351), None)
-        self.assertListEqual(editor.window_content, ['line 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['line 1', 'line 2'])
         editor.cpos.set_pos((0,0))
         editor._key_string(':):):)')
         editor.cpos.set_pos((1,0))
         editor._key_string(':):):):)')
-        self.assertListEqual(editor.window_content, [':):):)line 1', ':):):):)line 2'])
+        self.assertSequenceEqual(editor.window_content, [':):):)line 1', ':):):):)line 2'])
         editor.spos.set_pos((0,2))
         editor.cpos.set_pos((0,4))
         self.assertEqual(editor._indent_btab(351), ':)\0')
-        self.assertListEqual(editor.window_content, [':):)line 1', ':):):):)line 2'])
+        self.assertSequenceEqual(editor.window_content, [':):)line 1', ':):):):)line 2'])
         editor.cpos.set_pos((1,3))
         self.assertEqual(editor._indent_btab(351), ':)\0:)\0')
-        self.assertListEqual(editor.window_content, [':)line 1', ':):):)line 2'])
+        self.assertSequenceEqual(editor.window_content, [':)line 1', ':):):)line 2'])
         editor.selecting = False
         self.assertEqual(editor._indent_btab(351), ':)\0')
-        self.assertListEqual(editor.window_content, [':)line 1', ':):)line 2'])
+        self.assertSequenceEqual(editor.window_content, [':)line 1', ':):)line 2'])
         self.assertEqual(editor._indent_btab(':)\0:)\0'), ':)\0:)\0')
-        self.assertListEqual(editor.window_content, ['line 1', ':)line 2'])
+        self.assertSequenceEqual(editor.window_content, ['line 1', ':)line 2'])
         self.assertEqual(editor._indent_btab(':)\0:)\0'), '\0:)\0')
-        self.assertListEqual(editor.window_content, ['line 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['line 1', 'line 2'])
 
     def test_editor_key_remove_add_selected(self):
         editor = Editor(test_file_path, '')
@@ -571,7 +664,7 @@ class TestEditor(TestCase):
         editor.cpos.set_pos((6,2))
         self.assertEqual(editor._key_remove_chunk(None),
                          'owing Line is Empty:\n\nTh')
-        self.assertListEqual(editor.window_content,
+        self.assertSequenceEqual(editor.window_content,
                              [
                                  'Sample Text:',
                                  'This is a Tab-Character: >\t<',
@@ -627,17 +720,17 @@ class TestEditor(TestCase):
         editor = Editor(test_file_path_editor, '')
         self.assertEqual(editor._key_string(1), '')
         self.assertEqual(editor._key_string(''), '')
-        self.assertListEqual(editor.window_content, ['line 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['line 1', 'line 2'])
         editor._move_key_right()
         editor._key_string('test')
-        self.assertListEqual(editor.window_content, ['ltestine 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['ltestine 1', 'line 2'])
         editor._key_string('\t')
-        self.assertListEqual(editor.window_content, ['ltest\tine 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['ltest\tine 1', 'line 2'])
         editor._key_enter('')
         editor._key_string('\t')
-        self.assertListEqual(editor.window_content, ['ltest\t', '!!!ine 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['ltest\t', '!!!ine 1', 'line 2'])
         editor._key_string('\t')
-        self.assertListEqual(editor.window_content, ['ltest\t', '!!!!!!ine 1', 'line 2'])
+        self.assertSequenceEqual(editor.window_content, ['ltest\t', '!!!!!!ine 1', 'line 2'])
 
     @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(['@@@'] * 4))
     def test_editor_select_key_all(self):
@@ -710,7 +803,8 @@ class TestEditor(TestCase):
             ['$a', '$$', '$$c'],
             ['ab', '$cd', '$$ef'],
             ['a', 'b', ''],
-            ['XYba'],
+            # replacing all is undone at once
+            ['Xaba'],
             ['abC', 'DEf'],
             ['ABCDEF', ''],
         ]
@@ -756,7 +850,7 @@ class TestEditor(TestCase):
         editor.spos.set_pos((3, 2))
         with patch('cat_win.src.service.clipboard.Clipboard.put', assertCopy):
             editor._action_cut()
-        self.assertListEqual(editor.window_content, ['@@'])
+        self.assertSequenceEqual(editor.window_content, ['@@'])
 
     def test__action_render_scr(self):
         editor = Editor('', '')
@@ -768,19 +862,23 @@ class TestEditor(TestCase):
         editor = Editor(test_file_path, '')
         editor.debug_mode = True
         error_def = ErrorDefGen.get_def(OSError('TestError'))
-        with patch('cat_win.src.service.helper.iohelper.IoHelper.write_file', new=error_def), patch('sys.stderr', new=StdOutMock()) as fake_out:
-            self.assertEqual(editor._action_save(), True)
+        with patch('cat_win.src.service.helper.iohelper.IoHelper.write_temp_file', new=error_def), patch('sys.stderr', new=StdOutMock()) as fake_out:
+            self.assertEqual(editor._action_save(True), True)
             self.assertEqual(editor.error_bar, 'TestError')
+            self.assertEqual(editor.unsaved_progress, True)
             self.assertEqual('TestError\n', fake_out.getvalue())
 
-        with patch('cat_win.src.service.helper.iohelper.IoHelper.write_file', new=lambda *_: None):
+        with patch('cat_win.src.service.helper.iohelper.IoHelper.write_temp_file', new=lambda *_: None), \
+            patch('cat_win.src.service.helper.iohelper.IoHelper.replace_file', new=lambda *_: None):
             self.assertEqual(editor._action_save(), True)
+            editor.editor_save.join()
+            editor._finish_save()
             self.assertEqual(editor.error_bar, '')
+            self.assertEqual(editor.unsaved_progress, False)
+            self.assertEqual(editor.changes_made, True)
 
     @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(['@@@'] * 501))
     def test_editor_action_save_correctness(self):
-        def assertWriteFile(_, _s: str):
-            self.assertEqual(_s, (b'@@@\n@!\n'+b'\n'*99+b'@@\n'+b'@@@\n'*498+b'@@@'))
         editor = Editor('', '')
         editor.cpos.set_pos((1,1))
         editor._key_string('!')
@@ -789,18 +887,29 @@ class TestEditor(TestCase):
         self.assertEqual(editor.cpos.get_pos(), (101, 0))
         self.assertEqual(len(editor.window_content), 130)
         self.assertEqual(editor.window_content[editor.cpos.row], '@@')
-        with patch('cat_win.src.service.helper.iohelper.IoHelper.write_file', assertWriteFile):
-            editor._action_save()
+        self.assertEqual(get_save_content(editor), (b'@@@\n@!\n'+b'\n'*99+b'@@\n'+b'@@@\n'*498+b'@@@'))
 
     @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(['a' * 10] * 50))
     def test__action_save_lazy_load(self):
-        def assertWriteFile(_, _s: str):
-            self.assertEqual(_s, ('\n'.join(['a' * 10] * 29) + '\nTEST\n' + '\n'.join(['a' * 10] * 20)).encode(editor.file_encoding))
         editor = Editor('', '')
         self.assertEqual(editor.window_content, ['a' * 10] * 30)
         editor.window_content[29] = 'TEST'
-        with patch('cat_win.src.service.helper.iohelper.IoHelper.write_file', assertWriteFile):
-            editor._action_save()
+        self.assertEqual(get_save_content(editor), ('\n'.join(['a' * 10] * 29) + '\nTEST\n' + '\n'.join(['a' * 10] * 20)).encode(editor.file_encoding))
+        # the lines read by the save are loaded from there
+        self.assertEqual(len(editor.window_content), 30)
+        editor._build_file()
+        self.assertEqual(editor.window_content, ['a' * 10] * 29 + ['TEST'] + ['a' * 10] * 20)
+        self.assertEqual(editor.unsaved_progress, False)
+
+    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(['a', 'b', 'c', 'd', 'e'] * 10))
+    def test__action_save_content(self):
+        editor = Editor('', '')
+        editor.line_sep = '\r\n'
+        editor.window_content[0] = 'ä'
+        self.assertEqual(get_save_content(editor), '\r\n'.join(['ä'] + ['b', 'c', 'd', 'e', 'a'] * 10)[:-3].encode())
+        with patch.object(Editor, 'file_encoding', 'utf-16'):
+            self.assertEqual(get_save_content(editor),
+                             '\r\n'.join(['ä'] + ['b', 'c', 'd', 'e', 'a'] * 10)[:-3].encode('utf-16'))
 
     @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(['a' * 10] * 50))
     def test__action_jump(self):
@@ -876,6 +985,63 @@ class TestEditor(TestCase):
         self.assertEqual(editor._action_replace(), True)
         self.assertEqual(editor.cpos.get_pos(), (40, 4))
 
+    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(['ab ab', 'b', 'abab']))
+    def test__action_replace_all(self):
+        editor = Editor('', '')
+        editor.curse_window = MagicMock()
+        editor.search = 'ab'
+        editor.get_char = iter([('', b'_action_insert'), ('x', b'_key_string'), ('', b'_key_enter')])
+        editor.cpos.set_pos((2, 4))
+        self.assertEqual(editor._action_replace(), True)
+        self.assertSequenceEqual(editor.window_content, ['x x', 'b', 'xx'])
+        self.assertEqual(editor.status_msg, 'Replaced 4 occurrences')
+        self.assertEqual(editor.cpos.get_pos(), (2, 2))
+        self.assertEqual(len(editor.history._stack_undo), 1)
+        editor.history.undo(editor)
+        self.assertSequenceEqual(editor.window_content, ['ab ab', 'b', 'abab'])
+        self.assertEqual(editor.cpos.get_pos(), (2, 4))
+        editor.history.redo(editor)
+        self.assertSequenceEqual(editor.window_content, ['x x', 'b', 'xx'])
+
+        editor._render_scr()
+        self.assertEqual(editor.status_msg, '')
+
+    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(['ab ab', 'b', 'abab']))
+    def test__replace_all(self):
+        editor = Editor('', '')
+        editor.search = re.compile('a(b)')
+        editor.replace = r'<\1>'
+        editor.selecting = True
+        editor.spos.set_pos((0, 2))
+        editor.cpos.set_pos((2, 3))
+        self.assertEqual(editor._replace_all(), 2)
+        self.assertSequenceEqual(editor.window_content, ['ab <b>', 'b', '<b>ab'])
+        editor.selecting = False
+        editor.replace = r'\2'
+        self.assertEqual(editor._replace_all(), 2)
+        self.assertSequenceEqual(editor.window_content, ['\\2 <b>', 'b', '<b>\\2'])
+        editor.search = 'x'
+        self.assertEqual(editor._replace_all(), 0)
+        self.assertEqual(len(editor.history._stack_undo), 2)
+
+    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(['abab', 'aab']))
+    def test__replace_all_selection_context(self):
+        editor = Editor('', '')
+        editor.selecting = True
+        editor.spos.set_pos((0, 2))
+        editor.cpos.set_pos((1, 1))
+        editor.replace = 'x'
+        # the anchors and lookarounds see the whole line, not only the selection
+        for search, count, expected in [('^a', 1, ['abab', 'xab']),
+                                        ('(?<=b)a', 1, ['abxb', 'xab']),
+                                        ('x$', 0, ['abxb', 'xab']),
+                                        # matches exceeding the selection are not replaced
+                                        ('a+', 0, ['abxb', 'xab']),
+                                        ('b$', 1, ['abxx', 'xab'])]:
+            editor.search = re.compile(search)
+            self.assertEqual(editor._replace_all(), count)
+            self.assertSequenceEqual(editor.window_content, expected)
+
     @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(['a' * 10] * 50))
     def test__action_reload(self):
         editor = Editor('', '')
@@ -945,7 +1111,7 @@ class TestEditor(TestCase):
         self.assertEqual(editor._action_quit(), True)
         editor.get_char = yield_tuple('\x1b', b'_key_string')
         self.assertEqual(editor._action_quit(), True)
-        def action_save(_):
+        def action_save(*_):
             editor.unsaved_progress = False
         def char_gen(user_input: list):
             yield from zip(user_input, [b'_key_string'] * len(user_input))
@@ -1035,6 +1201,83 @@ class TestEditor(TestCase):
         editor.wpos.set_pos((0, 0))
         self.assertEqual(editor._render_scr(), None)
 
+    def test__get_line_display(self):
+        editor = Editor('', '')
+        editor._set_special_chars({'\0': '␀'})
+        self.assertEqual(editor._get_line_display('a\tb  '), ('a>b  ', b'\0\4\0\3\3'))
+        self.assertEqual(editor._get_line_display(' \t\0'), (' >␀', b'\0\4\3'))
+        self.assertEqual(editor._get_line_display('a\x01あ \t'), ('a?� >', b'\0\3\x08\3\4'))
+        self.assertEqual(editor._get_line_display(''), ('', b''))
+        self.assertIn('a\tb  ', editor._line_cache)
+
+    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(['abc', 'd\te ', 'fg']))
+    def test__render_scr_dirty_rows(self):
+        editor = Editor('', '')
+        editor.curse_window = MagicMock()
+        editor.curse_window.getmaxyx.return_value = (5, 10)
+        editor._render_scr()
+        self.assertListEqual(
+            [c[0][:3] for c in editor.curse_window.addstr.call_args_list[:5]],
+            [(0, 0, 'abc'), (1, 0, 'd'), (1, 1, '>'), (1, 2, 'e'), (1, 3, ' ')]
+        )
+        self.assertEqual(editor._drawn_rows[3], ())
+
+        # nothing has changed, only the status bar is drawn
+        editor.curse_window.reset_mock()
+        editor._render_scr()
+        self.assertEqual(editor.curse_window.addstr.call_count, 1)
+
+        editor.window_content[2] = 'fgh'
+        editor.curse_window.reset_mock()
+        editor._render_scr()
+        self.assertEqual(editor.curse_window.addstr.call_args_list[0][0][:3], (2, 0, 'fgh'))
+        self.assertEqual(editor.curse_window.addstr.call_count, 2)
+
+        editor.selecting = True
+        editor.spos.set_pos((0, 1))
+        editor.cpos.set_pos((0, 2))
+        editor.curse_window.reset_mock()
+        editor._render_scr()
+        self.assertListEqual(
+            [c[0][:3] for c in editor.curse_window.addstr.call_args_list[:3]],
+            [(0, 0, 'a'), (0, 1, 'b'), (0, 2, 'c')]
+        )
+        self.assertEqual(editor.curse_window.addstr.call_count, 4)
+
+        editor._action_resize()
+        editor.curse_window.reset_mock()
+        editor._render_scr()
+        self.assertEqual(editor.curse_window.addstr.call_count, 9)
+
+    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(['abc def  ' * 4, 'x']))
+    def test_editor_long_line(self):
+        with patch.object(LongLine, 'min_length', 20), patch.object(LongLine, 'chunk_size', 8):
+            editor = Editor('', '')
+            editor.cpos.set_pos((0, 4))
+            editor._key_string('X')
+            self.assertIsInstance(editor.window_content[0], LongLine)
+            self.assertEqual(editor.window_content[0], 'abc Xdef  ' + 'abc def  ' * 3)
+            editor._key_dc(None)
+            editor._key_backspace('\b')
+            self.assertEqual(editor.window_content[0], 'abc ef  ' + 'abc def  ' * 3)
+            editor._move_key_ctl_right()
+            self.assertEqual(editor.cpos.get_pos(), (0, 6))
+            editor._move_key_ctl_right()
+            editor._move_key_ctl_left()
+            self.assertEqual(editor.cpos.get_pos(), (0, 6))
+            self.assertEqual(get_save_content(editor),
+                             ('abc ef  ' + 'abc def  ' * 3 + '\nx').encode())
+
+            editor.curse_window = MagicMock()
+            editor.curse_window.getmaxyx.return_value = (5, 6)
+            editor.window_content[0] = LongLine('abc def  ' * 4)
+            editor.wpos.col = 32
+            editor._render_scr()
+            self.assertListEqual(
+                [c[0][:3] for c in editor.curse_window.addstr.call_args_list[:2]],
+                [(0, 0, 'ef'), (0, 2, '  ')]
+            )
+
     @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(['a' * 10] * 50))
     def test__run(self):
         editor = Editor('', '')
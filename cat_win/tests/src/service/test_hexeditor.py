@@ -1,10 +1,11 @@
-from copy import deepcopy
 from unittest.mock import patch, MagicMock
 from unittest import TestCase
+import os
+import tempfile
 
 from cat_win.tests.mocks.edit import getxymax
 from cat_win.tests.mocks.error import ErrorDefGen
-from cat_win.tests.mocks.std import StdOutMock, IoHelperMock
+from cat_win.tests.mocks.std import StdOutMock
 
 from cat_win.src.service import hexeditor
 if hexeditor.CURSES_MODULE_ERROR:
@@ -42,53 +43,31 @@ class TestHexEditor(TestCase):
         with patch('cat_win.src.service.hexeditor.HexEditor.columns', 3):
             self.assertListEqual(list(HexEditor.pos_between((2,0),(4,1))), [(2,0),(2,1),(2,2),(3,0),(3,1),(3,2),(4,0),(4,1)])
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 723))
-    def test__build_file(self):
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 723)
+    def test__setup_file(self):
         editor = HexEditor('', '')
-        self.assertSequenceEqual(editor.hex_array, [['40'] * 16] * 30)
-        self.assertSequenceEqual(editor.hex_array_edit, [[None] * 16] * 30)
-        editor.hex_array_edit[15][1] = '00'
-        editor._build_file()
         self.assertSequenceEqual(editor.hex_array, [['40'] * 16] * 45 + [['40'] * 3])
-        self.assertSequenceEqual(editor.hex_array_edit,
-                                 [[None] * 16] * 15 + [[None, '00', None, None, None, None, None, None, None, None, None, None, None, None, None, None]] + [[None] * 16] * 29 + [[None] * 3])
-
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 723))
-    def test__build_file_upto_16(self):
-        editor = HexEditor('', '')
-        self.assertSequenceEqual(editor.hex_array, [['40'] * 16] * 30)
-        self.assertSequenceEqual(editor.hex_array_edit, [[None] * 16] * 30)
-        editor._build_file_upto(40)
-        self.assertSequenceEqual(editor.hex_array, [['40'] * 16] * 40)
-        self.assertSequenceEqual(editor.hex_array_edit, [[None] * 16] * 40)
+        self.assertSequenceEqual(editor.hex_array_edit, [[None] * 16] * 45 + [[None] * 3])
         editor.hex_array_edit[15][1] = '00'
-        editor._build_file_upto(50)
         self.assertSequenceEqual(editor.hex_array, [['40'] * 16] * 45 + [['40'] * 3])
         self.assertSequenceEqual(editor.hex_array_edit,
                                  [[None] * 16] * 15 + [[None, '00', None, None, None, None, None, None, None, None, None, None, None, None, None, None]] + [[None] * 16] * 29 + [[None] * 3])
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'!' * 454))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'!' * 454)
     @patch('cat_win.src.service.hexeditor.HexEditor.columns', 10)
-    def test__build_file_upto_10(self):
+    def test__setup_file_10(self):
         editor = HexEditor('', '')
-        self.assertSequenceEqual(editor.hex_array, [['21'] * 10] * 30)
-        self.assertSequenceEqual(editor.hex_array_edit, [[None] * 10] * 30)
-        editor._build_file_upto(40)
-        self.assertSequenceEqual(editor.hex_array, [['21'] * 10] * 40)
-        self.assertSequenceEqual(editor.hex_array_edit, [[None] * 10] * 40)
-        editor.hex_array_edit[15][1] = '00'
-        editor._build_file_upto(50)
         self.assertSequenceEqual(editor.hex_array, [['21'] * 10] * 45 + [['21'] * 4])
+        editor.hex_array_edit[15][1] = '00'
         self.assertSequenceEqual(editor.hex_array_edit,
                                  [[None] * 10] * 15 + [[None, '00', None, None, None, None, None, None, None, None]] + [[None] * 10] * 29 + [[None] * 4])
 
     def test__key_dc_empty(self):
         editor = HexEditor('', '')
-        editor._build_file_upto(0)
         editor._key_dc(None)
         self.assertEqual(editor.cpos.get_pos(), (0, 0))
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 20))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 20)
     def test__get_current_state_row(self):
         editor = HexEditor('', '')
         self.assertListEqual(editor._get_current_state_row(0), ['40'] * 16)
@@ -102,8 +81,8 @@ class TestHexEditor(TestCase):
 
     def test__key_dc(self):
         editor = HexEditor(__file__, '')
-        hex_array = deepcopy(editor.hex_array)
-        hex_array_edit = deepcopy(editor.hex_array_edit)
+        hex_array = [list(row) for row in editor.hex_array]
+        hex_array_edit = [list(row) for row in editor.hex_array_edit]
         editor.cpos.set_pos((5, 12))
         editor.hex_array_edit[5][12] = '00'
         editor._key_dc(None)
@@ -113,8 +92,8 @@ class TestHexEditor(TestCase):
 
     def test__key_dc_selection(self):
         editor = HexEditor(__file__, '')
-        hex_array = deepcopy(editor.hex_array)
-        hex_array_edit = deepcopy(editor.hex_array_edit)
+        hex_array = [list(row) for row in editor.hex_array]
+        hex_array_edit = [list(row) for row in editor.hex_array_edit]
         editor.cpos.set_pos((1,5))
         editor.spos.set_pos((4,10))
         editor.selecting = True
@@ -130,14 +109,13 @@ class TestHexEditor(TestCase):
 
     def test__key_dl_empty(self):
         editor = HexEditor('', '')
-        editor._build_file_upto(0)
         editor._key_dl(None)
         self.assertEqual(editor.cpos.get_pos(), (0, 0))
 
     def test__key_dl(self):
         editor = HexEditor(__file__, '')
-        hex_array = deepcopy(editor.hex_array)
-        hex_array_edit = deepcopy(editor.hex_array_edit)
+        hex_array = [list(row) for row in editor.hex_array]
+        hex_array_edit = [list(row) for row in editor.hex_array_edit]
         editor.cpos.set_pos((5, 12))
         editor._key_dl(None)
         hex_array_edit[5][12] = '--'
@@ -147,8 +125,8 @@ class TestHexEditor(TestCase):
 
     def test__key_dl_selection(self):
         editor = HexEditor(__file__, '')
-        hex_array = deepcopy(editor.hex_array)
-        hex_array_edit = deepcopy(editor.hex_array_edit)
+        hex_array = [list(row) for row in editor.hex_array]
+        hex_array_edit = [list(row) for row in editor.hex_array_edit]
         editor.cpos.set_pos((3, 15))
         editor.spos.set_pos((5, 0))
         editor.selecting = True
@@ -162,15 +140,14 @@ class TestHexEditor(TestCase):
 
     def test__key_backspace_empty(self):
         editor = HexEditor('', '')
-        editor._build_file_upto(0)
         editor._key_backspace(None)
         editor.cpos.set_pos((5, 5))
         self.assertEqual(editor.cpos.get_pos(), (5, 5))
 
     def test__key_backspace(self):
         editor = HexEditor(__file__, '')
-        hex_array = deepcopy(editor.hex_array)
-        hex_array_edit = deepcopy(editor.hex_array_edit)
+        hex_array = [list(row) for row in editor.hex_array]
+        hex_array_edit = [list(row) for row in editor.hex_array_edit]
         editor.cpos.set_pos((5, 5))
         editor.hex_array_edit[5][5] = '00'
         editor._key_backspace(None)
@@ -180,8 +157,8 @@ class TestHexEditor(TestCase):
 
     def test__key_backspace_selection(self):
         editor = HexEditor(__file__, '')
-        hex_array = deepcopy(editor.hex_array)
-        hex_array_edit = deepcopy(editor.hex_array_edit)
+        hex_array = [list(row) for row in editor.hex_array]
+        hex_array_edit = [list(row) for row in editor.hex_array_edit]
         editor.cpos.set_pos((4,10))
         editor.spos.set_pos((1,5))
         editor.selecting = True
@@ -197,15 +174,14 @@ class TestHexEditor(TestCase):
 
     def test__key_ctl_backspace_empty(self):
         editor = HexEditor('', '')
-        editor._build_file_upto(0)
         editor._key_ctl_backspace(None)
         editor.cpos.set_pos((5, 5))
         self.assertEqual(editor.cpos.get_pos(), (5, 5))
 
     def test__key_ctl_backspace(self):
         editor = HexEditor(__file__, '')
-        hex_array = deepcopy(editor.hex_array)
-        hex_array_edit = deepcopy(editor.hex_array_edit)
+        hex_array = [list(row) for row in editor.hex_array]
+        hex_array_edit = [list(row) for row in editor.hex_array_edit]
         editor.cpos.set_pos((5, 5))
         editor._key_ctl_backspace(None)
         hex_array_edit[5][5] = '--'
@@ -215,8 +191,8 @@ class TestHexEditor(TestCase):
 
     def test__key_ctl_backspace_selection(self):
         editor = HexEditor(__file__, '')
-        hex_array = deepcopy(editor.hex_array)
-        hex_array_edit = deepcopy(editor.hex_array_edit)
+        hex_array = [list(row) for row in editor.hex_array]
+        hex_array_edit = [list(row) for row in editor.hex_array_edit]
         editor.cpos.set_pos((5, 0))
         editor.spos.set_pos((3, 15))
         editor.selecting = True
@@ -400,7 +376,7 @@ class TestHexEditor(TestCase):
         self.assertEqual(editor.cpos.get_pos(), (63, 11))
         self.assertEqual(editor.wpos.get_pos(), (0, 0))
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 20))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 20)
     def test__move_key_end(self):
         editor = HexEditor('', '')
         editor.cpos.set_pos((0, 2))
@@ -410,14 +386,14 @@ class TestHexEditor(TestCase):
         editor._move_key_end()
         self.assertEqual(editor.cpos.get_pos(), (1, 3))
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 70))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 70)
     def test__move_key_ctl_end(self):
         editor = HexEditor('', '')
         editor.cpos.set_pos((1, 1))
         editor._move_key_ctl_end()
         self.assertEqual(editor.cpos.get_pos(), (4, 5))
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 20))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 20)
     def test__select_key_end(self):
         editor = HexEditor('', '')
         editor.cpos.set_pos((0, 2))
@@ -445,7 +421,7 @@ class TestHexEditor(TestCase):
         editor._select_key_home()
         self.assertEqual(editor.cpos.get_pos(), (123, 0))
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 16))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 16)
     def test__insert_byte_left(self):
         editor = HexEditor('', '')
         editor.cpos.set_pos((0, 8))
@@ -456,7 +432,7 @@ class TestHexEditor(TestCase):
         self.assertSequenceEqual(editor.hex_array, [['40'] * 8 + ['--'] * 2 + ['40'] * 6] + [['40'] * 2])
         self.assertEqual(editor.cpos.get_pos(), (0, 8))
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 16))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 16)
     def test__insert_byte_right(self):
         editor = HexEditor('', '')
         editor.cpos.set_pos((0, 8))
@@ -469,8 +445,8 @@ class TestHexEditor(TestCase):
 
     def test__key_string_invalid(self):
         editor = HexEditor(__file__, '')
-        hex_array = deepcopy(editor.hex_array)
-        hex_array_edit = deepcopy(editor.hex_array_edit)
+        hex_array = [list(row) for row in editor.hex_array]
+        hex_array_edit = [list(row) for row in editor.hex_array_edit]
         editor._key_string('')
         self.assertSequenceEqual(editor.hex_array, hex_array)
         self.assertSequenceEqual(editor.hex_array_edit, hex_array_edit)
@@ -485,14 +461,14 @@ class TestHexEditor(TestCase):
         self.assertEqual(editor.cpos.get_pos(), (0, 0))
 
         editor = HexEditor('', '')
-        hex_array = deepcopy(editor.hex_array)
-        hex_array_edit = deepcopy(editor.hex_array_edit)
+        hex_array = [list(row) for row in editor.hex_array]
+        hex_array_edit = [list(row) for row in editor.hex_array_edit]
         editor._key_string('0')
         self.assertSequenceEqual(editor.hex_array, hex_array)
         self.assertSequenceEqual(editor.hex_array_edit, hex_array_edit)
         self.assertEqual(editor.cpos.get_pos(), (0, 0))
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 16))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 16)
     def test__key_string(self):
         editor = HexEditor('', '')
         editor.cpos.set_pos((0, 1))
@@ -506,7 +482,7 @@ class TestHexEditor(TestCase):
         self.assertSequenceEqual(editor.hex_array_edit, [[None] + ['FE'] + ['40'] + [None] * 13])
         self.assertEqual(editor.cpos.get_pos(), (0, 2))
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 20))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 20)
     def test__select_key_all(self):
         editor = HexEditor('', '')
         editor.spos.set_pos((1,1))
@@ -514,7 +490,7 @@ class TestHexEditor(TestCase):
         self.assertEqual(editor.spos.get_pos(), (0, 0))
         self.assertEqual(editor.cpos.get_pos(), (1, 3))
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen([]))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'')
     def test_full_integration(self):
         mm_backup1 = mm.error
         mm_backup2 = mm.keyname
@@ -592,7 +568,7 @@ class TestHexEditor(TestCase):
         mm.keyname = mm_backup2
         mm.initscr = mm_backup2
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 21))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 21)
     def test__action_copy(self):
         def assertCopy(_s: str):
             self.assertEqual(_s, '40' * 10 + '21' + '40' * 10)
@@ -603,7 +579,7 @@ class TestHexEditor(TestCase):
         with patch('cat_win.src.service.clipboard.Clipboard.put', assertCopy):
             editor._action_copy()
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 21))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 21)
     def test__action_copy_single(self):
         def assertCopy(_s: str):
             self.assertEqual(_s, '21')
@@ -613,7 +589,7 @@ class TestHexEditor(TestCase):
         with patch('cat_win.src.service.clipboard.Clipboard.put', assertCopy):
             editor._action_copy()
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 21))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 21)
     def test__action_cut(self):
         def assertCopy(_s: str):
             self.assertEqual(_s, '40' * 10 + '21' + '40' * 10)
@@ -623,9 +599,9 @@ class TestHexEditor(TestCase):
         editor._select_key_all()
         with patch('cat_win.src.service.clipboard.Clipboard.put', assertCopy):
             editor._action_cut()
-        self.assertListEqual(editor.hex_array_edit, [['--'] * 16, ['--'] * 5])
+        self.assertSequenceEqual(editor.hex_array_edit, [['--'] * 16, ['--'] * 5])
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 21))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 21)
     def test__action_cut_single(self):
         def assertCopy(_s: str):
             self.assertEqual(_s, '21')
@@ -634,7 +610,7 @@ class TestHexEditor(TestCase):
         editor.cpos.set_pos((0, 10))
         with patch('cat_win.src.service.clipboard.Clipboard.put', assertCopy):
             editor._action_cut()
-        self.assertListEqual(editor.hex_array_edit, [[None] * 10 + ['--'] + [None] * 5, [None] * 5])
+        self.assertSequenceEqual(editor.hex_array_edit, [[None] * 10 + ['--'] + [None] * 5, [None] * 5])
 
     def test__action_render_scr(self):
         editor = HexEditor('', '')
@@ -642,46 +618,84 @@ class TestHexEditor(TestCase):
         self.assertNotEqual(editor.error_bar, '')
         self.assertEqual(editor._action_render_scr(''), None)
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 496))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 496)
     def test__action_save(self):
-        def assertWriteFile(_, _s: str):
-            self.assertEqual(_s, b'!'*16+b'@'*479)
+        def assertWriteFile(_, chunks, _p_bar):
+            self.assertEqual(b''.join(chunks), b'!'*16+b'@'*479)
         editor = HexEditor('', '')
         editor.hex_array_edit[0] = ['21'] * 16
         editor.cpos.set_pos((5, 2))
         editor._key_dl(None)
-        with patch('cat_win.src.service.helper.iohelper.IoHelper.write_file', assertWriteFile):
+        with patch('cat_win.src.service.helper.iohelper.IoHelper.write_file_atomic', assertWriteFile):
             editor._action_save()
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 500))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 500)
     @patch('cat_win.src.service.hexeditor.HexEditor.columns', 5)
     def test__action_save_correctness(self):
-        def assertWriteFile(_, _s: str):
-            self.assertEqual(_s, b'@'*6+b'!@!'+b'@'*492)
+        def assertWriteFile(_, chunks, _p_bar):
+            self.assertEqual(b''.join(chunks), b'@'*6+b'!@!'+b'@'*492)
         editor = HexEditor('', '')
         editor.cpos.set_pos((1,1))
         editor._key_string('2')
         editor._key_string('1')
         for _ in range(100):
             editor._key_string(' ')
-        editor._build_file_upto(editor.cpos.row+32)
         editor._fix_cursor_position(30)
         for _ in range(4):
             editor._move_key_up()
         editor._key_string('2')
         editor._key_string('1')
-        with patch('cat_win.src.service.helper.iohelper.IoHelper.write_file', assertWriteFile):
+        with patch('cat_win.src.service.helper.iohelper.IoHelper.write_file_atomic', assertWriteFile):
             editor._action_save()
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 496))
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.write_file', ErrorDefGen.get_def(PermissionError("validn't")))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 496)
+    @patch('cat_win.src.service.helper.iohelper.IoHelper.write_file_atomic', ErrorDefGen.get_def(PermissionError("validn't")))
     def test__action_save_error(self):
         editor = HexEditor('', '')
         editor.hex_array_edit[0] = ['21'] * 16
         editor._action_save()
         self.assertEqual(editor.error_bar, "validn't")
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 496))
+    def test__action_save_in_place(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, 'test.bin')
+            with open(tmp_file, 'wb') as raw_f:
+                raw_f.write(b'@' * 100)
+            editor = HexEditor(tmp_file, '')
+            editor.curse_window = MagicMock()
+            editor.hex_array_edit[2][3:5] = ['21', '21']
+            with patch('cat_win.src.service.helper.iohelper.IoHelper.write_file_atomic') as write_mock:
+                editor._action_save()
+            write_mock.assert_not_called()
+            self.assertEqual(editor.error_bar, '')
+            self.assertIn('Saving', editor.curse_window.addstr.call_args_list[-1][0][2])
+            self.assertSequenceEqual(editor.hex_array_edit, [[None] * 16] * 6 + [[None] * 4])
+            editor.hex_buffer.close()
+            with open(tmp_file, 'rb') as raw_f:
+                self.assertEqual(raw_f.read(), b'@' * 35 + b'!!' + b'@' * 63)
+
+    def test__action_save_resized(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, 'test.bin')
+            with open(tmp_file, 'wb') as raw_f:
+                raw_f.write(b'@' * 100)
+            editor = HexEditor(tmp_file, '')
+            editor.cpos.set_pos((1, 0))
+            editor._key_string('>')
+            editor._key_string('2')
+            editor._key_string('1')
+            editor._key_dl(None)
+            with patch('cat_win.src.service.helper.iohelper.IoHelper.patch_file') as patch_mock:
+                editor._action_save()
+            patch_mock.assert_not_called()
+            self.assertEqual(editor.error_bar, '')
+            self.assertEqual(len(editor.hex_buffer), 100)
+            editor.hex_buffer.close()
+            with open(tmp_file, 'rb') as raw_f:
+                self.assertEqual(raw_f.read(), b'@' * 17 + b'!' + b'@' * 82)
+            self.assertListEqual(os.listdir(tmp_dir), ['test.bin'])
+
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 496)
     def test__action_jump(self):
         editor = HexEditor('', '')
         editor.curse_window = MagicMock()
@@ -703,7 +717,7 @@ class TestHexEditor(TestCase):
             self.assertEqual(editor._action_jump(), True)
         self.assertEqual(editor.cpos.get_pos(), (15, 15))
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 254 + b'!' * 2 + b'@' * 255))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 254 + b'!' * 2 + b'@' * 255)
     def test__action_find(self):
         editor = HexEditor('', '')
         editor.curse_window = MagicMock()
@@ -727,7 +741,39 @@ class TestHexEditor(TestCase):
             self.assertEqual(editor._action_find(), True)
         self.assertEqual(editor.cpos.get_pos(), (15, 15))
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 66))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 40 + b'ab12' + b'@' * 40 + b'x345')
+    def test__action_find_regex(self):
+        editor = HexEditor('', '')
+        editor.curse_window = MagicMock()
+        def char_gen(user_input: list):
+            yield from zip(['', ''] + user_input + [''],
+                           [b'_action_insert'] * 2 + [b'_key_string'] * len(user_input) + [b'_key_enter'])
+        char_gen_ = char_gen(list(r'\d+'))
+        with patch('cat_win.src.service.hexeditor.HexEditor._get_next_char', lambda *args: next(char_gen_)):
+            self.assertEqual(editor._action_find(), True)
+        self.assertEqual(editor.search.pattern, rb'\d+')
+        self.assertEqual(editor.cpos.get_pos(), (2, 10))
+        self.assertDictEqual(editor.search_items, {(2, 10): 4, (5, 5): 6})
+        editor._function_search()
+        self.assertEqual(editor.cpos.get_pos(), (5, 5))
+        editor._function_search()
+        self.assertEqual(editor.cpos.get_pos(), (2, 10))
+        editor._function_search_r()
+        self.assertEqual(editor.cpos.get_pos(), (5, 5))
+        editor._stop_search()
+
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 66)
+    def test__action_find_regex_invalid(self):
+        editor = HexEditor('', '')
+        editor.curse_window = MagicMock()
+        user_input = [('', b'_action_insert')] * 2 + [('(', b'_key_string'), ('', b'_key_enter'), ('\x1b', b'_key_string')]
+        char_gen_ = iter(user_input)
+        with patch('cat_win.src.service.hexeditor.HexEditor._get_next_char', lambda *args: next(char_gen_)):
+            self.assertEqual(editor._action_find(), True)
+        self.assertEqual(editor.search, '(')
+        self.assertIn('invalid regular expression', editor.curse_window.addstr.call_args_list[-2][0][2])
+
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 66)
     def test__action_reload(self):
         editor = HexEditor('', '')
         editor.curse_window = MagicMock()
@@ -745,7 +791,7 @@ class TestHexEditor(TestCase):
         self.assertEqual(editor.cpos.get_pos(), (1, 14))
         self.assertEqual(editor.hex_array_edit[0][0], None)
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 32))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 32)
     def test__action_insert(self):
         editor = HexEditor('', '')
         editor.curse_window = MagicMock()
@@ -776,7 +822,7 @@ class TestHexEditor(TestCase):
                                                                 '41', '42', None, None,
                                                                 None, None, None, None,])
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 32))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 32)
     def test__action_quit(self):
         editor = HexEditor('', '')
         editor.curse_window = MagicMock()
@@ -799,7 +845,7 @@ class TestHexEditor(TestCase):
             patch('cat_win.src.service.hexeditor.HexEditor._action_save', action_save):
             self.assertEqual(editor._action_quit(), False)
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 32))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 32)
     def test__action_interrupt(self):
         editor = HexEditor('', '')
         editor.curse_window = MagicMock()
@@ -834,7 +880,7 @@ class TestHexEditor(TestCase):
         mm.color_pair.return_value = 5
         self.assertEqual(editor._get_color(0), 5)
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 66))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 66)
     def test__fix_cursor_position(self):
         editor = HexEditor('', '')
         editor.cpos.set_pos((-2, 1))
@@ -869,7 +915,7 @@ class TestHexEditor(TestCase):
         self.assertEqual(editor.cpos.get_pos(), (4, 1))
         self.assertEqual(editor.wpos.get_pos(), (3, 0))
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 66))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 66)
     def test__render_scr(self):
         editor = HexEditor('', 'X' * 300)
         editor.curse_window = MagicMock()
@@ -879,7 +925,7 @@ class TestHexEditor(TestCase):
         editor.hex_array_edit[1][1] = '00'
         self.assertEqual(editor._render_scr(), None)
 
-    @patch('cat_win.src.service.helper.iohelper.IoHelper.yield_file', IoHelperMock.yield_file_gen(b'@' * 16))
+    @patch('cat_win.src.service.hexeditor.PageCache', lambda *_: b'@' * 16)
     def test__run(self):
         editor = HexEditor('', '')
         editor.curse_window = MagicMock()
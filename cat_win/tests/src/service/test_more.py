@@ -1,7 +1,10 @@
 from unittest import TestCase
 from unittest.mock import patch
+import os
+import tempfile
 
 from cat_win.tests.mocks.std import StdInMock, StdOutMock, OSAttyDefGen
+from cat_win.src.service.helper.lineindex import LineIndex
 from cat_win.src.service.more import More
 
 
@@ -140,6 +143,34 @@ class TestMore(TestCase):
                 index = n if n < 0 else n-1 if n > 0 else n
                 self.assertIn('\x1b[2K\x1b[1F\x1b[2K' + str(l[index]), fake_out.getvalue())
 
+    @patch.object(LineIndex, 'min_file_size', 0)
+    @patch.object(LineIndex, 'step', 16)
+    def test_jump_lazy_load(self):
+        def input_mock_helper():
+            yield 'j3000'
+            yield 'j5'
+            yield 'n'
+
+        helper = input_mock_helper()
+        def input_mock(_):
+            return next(helper)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, 'test.txt')
+            with open(tmp_file, 'w', encoding='utf-8', newline='') as raw_f:
+                raw_f.write('\r\n'.join(f"line{i}" for i in range(1, 5001)))
+            more = More()
+            with patch('builtins.input', input_mock), patch('sys.stdout', new=StdOutMock()) as fake_out:
+                more.lazy_load_file(tmp_file)
+                more.step_through()
+                self.assertIn('\x1b[2K\x1b[1F\x1b[2K' + '\n'.join(f"line{i}" for i in range(3000, 3028)),
+                              fake_out.getvalue())
+                self.assertIn('\x1b[2K\x1b[1F\x1b[2K' + '\n'.join(f"line{i}" for i in range(5, 33)),
+                              fake_out.getvalue())
+            # the lines before the jump target have not been loaded
+            self.assertLess(len(more.lines), 100)
+        LineIndex._loaded.clear()
+
     def test_down_n(self):
         for n in list(range(-10, 100)):
             def input_mock_helper():
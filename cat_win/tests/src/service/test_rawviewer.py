@@ -3,6 +3,8 @@ from unittest.mock import patch
 import os
 
 from cat_win.tests.mocks.error import ErrorDefGen
+from cat_win.src.service.helper.iohelper import IoHelper
+from cat_win.src.service import rawviewer
 from cat_win.src.service.rawviewer import get_display_char_gen, get_raw_view_lines_gen
 
 
@@ -29,6 +31,43 @@ class TestRawViewer(TestCase):
         gen_hex = get_display_char_gen(base=8)
         self.assertEqual(gen_hex('12'), '␤')
 
+    def test_yield_rows(self):
+        chunks = [b'a' * 5, b'b' * 20, b'c' * 7, b'd' * 12]
+        rows = list(rawviewer._yield_rows(chunks))
+        self.assertTrue(all(len(row) % 16 == 0 for row in rows[:-1]))
+        self.assertEqual(b''.join(rows), b''.join(chunks))
+        self.assertListEqual(list(rawviewer._yield_rows([b'a' * 16, b''])), [b'a' * 16])
+        rows = list(rawviewer._yield_rows(chunks, 5))
+        self.assertTrue(all((len(row) + 5 * (i == 0)) % 16 == 0 for i, row in enumerate(rows[:-1])))
+        self.assertEqual(b''.join(rows), b''.join(chunks))
+
+    def test_chunked_view(self):
+        expected_result = list(get_raw_view_lines_gen(test_file_path, 'x'))
+        yield_bytes = IoHelper.yield_bytes
+        with patch('cat_win.src.service.helper.iohelper.IoHelper.yield_bytes',
+                   lambda file, offset, length: yield_bytes(file, offset, length, 7)):
+            self.assertListEqual(list(get_raw_view_lines_gen(test_file_path, 'x')),
+                                 expected_result)
+        with patch.object(rawviewer, 'HEX_SEP', False):
+            self.assertListEqual(list(get_raw_view_lines_gen(test_file_path, 'x')),
+                                 expected_result)
+        self.assertListEqual(list(get_raw_view_lines_gen(test_file_path, 'x', offset=32)),
+                             expected_result[:1] + expected_result[3:])
+
+    def test_offset_length(self):
+        expected_result = list(get_raw_view_lines_gen(test_file_path, 'x'))
+        result = list(get_raw_view_lines_gen(test_file_path, 'x', offset=20, length=30))
+        self.assertEqual(len(result), 4)
+        self.assertEqual(result[0], expected_result[0])
+        # the rows stay aligned to the file
+        self.assertEqual(result[1], expected_result[2][:9] + ' ' * 12 + expected_result[2][21:59] +
+                         ' ' * 8 + expected_result[2][67:])
+        self.assertEqual(result[2], expected_result[3])
+        self.assertEqual(result[3], expected_result[4][:9] + expected_result[4][9:14].ljust(47) +
+                         ' # ' + expected_result[4][59:62])
+        self.assertListEqual(list(get_raw_view_lines_gen(test_file_path, 'x', offset=20, length=0)),
+                             expected_result[:1])
+
     def test_mode_x_upper(self):
         expected_result = """\
 Address  00 01 02 03 04 05 06 07 08 09 0A 0B 0C 0D 0E 0F # Decoded Text                   
@@ -103,10 +142,10 @@ Address  00       01       02       03       04       05       06       07
                          expected_result)
 
     def test_get_raw_view_lines_gen_oserror(self):
-        with patch('cat_win.src.service.helper.iohelper.IoHelper.read_file',
+        with patch('cat_win.src.service.helper.iohelper.IoHelper.yield_bytes',
                    ErrorDefGen.get_def(FileNotFoundError('Test123'))):
             self.assertEqual('\n'.join(get_raw_view_lines_gen(__file__)), 'FileNotFoundError')
-        with patch('cat_win.src.service.helper.iohelper.IoHelper.read_file',
+        with patch('cat_win.src.service.helper.iohelper.IoHelper.yield_bytes',
                    ErrorDefGen.get_def(PermissionError('Test123'))):
             self.assertEqual('\n'.join(get_raw_view_lines_gen(__file__)), 'PermissionError')
 
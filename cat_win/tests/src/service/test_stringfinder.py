@@ -92,3 +92,47 @@ class TestStringFinder(TestCase):
                                           [6, 'reset_found'], [4, 'found_keyword']])
         self.assertCountEqual(f_keywords, [('Is', [4, 6]), ('Test', [7, 11])])
         self.assertCountEqual(m_keywords, [(r"[0-9]\!", [12, 14])])
+
+    def test_find_keywords_ignore_case(self):
+        string_finder = StringFinder([('is', True), ('IS', False), ('is', True)])
+        line = 'ThisIsATest!'
+        intervals, f_keywords, _ = string_finder.find_keywords(line)
+
+        self.assertCountEqual(intervals, [[6, 'reset_found'], [2, 'found_keyword']])
+        self.assertListEqual(f_keywords, [('is', [2, 4]), ('is', [2, 4]),
+                                          ('is', [4, 6]), ('is', [4, 6])])
+
+    def test_find_keywords_automaton(self):
+        queries = [(f"word{i}", bool(i % 2)) for i in range(100)] + [('', False)]
+        line = 'word1 WORD2 Word3 word10word11'
+        expected_output = ([], [], [])
+        for query, ignore_case in queries:
+            for _f in StringFinder([]).find_literals(query, line, ignore_case):
+                expected_output[1].append((query, _f))
+                expected_output[0].append(_f[:])
+        expected_output[1].sort(key=lambda x: x[1][0])
+
+        intervals, f_keywords, m_keywords = StringFinder(queries).find_keywords(line)
+        self.assertListEqual(
+            intervals, StringFinder([])._merge_keyword_intervals(expected_output[0], [])
+        )
+        self.assertListEqual(f_keywords, expected_output[1])
+        self.assertListEqual(m_keywords, [])
+
+    def test_find_literal_lines(self):
+        string_finder = StringFinder([('is', False), ('TEST', True), (re.compile('x'), False)])
+        text = 'This\nxxx\r\n\nA Test\rnothing\r\nis\n' + '\n' * 20 + '\u2028this'
+        self.assertListEqual(list(string_finder.find_literal_lines(text)),
+                             [(0, 'This'), (3, 'A Test'), (5, 'is'), (27, 'this')])
+
+    def test_find_literal_lines_dense(self):
+        string_finder = StringFinder([('is', False)])
+        text = 'This\nxxx\nis\nx'
+        self.assertListEqual(list(string_finder.find_literal_lines(text)),
+                             list(enumerate(text.splitlines())))
+
+    def test_find_literal_lines_fallback(self):
+        string_finder = StringFinder([('i', True)])
+        text = '\u0130\nx'
+        self.assertListEqual(list(string_finder.find_literal_lines(text)),
+                             [(0, '\u0130'), (1, 'x')])
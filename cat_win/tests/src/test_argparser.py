@@ -103,6 +103,18 @@ class TestArgParser(TestCase):
         self.assertListEqual(arg_parser.file_truncate, [4, 6, -5])
         arg_parser.get_arguments(['CAT', 'trunc=:2*4-3:'])
         self.assertListEqual(arg_parser.file_truncate, [None, 5, None])
+        arg_parser.get_arguments(['CAT', 'trunc=0x3FFF0000:0x3FFF0000+0o20:'])
+        self.assertListEqual(arg_parser.file_truncate, [0x3FFF0000, 0x3FFF0010, None])
+        arg_parser.get_arguments(['CAT', 't=-0xff:0b11'])
+        self.assertListEqual(arg_parser.file_truncate, [-255, 3, None])
+        arg_parser.get_arguments(['CAT', 'trunc=():'])
+        self.assertListEqual(arg_parser.file_truncate, [None, None, None])
+
+    def test_get_arguments_trunc_no_names(self):
+        for param in ['trunc=exec(0xa):', 't=dec:', 'trunc=abc:1', 't=1:fab', 't=0b10xab:']:
+            arg_parser = ArgParser()
+            arg_parser.get_arguments(['CAT', param])
+            self.assertListEqual(arg_parser.file_truncate, [None, None, None])
 
     def test_get_arguments_cut(self):
         arg_parser = ArgParser()
@@ -1,18 +1,22 @@
 from unittest import TestCase
 from unittest.mock import patch
+from functools import partial
 import os
 
 from cat_win.src import cat
-from cat_win.src.const.argconstants import ARGS_ENDS, ARGS_REVERSE, ARGS_CHR
+from cat_win.src.const.argconstants import ARGS_ENDS, ARGS_REVERSE, ARGS_CHR, ARGS_NUMBER, ARGS_GREP
+from cat_win.src.const.defaultconstants import DKW
 from cat_win.tests.mocks.std import StdOutMock, StdInMock
 from cat_win.src.domain.file import File
 from cat_win.src.persistence.cconfig import CConfig
 from cat_win.src.persistence.config import Config
+from cat_win.src.service.helper.outputsink import OutputSink
 # import sys
 # sys.path.append('../cat_win')
 
 
 test_file_path = os.path.join(os.path.dirname(__file__), '..', 'texts', 'test.txt')
+test_file_path_empty = os.path.join(os.path.dirname(__file__), '..', 'texts', 'test_empty.txt')
 test_file_content = []
 with open(test_file_path, 'r', encoding='utf-8') as f:
     test_file_content = f.read().split('\n')
@@ -59,6 +63,45 @@ class TestCat(TestCase):
             cat.edit_files()
             self.assertEqual(fake_out.getvalue(), check_against)
 
+    @patch('cat_win.src.cat.arg_parser.file_queries', new=[('Line', False)])
+    def test_cat_output_multiple_files_parallel(self):
+        cat.u_files.set_files([test_file_path, test_file_path_empty, test_file_path])
+        cat.u_args.set_args([(ARGS_NUMBER, ''), (ARGS_GREP, '')])
+
+        with patch('sys.stdout', new=StdOutMock()) as fake_out:
+            cat.edit_files()
+            check_against = fake_out.getvalue()
+
+        cat.const_dic[DKW.FILE_WORKERS] = 2
+        cat.u_files.set_files([test_file_path, test_file_path_empty, test_file_path])
+        with patch('sys.stdout', new=StdOutMock()) as fake_out:
+            cat.edit_files()
+            self.assertEqual(fake_out.getvalue(), check_against)
+        self.assertListEqual([file.contains_queried for file in cat.u_files],
+                             [True, False, True])
+
+    @patch('cat_win.src.cat.arg_parser.file_queries', new=[('Line', False)])
+    def test_cat_output_multiple_files_parallel_large(self):
+        cat.u_files.set_files([test_file_path, test_file_path_empty, test_file_path])
+        cat.u_args.set_args([(ARGS_NUMBER, ''), (ARGS_GREP, '')])
+
+        with patch('sys.stdout', new=StdOutMock()) as fake_out:
+            cat.edit_files()
+            check_against = fake_out.getvalue()
+
+        cat.u_files.set_files([test_file_path, test_file_path_empty, test_file_path])
+        for file in cat.u_files:
+            file.set_file_size(os.path.getsize(file.path))
+        with patch.dict(cat.const_dic, {DKW.FILE_WORKERS: 2, DKW.LARGE_FILE_SIZE: 4}), \
+            patch('cat_win.src.cat.edit_file', side_effect=cat.edit_file) as edit_file, \
+                patch('sys.stdout', new=StdOutMock()) as fake_out:
+            cat.edit_files()
+            self.assertEqual(fake_out.getvalue(), check_against)
+        # only the empty file is small enough to be edited by a worker
+        self.assertListEqual([c[0][0] for c in edit_file.call_args_list], [0, 2])
+        self.assertListEqual([file.contains_queried for file in cat.u_files],
+                             [True, False, True])
+
     def test_cat_output_reverse(self):
         cat.u_files.set_files([test_file_path])
         cat.u_args.set_args([(ARGS_REVERSE, '')]) #reverse
@@ -71,6 +114,20 @@ class TestCat(TestCase):
             cat.edit_files()
             self.assertEqual(fake_out.getvalue(), check_against)
 
+    def test_cat_output_reverse_number(self):
+        cat.u_files.set_files([test_file_path])
+        cat.u_args.set_args([(ARGS_NUMBER, ''), (ARGS_REVERSE, '')]) #number & reverse
+
+        with open(test_file_path, 'r', encoding='utf-8') as file:
+            check_against = [cat._get_line_prefix(i, 1) + line
+                             for i, line in enumerate(file.read().split('\n'), start=1)]
+        check_against.reverse()
+        check_against = '\n'.join(check_against) + '\n'
+
+        with patch('sys.stdout', new=StdOutMock()) as fake_out:
+            cat.edit_files()
+            self.assertEqual(fake_out.getvalue(), check_against)
+
     def test_cat_output_ends_and_tabs(self):
         cat.u_files.set_files([test_file_path])
         cat.u_args.set_args([(ARGS_ENDS, ''), (ARGS_CHR, '')]) #ends & char
@@ -82,6 +139,45 @@ class TestCat(TestCase):
             cat.edit_files()
             self.assertEqual(fake_out.getvalue(), check_against)
 
+    @patch('cat_win.src.cat.OutputSink', new=partial(OutputSink, 1))
+    def test_cat_edit_content_lazy(self):
+        cat.u_files.set_files([test_file_path])
+        cat.u_args.set_args([(ARGS_NUMBER, ''), (ARGS_ENDS, '')])
+
+        with patch('sys.stdout', new=StdOutMock()) as fake_out:
+            written = []
+            def content_gen():
+                for line in test_file_content:
+                    written.append(fake_out.getvalue())
+                    yield ('', line)
+
+            cat.edit_content(content_gen(), 0)
+            output_lines = fake_out.getvalue().splitlines(True)
+        # every line has been written before the next line has been read
+        self.assertEqual(len(output_lines), len(test_file_content))
+        self.assertListEqual(written, [''.join(output_lines[:i])
+                                       for i in range(len(test_file_content))])
+
+    @patch('cat_win.src.cat.arg_parser.file_truncate', new=[None, 3, None])
+    def test_cat_edit_content_lazy_truncate(self):
+        cat.u_files.set_files([test_file_path])
+        cat.u_args.set_args([(ARGS_NUMBER, ''), (ARGS_ENDS, '')])
+
+        consumed = []
+        def content_gen():
+            for line in test_file_content:
+                if len(consumed) == 3:
+                    raise AssertionError('the content has been read beyond the truncation')
+                consumed.append(line)
+                yield ('', line)
+
+        with patch('sys.stdout', new=StdOutMock()) as fake_out:
+            cat.edit_content(content_gen(), 0)
+            self.assertEqual(fake_out.getvalue(), ''.join(
+                f"{cat._get_line_prefix(i, 1)}{line}$\n"
+                for i, line in enumerate(test_file_content[:3], start=1)))
+        self.assertListEqual(consumed, test_file_content[:3])
+
     def test_cat__get_line_prefix_file_excess(self):
         cat.u_files.all_line_number_place_holder = 5
         self.assertEqual(cat._get_line_prefix(9, 1), '    9) ')
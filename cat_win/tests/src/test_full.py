@@ -1,11 +1,13 @@
 from unittest.mock import patch
 from unittest import TestCase
 import os
+import tempfile
 
 from cat_win.src import cat
 from cat_win.tests.mocks.std import StdInMock, StdOutMock
 from cat_win.src.persistence.cconfig import CConfig
 from cat_win.src.persistence.config import Config
+from cat_win.src.service.helper.lineindex import LineIndex
 # import sys
 # sys.path.append('../cat_win')
 
@@ -142,6 +144,27 @@ class TestCatFull(TestCase):
 8
 9
 10
+"""
+        with patch('sys.stdout', new=StdOutMock()) as fake_out:
+            cat.main()
+            self.assertEqual(fake_out.getvalue(), expected_output)
+
+    @patch('sys.argv', ['<CAT>', test_peek, 'enc=utf-8', '--peek', '-n'])
+    def test_cat_output_full_peek_numbered(self):
+        expected_output = """\
+ 1) 1
+ 2) 2
+ 3) 3
+ 4) 4
+ 5) 5
+               :
+              (11)
+               :
+17) 6
+18) 7
+19) 8
+20) 9
+21) 10
 """
         with patch('sys.stdout', new=StdOutMock()) as fake_out:
             cat.main()
@@ -222,6 +245,62 @@ following: 1
             cat.main()
             self.assertEqual(expected_output, fake_out.getvalue())
 
+    @patch('sys.argv', ['<CAT>', test_file_path, '-g', '-n', 'find=Line', 'FIND=SUM'])
+    def test_cat_output_grep_numbered(self):
+        expected_output = """\
+4) N-Ary Summation: ∑
+5) The following Line is Empty:
+7) This Line is a Duplicate!
+8) This Line is a Duplicate!
+"""
+        with patch('sys.stdout', new=StdOutMock()) as fake_out:
+            cat.main()
+            self.assertEqual(expected_output, fake_out.getvalue())
+
+    @patch('sys.argv', ['<CAT>', test_file_path, 'trunc=-5:-1:2', '-n'])
+    def test_cat_output_trunc_negative_numbered(self):
+        expected_output = """\
+4) N-Ary Summation: ∑
+6) 
+"""
+        with patch('sys.stdout', new=StdOutMock()) as fake_out:
+            cat.main()
+            self.assertEqual(expected_output, fake_out.getvalue())
+
+    @patch('sys.argv', ['<CAT>', test_file_path, 'trunc=-3:'])
+    def test_cat_output_trunc_last_lines(self):
+        expected_output = """\
+
+This Line is a Duplicate!
+This Line is a Duplicate!
+"""
+        with patch('sys.stdout', new=StdOutMock()) as fake_out:
+            cat.main()
+            self.assertEqual(expected_output, fake_out.getvalue())
+
+    @patch.object(LineIndex, 'set_flags', lambda *_: None)
+    @patch.object(LineIndex, 'cache_size', 0)
+    @patch.object(LineIndex, 'min_file_size', 0)
+    @patch.object(LineIndex, 'step', 4)
+    def test_cat_output_trunc_pager_index(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, 'test.txt')
+            with open(tmp_file, 'wb') as raw_f:
+                raw_f.write(b'\n'.join(b'line %d' % i for i in range(20)))
+            # the index the pager and the editor build
+            index = LineIndex.get(tmp_file)
+            find_line = LineIndex.find_line
+            with patch('sys.argv', ['<CAT>', tmp_file, 'trunc=10:12']), \
+                patch.object(LineIndex, 'build', side_effect=AssertionError), \
+                patch.object(LineIndex, 'find_line', side_effect=find_line) as find_line_mock, \
+                patch('sys.stdout', new=StdOutMock()) as fake_out:
+                cat.main()
+                self.assertEqual(fake_out.getvalue(), 'line 10\nline 11\n')
+            # the search for the first line starts at the closest indexed line
+            self.assertEqual(find_line_mock.call_args[0][3], index.seek(10))
+            self.assertEqual(index.seek(10), (8, 56))
+        LineIndex._loaded.clear()
+
     @patch('sys.argv', ['<CAT>', test_file_path, '--sort'])
     def test_cat_output_sort(self):
         expected_output = """\
@@ -261,6 +340,29 @@ Address  00 01 02 03 04 05 06 07 08 09 0A 0B 0C 0D 0E 0F # Decoded Text
             cat.main()
             self.assertEqual(expected_output, '\n'.join(fake_out.getvalue().split('\n')[1:]))
 
+    @patch('sys.argv', ['<CAT>', test_file_path, '--HEXVIEW', 'trunc=0x5:0x5+7'])
+    def test_cat_output_raw_trunc(self):
+        expected_output = """\
+Address  00 01 02 03 04 05 06 07 08 09 0A 0B 0C 0D 0E 0F # Decoded Text                   
+00000000                65 20 54 65 78 74 3A             #           e   T e x t :
+
+"""
+        with patch('sys.stdout', new=StdOutMock()) as fake_out:
+            cat.main()
+            self.assertEqual(expected_output, '\n'.join(fake_out.getvalue().split('\n')[1:]))
+
+    def test_cat_output_plain_only_late_invalid_byte(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, 'test.txt')
+            # the invalid byte is not part of the first chunk decoded
+            with open(tmp_file, 'wb') as raw_f:
+                raw_f.write(b'hello world\n' * (1024 * 1024) + b'\xff\n')
+            for args in [[], ['-n'], ['find=hello', '-g'], ['--peek']]:
+                with patch('sys.argv', ['<CAT>', tmp_file, '--plain-only', *args]), \
+                    patch('sys.stdout', new=StdOutMock()) as fake_out:
+                    cat.main()
+                    self.assertEqual(fake_out.getvalue(), '')
+
     @patch('sys.argv', ['<CAT>', test_binary])
     @patch('sys.stderr', new=StdOutMock())
     def test_cat_output_binary(self):
@@ -0,0 +1,102 @@
+#!/usr/bin/python
+"""
+compare the throughput of different implementations used by catw.
+usage: python -m workflowHelper.benchmark
+"""
+
+from timeit import timeit
+from unittest.mock import patch
+import io
+import os
+import random
+import string
+import sys
+import tempfile
+
+from cat_win.src.service.helper.outputsink import OutputSink
+from cat_win.src.service.rawviewer import get_display_char_gen, get_raw_view_lines_gen
+from cat_win.src.service.stringfinder import StringFinder
+
+
+def _devnull_stdout() -> io.TextIOWrapper:
+    return io.TextIOWrapper(open(os.devnull, 'wb'), encoding='utf-8', errors='replace')
+
+
+def bench_output(line_count: int = 1_000_000, repeat: int = 3) -> None:
+    """
+    compare writing lines using print() with writing them using the OutputSink.
+    """
+    lines = [f"{i}) some line of text with a few words in it" for i in range(line_count)]
+    size = sum(len(line) + 1 for line in lines) / 1024 / 1024
+
+    def print_lines():
+        for line in lines:
+            print(line)
+
+    def sink_lines():
+        with OutputSink() as sink:
+            for line in lines:
+                sink.write_line(line)
+
+    stdout = sys.stdout
+    print(f"output: {line_count} lines ({size:.2f} MB)")
+    for name, func in [('print', print_lines), ('OutputSink', sink_lines)]:
+        sys.stdout = _devnull_stdout()
+        try:
+            duration = timeit(func, number=repeat) / repeat
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        print(f"\t{name:<12}{duration:8.3f}s {size/duration:10.2f} MB/s")
+
+
+def bench_stringfinder(line_count: int = 10_000) -> None:
+    """
+    compare searching every query on its own with the Aho-Corasick automaton.
+    """
+    rand = random.Random(0)
+    def random_word(min_length: int, max_length: int) -> str:
+        return ''.join(rand.choice(string.ascii_letters)
+                       for _ in range(rand.randint(min_length, max_length)))
+    lines = [' '.join(random_word(2, 8) for _ in range(15)) for _ in range(line_count)]
+
+    print(f"stringfinder: {line_count} lines")
+    for query_count in [1, 10, 100]:
+        queries = [(random_word(3, 6), bool(i % 2)) for i in range(query_count)]
+        for name, threshold in [('find', float('inf')), ('automaton', 0)]:
+            with patch('cat_win.src.service.stringfinder.AUTOMATON_THRESHOLD', threshold):
+                string_finder = StringFinder(queries)
+            duration = timeit(lambda: [string_finder.find_keywords(line) for line in lines],
+                              number=1)
+            print(f"\t{query_count:>3} queries {name:<12}{duration:8.3f}s "
+                  f"{line_count/duration:10.0f} lines/s")
+
+
+def bench_rawviewer(size: int = 1024 * 1024 * 4) -> None:
+    """
+    compare formatting every byte on its own with the table-driven raw viewer.
+    """
+    get_display_char = get_display_char_gen()
+
+    def format_bytes(file: str):
+        with open(file, 'rb') as raw_f:
+            content = raw_f.read()
+        for i in range(0, len(content), 16):
+            line = content[i:i+16]
+            yield f"{i:08X} " + ' '.join(f"{b:02X}" for b in line) + ' # ' + \
+                ' '.join(map(get_display_char, line))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_file = os.path.join(tmp_dir, 'bench.bin')
+        with open(tmp_file, 'wb') as raw_f:
+            raw_f.write(os.urandom(size))
+        print(f"rawviewer: {size/1024/1024:.2f} MB")
+        for name, func in [('per byte', format_bytes), ('tables', get_raw_view_lines_gen)]:
+            duration = timeit(lambda: sum(1 for _ in func(tmp_file)), number=1)
+            print(f"\t{name:<12}{duration:8.3f}s {size/1024/1024/duration:10.2f} MB/s")
+
+
+if __name__ == '__main__':
+    bench_output()
+    bench_stringfinder()
+    bench_rawviewer()